@@ -18,9 +18,10 @@ from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.pregel import Pregel
 from langgraph.runtime import Runtime
 
+from sdrbot_cli.agent_cache import config_stamp, dir_stamp, get_agent_cache
 from sdrbot_cli.agent_memory import AgentMemoryMiddleware
 from sdrbot_cli.config import COLORS, config, console, get_default_coding_instructions, settings
-from sdrbot_cli.deep_agent import create_custom_deep_agent
+from sdrbot_cli.deep_agent import create_custom_deep_agent, subagent_dirs
 from sdrbot_cli.integrations.sandbox_factory import get_default_working_dir
 from sdrbot_cli.mcp.manager import get_mcp_manager
 from sdrbot_cli.memory_tools import create_memory_tools
@@ -31,6 +32,9 @@ from sdrbot_cli.skills.load import list_skills
 from sdrbot_cli.token_utils import calculate_baseline_tokens
 from sdrbot_cli.tracing import get_tracing_callbacks
 
+# Compiled agents kept for reuse: one per tool scope, so cycling scopes is instant
+AGENT_VARIANTS = 3
+
 # Default summarization settings
 DEFAULT_TRIGGER_FRACTION = 0.85
 FALLBACK_TRIGGER_TOKENS = 170_000
@@ -235,6 +239,7 @@ def _get_enabled_services_prompt() -> str:
         "zohocrm",
         "lusha",
         "hunter",
+        "apollo",
     ]
     enabled = [s for s in all_services if config.is_enabled(s)]
 
@@ -262,7 +267,7 @@ No CRM services are enabled. Use `/services enable <name>` to enable a service.
         lines.append(f"**CRMs:** {', '.join(s.title() for s in crm_services)}\n")
 
     # Add enrichment services
-    enrichment = [s for s in enabled if s in ["lusha", "hunter"]]
+    enrichment = [s for s in enabled if s in ["lusha", "hunter", "apollo"]]
     if enrichment:
         lines.append(f"**Enrichment:** {', '.join(s.title() for s in enrichment)}\n")
 
@@ -271,6 +276,19 @@ No CRM services are enabled. Use `/services enable <name>` to enable a service.
     )
 
     # Add service-specific tips
+    if crm_services:
+        lines.append(
+            "\n**Bulk CRM tip:** To create, update or delete more than a few records, pass a "
+            "JSON array or CSV/JSON file to the `*_batch_*` tools instead of calling the "
+            "single-record tools in a loop."
+        )
+        lines.append(
+            "\n**Mirror tip:** For repeated lookups, duplicate checks or aggregates (counts, "
+            "group-bys) over many records, run `crm_mirror_sync` once and then query the "
+            "local copy with `crm_mirror_query` instead of paging through search tools. "
+            "To find duplicates, or records that already exist in another CRM or list, "
+            "use `dedupe_records`."
+        )
     if "salesforce" in enabled:
         lines.append("\n**Salesforce tip:** Use `salesforce_soql_query` for complex queries.")
     if "hubspot" in enabled:
@@ -283,6 +301,12 @@ No CRM services are enabled. Use `/services enable <name>` to enable a service.
         lines.append(
             "\n**Hunter tip:** Verify emails with `hunter_email_verifier` before adding to CRM."
         )
+    if enrichment:
+        lines.append(
+            "\n**Enrichment tip:** For more than a handful of records, save them to a CSV/JSON "
+            "file and use the `*_bulk_*` tools - one call covers the whole list. To fill "
+            "gaps across providers (e.g. email, then phone), use `enrich_waterfall`."
+        )
 
     return "\n".join(lines)
 
@@ -411,6 +435,21 @@ def _add_interrupt_on() -> dict[str, InterruptOnConfig]:
         "description": _format_task_description,
     }
 
+    # Waterfall enrichment spends credits across several providers
+    enrich_waterfall_interrupt_config: InterruptOnConfig = {
+        "allowed_decisions": ["approve", "reject"],
+    }
+
+    # Bulk loads write thousands of CRM records in one call
+    salesforce_bulk_load_interrupt_config: InterruptOnConfig = {
+        "allowed_decisions": ["approve", "reject"],
+    }
+
+    # Migrations write (or delete) whole CRM objects in the target
+    crm_migration_interrupt_config: InterruptOnConfig = {
+        "allowed_decisions": ["approve", "reject"],
+    }
+
     # Note: Service tool interrupts are dynamically registered in create_agent_with_config()
     # based on the tools returned by get_enabled_tools()
 
@@ -421,44 +460,17 @@ def _add_interrupt_on() -> dict[str, InterruptOnConfig]:
         "edit_file": edit_file_interrupt_config,
         "fetch_url": fetch_url_interrupt_config,
         "task": task_interrupt_config,
+        "enrich_waterfall": enrich_waterfall_interrupt_config,
+        "salesforce_bulk_load": salesforce_bulk_load_interrupt_config,
+        "crm_migration_run": crm_migration_interrupt_config,
+        "crm_migration_reset": crm_migration_interrupt_config,
     }
 
 
-def create_agent_with_config(
-    model: str | BaseChatModel,
-    assistant_id: str,
-    tools: list[BaseTool],
-    *,
-    sandbox: SandboxBackendProtocol | None = None,
-    sandbox_type: str | None = None,
-    checkpointer: BaseCheckpointSaver | None = None,
-    session_state=None,
-) -> tuple[Pregel, CompositeBackend, int, int, BaseCheckpointSaver, int]:
-    """Create and configure an agent with the specified model and tools.
-
-    Args:
-        model: LLM model to use
-        assistant_id: Agent identifier for memory storage
-        tools: Additional tools to provide to agent
-        sandbox: Optional sandbox backend for remote execution (e.g., ModalBackend).
-                 If None, uses local filesystem + shell.
-        sandbox_type: Type of sandbox provider ("modal", "runloop", "daytona")
-        checkpointer: Optional existing checkpointer to preserve conversation history.
-                     If None, creates a new InMemorySaver. Accepts any
-                     ``BaseCheckpointSaver`` (e.g. ``AsyncSqliteSaver``).
-        session_state: Optional session state for status callbacks during summarization.
-
-    Returns:
-        6-tuple of (agent, backend, tool_count, skill_count, checkpointer, baseline_tokens)
-    """
-    # Setup agent directory with prompt.md and memory.md (creates if needed)
-    default_content = get_default_coding_instructions()
-    settings.ensure_agent_prompt(assistant_id, default_content)
-    settings.ensure_agent_memory(assistant_id)
-
-    # Ensure skills directory exists
-    skills_dir = settings.ensure_skills_dir()
-
+def _create_backend_and_middleware(
+    assistant_id: str, skills_dir: Path, sandbox: SandboxBackendProtocol | None
+) -> tuple[CompositeBackend, list]:
+    """Create the file backend and the CLI's own middleware for the agent."""
     # CONDITIONAL SETUP: Local vs Remote Sandbox
     if sandbox is None:
         # ========== LOCAL MODE ==========
@@ -509,6 +521,53 @@ def create_agent_with_config(
             ),
         ]
 
+    return composite_backend, agent_middleware
+
+
+def create_agent_with_config(
+    model: str | BaseChatModel,
+    assistant_id: str,
+    tools: list[BaseTool],
+    *,
+    sandbox: SandboxBackendProtocol | None = None,
+    sandbox_type: str | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+    session_state=None,
+) -> tuple[Pregel, CompositeBackend, int, int, BaseCheckpointSaver, int]:
+    """Create and configure an agent with the specified model and tools.
+
+    Args:
+        model: LLM model to use
+        assistant_id: Agent identifier for memory storage
+        tools: Additional tools to provide to agent
+        sandbox: Optional sandbox backend for remote execution (e.g., ModalBackend).
+                 If None, uses local filesystem + shell.
+        sandbox_type: Type of sandbox provider ("modal", "runloop", "daytona")
+        checkpointer: Optional existing checkpointer to preserve conversation history.
+                     If None, creates a new InMemorySaver. Accepts any
+                     ``BaseCheckpointSaver`` (e.g. ``AsyncSqliteSaver``).
+        session_state: Optional session state for status callbacks during summarization.
+
+    Returns:
+        6-tuple of (agent, backend, tool_count, skill_count, checkpointer, baseline_tokens)
+    """
+    # Setup agent directory with prompt.md and memory.md (creates if needed)
+    default_content = get_default_coding_instructions()
+    settings.ensure_agent_prompt(assistant_id, default_content)
+    settings.ensure_agent_memory(assistant_id)
+
+    # Ensure skills directory exists
+    skills_dir = settings.ensure_skills_dir()
+
+    # Components are reused across reloads until their inputs change
+    cache = get_agent_cache()
+
+    composite_backend, agent_middleware = cache.get(
+        "backend",
+        (assistant_id, str(Path.cwd()), str(skills_dir), id(sandbox)),
+        lambda: _create_backend_and_middleware(assistant_id, skills_dir, sandbox),
+    )
+
     # Extract model identity for system prompt injection
     _model_name: str | None = getattr(model, "model_name", None) or getattr(model, "model", None)
     _provider: str | None = None
@@ -530,7 +589,11 @@ def create_agent_with_config(
     interrupt_on = _add_interrupt_on()
 
     # Load memory tools (no approval required)
-    memory_tools = create_memory_tools(assistant_id)
+    memory_tools = cache.get(
+        ("memory_tools", assistant_id),
+        str(settings.get_agent_memory_path(assistant_id)),
+        lambda: create_memory_tools(assistant_id),
+    )
     tools.extend(memory_tools)
 
     # Load tools from enabled services
@@ -551,6 +614,7 @@ def create_agent_with_config(
                 "create" in tool_name
                 or "update" in tool_name
                 or "delete" in tool_name
+                or "upsert" in tool_name
                 or "lusha_" in tool_name
                 or "hunter_" in tool_name
                 or "apollo_" in tool_name
@@ -568,7 +632,7 @@ def create_agent_with_config(
             }
 
     # Get tracing callbacks
-    tracing_callbacks = get_tracing_callbacks()
+    tracing_callbacks = cache.get("tracing_callbacks", config_stamp(), get_tracing_callbacks)
 
     # Build config with callbacks if any are configured
     agent_config = dict(config)
@@ -590,23 +654,42 @@ def create_agent_with_config(
     if session_state:
         session_state.model = model
 
-    agent = create_custom_deep_agent(
-        model=model,
-        system_prompt=system_prompt,
-        tools=tools,
-        backend=composite_backend,
-        middleware=agent_middleware,
-        interrupt_on=interrupt_on,
-        max_total_tokens=max_total_tokens,
-        messages_to_keep=6,
-        on_summarize=lambda msg: (
-            session_state._status_callback(msg)
-            if session_state and session_state._status_callback
-            else (console.print(f"[dim]{msg}[/dim]") if msg else None)
-        ),
-        context_overhead=baseline_tokens,  # Pass accurate overhead including memory section
-        session_state=session_state,
-    ).with_config(agent_config)
+    # Recompile only if something the graph is built from changed. The key holds
+    # ids; the cached graph keeps those objects alive, so the ids stay unique.
+    agent_key = (
+        id(model),
+        id(composite_backend),
+        tuple(id(tool) for tool in tools),
+        system_prompt,
+        tuple(sorted(interrupt_on)),
+        tuple(id(callback) for callback in tracing_callbacks),
+        baseline_tokens,
+        max_total_tokens,
+        id(session_state),
+        tuple(dir_stamp(d, "*.md") for d in subagent_dirs()),
+    )
+    agent = cache.get(
+        "agent",
+        agent_key,
+        lambda: create_custom_deep_agent(
+            model=model,
+            system_prompt=system_prompt,
+            tools=tools,
+            backend=composite_backend,
+            middleware=agent_middleware,
+            interrupt_on=interrupt_on,
+            max_total_tokens=max_total_tokens,
+            messages_to_keep=6,
+            on_summarize=lambda msg: (
+                session_state._status_callback(msg)
+                if session_state and session_state._status_callback
+                else (console.print(f"[dim]{msg}[/dim]") if msg else None)
+            ),
+            context_overhead=baseline_tokens,  # Pass accurate overhead including memory section
+            session_state=session_state,
+        ).with_config(agent_config),
+        variants=AGENT_VARIANTS,
+    )
 
     # Use existing checkpointer or create new one to preserve conversation history
     if checkpointer is None:
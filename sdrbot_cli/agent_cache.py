@@ -0,0 +1,118 @@
+"""Component cache for incremental agent reloads.
+
+The agent is rebuilt on every scope toggle, service enable, MCP change and
+schema-modifying tool call. Most of what goes into it - service tool lists
+(including the ``exec`` of generated tool files), MCP tool wrappers,
+subagent definitions, token counts, middleware and the compiled graph - is
+unaffected by any one of those changes.
+
+Each component is stored under a name together with a key built from the
+inputs it depends on (file stamps, the tools it wraps, config values). A
+lookup with the same key returns the stored value; a different key rebuilds
+that component only::
+
+    cache = get_agent_cache()
+    tools = cache.get(("service_tools", "hubspot"), file_stamp(path), load_tools)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ComponentCache:
+    """Values memoized by component name and dependency key."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, OrderedDict[Hashable, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: Hashable, key: Hashable, build: Callable[[], T], *, variants: int = 1) -> T:
+        """Return the value stored for ``name`` under ``key``, building it if needed.
+
+        Args:
+            name: Component name.
+            key: Everything the component depends on. Must be hashable.
+            build: Called to compute the value on a miss.
+            variants: How many keys to keep per component. More than one lets a
+                toggle back to an earlier state (e.g. cycling the tool scope)
+                hit the cache.
+
+        Returns:
+            The cached or freshly built value.
+        """
+        entries = self._entries.setdefault(name, OrderedDict())
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        value = build()
+        entries[key] = value
+        while len(entries) > variants:
+            entries.popitem(last=False)
+        return value
+
+    def invalidate(self, name: Hashable) -> None:
+        """Drop every stored value for ``name``."""
+        self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def file_stamp(path: Path) -> tuple[str, int, int] | None:
+    """Identify the current contents of ``path`` (None if it doesn't exist)."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def dir_stamp(directory: Path, pattern: str = "*") -> tuple:
+    """Stamp of every file matching ``pattern`` in ``directory``."""
+    if not directory.is_dir():
+        return (str(directory),)
+    return (str(directory), *(file_stamp(p) for p in sorted(directory.glob(pattern))))
+
+
+def model_stamp() -> tuple:
+    """Stamp of the files the model is created from: .env and model.json."""
+    from sdrbot_cli.config import get_config_dir
+
+    return (file_stamp(Path.cwd() / ".env"), file_stamp(get_config_dir() / "model.json"))
+
+
+def config_stamp() -> tuple:
+    """Stamp of the files a reload re-reads: .env, model.json and services.json."""
+    from sdrbot_cli.services.registry import get_config_path
+
+    return (*model_stamp(), file_stamp(get_config_path()))
+
+
+_cache: ComponentCache | None = None
+
+
+def get_agent_cache() -> ComponentCache:
+    """Get the process-wide component cache."""
+    global _cache
+    if _cache is None:
+        _cache = ComponentCache()
+    return _cache
+
+
+def reset_agent_cache() -> None:
+    """Forget all cached components (the next build starts from scratch)."""
+    if _cache is not None:
+        _cache.clear()
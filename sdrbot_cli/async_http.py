@@ -0,0 +1,60 @@
+"""Shared async HTTP client for REST service tools.
+
+Generated CRM tools for REST-based services are ``async`` so that the agent
+loop can await them directly: parallel tool calls from one model turn then
+run concurrently on the event loop instead of each taking a thread from the
+default executor. Their service clients send requests through
+:func:`arequest`, which goes through the same rate limit buckets as the
+synchronous ``requests`` path.
+
+An ``httpx.AsyncClient`` is tied to the event loop it was first used on, so
+one connection pool is kept per running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any
+
+import httpx
+
+from sdrbot_cli.rate_limit import acall_with_rate_limit
+
+# Matches the patience of the synchronous clients, which set no timeout
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
+        _clients[loop] = client
+    return client
+
+
+async def arequest(
+    service: str, method: str, url: str, endpoint: str | None = None, **kwargs: Any
+) -> httpx.Response:
+    """Send a rate-limited request on the shared async client.
+
+    Args:
+        service: Service name, used to pick the rate limit buckets.
+        method: HTTP method.
+        url: Full request URL.
+        endpoint: Request path for endpoint-specific budgets.
+        **kwargs: Passed to ``httpx.AsyncClient.request`` (json, params, headers...).
+
+    Returns:
+        The final response (after any 429 retries).
+    """
+    client = get_async_client()
+    return await acall_with_rate_limit(
+        service, endpoint, lambda: client.request(method, url, **kwargs)
+    )
@@ -10,6 +10,7 @@ import requests
 from rich.prompt import Prompt
 
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_apollo"
 TOKEN_KEY = "api_key"
@@ -85,7 +86,9 @@ class ApolloClient:
             raise ValueError("Apollo API Key is missing. Please set APOLLO_API_KEY in .env")
 
         url = f"{self.base_url}{endpoint}"
-        response = self.session.request(method, url, **kwargs)
+        response = call_with_rate_limit(
+            "apollo", endpoint, lambda: self.session.request(method, url, **kwargs)
+        )
 
         if not response.ok:
             try:
@@ -2,11 +2,14 @@
 
 import os
 
+import httpx
 import keyring
 import requests
 from rich.prompt import Prompt
 
+from sdrbot_cli import async_http
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_attio"
 TOKEN_KEY = "api_key"
@@ -68,9 +71,26 @@ class AttioClient:
 
     def request(self, method: str, endpoint: str, **kwargs):
         url = f"{self.base_url}{endpoint}"
-        response = self.session.request(method, url, **kwargs)
+        response = call_with_rate_limit(
+            "attio", endpoint, lambda: self.session.request(method, url, **kwargs)
+        )
+        return self._parse(response)
+
+    async def arequest(self, method: str, endpoint: str, **kwargs):
+        """Async :meth:`request`, sent on the shared ``httpx`` client."""
+        response = await async_http.arequest(
+            "attio",
+            method,
+            f"{self.base_url}{endpoint}",
+            endpoint,
+            headers=dict(self.session.headers),
+            **kwargs,
+        )
+        return self._parse(response)
 
-        if not response.ok:
+    @staticmethod
+    def _parse(response: requests.Response | httpx.Response):
+        if response.status_code >= 400:
             try:
                 error = response.json()
             except Exception:
@@ -1,17 +1,27 @@
 """HubSpot Authentication Manager."""
 
+from __future__ import annotations
+
 import json
 import os
 import time
 import urllib.parse
 import webbrowser
+from typing import TYPE_CHECKING
 
 import keyring
 import requests
-from hubspot import HubSpot
 
 from sdrbot_cli.auth.oauth_server import wait_for_callback
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.lazy import lazy_import
+from sdrbot_cli.rate_limit import call_with_rate_limit
+
+if TYPE_CHECKING:
+    from hubspot import HubSpot
+
+hubspot = lazy_import("hubspot")
+hubspot_discovery = lazy_import("hubspot.discovery.discovery_base")
 
 SERVICE_NAME = "sdrbot_hubspot"
 TOKEN_KEY = "oauth_token"
@@ -195,6 +205,24 @@ def _refresh_token(token_data: dict) -> dict | None:
         return None
 
 
+def _rate_limited_api_factory(api_client_package, api_name, config):
+    """Build a HubSpot SDK API whose HTTP calls go through the shared rate limiter."""
+    api = hubspot_discovery.DiscoveryBase._default_api_factory(api_client_package, api_name, config)
+    rest_client = api.api_client.rest_client
+    send = rest_client.request
+
+    def request(method, url, *args, **kwargs):
+        path = urllib.parse.urlparse(url).path
+        return call_with_rate_limit("hubspot", path, lambda: send(method, url, *args, **kwargs))
+
+    rest_client.request = request
+    return api
+
+
+def _new_client(access_token: str) -> HubSpot:
+    return hubspot.HubSpot(access_token=access_token, api_factory=_rate_limited_api_factory)
+
+
 def get_client() -> HubSpot | None:
     # 1. Check for Personal Access Token (PAT)
     pat = os.getenv("HUBSPOT_ACCESS_TOKEN")
@@ -202,7 +230,7 @@ def get_client() -> HubSpot | None:
         console.print(
             f"[{COLORS['primary']}]Using HubSpot Personal Access Token (PAT).[/{COLORS['primary']}]"
         )
-        return HubSpot(access_token=pat)
+        return _new_client(pat)
 
     # 2. Fallback to OAuth if Client ID/Secret are available
     if not CLIENT_ID or not CLIENT_SECRET:
@@ -236,7 +264,7 @@ def get_client() -> HubSpot | None:
             if not token_data:
                 return None
 
-    client = HubSpot(access_token=token_data["access_token"])
+    client = _new_client(token_data["access_token"])
 
     try:
         # Test connection by fetching a contact (limit 1) or some safe endpoint
@@ -253,7 +281,7 @@ def get_client() -> HubSpot | None:
             )
             token_data = _refresh_token(token_data) if token_data else None
             if token_data:
-                return HubSpot(access_token=token_data["access_token"])
+                return _new_client(token_data["access_token"])
 
             # Refresh failed, re-login
             console.print(
@@ -261,7 +289,7 @@ def get_client() -> HubSpot | None:
             )
             token_data = login()
             if token_data:
-                return HubSpot(access_token=token_data["access_token"])
+                return _new_client(token_data["access_token"])
             return None
 
         # Non-auth error, re-raise
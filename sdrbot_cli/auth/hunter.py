@@ -7,6 +7,7 @@ import requests
 from rich.prompt import Prompt
 
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_hunter"
 TOKEN_KEY = "api_key"
@@ -69,7 +70,9 @@ class HunterClient:
         params["api_key"] = self.api_key
         kwargs["params"] = params
 
-        response = self.session.request(method, url, **kwargs)
+        response = call_with_rate_limit(
+            "hunter", endpoint, lambda: self.session.request(method, url, **kwargs)
+        )
 
         if not response.ok:
             try:
@@ -7,6 +7,7 @@ import requests
 from rich.prompt import Prompt
 
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_lusha"
 TOKEN_KEY = "api_key"
@@ -66,7 +67,9 @@ class LushaClient:
             raise ValueError("Lusha API Key is missing. Please set LUSHA_API_KEY in .env")
 
         url = f"{self.base_url}{endpoint}"
-        response = self.session.request(method, url, **kwargs)
+        response = call_with_rate_limit(
+            "lusha", endpoint, lambda: self.session.request(method, url, **kwargs)
+        )
 
         if not response.ok:
             try:
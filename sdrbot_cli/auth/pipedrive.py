@@ -12,8 +12,10 @@ import webbrowser
 import keyring
 import requests
 
+from sdrbot_cli import async_http
 from sdrbot_cli.auth.oauth_server import wait_for_callback
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_pipedrive"
 TOKEN_KEY = "oauth_token"
@@ -214,8 +216,23 @@ class PipedriveClient:
             JSON response as dict.
         """
         url = f"{self.base_url}{endpoint}"
+        self._authenticate(kwargs)
+        response = call_with_rate_limit(
+            "pipedrive", endpoint, lambda: requests.request(method, url, **kwargs)
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _arequest(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Async :meth:`_request`, sent on the shared ``httpx`` client."""
+        url = f"{self.base_url}{endpoint}"
+        self._authenticate(kwargs)
+        response = await async_http.arequest("pipedrive", method, url, endpoint, **kwargs)
+        response.raise_for_status()
+        return response.json()
 
-        # Set up authentication
+    def _authenticate(self, kwargs: dict) -> None:
+        """Add the API token or OAuth header to a request's arguments."""
         headers = kwargs.pop("headers", {})
 
         if self.api_token:
@@ -230,10 +247,6 @@ class PipedriveClient:
         headers["Content-Type"] = "application/json"
         kwargs["headers"] = headers
 
-        response = requests.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response.json()
-
     def get(self, endpoint: str, **kwargs) -> dict:
         """Make a GET request."""
         return self._request("GET", endpoint, **kwargs)
@@ -250,6 +263,22 @@ class PipedriveClient:
         """Make a DELETE request."""
         return self._request("DELETE", endpoint, **kwargs)
 
+    async def aget(self, endpoint: str, **kwargs) -> dict:
+        """Make an async GET request."""
+        return await self._arequest("GET", endpoint, **kwargs)
+
+    async def apost(self, endpoint: str, **kwargs) -> dict:
+        """Make an async POST request."""
+        return await self._arequest("POST", endpoint, **kwargs)
+
+    async def aput(self, endpoint: str, **kwargs) -> dict:
+        """Make an async PUT request."""
+        return await self._arequest("PUT", endpoint, **kwargs)
+
+    async def adelete(self, endpoint: str, **kwargs) -> dict:
+        """Make an async DELETE request."""
+        return await self._arequest("DELETE", endpoint, **kwargs)
+
 
 def get_pipedrive_client() -> PipedriveClient | None:
     """Get an authenticated Pipedrive client.
@@ -1,17 +1,25 @@
 """Salesforce Authentication Manager."""
 
+from __future__ import annotations
+
 import json
 import os
 import time
 import urllib.parse
 import webbrowser
+from typing import TYPE_CHECKING
 
 import keyring
 import requests
-from simple_salesforce import Salesforce
 
 from sdrbot_cli.auth.oauth_server import wait_for_callback
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from simple_salesforce import Salesforce
+
+simple_salesforce = lazy_import("simple_salesforce")
 
 SERVICE_NAME = "sdrbot_salesforce"
 TOKEN_KEY = "oauth_token"
@@ -193,7 +201,7 @@ def get_client() -> Salesforce | None:
 
     try:
         # Attempt to create client with existing token
-        sf = Salesforce(
+        sf = simple_salesforce.Salesforce(
             instance_url=token_data["instance_url"], session_id=token_data["access_token"]
         )
         # Test connection
@@ -206,7 +214,7 @@ def get_client() -> Salesforce | None:
         )
         token_data = _refresh_token(token_data) if token_data else None
         if token_data:
-            return Salesforce(
+            return simple_salesforce.Salesforce(
                 instance_url=token_data["instance_url"], session_id=token_data["access_token"]
             )
 
@@ -215,6 +223,6 @@ def get_client() -> Salesforce | None:
         token_data = login()
         if not token_data:
             return None
-        return Salesforce(
+        return simple_salesforce.Salesforce(
             instance_url=token_data["instance_url"], session_id=token_data["access_token"]
         )
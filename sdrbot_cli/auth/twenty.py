@@ -6,11 +6,14 @@ Supports both cloud (api.twenty.com) and self-hosted instances.
 
 import os
 
+import httpx
 import keyring
 import requests
 from rich.prompt import Prompt
 
+from sdrbot_cli import async_http
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_twenty"
 TOKEN_KEY = "api_key"
@@ -126,14 +129,35 @@ class TwentyClient:
         Raises:
             Exception: If the API returns an error response.
         """
-        # Ensure endpoint starts with /rest if not already
-        if not endpoint.startswith("/rest"):
-            endpoint = f"/rest{endpoint}"
-
+        endpoint = self._rest_endpoint(endpoint)
         url = f"{self.base_url}{endpoint}"
-        response = self.session.request(method, url, **kwargs)
+        response = call_with_rate_limit(
+            "twenty", endpoint, lambda: self.session.request(method, url, **kwargs)
+        )
+        return self._parse(response)
+
+    async def arequest(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Async :meth:`request`, sent on the shared ``httpx`` client."""
+        endpoint = self._rest_endpoint(endpoint)
+        response = await async_http.arequest(
+            "twenty",
+            method,
+            f"{self.base_url}{endpoint}",
+            endpoint,
+            headers=dict(self.session.headers),
+            **kwargs,
+        )
+        return self._parse(response)
 
-        if not response.ok:
+    @staticmethod
+    def _rest_endpoint(endpoint: str) -> str:
+        # Ensure endpoint starts with /rest if not already
+        return endpoint if endpoint.startswith("/rest") else f"/rest{endpoint}"
+
+    @staticmethod
+    def _parse(response: requests.Response | httpx.Response) -> dict:
+        """Return the JSON body, raising on error responses."""
+        if response.status_code >= 400:
             try:
                 error = response.json()
                 # Handle different error response formats from Twenty API
@@ -177,6 +201,22 @@ class TwentyClient:
         """Make a DELETE request."""
         return self.request("DELETE", endpoint, **kwargs)
 
+    async def aget(self, endpoint: str, **kwargs) -> dict:
+        """Make an async GET request."""
+        return await self.arequest("GET", endpoint, **kwargs)
+
+    async def apost(self, endpoint: str, **kwargs) -> dict:
+        """Make an async POST request."""
+        return await self.arequest("POST", endpoint, **kwargs)
+
+    async def apatch(self, endpoint: str, **kwargs) -> dict:
+        """Make an async PATCH request."""
+        return await self.arequest("PATCH", endpoint, **kwargs)
+
+    async def adelete(self, endpoint: str, **kwargs) -> dict:
+        """Make an async DELETE request."""
+        return await self.arequest("DELETE", endpoint, **kwargs)
+
     def graphql(self, query: str, variables: dict | None = None) -> dict:
         """Execute a GraphQL query against the Twenty GraphQL endpoint.
 
@@ -195,7 +235,9 @@ class TwentyClient:
         if variables:
             payload["variables"] = variables
 
-        response = self.session.post(url, json=payload)
+        response = call_with_rate_limit(
+            "twenty", "/graphql", lambda: self.session.post(url, json=payload)
+        )
 
         if not response.ok:
             raise Exception(f"Twenty GraphQL Error ({response.status_code}): {response.text}")
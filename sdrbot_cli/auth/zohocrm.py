@@ -9,8 +9,10 @@ import webbrowser
 import keyring
 import requests
 
+from sdrbot_cli import async_http
 from sdrbot_cli.auth.oauth_server import wait_for_callback
 from sdrbot_cli.config import COLORS, console
+from sdrbot_cli.rate_limit import call_with_rate_limit
 
 SERVICE_NAME = "sdrbot_zohocrm"
 TOKEN_KEY = "oauth_token"
@@ -311,7 +313,21 @@ class ZohoClient:
         if "headers" in kwargs:
             headers.update(kwargs.pop("headers"))
 
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = call_with_rate_limit(
+            "zohocrm", endpoint, lambda: requests.request(method, url, headers=headers, **kwargs)
+        )
+        response.raise_for_status()
+        return response.json() if response.text else {}
+
+    async def arequest(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Async :meth:`request`, sent on the shared ``httpx`` client."""
+        headers = self._headers()
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+
+        response = await async_http.arequest(
+            "zohocrm", method, f"{self.base_url}{endpoint}", endpoint, headers=headers, **kwargs
+        )
         response.raise_for_status()
         return response.json() if response.text else {}
 
@@ -331,6 +347,22 @@ class ZohoClient:
         """Make a DELETE request."""
         return self.request("DELETE", endpoint, **kwargs)
 
+    async def aget(self, endpoint: str, **kwargs) -> dict:
+        """Make an async GET request."""
+        return await self.arequest("GET", endpoint, **kwargs)
+
+    async def apost(self, endpoint: str, **kwargs) -> dict:
+        """Make an async POST request."""
+        return await self.arequest("POST", endpoint, **kwargs)
+
+    async def aput(self, endpoint: str, **kwargs) -> dict:
+        """Make an async PUT request."""
+        return await self.arequest("PUT", endpoint, **kwargs)
+
+    async def adelete(self, endpoint: str, **kwargs) -> dict:
+        """Make an async DELETE request."""
+        return await self.arequest("DELETE", endpoint, **kwargs)
+
 
 def get_zoho_client() -> ZohoClient | None:
     """Get an authenticated ZohoClient instance.
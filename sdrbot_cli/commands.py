@@ -1,5 +1,6 @@
 """Command handlers for slash commands and bash execution."""
 
+import asyncio
 import subprocess
 from pathlib import Path
 
@@ -127,6 +128,34 @@ def display_context_usage(token_tracker: TokenTracker, session_state: SessionSta
     return output_lines
 
 
+async def handle_jobs_command(args: list[str]) -> list[Text]:
+    """List jobs, or resume/cancel one (``/jobs [resume|cancel <id>]``)."""
+    from sdrbot_cli.jobs import cancel_job, format_job, get_job_store, resume_job
+
+    if not args:
+        jobs = get_job_store().list()
+        if not jobs:
+            return [Text("No jobs yet.", style=COLORS["dim"])]
+        output_lines = [Text("\nJobs:", style=f"bold {COLORS['primary']}")]
+        output_lines.extend(Text(f"  {format_job(job)}", style=COLORS["dim"]) for job in jobs)
+        output_lines.append(
+            Text("  /jobs resume <id> | /jobs cancel <id>", style=COLORS["dim"]),
+        )
+        return output_lines
+
+    action = args[0].lower()
+    job_id = args[1].lstrip("#") if len(args) == 2 else ""
+    if action not in ("resume", "cancel") or not job_id.isdigit():
+        return [Text("Usage: /jobs [resume <id> | cancel <id>]", style="yellow")]
+    if action == "cancel":
+        return [Text(cancel_job(int(job_id)), style=COLORS["primary"])]
+
+    # Resumed jobs make blocking API calls; keep the event loop free
+    result = await asyncio.to_thread(resume_job, int(job_id))
+    style = "red" if result.startswith("Error") else COLORS["primary"]
+    return [Text(result, style=style)]
+
+
 async def handle_command(
     command: str, session_state: SessionState, token_tracker: TokenTracker
 ) -> str | list[RenderableType] | None:
@@ -214,6 +243,9 @@ async def handle_command(
     if cmd == "context":
         return display_context_usage(token_tracker, session_state)
 
+    if cmd == "jobs":
+        return await handle_jobs_command(args)
+
     # Setup commands - DISABLE IN TUI
     if session_state.is_tui and cmd in ["setup", "mcp", "models", "services"]:
         return Text(
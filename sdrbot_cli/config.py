@@ -7,13 +7,15 @@ import sys
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 import dotenv
-from langchain_core.language_models import BaseChatModel
 from rich.console import Console
 from rich.theme import Theme
 
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
 # Load .env ONLY from current working directory to avoid accidental parent config inheritance
 dotenv.load_dotenv(Path.cwd() / ".env")
 
@@ -45,6 +47,7 @@ COMMANDS = {
     "clear": "Clear screen and reset conversation",
     "context": "Show context usage and compaction status",
     "help": "Show help information",
+    "jobs": "List, resume or cancel long-running jobs",
     "quit": "Exit the CLI",
     "exit": "Exit the CLI",
     "setup": "Re-run the setup wizard",
@@ -64,6 +67,7 @@ TUI_COMMANDS = {
     "agents": "Open agents management screen",
     "skills": "Open skills management screen",
     "sessions": "Browse and resume past conversations",
+    "jobs": "List, resume or cancel long-running jobs",
     "sync": "Sync service schemas",
     "clear": "Clear screen and reset conversation",
     "quit": "Exit the application",
@@ -1200,7 +1204,7 @@ def validate_model_capabilities(model_name: str, provider: str) -> list[str]:
     return warnings
 
 
-def create_model() -> BaseChatModel:
+def create_model() -> "BaseChatModel":
     """Create the appropriate model based on available API keys.
 
     Uses the global settings instance to determine which model to create.
@@ -0,0 +1,16 @@
+"""Entity resolution: find duplicate records and match records across CRMs."""
+
+from sdrbot_cli.dedupe.engine import Cluster, Match, find_duplicates, match_records
+from sdrbot_cli.dedupe.normalize import Entity, normalize_entity
+from sdrbot_cli.dedupe.plan import run_dedupe, write_merge_plan
+
+__all__ = [
+    "Cluster",
+    "Entity",
+    "Match",
+    "find_duplicates",
+    "match_records",
+    "normalize_entity",
+    "run_dedupe",
+    "write_merge_plan",
+]
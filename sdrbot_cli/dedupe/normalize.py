@@ -0,0 +1,254 @@
+"""Field normalization for entity resolution.
+
+Raw CRM exports name the same field a dozen ways ("Email", "emails.primaryEmail",
+"Email_Address") and format values inconsistently ("ACME, Inc." vs "Acme",
+"+1 (415) 555-0100" vs "4155550100"). :func:`normalize_entity` maps a raw
+record onto a fixed set of comparable fields.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any
+
+from sdrbot_cli.result_format import CRM_METADATA_KEYS, flatten
+
+# Column aliases, keyed by the flattened field name lowercased with
+# spaces, dashes and dots collapsed to "_"
+_FIELD_ALIASES = {
+    "email": ("email", "email_address", "e_mail", "work_email", "emails_primaryemail", "email1"),
+    "first_name": ("first_name", "firstname", "given_name", "name_firstname"),
+    "last_name": ("last_name", "lastname", "surname", "family_name", "name_lastname"),
+    "name": ("full_name", "fullname", "contact_name", "person_name", "name"),
+    "company": (
+        "company",
+        "company_name",
+        "organization",
+        "organization_name",
+        "org_name",
+        "org_id_name",
+        "account_name",
+        "account_name_name",
+    ),
+    "domain": (
+        "domain",
+        "domains",
+        "company_domain",
+        "website",
+        "company_website",
+        "domainname_primarylinkurl",
+        "domain_name",
+    ),
+    "phone": (
+        "phone",
+        "phone_number",
+        "phone_numbers",
+        "mobile",
+        "mobilephone",
+        "mobile_phone",
+        "work_phone",
+        "phones_primaryphonenumber",
+    ),
+    "id": ("id", "record_id", "hs_object_id"),
+}
+_ALIAS_LOOKUP = {
+    alias: canonical for canonical, aliases in _FIELD_ALIASES.items() for alias in aliases
+}
+
+# Mailbox providers: their domain says nothing about the company
+FREE_EMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "yahoo.com",
+        "hotmail.com",
+        "outlook.com",
+        "live.com",
+        "msn.com",
+        "aol.com",
+        "icloud.com",
+        "me.com",
+        "proton.me",
+        "protonmail.com",
+        "gmx.com",
+        "gmx.de",
+        "web.de",
+        "mail.com",
+        "yandex.com",
+        "zoho.com",
+    }
+)
+
+# Legal-form and filler words dropped from company names
+_COMPANY_STOPWORDS = frozenset(
+    {
+        "the",
+        "inc",
+        "incorporated",
+        "llc",
+        "llp",
+        "ltd",
+        "limited",
+        "corp",
+        "corporation",
+        "co",
+        "company",
+        "plc",
+        "gmbh",
+        "ag",
+        "sa",
+        "sas",
+        "sarl",
+        "bv",
+        "nv",
+        "oy",
+        "ab",
+        "as",
+        "srl",
+        "spa",
+        "pty",
+        "pte",
+        "kk",
+        "group",
+        "holdings",
+    }
+)
+
+
+KIND_PERSON = "person"
+KIND_COMPANY = "company"
+
+
+@dataclass
+class Entity:
+    """A record reduced to normalized, comparable fields."""
+
+    index: int
+    id: str
+    email: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    company: str = ""
+    domain: str = ""
+    phone: str = ""
+    filled: int = 0
+    raw: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def full_name(self) -> str:
+        """Normalized "first last" name."""
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents ("Müller" -> "muller")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def normalize_email(value: str) -> str:
+    """Lowercase an address and drop "+tags" (and Gmail's ignored dots)."""
+    value = value.strip().lower()
+    if value.startswith("mailto:"):
+        value = value[7:]
+    local, at, domain = value.partition("@")
+    if not at or not local or "." not in domain:
+        return ""
+    local = local.split("+", 1)[0]
+    if domain in ("gmail.com", "googlemail.com"):
+        local, domain = local.replace(".", ""), "gmail.com"
+    return f"{local}@{domain}"
+
+
+def normalize_domain(value: str) -> str:
+    """Reduce a URL or domain to its bare host ("https://www.acme.com/x" -> "acme.com")."""
+    value = value.strip().lower()
+    value = re.sub(r"^[a-z]+://", "", value)
+    value = value.split("/", 1)[0].split("?", 1)[0].split(":", 1)[0]
+    if value.startswith("www."):
+        value = value[4:]
+    return value if "." in value and " " not in value else ""
+
+
+def normalize_phone(value: str) -> str:
+    """Keep a phone number's last 10 digits, enough to compare across formats."""
+    # Drop extensions ("x123", "ext. 123")
+    digits = re.sub(r"\D", "", value.lower().split("x", 1)[0])
+    return digits[-10:] if len(digits) >= 7 else ""
+
+
+def normalize_company(value: str) -> str:
+    """Fold case and accents, drop punctuation and legal suffixes."""
+    text = _fold(value).replace("&", " and ")
+    tokens = re.sub(r"[^a-z0-9 ]+", " ", text).split()
+    kept = [t for t in tokens if t not in _COMPANY_STOPWORDS]
+    return " ".join(kept or tokens)
+
+
+def normalize_name(value: str) -> str:
+    """Fold case and accents and drop punctuation from a person's name."""
+    return " ".join(re.sub(r"[^a-z0-9 ]+", " ", _fold(value).replace("'", "")).split())
+
+
+def _first_value(value: Any) -> str:
+    # "a@x.com; b@y.com" (flattened lists) -> first item
+    return str(value).split(";", 1)[0].strip()
+
+
+def canonical_fields(record: dict[str, Any]) -> dict[str, str]:
+    """Map a raw record's columns onto canonical field names (first match wins)."""
+    canonical: dict[str, str] = {}
+    for key, value in flatten(record, drop=CRM_METADATA_KEYS).items():
+        alias = _ALIAS_LOOKUP.get(re.sub(r"[\s.\-]+", "_", key.strip().lower()))
+        text = _first_value(value)
+        if alias and text and alias not in canonical:
+            canonical[alias] = text
+    return canonical
+
+
+def detect_kind(records: list[dict[str, Any]]) -> str:
+    """Guess whether records are people or companies from their columns."""
+    sample = records[:200]
+    people = sum(
+        1
+        for record in sample
+        if {"email", "first_name", "last_name"} & canonical_fields(record).keys()
+    )
+    return KIND_PERSON if people * 2 >= len(sample) else KIND_COMPANY
+
+
+def normalize_entity(index: int, record: dict[str, Any], kind: str) -> Entity:
+    """Build a comparable :class:`Entity` from a raw record.
+
+    Args:
+        index: Position of the record in its input.
+        record: The raw record.
+        kind: ``"person"`` or ``"company"``; decides what a bare "name" means.
+    """
+    fields = canonical_fields(record)
+    entity = Entity(index=index, id=fields.get("id", str(index + 1)), raw=record)
+
+    entity.email = normalize_email(fields.get("email", ""))
+    company = fields.get("company", "")
+    first = normalize_name(fields.get("first_name", ""))
+    last = normalize_name(fields.get("last_name", ""))
+    if kind == KIND_COMPANY:
+        company = company or fields.get("name", "")
+    elif not (first or last) and fields.get("name"):
+        first, _, last = normalize_name(fields["name"]).rpartition(" ")
+        if not first:
+            first, last = last, ""
+    entity.first_name, entity.last_name = first, last
+    entity.company = normalize_company(company)
+    entity.phone = normalize_phone(fields.get("phone", ""))
+
+    domain = normalize_domain(fields.get("domain", ""))
+    if not domain and entity.email:
+        email_domain = entity.email.split("@", 1)[1]
+        domain = "" if email_domain in FREE_EMAIL_DOMAINS else email_domain
+    entity.domain = domain
+
+    entity.filled = sum(1 for v in record.values() if v not in (None, "", [], {}))
+    return entity
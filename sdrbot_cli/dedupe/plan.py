@@ -0,0 +1,206 @@
+"""Dedupe runs: load records, find duplicates or matches, write a merge plan.
+
+Records come from a CSV/JSON/JSONL file or from a table of the local CRM
+mirror (e.g. ``hubspot_contacts``, see ``sdrbot_cli.services.mirror``).
+Results are written to ``./files/dedupe/``:
+
+- Dedupe: ``<name>_merge_plan_<stamp>.csv`` has one row per record in a
+  duplicate cluster (keep or merge, the survivor, score and reason).
+  ``<name>_merge_plan_<stamp>.json`` holds the same clusters, plus the
+  fields each survivor should take from its duplicates.
+- Matching against a second list: ``<name>_matches_<stamp>.csv`` has one
+  row per left record, with its best match on the right (blank if none).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import settings
+from sdrbot_cli.dedupe.engine import (
+    DEFAULT_THRESHOLD,
+    Cluster,
+    find_duplicates,
+    match_records,
+)
+from sdrbot_cli.dedupe.normalize import Entity
+from sdrbot_cli.enrichment.batch import load_records, resolve_input_path
+
+_PLAN_COLUMNS = (
+    "cluster",
+    "action",
+    "record_id",
+    "survivor_id",
+    "score",
+    "reason",
+    "email",
+    "name",
+    "company",
+    "domain",
+    "phone",
+)
+
+
+def load_source(source: str) -> tuple[list[dict[str, Any]], str]:
+    """Load records from a file or a CRM mirror table.
+
+    Returns:
+        (records, short name used for output files)
+
+    Raises:
+        FileNotFoundError: If the source is neither a file nor a mirrored table.
+    """
+    try:
+        path = resolve_input_path(source)
+    except FileNotFoundError:
+        from sdrbot_cli.services.mirror import get_mirror, mirror_exists, view_name
+
+        mirror = get_mirror() if mirror_exists() else None
+        for state in mirror.states() if mirror else []:
+            if view_name(state.service, state.object_name) == source.lower():
+                return mirror.records(state.service, state.object_name), source.lower()
+        raise FileNotFoundError(
+            f"'{source}' is neither a file nor a mirrored CRM table "
+            "(sync one with crm_mirror_sync, e.g. hubspot_contacts)"
+        ) from None
+    return load_records(path), path.stem
+
+
+def _output_path(name: str, kind: str, suffix: str, stamp: str) -> Path:
+    out_dir = settings.get_files_dir() / "dedupe"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir / f"{name}_{kind}_{stamp}.{suffix}"
+
+
+def _plan_row(
+    cluster_no: int,
+    action: str,
+    entity: Entity,
+    survivor_id: str,
+    score: float | None,
+    reason: str,
+) -> list[Any]:
+    return [
+        cluster_no,
+        action,
+        entity.id,
+        survivor_id,
+        f"{score:.2f}" if score is not None else "",
+        reason,
+        entity.email,
+        entity.full_name,
+        entity.company,
+        entity.domain,
+        entity.phone,
+    ]
+
+
+def write_merge_plan(clusters: list[Cluster], name: str, stamp: str) -> tuple[Path, Path]:
+    """Write the merge plan CSV and JSON files.
+
+    Returns:
+        (csv path, json path)
+    """
+    csv_path = _output_path(name, "merge_plan", "csv", stamp)
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_PLAN_COLUMNS)
+        for number, cluster in enumerate(clusters, 1):
+            survivor = cluster.survivor
+            writer.writerow(_plan_row(number, "keep", survivor, survivor.id, None, ""))
+            for match in cluster.duplicates:
+                writer.writerow(
+                    _plan_row(number, "merge", match.right, survivor.id, match.score, match.reason)
+                )
+
+    json_path = csv_path.with_suffix(".json")
+    plan = [
+        {
+            "cluster": number,
+            "survivor_id": cluster.survivor.id,
+            "duplicates": [
+                {"id": m.right.id, "score": round(m.score, 3), "reason": m.reason}
+                for m in cluster.duplicates
+            ],
+            "fill_from_duplicates": cluster.fills(),
+        }
+        for number, cluster in enumerate(clusters, 1)
+    ]
+    json_path.write_text(json.dumps(plan, indent=2, default=str))
+    return csv_path, json_path
+
+
+def run_dedupe(
+    source: str,
+    against: str | None = None,
+    kind: str = "auto",
+    threshold: float = DEFAULT_THRESHOLD,
+) -> str:
+    """Find duplicates in ``source``, or match it against ``against``.
+
+    Returns:
+        Summary for the agent with the output file paths, or an error message.
+    """
+    if not 0 < threshold <= 1:
+        return "Error: threshold must be between 0 and 1 (e.g. 0.85)"
+    try:
+        records, name = load_source(source)
+        other = load_source(against) if against else None
+    except (FileNotFoundError, ValueError) as e:
+        return f"Error: {e}"
+    if not records:
+        return f"Error: {source} has no records"
+
+    start = time.time()
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    try:
+        if other is None:
+            clusters = find_duplicates(records, kind, threshold)
+        else:
+            matches = list(match_records(records, other[0], kind, threshold))
+    except ValueError as e:
+        return f"Error: {e}"
+    elapsed = time.time() - start
+
+    if other is None:
+        if not clusters:
+            return f"No duplicates found among {len(records):,} records ({elapsed:.1f}s)."
+        csv_path, json_path = write_merge_plan(clusters, name, stamp)
+        duplicates = sum(len(c.duplicates) for c in clusters)
+        return (
+            f"Found {duplicates:,} duplicates in {len(clusters):,} clusters among "
+            f"{len(records):,} records ({elapsed:.1f}s).\n"
+            f"Merge plan (one row per record, keep/merge): {csv_path}\n"
+            f"Fields to copy onto each survivor: {json_path}\n"
+            "Review the plan before merging; records are only changed by CRM tools."
+        )
+
+    path = _output_path(name, "matches", "csv", stamp)
+    matched = 0
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(("left_id", "right_id", "score", "reason", "email", "name", "company"))
+        for entity, match in matches:
+            matched += match is not None
+            writer.writerow(
+                (
+                    entity.id,
+                    match.right.id if match else "",
+                    f"{match.score:.2f}" if match else "",
+                    match.reason if match else "",
+                    entity.email,
+                    entity.full_name,
+                    entity.company,
+                )
+            )
+    return (
+        f"Matched {matched:,} of {len(records):,} records from {source} against "
+        f"{len(other[0]):,} in {against} ({elapsed:.1f}s); "
+        f"{len(records) - matched:,} have no match.\n"
+        f"Matches (blank right_id = not found): {path}"
+    )
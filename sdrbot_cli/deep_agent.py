@@ -5,6 +5,7 @@ that allows customizing the summarization middleware with accurate token countin
 """
 
 from collections.abc import Callable, Sequence
+from pathlib import Path
 from typing import Any
 
 from deepagents.backends.protocol import BackendProtocol
@@ -23,10 +24,14 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langgraph.graph.state import CompiledStateGraph
 
+from sdrbot_cli.agent_cache import dir_stamp, get_agent_cache
+from sdrbot_cli.services.mirror import MirrorInvalidationMiddleware
 from sdrbot_cli.subagents import MIGRATION_EXECUTOR
 from sdrbot_cli.subagents.loader import scan_subagent_dirs
 from sdrbot_cli.summarization import CustomSummarizationMiddleware
 from sdrbot_cli.token_counting import calculate_context_overhead
+from sdrbot_cli.tool_cache import ToolResultCacheMiddleware
+from sdrbot_cli.tool_results import ToolResultOffloadMiddleware
 
 BASE_AGENT_PROMPT = (
     "In order to complete the objective that the user asks of you, "
@@ -34,6 +39,23 @@ BASE_AGENT_PROMPT = (
 )
 
 
+def subagent_dirs() -> tuple[Path, Path]:
+    """Directories scanned for subagent definitions (built-in, project-level)."""
+    from sdrbot_cli.config import get_config_dir
+
+    return Path(__file__).parent / "subagents", get_config_dir() / "subagents"
+
+
+def load_subagent_definitions() -> list[dict[str, Any]]:
+    """Subagent definitions from :func:`subagent_dirs`, re-read only when a file changes."""
+    dirs = subagent_dirs()
+    return get_agent_cache().get(
+        "subagent_definitions",
+        tuple(dir_stamp(d, "*.md") for d in dirs),
+        lambda: scan_subagent_dirs(*dirs),
+    )
+
+
 def create_custom_deep_agent(
     model: BaseChatModel,
     tools: Sequence[BaseTool] | None = None,
@@ -94,14 +116,7 @@ def create_custom_deep_agent(
     )
 
     # Discover subagent definitions from .md files
-    from pathlib import Path
-
-    from sdrbot_cli.config import get_config_dir
-
-    discovered_defs = scan_subagent_dirs(
-        Path(__file__).parent / "subagents",  # built-in
-        get_config_dir() / "subagents",  # project-level
-    )
+    discovered_defs = load_subagent_definitions()
     # Convert discovered dicts to SubAgent objects
     discovered_subagents: list[SubAgent] = [
         SubAgent(
@@ -125,10 +140,20 @@ def create_custom_deep_agent(
 
     shell_middleware = [m for m in (middleware or []) if isinstance(m, ShellMiddleware)]
 
+    # Large tool results go to /tmp/tool_results/ instead of the message history
+    tool_result_middleware: list[AgentMiddleware] = (
+        [ToolResultOffloadMiddleware(backend=backend)] if backend is not None else []
+    )
+    # Repeated read-only calls (schema, pipelines, counts) are answered from a TTL cache
+    tool_result_middleware.append(ToolResultCacheMiddleware())
+    # CRM writes mark the local mirror stale so the next query re-syncs
+    tool_result_middleware.append(MirrorInvalidationMiddleware())
+
     # Build subagent middleware stack
     subagent_middleware: list[AgentMiddleware] = [
         TodoListMiddleware(),
         FilesystemMiddleware(backend=backend),
+        *tool_result_middleware,
         *shell_middleware,  # Include shell if available
         # Subagents get their own summarization with same settings
         CustomSummarizationMiddleware(
@@ -145,6 +170,7 @@ def create_custom_deep_agent(
     deepagent_middleware: list[AgentMiddleware] = [
         TodoListMiddleware(),
         FilesystemMiddleware(backend=backend),
+        *tool_result_middleware,
         SubAgentMiddleware(
             default_model=model,
             default_tools=tools,
@@ -0,0 +1,20 @@
+"""Batch and waterfall enrichment across Apollo, Hunter and Lusha."""
+
+from sdrbot_cli.enrichment.batch import BatchJob, BatchResult, run_batch_enrichment
+from sdrbot_cli.enrichment.cache import cached_lookup, get_cache_stats, get_enrichment_cache
+from sdrbot_cli.enrichment.providers import EnrichmentOperation, get_operation, list_operations
+from sdrbot_cli.enrichment.waterfall import WaterfallJob, run_waterfall_enrichment
+
+__all__ = [
+    "BatchJob",
+    "BatchResult",
+    "EnrichmentOperation",
+    "cached_lookup",
+    "get_cache_stats",
+    "get_enrichment_cache",
+    "get_operation",
+    "list_operations",
+    "WaterfallJob",
+    "run_batch_enrichment",
+    "run_waterfall_enrichment",
+]
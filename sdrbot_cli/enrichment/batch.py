@@ -0,0 +1,451 @@
+"""Batch enrichment engine.
+
+Takes a CSV/JSON/JSONL file of leads, fans out over a provider's API with
+bounded concurrency (the service clients apply the shared rate limiter), and
+writes the merged results back to ``./files/enrichment/``. Progress is
+appended to a per-job log in ``.sdrbot/enrichment/`` after every chunk, so an
+interrupted job picks up where it left off when re-run with the same input.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import get_config_dir, settings
+from sdrbot_cli.enrichment.cache import get_cache_stats, get_enrichment_cache
+from sdrbot_cli.enrichment.providers import INPUT_FIELDS, EnrichmentOperation
+
+DEFAULT_MAX_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+
+# Column name aliases (lowercased, with spaces/dashes collapsed to "_")
+_INPUT_ALIASES = {
+    "email": "email",
+    "email_address": "email",
+    "e_mail": "email",
+    "work_email": "email",
+    "first_name": "first_name",
+    "firstname": "first_name",
+    "given_name": "first_name",
+    "last_name": "last_name",
+    "lastname": "last_name",
+    "surname": "last_name",
+    "family_name": "last_name",
+    "name": "name",
+    "full_name": "name",
+    "fullname": "name",
+    "company": "organization_name",
+    "company_name": "organization_name",
+    "organization": "organization_name",
+    "organization_name": "organization_name",
+    "account_name": "organization_name",
+    "domain": "domain",
+    "company_domain": "domain",
+    "website": "domain",
+    "company_website": "domain",
+    "linkedin": "linkedin_url",
+    "linkedin_url": "linkedin_url",
+    "linkedin_profile": "linkedin_url",
+}
+
+# Record statuses written to the progress log
+STATUS_ENRICHED = "enriched"
+STATUS_NOT_FOUND = "not_found"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+
+def resolve_input_path(path: str) -> Path:
+    """Resolve a user/agent supplied path to an existing file.
+
+    Absolute paths are used as-is when they exist; otherwise the path is
+    looked up relative to ``./files/`` (the agent's working area).
+
+    Raises:
+        FileNotFoundError: If no matching file exists.
+    """
+    candidate = Path(path).expanduser()
+    if candidate.is_absolute() and candidate.is_file():
+        return candidate
+
+    files_dir = settings.get_files_dir()
+    for option in (files_dir / str(path).lstrip("/"), Path.cwd() / path):
+        if option.is_file():
+            return option
+
+    raise FileNotFoundError(f"Input file not found: {path}")
+
+
+def load_records(path: Path) -> list[dict[str, Any]]:
+    """Load records from a CSV, JSON (array) or JSONL file.
+
+    Raises:
+        ValueError: If the format is unsupported or the content isn't a list of objects.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as f:
+            return [dict(row) for row in csv.DictReader(f)]
+
+    text = path.read_text(encoding="utf-8")
+    if suffix == ".jsonl":
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif suffix == ".json":
+        data = json.loads(text)
+        if isinstance(data, dict):
+            # Accept {"records": [...]} / {"results": [...]} style wrappers
+            data = next((v for v in data.values() if isinstance(v, list)), None)
+        records = data
+    else:
+        raise ValueError(f"Unsupported input format '{suffix}'. Use .csv, .json or .jsonl")
+
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError("Input must be a list of objects")
+    return records
+
+
+def _clean_domain(value: str) -> str:
+    value = value.strip().lower()
+    for prefix in ("https://", "http://"):
+        if value.startswith(prefix):
+            value = value[len(prefix) :]
+    if value.startswith("www."):
+        value = value[4:]
+    return value.split("/")[0]
+
+
+def normalize_record(raw: dict[str, Any]) -> dict[str, str]:
+    """Map a raw input row onto the canonical enrichment input fields.
+
+    Column names are matched case-insensitively against common aliases
+    (e.g. "Email Address", "Company Domain", "LinkedIn").
+    """
+    normalized: dict[str, str] = {}
+    for key, value in raw.items():
+        if value is None or not isinstance(key, str):
+            continue
+        alias = _INPUT_ALIASES.get(key.strip().lower().replace(" ", "_").replace("-", "_"))
+        text = str(value).strip()
+        if alias and text and alias not in normalized:
+            normalized[alias] = text
+
+    if "domain" in normalized:
+        normalized["domain"] = _clean_domain(normalized["domain"])
+    elif "@" in normalized.get("email", ""):
+        normalized["domain"] = normalized["email"].split("@", 1)[1].lower()
+    if "email" in normalized:
+        normalized["email"] = normalized["email"].lower()
+
+    return {k: normalized[k] for k in INPUT_FIELDS if k in normalized}
+
+
+def _cache_params(operation: EnrichmentOperation, record: dict[str, str]) -> dict[str, Any]:
+    params: dict[str, Any] = {k: record[k] for k in operation.input_fields if record.get(k)}
+    return {**params, **operation.options}
+
+
+def _lookup_cached(
+    operation: EnrichmentOperation, records: list[dict[str, str]], indices: list[int]
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """Split records into cache hits (as entries) and misses."""
+    cache = get_enrichment_cache()
+    stats = get_cache_stats()
+    hits: list[dict[str, Any]] = []
+    misses: list[int] = []
+    for i in indices:
+        cached = cache.get(operation.provider, operation.key, _cache_params(operation, records[i]))
+        if cached is None:
+            misses.append(i)
+            continue
+        stats.record(operation.provider, hit=True, found=cached.found)
+        if cached.found:
+            hits.append(
+                {"index": i, "status": STATUS_ENRICHED, "data": cached.value, "cached": True}
+            )
+        else:
+            hits.append({"index": i, "status": STATUS_NOT_FOUND, "cached": True})
+    return hits, misses
+
+
+def _run_chunk(
+    operation: EnrichmentOperation, records: list[dict[str, str]], indices: list[int]
+) -> list[dict[str, Any]]:
+    """Send one chunk to the provider and cache the per-record results."""
+    try:
+        results = operation.call([records[i] for i in indices])
+    except Exception as e:
+        return [{"index": i, "status": STATUS_ERROR, "error": str(e)[:300]} for i in indices]
+
+    cache = get_enrichment_cache()
+    stats = get_cache_stats()
+    entries = []
+    for i, result in zip(indices, results, strict=False):
+        params = _cache_params(operation, records[i])
+        cache.set(operation.provider, operation.key, params, result, found=bool(result))
+        stats.record(operation.provider, hit=False)
+        if result:
+            entries.append({"index": i, "status": STATUS_ENRICHED, "data": result})
+        else:
+            entries.append({"index": i, "status": STATUS_NOT_FOUND})
+    return entries
+
+
+def enrich_records(
+    operation: EnrichmentOperation,
+    records: list[dict[str, str]],
+    indices: list[int],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    on_entries: Callable[[list[dict[str, Any]]], None] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Enrich the selected records, serving cache hits first.
+
+    Cache misses are packed into provider-sized chunks and sent through a
+    bounded thread pool; the service clients apply the provider's rate limit.
+
+    Args:
+        operation: The enrichment operation to run.
+        records: Normalized input records.
+        indices: Indices into ``records`` to enrich.
+        max_concurrency: Maximum in-flight requests.
+        on_entries: Called with each batch of finished entries (cache hits first,
+            then one call per chunk) - used for progress logging.
+
+    Returns:
+        Mapping of record index to result entry.
+    """
+    entries: dict[int, dict[str, Any]] = {}
+
+    cached, pending = _lookup_cached(operation, records, indices)
+    if cached:
+        entries.update({e["index"]: e for e in cached})
+        if on_entries:
+            on_entries(cached)
+
+    size = operation.batch_size
+    chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+    if not chunks:
+        return entries
+
+    workers = max(1, min(max_concurrency, MAX_CONCURRENCY, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, operation, records, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            chunk_entries = future.result()
+            entries.update({e["index"]: e for e in chunk_entries})
+            if on_entries:
+                on_entries(chunk_entries)
+
+    return entries
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch enrichment job."""
+
+    job_id: str
+    operation: str
+    total: int
+    enriched: int
+    not_found: int
+    failed: int
+    skipped: int
+    resumed: int
+    cached: int
+    output_path: Path
+    elapsed: float
+
+    def summary(self) -> str:
+        """Compact, agent-facing summary of the job."""
+        lines = [
+            f"Batch enrichment {self.operation} (job {self.job_id}) finished "
+            f"in {self.elapsed:.1f}s:",
+            f"- Total records: {self.total}",
+            f"- Enriched: {self.enriched}",
+            f"- Not found: {self.not_found}",
+            f"- Skipped (missing input fields): {self.skipped}",
+            f"- Failed: {self.failed}",
+        ]
+        if self.resumed:
+            lines.append(f"- Resumed from previous run: {self.resumed}")
+        if self.cached:
+            lines.append(f"- Served from enrichment cache (no credits used): {self.cached}")
+        lines.append(f"Results written to: {self.output_path}")
+        if self.failed:
+            lines.append(
+                "Re-run the same tool with the same file to retry only the failed records."
+            )
+        return "\n".join(lines)
+
+
+class BatchJob:
+    """A resumable batch enrichment run over one input file."""
+
+    def __init__(
+        self,
+        operation: EnrichmentOperation,
+        input_path: Path,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress_dir: Path | None = None,
+        output_dir: Path | None = None,
+    ) -> None:
+        self.operation = operation
+        self.input_path = input_path
+        self.max_concurrency = max(1, min(max_concurrency, MAX_CONCURRENCY))
+        self.raw_records = load_records(input_path)
+        self.records = [normalize_record(r) for r in self.raw_records]
+        self.job_id = self._compute_job_id()
+        self.progress_path = (
+            progress_dir or get_config_dir() / "enrichment"
+        ) / f"{self.job_id}.jsonl"
+        op_slug = operation.key.replace(".", "_")
+        self.output_path = (
+            output_dir or settings.get_files_dir() / "enrichment"
+        ) / f"{input_path.stem}.{op_slug}.csv"
+        self._lock = threading.Lock()
+
+    def _compute_job_id(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(self.operation.key.encode())
+        digest.update(json.dumps(self.operation.options, sort_keys=True).encode())
+        digest.update(self.input_path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def _load_progress(self) -> dict[int, dict[str, Any]]:
+        """Read completed entries from the progress log (last entry per index wins)."""
+        done: dict[int, dict[str, Any]] = {}
+        if not self.progress_path.exists():
+            return done
+        for line in self.progress_path.read_text(encoding="utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from an interrupted write
+            done[entry["index"]] = entry
+        return {i: e for i, e in done.items() if e.get("status") != STATUS_ERROR}
+
+    def _record(self, log, entries: list[dict[str, Any]]) -> None:
+        with self._lock:
+            for entry in entries:
+                log.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            log.flush()
+
+    def run(self) -> BatchResult:
+        """Execute (or resume) the job and write the merged output file."""
+        start = time.monotonic()
+        self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+
+        entries = self._load_progress()
+        resumed = len(entries)
+
+        pending: list[int] = []
+        skipped: list[dict[str, Any]] = []
+        for i, rec in enumerate(self.records):
+            if i in entries:
+                continue
+            if self.operation.accepts(rec):
+                pending.append(i)
+            else:
+                skipped.append({"index": i, "status": STATUS_SKIPPED})
+
+        with self.progress_path.open("a", encoding="utf-8") as log:
+            if skipped:
+                self._record(log, skipped)
+                entries.update({e["index"]: e for e in skipped})
+
+            new_entries = enrich_records(
+                self.operation,
+                self.records,
+                pending,
+                max_concurrency=self.max_concurrency,
+                on_entries=lambda done: self._record(log, done),
+            )
+            entries.update(new_entries)
+
+        self._write_output(entries)
+
+        counts = {STATUS_ENRICHED: 0, STATUS_NOT_FOUND: 0, STATUS_SKIPPED: 0, STATUS_ERROR: 0}
+        for entry in entries.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+
+        return BatchResult(
+            job_id=self.job_id,
+            operation=self.operation.key,
+            total=len(self.records),
+            enriched=counts[STATUS_ENRICHED],
+            not_found=counts[STATUS_NOT_FOUND],
+            failed=counts[STATUS_ERROR],
+            skipped=counts[STATUS_SKIPPED],
+            resumed=resumed,
+            cached=sum(1 for e in new_entries.values() if e.get("cached")),
+            output_path=self.output_path,
+            elapsed=time.monotonic() - start,
+        )
+
+    def _write_output(self, entries: dict[int, dict[str, Any]]) -> None:
+        """Write input columns plus provider-prefixed result columns as CSV."""
+        prefix = self.operation.provider
+        input_columns: list[str] = []
+        for raw in self.raw_records:
+            for key in raw:
+                if key not in input_columns:
+                    input_columns.append(key)
+
+        result_columns: list[str] = []
+        for entry in entries.values():
+            for key in entry.get("data") or {}:
+                column = f"{prefix}_{key}"
+                if column not in result_columns:
+                    result_columns.append(column)
+
+        status_column = f"{prefix}_status"
+        fieldnames = [*input_columns, status_column, *result_columns]
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.output_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for i, raw in enumerate(self.raw_records):
+                entry = entries.get(i, {})
+                row = {k: v for k, v in raw.items() if k in input_columns}
+                row[status_column] = entry.get("status", "")
+                for key, value in (entry.get("data") or {}).items():
+                    row[f"{prefix}_{key}"] = value
+                writer.writerow(row)
+
+
+def run_batch_enrichment(
+    operation: EnrichmentOperation,
+    input_file: str,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> str:
+    """Run a batch enrichment job and return an agent-facing summary.
+
+    Args:
+        operation: The enrichment operation to run.
+        input_file: CSV/JSON/JSONL file (absolute, or relative to ./files/).
+        max_concurrency: Maximum in-flight requests.
+
+    Returns:
+        Summary string, or an error message.
+    """
+    try:
+        job = BatchJob(operation, resolve_input_path(input_file), max_concurrency=max_concurrency)
+    except (OSError, ValueError) as e:
+        return f"Error: {e}"
+
+    if not job.records:
+        return f"Error: No records found in {input_file}"
+
+    return job.run().summary()
@@ -0,0 +1,300 @@
+"""Persistent cache for paid enrichment lookups.
+
+Results are stored in ``.sdrbot/enrichment_cache.db`` keyed by provider,
+endpoint and a hash of the normalized request input, so the same email or
+domain is not billed twice across sessions. "No match" answers are cached
+too (with a shorter TTL) since providers usually charge for those as well.
+
+TTLs default per provider and can be overridden per service with the
+``cache_ttl_days`` / ``negative_cache_ttl_days`` service settings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import get_config_dir
+
+_DAY = 86_400
+
+# Default time-to-live for positive results, in days
+DEFAULT_TTL_DAYS = {
+    "apollo": 90,
+    "lusha": 90,
+    "hunter": 30,
+}
+FALLBACK_TTL_DAYS = 30
+
+# Default time-to-live for "no match" results, in days
+DEFAULT_NEGATIVE_TTL_DAYS = 7
+
+# Approximate credits billed per lookup, used for the "credits saved" counter
+CREDIT_COSTS = {
+    "apollo": 1.0,
+    "lusha": 1.0,
+    "hunter": 1.0,
+}
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize request input so equivalent lookups share a cache key."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if v not in (None, "", [], {})}
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def make_cache_key(params: dict[str, Any]) -> str:
+    """Hash normalized request parameters into a stable cache key."""
+    payload = json.dumps(_normalize(params), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached lookup result."""
+
+    value: Any
+    found: bool
+    created_at: float
+
+
+@dataclass
+class CacheStats:
+    """Session counters for cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    credits_saved: float = 0.0
+    by_provider: dict[str, dict[str, int]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, provider: str, hit: bool, found: bool = True) -> None:
+        """Record a lookup outcome (safe to call from worker threads)."""
+        with self._lock:
+            counters = self.by_provider.setdefault(provider, {"hits": 0, "misses": 0})
+            if hit:
+                self.hits += 1
+                counters["hits"] += 1
+                if not found:
+                    self.negative_hits += 1
+                self.credits_saved += CREDIT_COSTS.get(provider, 1.0)
+            else:
+                self.misses += 1
+                counters["misses"] += 1
+
+    @property
+    def lookups(self) -> int:
+        """Total lookups that went through the cache."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class EnrichmentCache:
+    """SQLite-backed enrichment result cache (safe to share across threads)."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS enrichment_cache (
+                provider TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                found INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (provider, endpoint, key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(
+        self,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        *,
+        now: float | None = None,
+    ) -> CacheEntry | None:
+        """Return a fresh cached entry, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, found, created_at FROM enrichment_cache "
+                "WHERE provider = ? AND endpoint = ? AND key = ?",
+                (provider, endpoint, make_cache_key(params)),
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, found, created_at = row
+        ttl = get_ttl_seconds(provider, found=bool(found))
+        if (now or time.time()) - created_at > ttl:
+            return None
+        return CacheEntry(
+            value=json.loads(value) if value is not None else None,
+            found=bool(found),
+            created_at=created_at,
+        )
+
+    def set(
+        self,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        value: Any,
+        *,
+        found: bool = True,
+    ) -> None:
+        """Store a lookup result (``found=False`` for negative results)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO enrichment_cache "
+                "(provider, endpoint, key, value, found, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    provider,
+                    endpoint,
+                    make_cache_key(params),
+                    json.dumps(value, default=str) if value is not None else None,
+                    int(found),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def clear(self, provider: str | None = None) -> int:
+        """Delete cached entries (all, or for one provider).
+
+        Returns:
+            Number of entries deleted.
+        """
+        with self._lock:
+            if provider:
+                cursor = self._conn.execute(
+                    "DELETE FROM enrichment_cache WHERE provider = ?", (provider,)
+                )
+            else:
+                cursor = self._conn.execute("DELETE FROM enrichment_cache")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of stored entries (including expired ones)."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM enrichment_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_ttl_seconds(provider: str, *, found: bool = True) -> float:
+    """Get the TTL for a provider's cached results.
+
+    Service settings (``cache_ttl_days`` / ``negative_cache_ttl_days``)
+    override the built-in defaults.
+    """
+    from sdrbot_cli.services.registry import load_config
+
+    config = load_config()
+    if found:
+        days = config.get_setting(
+            provider, "cache_ttl_days", DEFAULT_TTL_DAYS.get(provider, FALLBACK_TTL_DAYS)
+        )
+    else:
+        days = config.get_setting(provider, "negative_cache_ttl_days", DEFAULT_NEGATIVE_TTL_DAYS)
+    return float(days) * _DAY
+
+
+def _cache_db_path() -> Path:
+    """Return the path to the enrichment cache database."""
+    return get_config_dir() / "enrichment_cache.db"
+
+
+# Shared cache instance, re-opened if the working directory changes
+_cache: EnrichmentCache | None = None
+_cache_lock = threading.Lock()
+_stats = CacheStats()
+
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """Get the shared enrichment cache for the current project."""
+    global _cache
+    db_path = _cache_db_path()
+    with _cache_lock:
+        if _cache is None or _cache.db_path != db_path:
+            if _cache is not None:
+                _cache.close()
+            _cache = EnrichmentCache(db_path)
+        return _cache
+
+
+def reset_enrichment_cache() -> None:
+    """Close the shared cache and reset session counters (useful for testing)."""
+    global _cache, _stats
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        _stats = CacheStats()
+
+
+def get_cache_stats() -> CacheStats:
+    """Get this session's cache counters."""
+    return _stats
+
+
+def cached_lookup(
+    provider: str,
+    endpoint: str,
+    params: dict[str, Any],
+    fetch: Callable[[], Any],
+    *,
+    found: Callable[[Any], bool] = bool,
+) -> Any:
+    """Return a cached result for this lookup, or fetch and cache it.
+
+    Errors raised by ``fetch`` propagate and are never cached.
+
+    Args:
+        provider: Service name (e.g. "apollo").
+        endpoint: API endpoint or operation key.
+        params: Request input identifying the lookup.
+        fetch: Callable performing the real API call.
+        found: Predicate deciding whether a response is a positive match.
+
+    Returns:
+        The cached or freshly fetched response.
+    """
+    cache = get_enrichment_cache()
+    entry = cache.get(provider, endpoint, params)
+    if entry is not None:
+        _stats.record(provider, hit=True, found=entry.found)
+        return entry.value
+
+    _stats.record(provider, hit=False)
+    value = fetch()
+    cache.set(provider, endpoint, params, value, found=found(value))
+    return value
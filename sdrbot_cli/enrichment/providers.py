@@ -0,0 +1,387 @@
+"""Provider adapters for batch enrichment.
+
+Each adapter wraps one enrichment endpoint (Apollo, Hunter, Lusha) behind a
+common shape: a chunk of normalized input records goes in, a list of
+normalized results (or ``None`` for "no match") comes out in the same order.
+Bulk endpoints are used where the provider offers them.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Normalized input keys understood by every adapter
+INPUT_FIELDS = (
+    "email",
+    "first_name",
+    "last_name",
+    "name",
+    "organization_name",
+    "domain",
+    "linkedin_url",
+)
+
+# Output fields produced by person / company enrichment
+PERSON_FIELDS = (
+    "name",
+    "title",
+    "email",
+    "email_status",
+    "phone",
+    "company",
+    "domain",
+    "linkedin_url",
+    "seniority",
+    "location",
+)
+COMPANY_FIELDS = (
+    "company",
+    "domain",
+    "industry",
+    "employees",
+    "revenue",
+    "founded_year",
+    "linkedin_url",
+    "location",
+)
+
+
+@dataclass
+class EnrichmentOperation:
+    """A single enrichment endpoint usable by the batch engine.
+
+    Attributes:
+        key: Unique operation key (e.g. "apollo.people").
+        provider: Service name the operation bills against.
+        batch_size: Records sent per HTTP call (1 for single-record endpoints).
+        requires: Alternative sets of input fields; a record must satisfy one.
+        provides: Output fields the operation can fill (used by the waterfall).
+        call: Function mapping a chunk of inputs to results (None = no match).
+        options: Options that affect results (part of the job identity).
+    """
+
+    key: str
+    provider: str
+    batch_size: int
+    requires: tuple[tuple[str, ...], ...]
+    call: Callable[[list[dict[str, str]]], list[dict[str, Any] | None]]
+    provides: tuple[str, ...] = ()
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def accepts(self, record: dict[str, str]) -> bool:
+        """Check whether a record has enough input for this operation."""
+        return any(all(record.get(f) for f in combo) for combo in self.requires)
+
+    @property
+    def input_fields(self) -> tuple[str, ...]:
+        """All input fields the operation may send (identifies a lookup)."""
+        return tuple(f for f in INPUT_FIELDS if any(f in combo for combo in self.requires))
+
+
+def format_location(data: dict[str, Any]) -> str:
+    """Join a record's city/state/country into one display string."""
+    return ", ".join(filter(None, [data.get("city"), data.get("state"), data.get("country")]))
+
+
+def _compact(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty values so results stay small."""
+    return {k: v for k, v in data.items() if v not in (None, "", [], {})}
+
+
+# =============================================================================
+# APOLLO
+# =============================================================================
+
+
+def _apollo_person(person: dict[str, Any]) -> dict[str, Any]:
+    org = person.get("organization") or {}
+    phones = [
+        p.get("sanitized_number") or p.get("raw_number") for p in person.get("phone_numbers") or []
+    ]
+    name = person.get("name") or (
+        f"{person.get('first_name', '')} {person.get('last_name', '')}".strip()
+    )
+    return _compact(
+        {
+            "name": name,
+            "title": person.get("title"),
+            "email": person.get("email"),
+            "email_status": person.get("email_status"),
+            "personal_emails": ", ".join((person.get("personal_emails") or [])[:3]),
+            "phone": next(filter(None, phones), None),
+            "company": org.get("name"),
+            "domain": org.get("primary_domain"),
+            "linkedin_url": person.get("linkedin_url"),
+            "seniority": person.get("seniority"),
+            "location": format_location(person),
+        }
+    )
+
+
+def _apollo_org(org: dict[str, Any]) -> dict[str, Any]:
+    return _compact(
+        {
+            "company": org.get("name"),
+            "domain": org.get("primary_domain"),
+            "industry": org.get("industry"),
+            "employees": org.get("estimated_num_employees"),
+            "revenue": org.get("annual_revenue_printed"),
+            "founded_year": org.get("founded_year"),
+            "linkedin_url": org.get("linkedin_url"),
+            "location": format_location(org),
+        }
+    )
+
+
+def _apollo_people_operation(reveal_personal_emails: bool = False) -> EnrichmentOperation:
+    def call(chunk: list[dict[str, str]]) -> list[dict[str, Any] | None]:
+        from sdrbot_cli.services.apollo.tools import get_apollo
+
+        details = []
+        for rec in chunk:
+            detail = {k: rec[k] for k in INPUT_FIELDS if rec.get(k) and k != "name"}
+            if rec.get("name") and not (rec.get("first_name") or rec.get("last_name")):
+                detail["name"] = rec["name"]
+            details.append(detail)
+
+        response = get_apollo().post(
+            "/people/bulk_match",
+            json={"details": details, "reveal_personal_emails": reveal_personal_emails},
+        )
+        matches = response.get("matches") or []
+        return [
+            _apollo_person(matches[i]) if i < len(matches) and matches[i] else None
+            for i in range(len(chunk))
+        ]
+
+    return EnrichmentOperation(
+        key="apollo.people",
+        provider="apollo",
+        batch_size=10,
+        requires=(
+            ("email",),
+            ("linkedin_url",),
+            ("first_name", "last_name", "domain"),
+            ("first_name", "last_name", "organization_name"),
+            ("name", "domain"),
+            ("name", "organization_name"),
+        ),
+        call=call,
+        provides=PERSON_FIELDS,
+        options={"reveal_personal_emails": reveal_personal_emails},
+    )
+
+
+def _apollo_companies_operation() -> EnrichmentOperation:
+    def call(chunk: list[dict[str, str]]) -> list[dict[str, Any] | None]:
+        from sdrbot_cli.services.apollo.tools import get_apollo
+
+        domains = [rec["domain"].lower() for rec in chunk]
+        response = get_apollo().post("/organizations/bulk_enrich", json={"domains": domains})
+        by_domain = {}
+        for org in response.get("organizations") or []:
+            if org and org.get("primary_domain"):
+                by_domain[org["primary_domain"].lower()] = org
+        return [_apollo_org(by_domain[d]) if d in by_domain else None for d in domains]
+
+    return EnrichmentOperation(
+        key="apollo.companies",
+        provider="apollo",
+        batch_size=10,
+        requires=(("domain",),),
+        call=call,
+        provides=COMPANY_FIELDS,
+    )
+
+
+# =============================================================================
+# HUNTER (no bulk API - one record per request, fanned out concurrently)
+# =============================================================================
+
+
+def _hunter_email_finder_operation() -> EnrichmentOperation:
+    def call(chunk: list[dict[str, str]]) -> list[dict[str, Any] | None]:
+        from sdrbot_cli.services.hunter.tools import get_hunter
+
+        rec = chunk[0]
+        params = {"domain": rec.get("domain") or "", "company": rec.get("organization_name")}
+        if rec.get("first_name") and rec.get("last_name"):
+            params["first_name"] = rec["first_name"]
+            params["last_name"] = rec["last_name"]
+        else:
+            params["full_name"] = rec.get("name")
+        params = {k: v for k, v in params.items() if v}
+
+        data = get_hunter().request("GET", "/email-finder", params=params).get("data") or {}
+        if not data.get("email"):
+            return [None]
+        verification = data.get("verification") or {}
+        return [
+            _compact(
+                {
+                    "email": data.get("email"),
+                    "email_score": data.get("score"),
+                    "email_status": verification.get("status"),
+                    "title": data.get("position"),
+                    "phone": data.get("phone_number"),
+                    "linkedin_url": data.get("linkedin_url"),
+                }
+            )
+        ]
+
+    return EnrichmentOperation(
+        key="hunter.email_finder",
+        provider="hunter",
+        batch_size=1,
+        requires=(
+            ("first_name", "last_name", "domain"),
+            ("name", "domain"),
+            ("first_name", "last_name", "organization_name"),
+            ("name", "organization_name"),
+        ),
+        call=call,
+        provides=("email", "email_status", "title", "phone", "linkedin_url"),
+    )
+
+
+def _hunter_email_verifier_operation() -> EnrichmentOperation:
+    def call(chunk: list[dict[str, str]]) -> list[dict[str, Any] | None]:
+        from sdrbot_cli.services.hunter.tools import get_hunter
+
+        email = chunk[0]["email"]
+        data = get_hunter().request("GET", "/email-verifier", params={"email": email}).get("data")
+        if not data:
+            return [None]
+        return [
+            _compact(
+                {
+                    "email": email,
+                    "email_status": data.get("status"),
+                    "email_score": data.get("score"),
+                }
+            )
+        ]
+
+    return EnrichmentOperation(
+        key="hunter.email_verifier",
+        provider="hunter",
+        batch_size=1,
+        requires=(("email",),),
+        call=call,
+        provides=("email_status",),
+    )
+
+
+# =============================================================================
+# LUSHA
+# =============================================================================
+
+
+def _lusha_person(p: dict[str, Any]) -> dict[str, Any]:
+    emails = [e.get("email") for e in p.get("emailAddresses") or [] if e.get("email")]
+    phones = [
+        ph.get("internationalNumber") or ph.get("number") for ph in p.get("phoneNumbers") or []
+    ]
+    company = p.get("company") or {}
+    social = p.get("socialLinks") or p.get("social") or {}
+    return _compact(
+        {
+            "name": p.get("fullName"),
+            "title": p.get("jobTitle") if isinstance(p.get("jobTitle"), str) else None,
+            "email": emails[0] if emails else None,
+            "phone": next(filter(None, phones), None),
+            "company": company.get("name"),
+            "domain": company.get("domain") or company.get("fqdn"),
+            "linkedin_url": social.get("linkedin"),
+        }
+    )
+
+
+def _lusha_people_operation() -> EnrichmentOperation:
+    def call(chunk: list[dict[str, str]]) -> list[dict[str, Any] | None]:
+        from sdrbot_cli.services.lusha.tools import get_lusha
+
+        contacts = []
+        for i, rec in enumerate(chunk):
+            contact: dict[str, Any] = {"contactId": str(i)}
+            if rec.get("email"):
+                contact["email"] = rec["email"]
+            if rec.get("linkedin_url"):
+                contact["linkedinUrl"] = rec["linkedin_url"]
+            full_name = rec.get("name") or " ".join(
+                filter(None, [rec.get("first_name"), rec.get("last_name")])
+            )
+            if full_name:
+                contact["fullName"] = full_name
+            if rec.get("domain") or rec.get("organization_name"):
+                contact["companies"] = [
+                    _compact(
+                        {
+                            "domain": rec.get("domain"),
+                            "name": rec.get("organization_name"),
+                            "isCurrent": True,
+                        }
+                    )
+                ]
+            contacts.append(contact)
+
+        response = get_lusha().request("POST", "/v2/person", json={"contacts": contacts})
+        results_by_id = response.get("contacts") or {}
+        results: list[dict[str, Any] | None] = []
+        for i in range(len(chunk)):
+            entry = results_by_id.get(str(i)) or {}
+            data = entry.get("data")
+            results.append(_lusha_person(data) if data else None)
+        return results
+
+    return EnrichmentOperation(
+        key="lusha.people",
+        provider="lusha",
+        batch_size=100,
+        requires=(
+            ("email",),
+            ("linkedin_url",),
+            ("first_name", "last_name", "domain"),
+            ("first_name", "last_name", "organization_name"),
+            ("name", "domain"),
+            ("name", "organization_name"),
+        ),
+        call=call,
+        provides=("name", "title", "email", "phone", "company", "domain", "linkedin_url"),
+    )
+
+
+_OPERATION_FACTORIES: dict[str, Callable[..., EnrichmentOperation]] = {
+    "apollo.people": _apollo_people_operation,
+    "apollo.companies": _apollo_companies_operation,
+    "hunter.email_finder": _hunter_email_finder_operation,
+    "hunter.email_verifier": _hunter_email_verifier_operation,
+    "lusha.people": _lusha_people_operation,
+}
+
+
+def get_operation(key: str, **options: Any) -> EnrichmentOperation:
+    """Build an enrichment operation by key.
+
+    Args:
+        key: Operation key (e.g. "apollo.people").
+        **options: Operation-specific options (e.g. reveal_personal_emails).
+
+    Returns:
+        Configured EnrichmentOperation.
+
+    Raises:
+        ValueError: If the key is unknown.
+    """
+    factory = _OPERATION_FACTORIES.get(key)
+    if factory is None:
+        raise ValueError(
+            f"Unknown enrichment operation: {key}. "
+            f"Valid options: {', '.join(sorted(_OPERATION_FACTORIES))}"
+        )
+    return factory(**options)
+
+
+def list_operations() -> list[str]:
+    """List available operation keys."""
+    return sorted(_OPERATION_FACTORIES)
@@ -0,0 +1,436 @@
+"""Waterfall enrichment across providers.
+
+Runs a lead list through an ordered sequence of enrichment operations. Each
+stage only receives the leads that are still missing a required field, so
+the cheaper (or more precise) providers answer first and later providers are
+billed only for the gaps. Operations grouped in the same stage run in
+parallel; their answers are merged in the order they are listed.
+
+Every filled field records which operation supplied it (``<field>_source``).
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import settings
+from sdrbot_cli.enrichment.batch import (
+    DEFAULT_MAX_CONCURRENCY,
+    STATUS_ENRICHED,
+    STATUS_ERROR,
+    enrich_records,
+    load_records,
+    normalize_record,
+    resolve_input_path,
+)
+from sdrbot_cli.enrichment.providers import INPUT_FIELDS, EnrichmentOperation, get_operation
+
+# Built-in provider orders. Each inner list is one stage (run in parallel).
+PRESET_ORDERS = {
+    # Cheapest credits first, Lusha (phone numbers) last
+    "cost": [
+        ["apollo.people"],
+        ["hunter.email_finder"],
+        ["hunter.email_verifier"],
+        ["lusha.people"],
+    ],
+    # Ask both contact databases up front, then fill and verify emails
+    "precision": [
+        ["lusha.people", "apollo.people"],
+        ["hunter.email_finder"],
+        ["hunter.email_verifier"],
+    ],
+    # Everything at once, verification last
+    "speed": [
+        ["apollo.people", "lusha.people", "hunter.email_finder"],
+        ["hunter.email_verifier"],
+    ],
+}
+DEFAULT_ORDER = "cost"
+
+# Shorthands accepted in custom orders
+_OPERATION_ALIASES = {
+    "apollo": "apollo.people",
+    "lusha": "lusha.people",
+    "hunter": "hunter.email_finder",
+    "verify": "hunter.email_verifier",
+}
+
+DEFAULT_REQUIRED_FIELDS = ("email", "verified_email", "phone", "title")
+
+# Statuses meaning the email address was confirmed deliverable
+VERIFIED_EMAIL_STATUSES = {"verified", "valid", "deliverable"}
+
+# Input fields that later stages may use from earlier answers
+_CHAINED_FIELDS = ("email", "domain", "linkedin_url")
+
+
+def parse_order(order: str) -> list[list[str]]:
+    """Parse a preset name or custom order into stages of operation keys.
+
+    Custom orders separate stages with "," (or ">") and parallel operations
+    within a stage with "+", e.g. ``"apollo+lusha, hunter, verify"``.
+
+    Raises:
+        ValueError: If the order is empty or names an unknown operation.
+    """
+    order = (order or DEFAULT_ORDER).strip().lower()
+    if order in PRESET_ORDERS:
+        return [list(stage) for stage in PRESET_ORDERS[order]]
+
+    stages = []
+    for part in order.replace(">", ",").split(","):
+        stage = []
+        for name in part.split("+"):
+            name = name.strip()
+            if not name:
+                continue
+            key = _OPERATION_ALIASES.get(name, name)
+            get_operation(key)  # Validate
+            stage.append(key)
+        if stage:
+            stages.append(stage)
+
+    if not stages:
+        raise ValueError(
+            f"Empty enrichment order. Use a preset ({', '.join(PRESET_ORDERS)}) "
+            "or a list like 'apollo+lusha, hunter, verify'"
+        )
+    return stages
+
+
+def _needed_outputs(required: str, state: LeadState) -> tuple[str, ...]:
+    """Map a missing required field onto the operation outputs that can fill it.
+
+    A lead that already has an email only needs it verified, so finders are
+    not billed again just because the status is missing.
+    """
+    if required == "verified_email":
+        return ("email_status",) if state.fields.get("email") else ("email", "email_status")
+    return (required,)
+
+
+def _useful_outputs(operation: EnrichmentOperation, state: LeadState) -> set[str]:
+    """Outputs of ``operation`` that can still help a lead.
+
+    Once a lead has an email, only operations that look that address up can
+    verify it; a finder's ``email_status`` describes whatever it found instead.
+    """
+    provides = set(operation.provides)
+    if state.fields.get("email") and not any("email" in combo for combo in operation.requires):
+        provides.discard("email_status")
+    return provides
+
+
+@dataclass
+class LeadState:
+    """Merged enrichment result for one lead."""
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
+
+    def has(self, required: str) -> bool:
+        """Check whether a required field is filled."""
+        if required == "verified_email":
+            status = str(self.fields.get("email_status", "")).lower()
+            return bool(self.fields.get("email")) and status in VERIFIED_EMAIL_STATUSES
+        return bool(self.fields.get(required))
+
+    def missing(self, required: tuple[str, ...]) -> list[str]:
+        """Required fields that are still empty."""
+        return [name for name in required if not self.has(name)]
+
+    def merge(self, data: dict[str, Any], source: str) -> None:
+        """Merge an operation's answer; earlier sources keep their values.
+
+        ``email_status`` is only taken when it describes the merged email, and
+        may replace an earlier status that did not verify the address.
+        """
+        for key, value in data.items():
+            if key in ("email_status", "email_score") or key in self.fields:
+                continue
+            self.fields[key] = value
+            self.sources[key] = source
+
+        status = data.get("email_status")
+        email = self.fields.get("email")
+        if not status or not email or data.get("email", email) != email:
+            return
+        if self.has("verified_email"):
+            return
+        self.fields["email_status"] = status
+        self.sources["email_status"] = source
+        if data.get("email_score") is not None:
+            self.fields["email_score"] = data["email_score"]
+            self.sources["email_score"] = source
+
+
+@dataclass
+class WaterfallResult:
+    """Outcome of a waterfall enrichment run."""
+
+    order: list[list[str]]
+    required: tuple[str, ...]
+    total: int
+    complete: int
+    partial: int
+    empty: int
+    fill_counts: dict[str, int]
+    calls: dict[str, dict[str, int]]
+    output_path: Path
+    elapsed: float
+
+    def summary(self) -> str:
+        """Compact, agent-facing summary of the run."""
+        stages = " -> ".join(" + ".join(stage) for stage in self.order)
+        lines = [
+            f"Waterfall enrichment ({stages}) finished in {self.elapsed:.1f}s:",
+            f"- Total leads: {self.total}",
+            f"- Complete ({', '.join(self.required)}): {self.complete}",
+            f"- Partially enriched: {self.partial}",
+            f"- Nothing found: {self.empty}",
+            "Fill rates:",
+        ]
+        for name in self.required:
+            count = self.fill_counts.get(name, 0)
+            pct = 100 * count / self.total if self.total else 0
+            lines.append(f"- {name}: {count}/{self.total} ({pct:.0f}%)")
+        lines.append("Provider lookups:")
+        for key, counts in self.calls.items():
+            detail = f"{counts['sent']} sent, {counts['found']} found"
+            if counts["cached"]:
+                detail += f", {counts['cached']} from cache"
+            if counts["failed"]:
+                detail += f", {counts['failed']} failed"
+            lines.append(f"- {key}: {detail}")
+        lines.append(f"Results written to: {self.output_path}")
+        if any(c["failed"] for c in self.calls.values()):
+            lines.append("Re-run with the same file to retry; cached answers are not billed again.")
+        return "\n".join(lines)
+
+
+class WaterfallJob:
+    """Waterfall enrichment of one input file."""
+
+    def __init__(
+        self,
+        input_path: Path,
+        order: list[list[str]],
+        *,
+        required: tuple[str, ...] = DEFAULT_REQUIRED_FIELDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        output_dir: Path | None = None,
+    ) -> None:
+        self.input_path = input_path
+        self.order = order
+        self.required = required
+        self.max_concurrency = max_concurrency
+        self.raw_records = load_records(input_path)
+        self.records = [normalize_record(r) for r in self.raw_records]
+        self.output_path = (
+            output_dir or settings.get_files_dir() / "enrichment"
+        ) / f"{input_path.stem}.waterfall.csv"
+
+    def _seed_states(self) -> list[LeadState]:
+        """Start each lead from the input values it already has."""
+        states = []
+        for rec in self.records:
+            state = LeadState()
+            for key in _CHAINED_FIELDS:
+                if rec.get(key):
+                    state.fields[key] = rec[key]
+                    state.sources[key] = "input"
+            states.append(state)
+        return states
+
+    def _eligible(
+        self, operation: EnrichmentOperation, states: list[LeadState]
+    ) -> tuple[list[dict[str, str]], list[int]]:
+        """Select leads this operation can still help with.
+
+        Returns the lookup records (input plus chained answers) and the
+        indices of the leads to send.
+        """
+        lookups: list[dict[str, str]] = []
+        indices: list[int] = []
+        for i, (rec, state) in enumerate(zip(self.records, states, strict=True)):
+            chained = {k: str(state.fields[k]) for k in _CHAINED_FIELDS if state.fields.get(k)}
+            lookup = {**rec, **chained}
+            lookups.append(lookup)
+
+            wanted = {
+                out for name in state.missing(self.required) for out in _needed_outputs(name, state)
+            }
+            if not wanted & _useful_outputs(operation, state):
+                continue
+            if operation.accepts(lookup):
+                indices.append(i)
+        return lookups, indices
+
+    def run(self) -> WaterfallResult:
+        """Run every stage and write the merged output file."""
+        start = time.monotonic()
+        states = self._seed_states()
+        calls: dict[str, dict[str, int]] = {}
+
+        for stage in self.order:
+            operations = [get_operation(key) for key in stage]
+            selections = [self._eligible(op, states) for op in operations]
+
+            with ThreadPoolExecutor(max_workers=len(operations)) as pool:
+                futures = [
+                    pool.submit(
+                        enrich_records,
+                        op,
+                        lookups,
+                        indices,
+                        max_concurrency=self.max_concurrency,
+                    )
+                    for op, (lookups, indices) in zip(operations, selections, strict=True)
+                ]
+                stage_results = [future.result() for future in futures]
+
+            # Merge in listed order so earlier operations win ties
+            for op, entries in zip(operations, stage_results, strict=True):
+                counts = calls.setdefault(op.key, {"sent": 0, "found": 0, "cached": 0, "failed": 0})
+                for i, entry in sorted(entries.items()):
+                    counts["sent"] += 1
+                    counts["cached"] += 1 if entry.get("cached") else 0
+                    if entry["status"] == STATUS_ERROR:
+                        counts["failed"] += 1
+                    elif entry["status"] == STATUS_ENRICHED:
+                        counts["found"] += 1
+                        states[i].merge(entry.get("data") or {}, op.key)
+
+        self._write_output(states)
+
+        complete = partial = empty = 0
+        fill_counts = {name: 0 for name in self.required}
+        for state in states:
+            for name in self.required:
+                fill_counts[name] += 1 if state.has(name) else 0
+            if not state.missing(self.required):
+                complete += 1
+            elif any(source != "input" for source in state.sources.values()):
+                partial += 1
+            else:
+                empty += 1
+
+        return WaterfallResult(
+            order=self.order,
+            required=self.required,
+            total=len(self.records),
+            complete=complete,
+            partial=partial,
+            empty=empty,
+            fill_counts=fill_counts,
+            calls=calls,
+            output_path=self.output_path,
+            elapsed=time.monotonic() - start,
+        )
+
+    def _write_output(self, states: list[LeadState]) -> None:
+        """Write input columns plus merged fields and their sources as CSV."""
+        input_columns: list[str] = []
+        for raw in self.raw_records:
+            for key in raw:
+                if key not in input_columns:
+                    input_columns.append(key)
+
+        result_fields: list[str] = []
+        for state in states:
+            for key in state.fields:
+                if key not in result_fields:
+                    result_fields.append(key)
+
+        result_columns = []
+        for key in result_fields:
+            result_columns += [f"enriched_{key}", f"{key}_source"]
+        fieldnames = [*input_columns, "waterfall_status", *result_columns]
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.output_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for raw, state in zip(self.raw_records, states, strict=True):
+                row = {k: v for k, v in raw.items() if k in input_columns}
+                missing = state.missing(self.required)
+                row["waterfall_status"] = (
+                    "complete" if not missing else f"missing {', '.join(missing)}"
+                )
+                for key, value in state.fields.items():
+                    row[f"enriched_{key}"] = value
+                    row[f"{key}_source"] = state.sources.get(key, "")
+                writer.writerow(row)
+
+
+def _enabled_stages(stages: list[list[str]]) -> list[list[str]]:
+    """Drop operations whose provider service is not enabled."""
+    from sdrbot_cli.services.registry import load_config
+
+    config = load_config()
+    enabled = []
+    for stage in stages:
+        kept = [key for key in stage if config.is_enabled(key.split(".", 1)[0])]
+        if kept:
+            enabled.append(kept)
+    return enabled
+
+
+def run_waterfall_enrichment(
+    input_file: str,
+    order: str = DEFAULT_ORDER,
+    required_fields: str = ",".join(DEFAULT_REQUIRED_FIELDS),
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> str:
+    """Run a waterfall enrichment job and return an agent-facing summary.
+
+    Args:
+        input_file: CSV/JSON/JSONL file (absolute, or relative to ./files/).
+        order: Preset name or custom stage list (see ``parse_order``).
+        required_fields: Comma-separated fields a lead needs to be complete.
+        max_concurrency: Maximum in-flight requests per operation.
+
+    Returns:
+        Summary string, or an error message.
+    """
+    try:
+        stages = parse_order(order)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    stages = _enabled_stages(stages)
+    if not stages:
+        return (
+            "Error: None of the providers in this order are enabled. "
+            "Enable apollo, hunter or lusha with /services enable <name>"
+        )
+
+    required = tuple(f.strip() for f in required_fields.split(",") if f.strip())
+    known = {"verified_email", *INPUT_FIELDS}
+    for key in {k for stage in stages for k in stage}:
+        known.update(get_operation(key).provides)
+    unknown = [f for f in required if f not in known]
+    if not required or unknown:
+        return f"Error: Unknown required fields: {', '.join(unknown) or '(none given)'}"
+
+    try:
+        job = WaterfallJob(
+            resolve_input_path(input_file),
+            stages,
+            required=required,
+            max_concurrency=max_concurrency,
+        )
+    except (OSError, ValueError) as e:
+        return f"Error: {e}"
+
+    if not job.records:
+        return f"Error: No records found in {input_file}"
+
+    return job.run().summary()
@@ -26,9 +26,10 @@ from rich.markdown import Markdown as RichMarkdown
 from rich.text import Text
 
 from sdrbot_cli.config import COLORS
-from sdrbot_cli.file_ops import FileOpTracker
+from sdrbot_cli.file_ops import FileOpTracker, run_off_loop
 from sdrbot_cli.image_utils import ImageData, create_multimodal_content
 from sdrbot_cli.input import parse_file_mentions
+from sdrbot_cli.streaming_markdown import MarkdownStream
 from sdrbot_cli.tools import get_schema_modifying_tools
 from sdrbot_cli.ui import (
     TokenTracker,
@@ -94,6 +95,7 @@ async def execute_task(
     token_tracker: TokenTracker | None = None,
     backend=None,
     ui_callback: Callable | None = None,
+    stream_callback: Callable | None = None,
     todo_callback: Callable | None = None,
     approval_callback: Callable | None = None,
     auto_approve_callback: Callable | None = None,
@@ -111,6 +113,8 @@ async def execute_task(
         token_tracker: Optional token usage tracker
         backend: Optional backend for file operations
         ui_callback: Callback for UI updates
+        stream_callback: Callback previewing the open block of a streaming reply
+            (None once it's written); without it only completed blocks are shown
         todo_callback: Callback for todo list updates
         approval_callback: Callback for tool approval requests
         auto_approve_callback: Callback for auto-approve state changes
@@ -194,23 +198,38 @@ async def execute_task(
     displayed_tool_ids = set()
     # Buffer partial tool-call chunks keyed by streaming index
     tool_call_buffers: dict[str | int, dict] = {}
-    # Buffer assistant text so we can render complete markdown segments
-    pending_text = ""
+    # Assistant text is rendered block by block as each markdown block completes
+    markdown_stream = MarkdownStream(Markdown)
 
-    def flush_text_buffer(*, final: bool = False) -> None:
-        """Flush accumulated assistant text as rendered markdown when appropriate."""
-        nonlocal pending_text, spinner_active, has_responded
-        if not final or not pending_text.strip():
+    def show_text(blocks: list) -> None:
+        nonlocal spinner_active, has_responded
+        if not blocks:
             return
         if spinner_active:
             status.stop()
             spinner_active = False
-        if not has_responded:
-            has_responded = True
-        markdown = Markdown(pending_text.rstrip())
+        has_responded = True
         if ui_callback:
-            ui_callback(markdown)
-        pending_text = ""
+            for block in blocks:
+                ui_callback(block)
+
+    def stream_text(text: str) -> None:
+        """Write the blocks ``text`` completes and preview the open one."""
+        show_text(markdown_stream.feed(text))
+        if stream_callback:
+            tail = markdown_stream.tail()
+            if tail is not None:
+                stream_callback(tail)
+
+    def flush_text_buffer(*, final: bool = False) -> None:
+        """Flush accumulated assistant text as rendered markdown when appropriate."""
+        nonlocal markdown_stream
+        if not final:
+            return
+        if stream_callback and markdown_stream.previewing:
+            stream_callback(None)
+        show_text(markdown_stream.finish())
+        markdown_stream = MarkdownStream(Markdown)
 
     # Stream input - may need to loop if there are interrupts
     # Use multimodal content format if images are attached
@@ -331,7 +350,7 @@ async def execute_task(
                         tool_name = getattr(message, "name", "")
                         tool_status = getattr(message, "status", "success")
                         tool_content = format_tool_message_content(message.content)
-                        record = file_op_tracker.complete_with_message(message)
+                        record = await file_op_tracker.acomplete_with_message(message)
 
                         # Track schema-modifying tools for auto-reload
                         # Only trigger if tool succeeded (no error in response)
@@ -368,7 +387,8 @@ async def execute_task(
                                 status.stop()
                                 spinner_active = False
                             if ui_callback:
-                                for renderable in render_file_operation(record):
+                                renderables = await run_off_loop(render_file_operation, record)
+                                for renderable in renderables:
                                     ui_callback(renderable)
                             if not spinner_active:
                                 status.start()
@@ -427,7 +447,7 @@ async def execute_task(
                         if block_type == "text":
                             text = block.get("text", "")
                             if text:
-                                pending_text += text
+                                stream_text(text)
 
                         # Handle reasoning blocks
                         elif block_type == "reasoning":
@@ -504,11 +524,11 @@ async def execute_task(
                             if buffer_id is not None:
                                 if buffer_id not in displayed_tool_ids:
                                     displayed_tool_ids.add(buffer_id)
-                                    file_op_tracker.start_operation(
+                                    await file_op_tracker.astart_operation(
                                         buffer_name, parsed_args, buffer_id
                                     )
                                 else:
-                                    file_op_tracker.update_args(buffer_id, parsed_args)
+                                    await file_op_tracker.aupdate_args(buffer_id, parsed_args)
                             tool_call_buffers.pop(buffer_key, None)
                             icon = tool_icons.get(buffer_name, "🔧")
 
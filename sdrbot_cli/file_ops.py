@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import difflib
+import itertools
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
-
-from deepagents.backends.utils import perform_string_replacement
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from sdrbot_cli.config import settings
 
@@ -16,6 +20,15 @@ if TYPE_CHECKING:
 
 FileOpStatus = Literal["pending", "success", "error"]
 
+# Files with more lines than this (before and after together) use patience diff
+FAST_DIFF_LINES = 2000
+# Gaps without anchors up to this many line pairs are still diffed with difflib
+_SMALL_GAP = 250_000
+# Files larger than this aren't snapshotted or diffed
+MAX_SNAPSHOT_BYTES = 4 * 1024 * 1024
+
+T = TypeVar("T")
+
 
 @dataclass
 class ApprovalPreview:
@@ -43,6 +56,184 @@ def _count_lines(text: str) -> int:
     return len(text.splitlines())
 
 
+class _PatienceMatcher(difflib.SequenceMatcher):
+    """SequenceMatcher that aligns lines with patience diff.
+
+    ``difflib``'s matcher slows down badly on long files with many changes.
+    Patience diff anchors on lines that occur exactly once on both sides and
+    recurses between the anchors, comparing lines by small integer ids, which
+    keeps large files close to linear. Gaps without anchors fall back to
+    ``difflib`` when small, and are treated as replaced otherwise.
+    """
+
+    def __init__(self, a: list[str], b: list[str]) -> None:
+        # Skip SequenceMatcher's index of b; only the opcode methods are used
+        self.a = a
+        self.b = b
+        self.matching_blocks = None
+        self.opcodes = None
+
+    def get_matching_blocks(self) -> list[difflib.Match]:
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+        ids: dict[str, int] = {}
+        a = [ids.setdefault(line, len(ids)) for line in self.a]
+        b = [ids.setdefault(line, len(ids)) for line in self.b]
+
+        blocks = []
+        ranges = [(0, len(a), 0, len(b))]
+        while ranges:
+            alo, ahi, blo, bhi = ranges.pop()
+            start = alo
+            while alo < ahi and blo < bhi and a[alo] == b[blo]:
+                alo += 1
+                blo += 1
+            if alo > start:
+                blocks.append((start, blo - (alo - start), alo - start))
+            end = ahi
+            while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+                ahi -= 1
+                bhi -= 1
+            if ahi < end:
+                blocks.append((ahi, bhi, end - ahi))
+            if alo == ahi or blo == bhi:
+                continue
+
+            anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+            if anchors:
+                for i, j in anchors:
+                    ranges.append((alo, i, blo, j))
+                    blocks.append((i, j, 1))
+                    alo, blo = i + 1, j + 1
+                ranges.append((alo, ahi, blo, bhi))
+            elif (ahi - alo) * (bhi - blo) <= _SMALL_GAP:
+                matcher = difflib.SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+                blocks.extend((alo + i, blo + j, n) for i, j, n in matcher.get_matching_blocks())
+
+        merged: list[tuple[int, int, int]] = []
+        for i, j, n in sorted(blocks):
+            if not n:
+                continue
+            if merged and merged[-1][0] + merged[-1][2] == i and merged[-1][1] + merged[-1][2] == j:
+                merged[-1] = (merged[-1][0], merged[-1][1], merged[-1][2] + n)
+            else:
+                merged.append((i, j, n))
+        merged.append((len(a), len(b), 0))
+        self.matching_blocks = [difflib.Match(*block) for block in merged]
+        return self.matching_blocks
+
+
+def _unique_anchors(
+    a: list[int], b: list[int], alo: int, ahi: int, blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """Longest run of lines unique to both ranges that appear in the same order."""
+    a_counts = Counter(a[alo:ahi])
+    b_counts = Counter(b[blo:bhi])
+    b_index = {b[j]: j for j in range(blo, bhi) if b_counts[b[j]] == 1}
+    pairs = [(i, b_index[a[i]]) for i in range(alo, ahi) if a_counts[a[i]] == 1 and a[i] in b_index]
+
+    # Longest increasing subsequence of b positions (patience sorting)
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    previous = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pile = bisect.bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_pairs.append(k)
+        else:
+            tails[pile] = j
+            tail_pairs[pile] = k
+        previous[k] = tail_pairs[pile - 1] if pile else -1
+
+    anchors = []
+    k = tail_pairs[-1] if tail_pairs else -1
+    while k >= 0:
+        anchors.append(pairs[k])
+        k = previous[k]
+    return anchors[::-1]
+
+
+def _format_range(start: int, stop: int) -> str:
+    """A hunk range as ``difflib.unified_diff`` writes it."""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start + 1 if length else start},{length}"
+
+
+@dataclass
+class FileDiff:
+    """A unified diff and the number of lines it adds and removes."""
+
+    diff: str | None
+    added: int = 0
+    removed: int = 0
+
+
+def diff_contents(
+    before: str,
+    after: str,
+    display_path: str,
+    *,
+    max_lines: int | None = 800,
+    context_lines: int = 3,
+) -> FileDiff:
+    """Diff two versions of a file.
+
+    Files with more than ``FAST_DIFF_LINES`` lines (both sides together) are
+    compared with patience diff. Line counts cover the whole change even when
+    the diff text is truncated.
+
+    Args:
+        before: Original content
+        after: New content
+        display_path: Path for display in diff headers
+        max_lines: Maximum number of diff lines (None for unlimited)
+        context_lines: Number of context lines around changes (default 3)
+
+    Returns:
+        The diff (None if there are no changes) and its line counts
+    """
+    before_lines = before.splitlines()
+    after_lines = after.splitlines()
+    if len(before_lines) + len(after_lines) > FAST_DIFF_LINES:
+        matcher: difflib.SequenceMatcher = _PatienceMatcher(before_lines, after_lines)
+    else:
+        matcher = difflib.SequenceMatcher(None, before_lines, after_lines)
+
+    result = FileDiff(diff=None)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            result.removed += i2 - i1
+            result.added += j2 - j1
+    if not result.added and not result.removed:
+        return result
+
+    def unified() -> Iterator[str]:
+        yield f"--- {display_path} (before)"
+        yield f"+++ {display_path} (after)"
+        for group in matcher.get_grouped_opcodes(context_lines):
+            first, last = group[0], group[-1]
+            yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    yield from (f" {line}" for line in before_lines[i1:i2])
+                    continue
+                yield from (f"-{line}" for line in before_lines[i1:i2])
+                yield from (f"+{line}" for line in after_lines[j1:j2])
+
+    if max_lines is None:
+        result.diff = "\n".join(unified())
+        return result
+    diff_lines = list(itertools.islice(unified(), max_lines + 1))
+    if len(diff_lines) > max_lines:
+        diff_lines = diff_lines[: max_lines - 1]
+        diff_lines.append("...")
+    result.diff = "\n".join(diff_lines)
+    return result
+
+
 def compute_unified_diff(
     before: str,
     after: str,
@@ -63,25 +254,9 @@ def compute_unified_diff(
     Returns:
         Unified diff string or None if no changes
     """
-    before_lines = before.splitlines()
-    after_lines = after.splitlines()
-    diff_lines = list(
-        difflib.unified_diff(
-            before_lines,
-            after_lines,
-            fromfile=f"{display_path} (before)",
-            tofile=f"{display_path} (after)",
-            lineterm="",
-            n=context_lines,
-        )
-    )
-    if not diff_lines:
-        return None
-    if max_lines is not None and len(diff_lines) > max_lines:
-        truncated = diff_lines[: max_lines - 1]
-        truncated.append("...")
-        return "\n".join(truncated)
-    return "\n".join(diff_lines)
+    return diff_contents(
+        before, after, display_path, max_lines=max_lines, context_lines=context_lines
+    ).diff
 
 
 @dataclass
@@ -114,6 +289,8 @@ class FileOperationRecord:
     after_content: str | None = None
     read_output: str | None = None
     hitl_approved: bool = False
+    # The file was over MAX_SNAPSHOT_BYTES, so there's no before/after diff
+    snapshot_skipped: bool = False
 
 
 def resolve_physical_path(path_str: str | None, assistant_id: str | None) -> Path | None:
@@ -198,6 +375,9 @@ def build_approval_preview(
         old_string = str(args.get("old_string", ""))
         new_string = str(args.get("new_string", ""))
         replace_all = bool(args.get("replace_all", False))
+        # deepagents pulls in the model SDKs; keep it off the startup path
+        from deepagents.backends.utils import perform_string_replacement
+
         replacement = perform_string_replacement(before, old_string, new_string, replace_all)
         if isinstance(replacement, str):
             return ApprovalPreview(
@@ -236,8 +416,31 @@ def build_approval_preview(
     return None
 
 
+_executor: ThreadPoolExecutor | None = None
+
+
+def _file_op_executor() -> ThreadPoolExecutor:
+    """The worker thread file snapshots and diffs run on, off the UI thread.
+
+    One worker keeps a tracker's operations in order.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-ops")
+    return _executor
+
+
+async def run_off_loop(func: Callable[..., T], *args: Any) -> T:
+    """Run ``func(*args)`` on the file operation worker and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_file_op_executor(), func, *args)
+
+
 class FileOpTracker:
-    """Collect file operation metrics during a CLI interaction."""
+    """Collect file operation metrics during a CLI interaction.
+
+    Snapshots and diffs read whole files; the streaming loop calls the async
+    ``a*`` methods, which run the work on a worker thread.
+    """
 
     def __init__(self, *, assistant_id: str | None, backend: BACKEND_TYPES | None = None) -> None:
         """Initialize the tracker."""
@@ -261,21 +464,8 @@ class FileOpTracker:
             args=args,
         )
         if tool_name in {"write_file", "edit_file"}:
-            if self.backend and path_str:
-                try:
-                    responses = self.backend.download_files([path_str])
-                    if (
-                        responses
-                        and responses[0].content is not None
-                        and responses[0].error is None
-                    ):
-                        record.before_content = responses[0].content.decode("utf-8")
-                    else:
-                        record.before_content = ""
-                except (OSError, UnicodeDecodeError, AttributeError):
-                    record.before_content = ""
-            elif record.physical_path:
-                record.before_content = _safe_read(record.physical_path) or ""
+            if (self.backend and path_str) or record.physical_path:
+                record.before_content = self._read_content(record, path_str) or ""
         self.active[tool_call_id] = record
 
     def update_args(self, tool_call_id: str, args: dict[str, Any]) -> None:
@@ -292,21 +482,8 @@ class FileOpTracker:
             if path_str:
                 record.display_path = format_display_path(path_str)
                 record.physical_path = resolve_physical_path(path_str, self.assistant_id)
-                if self.backend:
-                    try:
-                        responses = self.backend.download_files([path_str])
-                        if (
-                            responses
-                            and responses[0].content is not None
-                            and responses[0].error is None
-                        ):
-                            record.before_content = responses[0].content.decode("utf-8")
-                        else:
-                            record.before_content = ""
-                    except (OSError, UnicodeDecodeError, AttributeError):
-                        record.before_content = ""
-                elif record.physical_path:
-                    record.before_content = _safe_read(record.physical_path) or ""
+                if self.backend or record.physical_path:
+                    record.before_content = self._read_content(record, path_str) or ""
 
     def complete_with_message(self, tool_message: Any) -> FileOperationRecord | None:
         tool_call_id = getattr(tool_message, "tool_call_id", None)
@@ -357,45 +534,29 @@ class FileOpTracker:
         else:
             # For write/edit operations, read back from backend (or local filesystem)
             self._populate_after_content(record)
+            if record.snapshot_skipped:
+                # Too large to diff; report the size only
+                if record.after_content is not None:
+                    record.metrics.lines_written = _count_lines(record.after_content)
+                    record.metrics.bytes_written = len(record.after_content.encode("utf-8"))
+                self._finalize(record)
+                return record
             if record.after_content is None:
                 record.status = "error"
                 record.error = "Could not read updated file content."
                 self._finalize(record)
                 return record
             record.metrics.lines_written = _count_lines(record.after_content)
-            before_lines = _count_lines(record.before_content or "")
-            diff = compute_unified_diff(
+            diff = diff_contents(
                 record.before_content or "",
                 record.after_content,
                 record.display_path,
                 max_lines=100,
             )
-            record.diff = diff
-            if diff:
-                additions = sum(
-                    1
-                    for line in diff.splitlines()
-                    if line.startswith("+") and not line.startswith("+++")
-                )
-                deletions = sum(
-                    1
-                    for line in diff.splitlines()
-                    if line.startswith("-") and not line.startswith("---")
-                )
-                record.metrics.lines_added = additions
-                record.metrics.lines_removed = deletions
-            elif record.tool_name == "write_file" and (record.before_content or "") == "":
-                record.metrics.lines_added = record.metrics.lines_written
+            record.diff = diff.diff
+            record.metrics.lines_added = diff.added
+            record.metrics.lines_removed = diff.removed
             record.metrics.bytes_written = len(record.after_content.encode("utf-8"))
-            if record.diff is None and (record.before_content or "") != record.after_content:
-                record.diff = compute_unified_diff(
-                    record.before_content or "",
-                    record.after_content,
-                    record.display_path,
-                    max_lines=100,
-                )
-            if record.diff is None and before_lines != record.metrics.lines_written:
-                record.metrics.lines_added = max(record.metrics.lines_written - before_lines, 0)
 
         self._finalize(record)
         return record
@@ -414,30 +575,61 @@ class FileOpTracker:
                     record.hitl_approved = True
 
     def _populate_after_content(self, record: FileOperationRecord) -> None:
-        # Use backend if available (works for any BackendProtocol implementation)
+        file_path = record.args.get("file_path") or record.args.get("path")
+        record.after_content = self._read_content(record, str(file_path or ""))
+
+    def _read_content(self, record: FileOperationRecord, path_str: str) -> str | None:
+        """Read a file's current content for a snapshot.
+
+        Uses the backend if available (works for any BackendProtocol
+        implementation), else the local filesystem.
+
+        Returns:
+            The content, or None if it can't be read or is over
+            ``MAX_SNAPSHOT_BYTES`` (then ``record.snapshot_skipped`` is set and
+            ``record.metrics.bytes_written`` holds the size)
+        """
         if self.backend:
+            if not path_str:
+                return None
             try:
-                file_path = record.args.get("file_path") or record.args.get("path")
-                if file_path:
-                    responses = self.backend.download_files([file_path])
-                    if (
-                        responses
-                        and responses[0].content is not None
-                        and responses[0].error is None
-                    ):
-                        record.after_content = responses[0].content.decode("utf-8")
-                    else:
-                        record.after_content = None
-                else:
-                    record.after_content = None
+                responses = self.backend.download_files([path_str])
+                if not responses or responses[0].content is None or responses[0].error is not None:
+                    return None
+                data = responses[0].content
+                if len(data) > MAX_SNAPSHOT_BYTES:
+                    record.snapshot_skipped = True
+                    record.metrics.bytes_written = len(data)
+                    return None
+                return data.decode("utf-8")
             except (OSError, UnicodeDecodeError, AttributeError):
-                record.after_content = None
-        else:
-            # Fallback: direct filesystem read when no backend provided
-            if record.physical_path is None:
-                record.after_content = None
-                return
-            record.after_content = _safe_read(record.physical_path)
+                return None
+
+        if record.physical_path is None:
+            return None
+        try:
+            size = record.physical_path.stat().st_size
+        except OSError:
+            return None
+        if size > MAX_SNAPSHOT_BYTES:
+            record.snapshot_skipped = True
+            record.metrics.bytes_written = size
+            return None
+        return _safe_read(record.physical_path)
+
+    async def astart_operation(
+        self, tool_name: str, args: dict[str, Any], tool_call_id: str | None
+    ) -> None:
+        """Async version of :meth:`start_operation`, run on the worker thread."""
+        await run_off_loop(self.start_operation, tool_name, args, tool_call_id)
+
+    async def aupdate_args(self, tool_call_id: str, args: dict[str, Any]) -> None:
+        """Async version of :meth:`update_args`, run on the worker thread."""
+        await run_off_loop(self.update_args, tool_call_id, args)
+
+    async def acomplete_with_message(self, tool_message: Any) -> FileOperationRecord | None:
+        """Async version of :meth:`complete_with_message`, run on the worker thread."""
+        return await run_off_loop(self.complete_with_message, tool_message)
 
     def _finalize(self, record: FileOperationRecord) -> None:
         self.completed.append(record)
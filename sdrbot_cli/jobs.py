@@ -0,0 +1,401 @@
+"""Persistent, resumable jobs for long-running writes (migrations, batch CRUD).
+
+Each job is a row in ``.sdrbot/jobs.db`` with its kind, the parameters it was
+started with, its status and progress. Work inside a job is checkpointed
+under idempotency keys (e.g. a hash of a batch chunk), so when a job is run
+again after a crash, a network failure or Ctrl+C, completed work is reused
+instead of being sent twice.
+
+Starting a job with the same kind and parameters as an unfinished one resumes
+that job. ``/jobs`` lists jobs, ``/jobs resume <id>`` runs one again through
+the runner registered for its kind, and ``/jobs cancel <id>`` stops a running
+job at its next checkpoint (or retires an unfinished one).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import get_config_dir
+
+STATUS_RUNNING = "running"
+STATUS_INTERRUPTED = "interrupted"
+STATUS_FAILED = "failed"
+STATUS_DONE = "done"
+STATUS_CANCELLED = "cancelled"
+
+# Statuses a job can be resumed from
+RESUMABLE = (STATUS_RUNNING, STATUS_INTERRUPTED, STATUS_FAILED)
+
+# Runner for each job kind, as "module:function". The function takes the
+# job's params as keyword arguments and returns a summary.
+RUNNERS = {
+    "batch": "sdrbot_cli.services.batch:resume_batch_job",
+    "migration": "sdrbot_cli.migration.runner:run_migration",
+}
+
+
+class JobCancelled(Exception):
+    """The job was cancelled with ``/jobs cancel``."""
+
+
+def params_key(kind: str, params: dict[str, Any]) -> str:
+    """Idempotency key of a job: its kind plus a hash of its parameters."""
+    payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{kind}:{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+@dataclass
+class Job:
+    """One job and its progress."""
+
+    id: int
+    kind: str
+    title: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: str = STATUS_RUNNING
+    done: int = 0
+    total: int = 0
+    error: str | None = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+
+class JobStore:
+    """Job table and checkpoints (safe to share across threads)."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                title TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                total INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key, status);
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                job_id INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (job_id, key)
+            );
+            """
+        )
+        self._conn.commit()
+        # Jobs being run by this process; "running" rows not in here were
+        # left behind by a process that died
+        self._active: set[int] = set()
+
+    _COLUMNS = "id, kind, title, params, status, done, total, error, created_at, updated_at"
+
+    def _job(self, row: tuple) -> Job:
+        job = Job(*row)
+        job.params = json.loads(row[3])
+        if job.status == STATUS_RUNNING and job.id not in self._active:
+            job.status = STATUS_INTERRUPTED
+        return job
+
+    def create(self, kind: str, title: str, params: dict[str, Any]) -> Job:
+        """Add a new running job."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, key, title, params, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    params_key(kind, params),
+                    title,
+                    json.dumps(params, default=str),
+                    STATUS_RUNNING,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.commit()
+            job_id = cursor.lastrowid
+        return Job(job_id, kind, title, params, created_at=now, updated_at=now)
+
+    def get(self, job_id: int) -> Job | None:
+        """Look up a job by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._job(row) if row else None
+
+    def list(self, limit: int = 20) -> list[Job]:
+        """Most recent jobs first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def find_unfinished(self, kind: str, params: dict[str, Any]) -> Job | None:
+        """The latest unfinished job with the same kind and params, if not running now."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE key = ? AND status IN (?, ?, ?) "
+                "ORDER BY id DESC",
+                (params_key(kind, params), *RESUMABLE),
+            ).fetchall()
+        for row in rows:
+            if row[0] not in self._active:
+                return self._job(row)
+        return None
+
+    def update(self, job_id: int, **fields: Any) -> None:
+        """Set ``status``, ``done``, ``total`` or ``error``."""
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns}, updated_at = ? WHERE id = ?",
+                (*fields.values(), time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def start(self, job_id: int) -> None:
+        """Mark a job as run by this process."""
+        with self._lock:
+            self._active.add(job_id)
+        self.update(job_id, status=STATUS_RUNNING, error=None, cancel_requested=0)
+
+    def finish(self, job_id: int, status: str, error: str | None = None) -> None:
+        """Record how a run of the job ended."""
+        with self._lock:
+            self._active.discard(job_id)
+        self.update(job_id, status=status, error=error)
+
+    def is_active(self, job_id: int) -> bool:
+        """Whether this process is running the job now."""
+        with self._lock:
+            return job_id in self._active
+
+    def request_cancel(self, job_id: int) -> None:
+        """Ask a running job to stop at its next checkpoint."""
+        self.update(job_id, cancel_requested=1)
+
+    def cancel_requested(self, job_id: int) -> bool:
+        """Whether ``/jobs cancel`` was used on the job."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def checkpoint(self, job_id: int, key: str, value: Any) -> None:
+        """Save the result of a unit of work under its idempotency key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (job_id, key, json.dumps(value, default=str)),
+            )
+            self._conn.commit()
+
+    def checkpoints(self, job_id: int) -> dict[str, Any]:
+        """All saved results of a job, by idempotency key."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM checkpoints WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _jobs_db_path() -> Path:
+    """Return the path to the job database."""
+    return get_config_dir() / "jobs.db"
+
+
+# Shared store instance, re-opened if the working directory changes
+_store: JobStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Get the shared job store for the current project."""
+    global _store
+    db_path = _jobs_db_path()
+    with _store_lock:
+        if _store is None or _store.db_path != db_path:
+            if _store is not None:
+                _store.close()
+            _store = JobStore(db_path)
+        return _store
+
+
+def reset_job_store() -> None:
+    """Close the shared store (useful for testing)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
+
+
+class JobHandle:
+    """What code running inside a job uses to report progress and checkpoint."""
+
+    def __init__(self, store: JobStore, job: Job) -> None:
+        self.store = store
+        self.job = job
+        self.cancelled = False
+        self.incomplete: str | None = None
+        self._saved = store.checkpoints(job.id)
+
+    @property
+    def id(self) -> int:
+        """The job's ID."""
+        return self.job.id
+
+    @property
+    def resumed(self) -> bool:
+        """Whether an earlier run of the job saved checkpoints."""
+        return bool(self._saved)
+
+    def saved(self, key: str) -> Any:
+        """Result saved under an idempotency key by this or an earlier run, or None."""
+        return self._saved.get(key)
+
+    def checkpoint(self, key: str, value: Any) -> None:
+        """Save a unit of work's result so a rerun skips it."""
+        self._saved[key] = value
+        self.store.checkpoint(self.job.id, key, value)
+
+    def progress(self, done: int, total: int | None = None) -> None:
+        """Report progress (shown by ``/jobs``)."""
+        fields: dict[str, Any] = {"done": done}
+        if total is not None:
+            fields["total"] = total
+        self.store.update(self.job.id, **fields)
+
+    def check_cancelled(self) -> None:
+        """Raise :class:`JobCancelled` if ``/jobs cancel`` was used on the job."""
+        if self.store.cancel_requested(self.job.id):
+            self.cancelled = True
+            raise JobCancelled(f"Job {self.job.id} was cancelled")
+
+    def mark_incomplete(self, reason: str) -> None:
+        """End the job as failed (and resumable) even though the block returns."""
+        self.incomplete = reason
+
+
+_current: ContextVar[JobHandle | None] = ContextVar("sdrbot_current_job", default=None)
+
+
+def current_job() -> JobHandle | None:
+    """The job the calling code runs in, if any."""
+    return _current.get()
+
+
+@contextmanager
+def job_context(kind: str, title: str, params: dict[str, Any]) -> Iterator[JobHandle]:
+    """Run a block as a job, resuming an unfinished job with the same params.
+
+    The job ends as done when the block returns (failed if it called
+    :meth:`JobHandle.mark_incomplete`, cancelled if it stopped on
+    :class:`JobCancelled`), failed on errors and interrupted on Ctrl+C.
+    Exceptions are re-raised.
+    """
+    store = get_job_store()
+    job = store.find_unfinished(kind, params) or store.create(kind, title, params)
+    store.start(job.id)
+    handle = JobHandle(store, job)
+    token = _current.set(handle)
+    try:
+        yield handle
+    except JobCancelled as e:
+        store.finish(job.id, STATUS_CANCELLED, str(e))
+        raise
+    except Exception as e:
+        store.finish(job.id, STATUS_FAILED, str(e))
+        raise
+    except BaseException:
+        store.finish(job.id, STATUS_INTERRUPTED)
+        raise
+    else:
+        if handle.cancelled:
+            store.finish(job.id, STATUS_CANCELLED, "Cancelled")
+        elif handle.incomplete:
+            store.finish(job.id, STATUS_FAILED, handle.incomplete)
+        else:
+            store.finish(job.id, STATUS_DONE)
+    finally:
+        _current.reset(token)
+
+
+def _runner(kind: str) -> Callable[..., str]:
+    module_name, _, function = RUNNERS[kind].partition(":")
+    return getattr(importlib.import_module(module_name), function)
+
+
+def resume_job(job_id: int) -> str:
+    """Run an unfinished job again; completed work is skipped.
+
+    Returns:
+        The runner's summary, or an error message.
+    """
+    store = get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        return f"Error: no job {job_id}"
+    if job.status not in RESUMABLE or store.is_active(job_id):
+        return f"Error: job {job_id} is {'running' if store.is_active(job_id) else job.status}"
+    if job.kind not in RUNNERS:
+        return f"Error: jobs of kind '{job.kind}' can't be resumed"
+    return _runner(job.kind)(**job.params)
+
+
+def cancel_job(job_id: int) -> str:
+    """Cancel a job: stop it at its next checkpoint, or retire it if it isn't running."""
+    store = get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        return f"Error: no job {job_id}"
+    if store.is_active(job_id):
+        store.request_cancel(job_id)
+        return f"Job {job_id} will stop after its current chunk."
+    if job.status not in RESUMABLE:
+        return f"Job {job_id} is already {job.status}."
+    store.finish(job_id, STATUS_CANCELLED, "Cancelled")
+    return f"Job {job_id} cancelled; it won't be resumed."
+
+
+def format_job(job: Job) -> str:
+    """One-line description of a job for ``/jobs``."""
+    progress = f"{job.done:,}/{job.total:,}" if job.total else f"{job.done:,}"
+    when = time.strftime("%Y-%m-%d %H:%M", time.localtime(job.updated_at))
+    line = f"#{job.id:<4} {job.status:<11} {progress:>15}  {when}  {job.title}"
+    if job.error and job.status in (STATUS_FAILED, STATUS_CANCELLED):
+        line += f"  ({job.error})"
+    return line
@@ -0,0 +1,66 @@
+"""Deferred imports for heavy dependencies.
+
+Startup only needs the TUI; the tracing SDKs, CRM and database drivers,
+tiktoken and friends are needed once the agent runs a tool that uses them.
+Modules that depend on one bind it with :func:`lazy_import` instead of a
+top-level ``import``::
+
+    tiktoken = lazy_import("tiktoken")
+    ...
+    encoding = tiktoken.get_encoding("cl100k_base")  # imports tiktoken
+
+The real module is imported on first attribute access. Use
+:func:`is_available` to check for an optional dependency without importing it.
+
+``tests/test_startup.py`` keeps these modules out of the startup path.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Not cached on the proxy, so patching the real module still takes effect
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a proxy for module ``name`` that imports it when first used.
+
+    Importing a submodule (``"hubspot.crm.objects"``) imports its parent
+    packages at the same time, like a regular import.
+    """
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """Whether module ``name`` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
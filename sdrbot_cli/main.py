@@ -6,6 +6,7 @@ import os
 import sys
 
 # Only import lightweight modules at top level for faster startup
+from sdrbot_cli.startup import get_startup_profile
 from sdrbot_cli.version import __version__
 
 
@@ -64,6 +65,11 @@ def parse_args():
         action="store_true",
         help="Disable the startup splash screen",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report time-to-interactive and agent build timings",
+    )
     parser.add_argument(
         "-n",
         "--non-interactive",
@@ -161,6 +167,9 @@ async def main(
         # Clean up MCP connections on exit
         await shutdown_mcp()
 
+    if getattr(session_state, "profile_startup", False):
+        console.print(get_startup_profile().report(), highlight=False)
+
     if exit_code != 0:
         sys.exit(exit_code)
 
@@ -221,6 +230,7 @@ def cli_main() -> None:
                     output_format=args.output_format,
                     max_turns=args.max_turns,
                     auto_approve=args.auto_approve,
+                    profile_startup=args.profile_startup,
                 )
             )
         else:
@@ -228,6 +238,7 @@ def cli_main() -> None:
             session_state = SessionState(
                 auto_approve=args.auto_approve, no_splash=args.no_splash, is_tui=True
             )
+            session_state.profile_startup = args.profile_startup
 
             # API key validation happens in create_model()
             asyncio.run(
@@ -0,0 +1,139 @@
+"""On-disk cache of MCP tool listings.
+
+Listing a server's tools means starting it (or opening its SSE stream),
+initializing a session and calling ``tools/list`` - often seconds per server.
+The listing rarely changes, so the last one seen is stored per server in
+``.sdrbot/mcp_tools_cache.json``, keyed by a hash of the server's connection
+settings. On the next start the tools are registered from the cache right
+away while the real connection comes up in the background; the connection
+then revalidates the entry (see :meth:`MCPManager.connect_enabled_servers`).
+
+Pydantic argument models are generated from the cached JSON schemas and
+memoized in-process by :func:`sdrbot_cli.mcp.tools.json_schema_to_pydantic`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import get_config_dir
+
+from .config import connection_settings
+from .tools import tool_annotations
+
+# Bump when the stored format changes; old entries then no longer match
+CACHE_FORMAT = 2
+
+
+@dataclass(frozen=True)
+class CachedTool:
+    """A tool listing entry, shaped like ``mcp.types.Tool`` where it's used."""
+
+    name: str
+    description: str | None
+    inputSchema: dict[str, Any]  # noqa: N815 - mirrors the MCP field name
+    annotations: dict[str, Any] | None = None
+
+
+def _tool_cache_path() -> Path:
+    return get_config_dir() / "mcp_tools_cache.json"
+
+
+def config_key(server_config: dict[str, Any]) -> str:
+    """Hash of everything a server's tool listing can depend on in its config."""
+    payload = json.dumps(
+        {"format": CACHE_FORMAT, "settings": connection_settings(server_config)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _to_entries(tools: list[Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": tool.name,
+            "description": getattr(tool, "description", None),
+            "inputSchema": getattr(tool, "inputSchema", None) or {},
+            "annotations": tool_annotations(tool) or None,
+        }
+        for tool in tools
+    ]
+
+
+def _load() -> dict[str, Any]:
+    try:
+        with open(_tool_cache_path()) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    servers = data.get("servers") if isinstance(data, dict) else None
+    return servers if isinstance(servers, dict) else {}
+
+
+def load_cached_tools(name: str, server_config: dict[str, Any]) -> list[CachedTool] | None:
+    """
+    Get the tools last listed by a server.
+
+    Args:
+        name: Server name
+        server_config: The server's current config
+
+    Returns:
+        The cached tools, or None if there's no entry for this config
+    """
+    entry = _load().get(name)
+    if not isinstance(entry, dict) or entry.get("key") != config_key(server_config):
+        return None
+    try:
+        return [CachedTool(**tool) for tool in entry["tools"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def save_cached_tools(
+    name: str, server_config: dict[str, Any], tools: list[Any], server_version: str = ""
+) -> bool:
+    """
+    Store a server's tool listing.
+
+    Args:
+        name: Server name
+        server_config: The config the server was connected with
+        tools: MCP tools (anything with ``name``, ``description`` and ``inputSchema``)
+        server_version: Version the server reported when initializing
+
+    Returns:
+        True if the stored listing changed (a new server, new config, new
+        server version or different tools), False if it was already current
+    """
+    servers = _load()
+    entry = {
+        "key": config_key(server_config),
+        "server_version": server_version,
+        "tools": _to_entries(tools),
+    }
+    if servers.get(name) == entry:
+        return False
+
+    servers[name] = entry
+    path = _tool_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_FORMAT, "servers": servers}, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # The cache is an optimization; the next connect lists tools again
+    return True
+
+
+def tools_match(cached: list[Any], tools: list[Any]) -> bool:
+    """Whether two tool listings describe the same tools."""
+    return _to_entries(cached) == _to_entries(tools)
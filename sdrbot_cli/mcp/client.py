@@ -2,30 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from sdrbot_cli.config import console
+from sdrbot_cli.lazy import is_available, lazy_import
 
 from .config import build_auth_headers, resolve_env_vars
+from .health import ServerHealth
+from .scheduler import CallScheduler
 
-# Import MCP SDK types - these will be available after adding the dependency
-MCP_AVAILABLE = False
-_ClientSession = None
-_StdioServerParameters = None
-_stdio_client = None
-_sse_client = None
-
-try:
-    from mcp import ClientSession as _ClientSession
-    from mcp import StdioServerParameters as _StdioServerParameters
-    from mcp.client.sse import sse_client as _sse_client
-    from mcp.client.stdio import stdio_client as _stdio_client
-
-    MCP_AVAILABLE = True
-except ImportError:
-    pass
+# The MCP SDK is imported when the first server connects
+MCP_AVAILABLE = is_available("mcp")
+mcp = lazy_import("mcp")
+mcp_sse = lazy_import("mcp.client.sse")
+mcp_stdio = lazy_import("mcp.client.stdio")
+mcp_types = lazy_import("mcp.types")
 
 if TYPE_CHECKING:
     from mcp import ClientSession
@@ -39,12 +35,27 @@ class MCPServerConnection:
     config: dict[str, Any]
     session: ClientSession | None = None
     tools: list[Any] = field(default_factory=list)
+    server_version: str = ""
+    # Called with the server name after the server changes its tool list
+    on_tools_changed: Callable[[str], None] | None = None
+    # The connect in progress while tools registered from the cache wait for it
+    pending_connect: asyncio.Future[bool] | None = None
+    # Limits, times out and cancels tool calls; several may be in flight at once
+    scheduler: CallScheduler = field(default_factory=CallScheduler)
+    # The loop the session was opened on (sync callers submit their calls to it)
+    loop: asyncio.AbstractEventLoop | None = None
+    health: ServerHealth = field(default_factory=ServerHealth)
     _context_stack: list[Any] = field(default_factory=list)
+    _refresh_tasks: set[asyncio.Task[None]] = field(default_factory=set)
 
     async def connect(self) -> bool:
         """
         Start the server and establish connection.
 
+        When already connected, this reconnects: the new session is swapped in
+        once it's ready and the old one is closed after, so tools holding this
+        connection never see it without a session.
+
         Returns:
             True if connection successful, False otherwise
         """
@@ -52,6 +63,7 @@ class MCPServerConnection:
             console.print("[red]MCP SDK not installed. Run: pip install mcp[/red]")
             return False
 
+        contexts: list[Any] = []
         try:
             transport = self.config.get("transport", "stdio")
 
@@ -63,7 +75,7 @@ class MCPServerConnection:
                 full_env = {**os.environ, **env}
                 full_env.pop("VIRTUAL_ENV", None)
 
-                params = _StdioServerParameters(
+                params = mcp.StdioServerParameters(
                     command=self.config["command"],
                     args=self.config.get("args", []),
                     env=full_env,
@@ -72,10 +84,10 @@ class MCPServerConnection:
                 # Enter stdio_client context
                 # Suppress verbose logging from mcp-remote and similar tools
                 devnull = open(os.devnull, "w")  # noqa: SIM115
-                self._context_stack.append(devnull)  # Track for cleanup
-                stdio_ctx = _stdio_client(params, errlog=devnull)
+                contexts.append(devnull)  # Track for cleanup
+                stdio_ctx = mcp_stdio.stdio_client(params, errlog=devnull)
                 streams = await stdio_ctx.__aenter__()
-                self._context_stack.append(stdio_ctx)
+                contexts.append(stdio_ctx)
                 read_stream, write_stream = streams
 
             elif transport == "sse":
@@ -83,9 +95,9 @@ class MCPServerConnection:
                 auth_headers = build_auth_headers(self.config.get("auth"))
 
                 # Enter sse_client context
-                sse_ctx = _sse_client(self.config["url"], headers=auth_headers or None)
+                sse_ctx = mcp_sse.sse_client(self.config["url"], headers=auth_headers or None)
                 streams = await sse_ctx.__aenter__()
-                self._context_stack.append(sse_ctx)
+                contexts.append(sse_ctx)
                 read_stream, write_stream = streams[0], streams[1]
 
             elif transport == "http":
@@ -105,32 +117,74 @@ class MCPServerConnection:
                 return False
 
             # Create and initialize session
-            self.session = _ClientSession(read_stream, write_stream)
-            await self.session.__aenter__()
-            self._context_stack.append(self.session)
+            session = mcp.ClientSession(
+                read_stream, write_stream, message_handler=self._handle_message
+            )
+            await session.__aenter__()
+            contexts.append(session)
 
-            await self.session.initialize()
+            init_result = await session.initialize()
+            server_info = getattr(init_result, "serverInfo", None)
 
             # Fetch available tools
-            result = await self.session.list_tools()
-            self.tools = result.tools if hasattr(result, "tools") else []
-
-            return True
+            result = await session.list_tools()
 
         except Exception as e:
             console.print(f"[red]Failed to connect to {self.name}: {e}[/red]")
-            await self.disconnect()
+            await self._close_contexts(contexts)
             return False
 
+        # No await until the swap is complete
+        old_contexts, self._context_stack = self._context_stack, contexts
+        self.session = session
+        self.tools = result.tools if hasattr(result, "tools") else []
+        self.server_version = getattr(server_info, "version", "") or ""
+        self.scheduler = CallScheduler.from_config(self.config)
+        self.loop = asyncio.get_running_loop()
+
+        await self._close_contexts(old_contexts)
+        return True
+
+    async def _handle_message(self, message: Any) -> None:
+        """Refresh the tool list when the server says it changed."""
+        notification = getattr(message, "root", message)
+        if isinstance(notification, mcp_types.ToolListChangedNotification):
+            # Not awaited here: the response to list_tools arrives through this handler's loop
+            task = asyncio.create_task(self.refresh_tools())
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+    async def refresh_tools(self) -> None:
+        """Re-list the server's tools and report the change."""
+        if not self.session:
+            return
+        try:
+            result = await self.session.list_tools()
+        except Exception as e:
+            console.print(f"[yellow]Could not refresh tools from {self.name}: {e}[/yellow]")
+            return
+        self.tools = result.tools if hasattr(result, "tools") else []
+        if self.on_tools_changed is not None:
+            self.on_tools_changed(self.name)
+
     async def disconnect(self) -> None:
         """Clean up connection."""
-        import asyncio
+        for task in self._refresh_tasks:
+            task.cancel()
 
+        await self._close_contexts(self._context_stack)
+        self._context_stack = []
+        self.session = None
+        self.tools = []
+
+    @staticmethod
+    async def _close_contexts(contexts: list[Any]) -> None:
+        """Exit a session's contexts (transport, session) and close its devnull."""
         # Exit contexts in reverse order, but keep devnull open until the end
         devnull_ctx = None
         other_contexts = []
 
-        for ctx in self._context_stack:
+        for ctx in contexts:
             if hasattr(ctx, "close") and not hasattr(ctx, "__aexit__"):
                 devnull_ctx = ctx  # This is the devnull file handle
             else:
@@ -157,10 +211,6 @@ class MCPServerConnection:
             except Exception:
                 pass
 
-        self._context_stack.clear()
-        self.session = None
-        self.tools = []
-
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """
         Call a tool on this server.
@@ -171,13 +221,43 @@ class MCPServerConnection:
 
         Returns:
             Tool result content
+
+        Raises:
+            TimeoutError: The call took longer than the server's ``call_timeout``
         """
+        if not self.session and self.pending_connect is not None:
+            # Registered from the tool cache; wait (without raising or cancelling it) for the connect
+            await asyncio.wait([self.pending_connect])
+
         if not self.session:
             raise RuntimeError(f"Not connected to server {self.name}")
 
-        result = await self.session.call_tool(tool_name, arguments)
+        session = self.session
+        start = time.perf_counter()
+        try:
+            result = await self.scheduler.run(lambda: session.call_tool(tool_name, arguments))
+        except Exception as e:
+            self.health.record_call(time.perf_counter() - start, False, str(e) or repr(e))
+            raise
+        self.health.record_call(time.perf_counter() - start, True)
         return result.content
 
+    async def ping(self) -> float:
+        """
+        Ping the server.
+
+        Returns:
+            Round-trip time in seconds
+        """
+        if not self.session:
+            raise RuntimeError(f"Not connected to server {self.name}")
+
+        start = time.perf_counter()
+        await self.session.send_ping()
+        elapsed = time.perf_counter() - start
+        self.health.record_ping(elapsed)
+        return elapsed
+
     def get_tool_names(self) -> list[str]:
         """Get list of available tool names."""
         return [tool.name for tool in self.tools]
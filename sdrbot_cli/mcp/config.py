@@ -7,12 +7,20 @@ from typing import Any
 
 from sdrbot_cli.config import get_config_dir
 
+# Server config keys that don't affect the connection itself
+_BOOKKEEPING_KEYS = ("enabled", "tool_count")
+
 
 def get_mcp_config_path() -> Path:
     """Get the path to the MCP configuration file."""
     return get_config_dir() / "mcp_servers.json"
 
 
+def connection_settings(server_config: dict[str, Any]) -> dict[str, Any]:
+    """The part of a server's config that a connection is made from."""
+    return {k: v for k, v in server_config.items() if k not in _BOOKKEEPING_KEYS}
+
+
 def load_mcp_config() -> dict[str, Any]:
     """
     Load MCP server configuration from file.
@@ -35,6 +43,8 @@ def load_mcp_config() -> dict[str, Any]:
                         "api_key": str,  # for apikey (supports ${VAR} syntax)
                         "headers": dict[str, str],  # for custom
                     },
+                    "max_concurrent_calls": int,  # optional, default 8
+                    "call_timeout": float,  # optional, seconds per tool call
                     "tool_count": int,  # cached after connection
                 }
             }
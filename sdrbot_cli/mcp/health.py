@@ -0,0 +1,94 @@
+"""Health of MCP server connections.
+
+Every connection keeps a :class:`ServerHealth`: the latency and outcome of
+its recent tool calls, the last ping, and the reconnect state kept by the
+supervisor in :class:`~sdrbot_cli.mcp.manager.MCPManager`. The ``/mcp``
+screens show it.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+# Tool calls the latency and error rate are computed over
+CALL_WINDOW = 50
+# Reconnect attempts back off exponentially from BASE up to CAP seconds
+RECONNECT_BACKOFF_BASE = 2.0
+RECONNECT_BACKOFF_CAP = 300.0
+
+
+@dataclass
+class ServerHealth:
+    """Call statistics and reconnect state for one MCP server."""
+
+    # "connected", "reconnecting" or "down" (waiting to retry)
+    state: str = "connected"
+    calls: int = 0
+    # (seconds, succeeded) for the last CALL_WINDOW calls
+    recent: deque[tuple[float, bool]] = field(default_factory=lambda: deque(maxlen=CALL_WINDOW))
+    last_ping: float | None = None
+    last_error: str = ""
+    reconnects: int = 0
+    # Consecutive failed reconnects, and when (time.monotonic) the next may start
+    failures: int = 0
+    retry_at: float = 0.0
+
+    def record_call(self, seconds: float, ok: bool, error: str = "") -> None:
+        """Record a finished tool call."""
+        self.calls += 1
+        self.recent.append((seconds, ok))
+        if not ok:
+            self.last_error = error
+
+    def record_ping(self, seconds: float) -> None:
+        """Record a successful ping."""
+        self.last_ping = seconds
+
+    def mark_unreachable(self, error: str) -> None:
+        """The server stopped answering; reconnect as soon as allowed."""
+        self.state = "down"
+        self.last_ping = None
+        self.last_error = error
+
+    def reconnected(self) -> None:
+        """A reconnect succeeded."""
+        self.state = "connected"
+        self.reconnects += 1
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def reconnect_failed(self) -> None:
+        """A reconnect failed; back off before the next one."""
+        self.state = "down"
+        delay = min(RECONNECT_BACKOFF_CAP, RECONNECT_BACKOFF_BASE * 2**self.failures)
+        self.failures += 1
+        self.retry_at = time.monotonic() + delay
+
+    @property
+    def latency(self) -> float | None:
+        """Mean duration (seconds) of the recent successful calls."""
+        durations = [seconds for seconds, ok in self.recent if ok]
+        return sum(durations) / len(durations) if durations else None
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of the recent calls that failed."""
+        if not self.recent:
+            return 0.0
+        return sum(1 for _, ok in self.recent if not ok) / len(self.recent)
+
+    def summary(self) -> str:
+        """Short status, e.g. ``42ms · 2% errors`` or ``down, retry in 8s``."""
+        if self.state == "reconnecting":
+            return "reconnecting"
+        if self.state == "down":
+            wait = self.retry_at - time.monotonic()
+            return f"down, retry in {wait:.0f}s" if wait > 0 else "down"
+
+        latency = self.latency if self.latency is not None else self.last_ping
+        parts = [] if latency is None else [f"{latency * 1000:.0f}ms"]
+        if self.recent:
+            parts.append(f"{self.error_rate:.0%} errors")
+        return " · ".join(parts)
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import partial
 
 from langchain_core.tools import BaseTool
 
+from sdrbot_cli.config import console
+
+from .cache import load_cached_tools, save_cached_tools, tools_match
 from .client import MCP_AVAILABLE, MCPServerConnection
-from .config import load_mcp_config, update_server_tool_count
+from .config import (
+    connection_settings,
+    disable_mcp_server,
+    load_mcp_config,
+    update_server_tool_count,
+)
+from .health import ServerHealth
 from .tools import create_langchain_tool
 
+# How long startup (or a reload) waits for servers; slower ones attach when ready
+STARTUP_WAIT = 5.0
+# A server that hasn't connected after this long is given up on and disabled
+CONNECT_TIMEOUT = 60.0
+# How often the health monitor pings each server, and how long a ping may take
+HEALTH_CHECK_INTERVAL = 30.0
+PING_TIMEOUT = 10.0
+
 
 @dataclass
 class MCPManager:
@@ -17,46 +38,286 @@ class MCPManager:
 
     connections: dict[str, MCPServerConnection] = field(default_factory=dict)
     _started: bool = False
-
-    async def connect_enabled_servers(self) -> tuple[int, list[str]]:
+    # Called as (server name, connected) when a slow server finishes in the background
+    on_late_connect: Callable[[str, bool], None] | None = None
+    # Called with the server name when a connected server's tool list changes
+    on_tools_changed: Callable[[str], None] | None = None
+    # LangChain wrappers per server, reused while the connection is unchanged
+    _tools: dict[str, tuple[MCPServerConnection, list[BaseTool]]] = field(default_factory=dict)
+    # Connections still in progress after connect_enabled_servers returned
+    _pending: dict[str, asyncio.Task[bool]] = field(default_factory=dict)
+    # Servers whose tools were registered from the cache before they connected
+    _attached_from_cache: set[str] = field(default_factory=set)
+    # Health monitor loop, and the server checks it (or a failed call) started
+    _monitor: asyncio.Task[None] | None = None
+    _checks: dict[str, asyncio.Task[None]] = field(default_factory=dict)
+
+    async def connect_enabled_servers(self, wait: float = STARTUP_WAIT) -> tuple[int, list[str]]:
         """
-        Connect to all enabled MCP servers.
+        Connect to all enabled MCP servers that aren't connected yet, concurrently.
+
+        Servers with a cached tool listing (see :mod:`sdrbot_cli.mcp.cache`)
+        are added to :attr:`connections` right away with the cached tools,
+        which wait for the connection when called. Once connected, a listing
+        that differs from the cache is reported through :attr:`on_tools_changed`.
+
+        Other servers still connecting after ``wait`` seconds carry on in the
+        background. When one finishes, it is added to :attr:`connections` and
+        :attr:`on_late_connect` is called so the agent can pick up its tools.
+
+        Args:
+            wait: Seconds to wait for uncached servers before returning.
 
         Returns:
-            Tuple of (number of successfully connected servers, list of failed server names)
+            Tuple of (number of connected or cache-registered servers, list of failed server names)
         """
         if not MCP_AVAILABLE:
             return 0, []
 
-        from .config import disable_mcp_server
-
         config = load_mcp_config()
         servers = config.get("servers", {})
 
-        connected_count = 0
-        failed_servers: list[str] = []
-
+        tasks: dict[str, asyncio.Task[bool]] = {}
         for name, server_config in servers.items():
-            if not server_config.get("enabled", False):
+            if (
+                not server_config.get("enabled", False)
+                or name in self.connections
+                or name in self._pending
+            ):
                 continue
-
             conn = MCPServerConnection(name=name, config=server_config)
+            tasks[name] = asyncio.create_task(self._connect_server(conn))
 
-            if await conn.connect():
+            cached_tools = load_cached_tools(name, server_config)
+            if cached_tools is not None:
+                conn.tools = cached_tools
+                conn.pending_connect = tasks[name]
                 self.connections[name] = conn
-                tool_count = len(conn.tools)
-                update_server_tool_count(name, tool_count)
+                self._attached_from_cache.add(name)
+
+        self._started = True
+        if not tasks:
+            return 0, []
+
+        uncached = [task for name, task in tasks.items() if name not in self._attached_from_cache]
+        if uncached:
+            await asyncio.wait(uncached, timeout=wait)
+
+        connected_count = 0
+        failed_servers: list[str] = []
+
+        for name, task in tasks.items():
+            if not task.done():
+                self._pending[name] = task
+                task.add_done_callback(partial(self._finish_late_connect, name))
+                if name in self._attached_from_cache:
+                    connected_count += 1
+            elif task.result():
                 connected_count += 1
+                self._attached_from_cache.discard(name)
             else:
-                # Disable the server since it failed to connect
-                disable_mcp_server(name)
                 failed_servers.append(name)
 
-        self._started = True
         return connected_count, failed_servers
 
+    async def _connect_server(self, conn: MCPServerConnection) -> bool:
+        """Connect one server and register it; disable it if that fails or times out."""
+        name = conn.name
+        cached_tools = list(conn.tools)
+
+        try:
+            connected = await asyncio.wait_for(conn.connect(), timeout=CONNECT_TIMEOUT)
+        except TimeoutError:
+            console.print(f"[red]Timed out connecting to {name} after {CONNECT_TIMEOUT:g}s[/red]")
+            await conn.disconnect()
+            connected = False
+        except asyncio.CancelledError:
+            await conn.disconnect()
+            self._unregister(conn)
+            raise
+        finally:
+            conn.pending_connect = None
+
+        if not connected:
+            self._unregister(conn)
+            # Disable the server since it failed to connect
+            disable_mcp_server(name)
+            return False
+
+        conn.on_tools_changed = self._tools_changed
+        self.connections[name] = conn
+        update_server_tool_count(name, len(conn.tools))
+        save_cached_tools(name, conn.config, conn.tools, conn.server_version)
+        if name in self._attached_from_cache and not tools_match(cached_tools, conn.tools):
+            # The agent was built with the cached listing
+            self._tools.pop(name, None)
+            if self.on_tools_changed is not None:
+                self.on_tools_changed(name)
+        return True
+
+    def _unregister(self, conn: MCPServerConnection) -> None:
+        """Remove a connection (registered from the cache) that didn't come up."""
+        if self.connections.get(conn.name) is conn:
+            del self.connections[conn.name]
+            self._tools.pop(conn.name, None)
+
+    def _tools_changed(self, name: str) -> None:
+        """Update the tool cache and wrappers after a server changed its tool list."""
+        conn = self.connections.get(name)
+        if conn is None:
+            return
+        save_cached_tools(name, conn.config, conn.tools, conn.server_version)
+        update_server_tool_count(name, len(conn.tools))
+        self._tools.pop(name, None)
+        if self.on_tools_changed is not None:
+            self.on_tools_changed(name)
+
+    def _finish_late_connect(self, name: str, task: asyncio.Task[bool]) -> None:
+        """Report a server that finished connecting after connect_enabled_servers returned."""
+        if self._pending.get(name) is not task:
+            return  # Cancelled by sync_enabled_servers
+        del self._pending[name]
+        from_cache = name in self._attached_from_cache
+        self._attached_from_cache.discard(name)
+        if task.cancelled() or self.on_late_connect is None:
+            return
+        connected = task.exception() is None and task.result()
+        if connected and from_cache:
+            return  # Its tools were attached from the cache already
+        self.on_late_connect(name, connected)
+
+    async def sync_enabled_servers(self) -> tuple[int, list[str]]:
+        """
+        Bring connections in line with the MCP config.
+
+        Servers that were disabled, removed or reconfigured are disconnected,
+        then newly enabled (or reconfigured) servers are connected. Servers
+        whose config is unchanged keep their connection and tools.
+
+        Returns:
+            Tuple of (number of newly connected servers, list of failed server names)
+        """
+        if not MCP_AVAILABLE:
+            return 0, []
+
+        servers = load_mcp_config().get("servers", {})
+
+        for name, task in list(self._pending.items()):
+            server_config = servers.get(name, {})
+            conn = self.connections.get(name)
+            if not server_config.get("enabled", False) or (
+                conn is not None
+                and connection_settings(server_config) != connection_settings(conn.config)
+            ):
+                task.cancel()
+                del self._pending[name]
+                self._attached_from_cache.discard(name)
+
+        for name, conn in list(self.connections.items()):
+            server_config = servers.get(name)
+            if (
+                server_config is None
+                or not server_config.get("enabled", False)
+                or connection_settings(server_config) != connection_settings(conn.config)
+            ):
+                try:
+                    await conn.disconnect()
+                except Exception:
+                    pass
+                del self.connections[name]
+
+        return await self.connect_enabled_servers()
+
+    def start_health_monitor(self, interval: float = HEALTH_CHECK_INTERVAL) -> None:
+        """
+        Ping every connected server each ``interval`` seconds, in the background.
+
+        A server that doesn't answer is reconnected with exponential backoff
+        (see :class:`~sdrbot_cli.mcp.health.ServerHealth`). The new session
+        is swapped into the existing connection, so the agent's tools keep
+        working without a reload. Does nothing if the monitor is running.
+        """
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._monitor_health(interval))
+
+    async def _monitor_health(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            for name in list(self.connections):
+                self.check_server(name)
+
+    def check_server(self, name: str) -> asyncio.Task[None] | None:
+        """
+        Check a server's connection in the background, reconnecting if it's gone.
+
+        Called by the health monitor, and by tools whose call failed.
+
+        Returns:
+            The check, or None if the server isn't connected (or no loop is running)
+        """
+        conn = self.connections.get(name)
+        if conn is None or conn.pending_connect is not None:
+            return None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        task = self._checks.get(name)
+        if task is None or task.done():
+            task = self._checks[name] = asyncio.create_task(self._check_server(conn))
+        return task
+
+    async def _check_server(self, conn: MCPServerConnection) -> None:
+        """Ping a server; reconnect it if it doesn't answer and its backoff allows."""
+        health = conn.health
+        if health.state == "connected":
+            try:
+                await asyncio.wait_for(conn.ping(), timeout=PING_TIMEOUT)
+                return
+            except Exception as e:
+                health.mark_unreachable(str(e) or repr(e))
+
+        if time.monotonic() < health.retry_at:
+            return
+
+        health.state = "reconnecting"
+        tools_before = list(conn.tools)
+        try:
+            reconnected = await asyncio.wait_for(conn.connect(), timeout=CONNECT_TIMEOUT)
+        except TimeoutError:
+            reconnected = False
+        if not reconnected:
+            health.reconnect_failed()
+            return
+
+        if self.connections.get(conn.name) is not conn:
+            # Removed by a config sync while reconnecting
+            await conn.disconnect()
+            return
+
+        health.reconnected()
+        if not tools_match(tools_before, conn.tools):
+            self._tools_changed(conn.name)
+
+    def get_health(self, server_name: str) -> ServerHealth | None:
+        """Get a connected server's call statistics and reconnect state."""
+        conn = self.connections.get(server_name)
+        return conn.health if conn is not None else None
+
     async def disconnect_all(self) -> None:
         """Disconnect from all MCP servers."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+        for task in self._checks.values():
+            task.cancel()
+        self._checks.clear()
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._attached_from_cache.clear()
+
         for _name, conn in list(self.connections.items()):
             try:
                 await conn.disconnect()
@@ -64,6 +325,7 @@ class MCPManager:
                 pass  # Ignore disconnect errors on shutdown
 
         self.connections.clear()
+        self._tools.clear()
         self._started = False
 
     async def reconnect_server(self, name: str) -> bool:
@@ -92,8 +354,10 @@ class MCPManager:
         conn = MCPServerConnection(name=name, config=server_config)
 
         if await conn.connect():
+            conn.on_tools_changed = self._tools_changed
             self.connections[name] = conn
             update_server_tool_count(name, len(conn.tools))
+            save_cached_tools(name, conn.config, conn.tools, conn.server_version)
             return True
 
         return False
@@ -107,10 +371,8 @@ class MCPManager:
         """
         tools = []
 
-        for name, conn in self.connections.items():
-            for mcp_tool in conn.tools:
-                tool = create_langchain_tool(name, mcp_tool, conn)
-                tools.append(tool)
+        for name in self.connections:
+            tools.extend(self.get_server_tools(name))
 
         return tools
 
@@ -120,13 +382,14 @@ class MCPManager:
             return []
 
         conn = self.connections[server_name]
-        tools = []
+        cached = self._tools.get(server_name)
+        if cached is not None and cached[0] is conn:
+            return list(cached[1])
 
-        for mcp_tool in conn.tools:
-            tool = create_langchain_tool(server_name, mcp_tool, conn)
-            tools.append(tool)
+        tools = [create_langchain_tool(server_name, mcp_tool, conn) for mcp_tool in conn.tools]
+        self._tools[server_name] = (conn, tools)
 
-        return tools
+        return list(tools)
 
     def get_connected_servers(self) -> list[str]:
         """Get list of connected server names."""
@@ -163,6 +426,7 @@ async def initialize_mcp() -> tuple[MCPManager, list[str]]:
     failed_servers: list[str] = []
     if not manager._started:
         _, failed_servers = await manager.connect_enabled_servers()
+    manager.start_health_monitor()
     return manager, failed_servers
 
 
@@ -175,12 +439,15 @@ async def shutdown_mcp() -> None:
 
 
 async def reinitialize_mcp() -> tuple[MCPManager, list[str]]:
-    """Reinitialize MCP - disconnect and reconnect to enabled servers.
+    """Reinitialize MCP after a config change.
+
+    Only servers whose config changed are reconnected; see
+    :meth:`MCPManager.sync_enabled_servers`.
 
     Returns:
         Tuple of (manager, list of failed server names)
     """
     manager = get_mcp_manager()
-    await manager.disconnect_all()
-    _, failed_servers = await manager.connect_enabled_servers()
+    _, failed_servers = await manager.sync_enabled_servers()
+    manager.start_health_monitor()
     return manager, failed_servers
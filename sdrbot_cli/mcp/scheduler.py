@@ -0,0 +1,135 @@
+"""Scheduling of MCP tool calls.
+
+An MCP session tags every request with an id and matches responses to them,
+so calls to one server don't have to wait for each other: when the model
+emits several tool calls for the same server they are all sent at once.
+:class:`CallScheduler` lets up to ``max_concurrent_calls`` of them be in
+flight per server (the rest queue), bounds each with ``call_timeout``
+seconds, and cancels the request when its caller is cancelled. Both can be
+set per server in ``mcp_servers.json``.
+
+A session only works on the event loop it was opened on. Sync callers
+(``BaseTool._run``, e.g. from LangChain's thread pool) go through
+:func:`run_on_loop`, which submits the call to that loop - or, for a
+connection that hasn't been opened yet, to a dedicated background loop
+thread - and blocks until it finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Calls in flight per server; more wait for a free slot
+MAX_CONCURRENT_CALLS = 8
+# Seconds a single tool call may take
+CALL_TIMEOUT = 300.0
+
+
+class CallScheduler:
+    """Limits and times out the tool calls made to one MCP server."""
+
+    def __init__(
+        self, max_concurrent: int = MAX_CONCURRENT_CALLS, timeout: float | None = CALL_TIMEOUT
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.timeout = timeout
+        self.in_flight = 0
+        self.queued = 0
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+
+    @classmethod
+    def from_config(cls, server_config: dict[str, Any]) -> CallScheduler:
+        """Scheduler with the server's ``max_concurrent_calls`` and ``call_timeout``."""
+        return cls(
+            max_concurrent=int(server_config.get("max_concurrent_calls", MAX_CONCURRENT_CALLS)),
+            timeout=server_config.get("call_timeout", CALL_TIMEOUT),
+        )
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``call`` once a slot is free.
+
+        Args:
+            call: Makes the request (called after the slot is acquired)
+
+        Returns:
+            The call's result
+
+        Raises:
+            TimeoutError: The call took longer than :attr:`timeout`
+        """
+        self.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            # wait_for cancels the request on timeout, as does cancelling the caller
+            return await asyncio.wait_for(call(), timeout=self.timeout)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """The event loop thread for sync callers of connections not opened on another loop."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever, name="mcp-calls", daemon=True
+            ).start()
+        return _background_loop
+
+
+def run_on_loop(
+    coro: Coroutine[Any, Any, T],
+    loop: asyncio.AbstractEventLoop | None,
+    timeout: float | None = None,
+) -> T:
+    """
+    Run a coroutine on ``loop`` from sync code and wait for its result.
+
+    Args:
+        coro: The coroutine to run
+        loop: The loop it must run on; the background loop if None or no longer running
+        timeout: Seconds to wait before cancelling it
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: Called from ``loop`` itself, which would deadlock
+        TimeoutError: The coroutine didn't finish within ``timeout``
+    """
+    if loop is None or loop.is_closed() or not loop.is_running():
+        loop = background_loop()
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("Sync MCP call made from its own event loop; use the async tool API")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except BaseException:
+        if not future.done():
+            # Timed out waiting, or interrupted: don't leave the call running
+            future.cancel()
+        raise
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.tools import BaseTool, ToolException
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
+from .scheduler import run_on_loop
+
 
 def json_schema_to_pydantic(
     schema: dict[str, Any], model_name: str = "Arguments"
@@ -74,6 +76,12 @@ def json_schema_to_pydantic(
     return create_model(model_name, **field_definitions)
 
 
+@lru_cache(maxsize=1024)
+def _args_model(schema_json: str, model_name: str) -> type[BaseModel]:
+    """Memoized :func:`json_schema_to_pydantic`, so reconnects reuse the generated models."""
+    return json_schema_to_pydantic(json.loads(schema_json), model_name=model_name)
+
+
 class MCPToolWrapper(BaseTool):
     """LangChain tool that wraps an MCP tool."""
 
@@ -85,88 +93,37 @@ class MCPToolWrapper(BaseTool):
     server_name: str
     mcp_tool_name: str
     connection: Any  # MCPServerConnection - using Any to avoid Pydantic type resolution issues
-    _reconnect_attempted: bool = False
 
     def _run(self, **kwargs: Any) -> str:
-        """Synchronous run - wraps async."""
-        return asyncio.get_event_loop().run_until_complete(self._arun(**kwargs))
+        """Synchronous run - executes the call on the connection's event loop."""
+        return run_on_loop(self._arun(**kwargs), self.connection.loop)
 
     async def _arun(self, **kwargs: Any) -> str:
-        """Execute the MCP tool asynchronously with auto-reconnect on failure."""
+        """Execute the MCP tool asynchronously.
+
+        A failed call doesn't wait for a reconnect: the MCP manager's health
+        monitor checks the server in the background and swaps a new session
+        into this tool's connection if it has to reconnect.
+        """
         try:
             result = await self.connection.call_tool(self.mcp_tool_name, kwargs)
-            # Reset reconnect flag on success
-            self._reconnect_attempted = False
             return self._format_result(result)
+        except TimeoutError as e:
+            # The server is busy, not gone: the request was cancelled, don't reconnect
+            timeout = self.connection.scheduler.timeout
+            raise ToolException(
+                f"MCP tool error ({self.server_name}/{self.mcp_tool_name}): "
+                f"timed out after {timeout:g}s"
+            ) from e
         except Exception as e:
-            # Try to reconnect once if we haven't already
-            if not self._reconnect_attempted:
-                self._reconnect_attempted = True
-                reconnected = await self._try_reconnect()
-                if reconnected:
-                    # Retry the call after reconnecting
-                    try:
-                        result = await self.connection.call_tool(self.mcp_tool_name, kwargs)
-                        self._reconnect_attempted = False
-                        return self._format_result(result)
-                    except Exception as retry_error:
-                        # Reconnect succeeded but call still failed
-                        await self._handle_persistent_failure()
-                        raise ToolException(
-                            f"MCP tool error ({self.server_name}/{self.mcp_tool_name}): {retry_error}"
-                        ) from retry_error
-                else:
-                    # Reconnect failed - disable the server
-                    await self._handle_persistent_failure()
+            from .manager import get_mcp_manager
 
+            checking = get_mcp_manager().check_server(self.server_name) is not None
+            hint = " (checking the connection in the background)" if checking else ""
             raise ToolException(
-                f"MCP tool error ({self.server_name}/{self.mcp_tool_name}): {e}"
+                f"MCP tool error ({self.server_name}/{self.mcp_tool_name}): {e}{hint}"
             ) from e
 
-    async def _try_reconnect(self) -> bool:
-        """Attempt to reconnect to the MCP server."""
-        from sdrbot_cli.config import console
-
-        console.print(
-            f"[yellow]MCP connection to {self.server_name} lost, attempting reconnect...[/yellow]"
-        )
-
-        try:
-            # Disconnect first (cleanup)
-            await self.connection.disconnect()
-            # Try to reconnect
-            success = await self.connection.connect()
-            if success:
-                console.print(f"[green]✓ Reconnected to {self.server_name}[/green]")
-                return True
-            return False
-        except Exception:
-            return False
-
-    async def _handle_persistent_failure(self) -> None:
-        """Handle persistent connection failure by disabling the server."""
-        from sdrbot_cli.config import console
-
-        from .config import disable_mcp_server
-        from .manager import get_mcp_manager
-
-        console.print(
-            f"[red]✗ Failed to reconnect to {self.server_name}. "
-            f"Disabling server. Use /mcp to re-enable.[/red]"
-        )
-
-        # Disable in config
-        disable_mcp_server(self.server_name)
-
-        # Remove from active connections
-        manager = get_mcp_manager()
-        if self.server_name in manager.connections:
-            try:
-                await manager.connections[self.server_name].disconnect()
-            except Exception:
-                pass
-            del manager.connections[self.server_name]
-
     def _format_result(self, result: Any) -> str:
         """Format MCP result content to string."""
         if isinstance(result, list):
@@ -209,8 +166,9 @@ def create_langchain_tool(server_name: str, mcp_tool: Any, connection: Any) -> B
 
     if input_schema and input_schema.get("properties"):
         try:
-            args_schema = json_schema_to_pydantic(
-                input_schema, model_name=f"{server_name}_{mcp_tool.name}_args"
+            args_schema = _args_model(
+                json.dumps(input_schema, sort_keys=True, default=str),
+                f"{server_name}_{mcp_tool.name}_args",
             )
         except Exception:
             # Fall back to no schema if conversion fails
@@ -222,6 +180,9 @@ def create_langchain_tool(server_name: str, mcp_tool: Any, connection: Any) -> B
     # Get description
     description = mcp_tool.description or f"MCP tool from {server_name}"
 
+    # Read-only tools may have their results reused (see sdrbot_cli.tool_cache)
+    read_only = bool(tool_annotations(mcp_tool).get("readOnlyHint"))
+
     return MCPToolWrapper(
         name=tool_name,
         description=description,
@@ -229,9 +190,20 @@ def create_langchain_tool(server_name: str, mcp_tool: Any, connection: Any) -> B
         server_name=server_name,
         mcp_tool_name=mcp_tool.name,
         connection=connection,
+        metadata={"read_only": True} if read_only else None,
     )
 
 
+def tool_annotations(mcp_tool: Any) -> dict[str, Any]:
+    """An MCP tool's behaviour hints (``readOnlyHint`` etc.) as a dict."""
+    annotations = getattr(mcp_tool, "annotations", None)
+    if annotations is None:
+        return {}
+    if isinstance(annotations, dict):
+        return annotations
+    return annotations.model_dump(exclude_none=True, by_alias=True)
+
+
 def get_mcp_tools() -> list[BaseTool]:
     """
     Get all MCP tools from connected servers.
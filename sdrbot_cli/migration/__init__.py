@@ -0,0 +1,32 @@
+"""CRM-to-CRM migrations run from a declarative config (see ``config``)."""
+
+from sdrbot_cli.migration.config import (
+    ConfigError,
+    FieldRule,
+    MigrationConfig,
+    StageConfig,
+    load_config,
+    parse_config,
+)
+from sdrbot_cli.migration.engine import map_record, preview_stage, reset_stage, run_stage
+from sdrbot_cli.migration.runner import preview_migration, reset_migration, run_migration
+from sdrbot_cli.migration.store import MigrationStore, StageRun, get_migration_store
+
+__all__ = [
+    "ConfigError",
+    "FieldRule",
+    "MigrationConfig",
+    "MigrationStore",
+    "StageConfig",
+    "StageRun",
+    "get_migration_store",
+    "load_config",
+    "map_record",
+    "parse_config",
+    "preview_migration",
+    "preview_stage",
+    "reset_migration",
+    "reset_stage",
+    "run_migration",
+    "run_stage",
+]
@@ -0,0 +1,358 @@
+"""Declarative migration config.
+
+A migration is described by a JSON file (usually ``files/migration/<name>.json``,
+written from the approved migration plan):
+
+.. code-block:: json
+
+    {
+      "name": "pipedrive_to_twenty",
+      "source": "pipedrive",
+      "target": "twenty",
+      "concurrency": 4,
+      "stages": [
+        {
+          "name": "companies",
+          "source_object": "organizations",
+          "target_object": "companies",
+          "fields": {
+            "name": "name",
+            "domainName.primaryLinkUrl": {"from": "website", "transform": "url"},
+            "employees": {"from": "people_count", "transform": "int"}
+          }
+        },
+        {
+          "name": "people",
+          "source_object": "persons",
+          "target_object": "people",
+          "filter": {"active_flag": true},
+          "fields": {
+            "name.firstName": {"from": "name", "transform": "first_word"},
+            "name.lastName": {"from": "name", "transform": "rest_words"},
+            "emails.primaryEmail": {"from": "email", "transform": "email", "required": true},
+            "companyId": {"ref": "companies", "from": "org_id.value"},
+            "city": {"value": "Berlin"}
+          }
+        }
+      ]
+    }
+
+Each ``fields`` entry maps a target field (dotted keys build nested objects)
+to a rule. A bare string is shorthand for ``{"from": "<source field>"}``.
+Nested source values are addressed with dots (``"org_id.value"``), list items
+by index (``"email.0.value"``) or, without an index, the first item
+(``"email.value"``). Rule keys:
+
+- ``from``: source field, or a list of fields (first non-empty wins, or all
+  are joined with ``join``).
+- ``value``: constant value instead of a source field.
+- ``transform``: one name or a list, applied in order (see ``TRANSFORMS``).
+- ``map``: lookup table for picklist values (unmapped values pass through
+  unless ``"map_default"`` is set).
+- ``ref``: name of an earlier stage. The source value is a source ID, and it
+  is replaced with the ID that record got in the target.
+- ``default``: value used when the result is empty.
+- ``required``: fail the record when the result is empty.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.dedupe.normalize import normalize_domain
+from sdrbot_cli.services.mirror import MIRROR_SERVICES, to_utc_iso
+
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+
+
+class ConfigError(ValueError):
+    """The migration config is invalid."""
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
+
+
+def _to_number(cast: Callable[[str], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        return cast(re.sub(r"[^0-9.\-]", "", str(value)) or "0")
+
+    return convert
+
+
+def _url(value: Any) -> str:
+    text = str(value).strip()
+    return text if re.match(r"^[a-z]+://", text, re.I) else f"https://{text}"
+
+
+def _date(value: Any) -> str | None:
+    stamp = to_utc_iso(value)
+    return stamp[:10] if stamp else None
+
+
+def _first_word(value: Any) -> str:
+    return str(value).strip().split(" ", 1)[0]
+
+
+def _rest_words(value: Any) -> str:
+    parts = str(value).strip().split(" ", 1)
+    return parts[1] if len(parts) > 1 else ""
+
+
+TRANSFORMS: dict[str, Callable[[Any], Any]] = {
+    "str": str,
+    "strip": lambda v: str(v).strip(),
+    "lower": lambda v: str(v).lower(),
+    "upper": lambda v: str(v).upper(),
+    "title": lambda v: str(v).title(),
+    "int": _to_number(lambda t: int(float(t))),
+    "float": _to_number(float),
+    "bool": _to_bool,
+    "date": _date,
+    "datetime": to_utc_iso,
+    "email": lambda v: str(v).strip().lower(),
+    "url": _url,
+    "domain": lambda v: normalize_domain(str(v)),
+    "digits": lambda v: re.sub(r"\D", "", str(v)),
+    "first_word": _first_word,
+    "rest_words": _rest_words,
+    "list": lambda v: [p.strip() for p in str(v).split(";") if p.strip()],
+}
+_RULE_KEYS = {
+    "from",
+    "value",
+    "transform",
+    "map",
+    "map_default",
+    "ref",
+    "default",
+    "required",
+    "join",
+}
+
+
+_EMPTY = (None, "", [], {})
+
+
+def source_value(record: dict[str, Any], path: str) -> Any:
+    """Read a dotted path from a source record (see the module docstring)."""
+    if path in record:
+        return record[path]
+    current: Any = record
+    for part in path.split("."):
+        if isinstance(current, list):
+            if part.isdigit():
+                index = int(part)
+                current = current[index] if index < len(current) else None
+                continue
+            current = current[0] if current else None
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+class MissingReference(LookupError):
+    """A ``ref`` field points at a record that hasn't been migrated."""
+
+
+@dataclass
+class FieldRule:
+    """How one target field is computed from a source record."""
+
+    target: str
+    sources: list[str] = field(default_factory=list)
+    value: Any = None
+    transforms: list[str] = field(default_factory=list)
+    mapping: dict[str, Any] | None = None
+    map_default: Any = None
+    ref: str | None = None
+    default: Any = None
+    required: bool = False
+    join: str | None = None
+
+    @classmethod
+    def parse(cls, target: str, spec: Any) -> FieldRule:
+        """Build a rule from its config entry."""
+        if isinstance(spec, str):
+            return cls(target, sources=[spec])
+        if not isinstance(spec, dict):
+            raise ConfigError(f"Field '{target}': expected a source field name or an object")
+        unknown = set(spec) - _RULE_KEYS
+        if unknown:
+            raise ConfigError(f"Field '{target}': unknown keys {', '.join(sorted(unknown))}")
+        sources = spec.get("from", [])
+        sources = [sources] if isinstance(sources, str) else list(sources)
+        if not sources and "value" not in spec:
+            raise ConfigError(f"Field '{target}': needs 'from' or 'value'")
+        transforms = spec.get("transform", [])
+        transforms = [transforms] if isinstance(transforms, str) else list(transforms)
+        for name in transforms:
+            if name not in TRANSFORMS:
+                raise ConfigError(
+                    f"Field '{target}': unknown transform '{name}'. "
+                    f"Options: {', '.join(TRANSFORMS)}"
+                )
+        return cls(
+            target,
+            sources=sources,
+            value=spec.get("value"),
+            transforms=transforms,
+            mapping=spec.get("map"),
+            map_default=spec.get("map_default"),
+            ref=spec.get("ref"),
+            default=spec.get("default"),
+            required=bool(spec.get("required")),
+            join=spec.get("join"),
+        )
+
+    def apply(self, record: dict[str, Any], lookup: Callable[[str, str], str | None]) -> Any:
+        """Compute the field's value for a source record.
+
+        Raises:
+            MissingReference: If a ``ref`` value has no migrated counterpart.
+        """
+        found = [v for v in (source_value(record, s) for s in self.sources) if v not in _EMPTY]
+        if not self.sources:
+            value = self.value
+        elif self.join is not None:
+            value = self.join.join(str(v) for v in found) or None
+        else:
+            value = found[0] if found else None
+
+        if value not in _EMPTY:
+            for name in self.transforms:
+                value = TRANSFORMS[name](value)
+            if self.mapping is not None:
+                value = self.mapping.get(
+                    str(value), self.map_default if self.map_default is not None else value
+                )
+            if self.ref:
+                target_id = lookup(self.ref, str(value))
+                if target_id is None:
+                    raise MissingReference(f"{self.ref} record {value} hasn't been migrated")
+                value = target_id
+
+        if value in _EMPTY:
+            value = self.default
+        return value
+
+
+@dataclass
+class StageConfig:
+    """One entity type to migrate."""
+
+    name: str
+    source_object: str
+    target_object: str
+    fields: list[FieldRule]
+    filter: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def references(self) -> set[str]:
+        """Stages this one looks IDs up in."""
+        return {rule.ref for rule in self.fields if rule.ref}
+
+
+@dataclass
+class MigrationConfig:
+    """A whole migration: source, target and ordered stages."""
+
+    name: str
+    source: str
+    target: str
+    stages: list[StageConfig]
+    concurrency: int = DEFAULT_CONCURRENCY
+    path: Path | None = None
+
+    def stage(self, name: str) -> StageConfig:
+        """Look up a stage by name.
+
+        Raises:
+            ConfigError: If there is no such stage.
+        """
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise ConfigError(
+            f"No stage named '{name}'. Stages: {', '.join(s.name for s in self.stages)}"
+        )
+
+    def select(self, names: str | None) -> list[StageConfig]:
+        """Stages named in a comma-separated list (all stages when None), in config order."""
+        if not names:
+            return list(self.stages)
+        wanted = {n.strip() for n in names.split(",") if n.strip()}
+        for name in wanted:
+            self.stage(name)
+        return [s for s in self.stages if s.name in wanted]
+
+
+def parse_config(data: dict[str, Any], path: Path | None = None) -> MigrationConfig:
+    """Validate a config dict.
+
+    Raises:
+        ConfigError: If the config is invalid.
+    """
+    for key in ("source", "target", "stages"):
+        if key not in data:
+            raise ConfigError(f"Missing '{key}'")
+    if not isinstance(data["stages"], list) or not data["stages"]:
+        raise ConfigError("'stages' must be a non-empty list")
+    for key in ("source", "target"):
+        if data[key] not in MIRROR_SERVICES:
+            raise ConfigError(
+                f"Unsupported {key} '{data[key]}'. Options: {', '.join(MIRROR_SERVICES)}"
+            )
+
+    stages: list[StageConfig] = []
+    for index, spec in enumerate(data["stages"], 1):
+        missing = [k for k in ("source_object", "target_object", "fields") if not spec.get(k)]
+        if missing:
+            raise ConfigError(f"Stage {index}: missing {', '.join(missing)}")
+        name = spec.get("name") or spec["target_object"]
+        fields = [FieldRule.parse(target, rule) for target, rule in spec["fields"].items()]
+        stage = StageConfig(name, spec["source_object"], spec["target_object"], fields)
+        stage.filter = dict(spec.get("filter") or {})
+        earlier = {s.name for s in stages}
+        for ref in stage.references:
+            if ref not in earlier:
+                raise ConfigError(
+                    f"Stage '{name}': ref '{ref}' must name an earlier stage "
+                    f"({', '.join(earlier) or 'none'})"
+                )
+        stages.append(stage)
+
+    concurrency = int(data.get("concurrency", DEFAULT_CONCURRENCY))
+    default_name = path.stem if path else f"{data['source']}_to_{data['target']}"
+    return MigrationConfig(
+        name=data.get("name") or default_name,
+        source=data["source"],
+        target=data["target"],
+        stages=stages,
+        concurrency=max(1, min(concurrency, MAX_CONCURRENCY)),
+        path=path,
+    )
+
+
+def load_config(path: Path) -> MigrationConfig:
+    """Load and validate a migration config file.
+
+    Raises:
+        ConfigError: If the file isn't valid JSON or the config is invalid.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ConfigError(f"{path.name} is not valid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ConfigError(f"{path.name} must contain a JSON object")
+    return parse_config(data, path)
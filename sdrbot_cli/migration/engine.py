@@ -0,0 +1,320 @@
+"""Streaming CRM-to-CRM migration runs.
+
+A stage streams records from the source CRM through its paginated mirror
+reader (``sdrbot_cli.services.<source>.mirror``), maps each record with the
+stage's field rules, and writes the results to the target CRM with its bulk
+writer (``sdrbot_cli.services.<target>.batch``). Several write chunks are in
+flight at once, up to the config's ``concurrency``, while the next pages are
+read. The service clients share the rate limiter, so extra workers never
+exceed the provider's limits.
+
+Every chunk is checkpointed in the :class:`~sdrbot_cli.migration.store.MigrationStore`
+as soon as it is written: source ID to new target ID for created records, the
+error for failed ones. Running a stage again skips mapped records, so an
+interrupted run resumes and a partly failed one retries only its failures.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import csv
+import importlib
+import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from sdrbot_cli.config import settings
+from sdrbot_cli.jobs import current_job
+from sdrbot_cli.migration.config import (
+    MigrationConfig,
+    MissingReference,
+    StageConfig,
+    source_value,
+)
+from sdrbot_cli.migration.store import MigrationStore, StageRun
+from sdrbot_cli.services.batch import BatchResult, expand_dotted
+from sdrbot_cli.services.mirror import get_source
+
+# Records handed to the target's batch writer at once (it splits them into
+# the provider's request size)
+WRITE_CHUNK_SIZE = 200
+
+
+@dataclass
+class MappedRecord:
+    """A source record and the payload it maps to."""
+
+    source_id: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    unresolved_refs: int = 0
+
+
+def _writer(service: str) -> ModuleType:
+    return importlib.import_module(f"sdrbot_cli.services.{service}.batch")
+
+
+def _matches_filter(data: dict[str, Any], conditions: dict[str, Any]) -> bool:
+    for path, expected in conditions.items():
+        value = source_value(data, path)
+        if value != expected and str(value) != str(expected):
+            return False
+    return True
+
+
+def map_record(
+    stage: StageConfig, source_id: str, data: dict[str, Any], refs: dict[str, dict[str, str]]
+) -> MappedRecord:
+    """Apply a stage's field rules to one source record.
+
+    Args:
+        stage: The stage being migrated.
+        source_id: The record's ID in the source CRM.
+        data: The source record.
+        refs: ID maps of the stages this one references.
+
+    Returns:
+        The target payload, or an error when a required field is empty, a
+        transform fails or a required link can't be resolved. Optional links
+        to records that weren't migrated are left out and counted.
+    """
+    mapped = MappedRecord(source_id)
+    flat: dict[str, Any] = {}
+
+    def lookup(ref: str, value: str) -> str | None:
+        return refs.get(ref, {}).get(value)
+
+    for rule in stage.fields:
+        try:
+            value = rule.apply(data, lookup)
+        except MissingReference as e:
+            if rule.required:
+                mapped.error = f"{rule.target}: {e}"
+                return mapped
+            mapped.unresolved_refs += 1
+            continue
+        except (TypeError, ValueError) as e:
+            mapped.error = f"{rule.target}: {e}"
+            return mapped
+        if value in (None, "", [], {}):
+            if rule.required:
+                mapped.error = f"{rule.target} is required but empty"
+                return mapped
+            continue
+        flat[rule.target] = value
+    mapped.payload = expand_dotted(flat)
+    return mapped
+
+
+def _read(
+    config: MigrationConfig, stage: StageConfig, client: Any
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    for record in get_source(config.source).fetch_records(client, stage.source_object, None):
+        if not record.deleted:
+            yield record.id, record.data
+
+
+def _correlate(
+    batch: list[MappedRecord], result: BatchResult
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Match a write's IDs and errors back to source records.
+
+    Returns:
+        (``(source_id, target_id)`` pairs, ``(source_id, error)`` pairs)
+    """
+    created = []
+    unmatched = []
+    for target_id, row in zip(result.ids, result.rows, strict=True):
+        if row is None:
+            unmatched.append(target_id)
+        else:
+            created.append((batch[row - 1].source_id, target_id))
+
+    done = {source_id for source_id, _ in created}
+    row_errors = {row: message for row, message in result.errors if row is not None}
+    general = next((message for row, message in result.errors if row is None), None)
+    failed = []
+    for row, mapped in enumerate(batch, 1):
+        if mapped.source_id in done:
+            continue
+        message = row_errors.get(row) or general or "not created"
+        if unmatched:
+            # The provider created records without saying which; they may include this one
+            message += f" (records {', '.join(unmatched)} were created but not matched)"
+        failed.append((mapped.source_id, message))
+    return created, failed
+
+
+def write_failures(config: MigrationConfig, stage: StageConfig, store: MigrationStore) -> Path:
+    """Write a stage's outstanding failures to ``files/migration/``."""
+    out_dir = settings.get_files_dir() / "migration"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{config.name}_{stage.name}_failures.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(("source_id", "error"))
+        writer.writerows(store.failures(config.name, stage.name))
+    return path
+
+
+def run_stage(
+    config: MigrationConfig,
+    stage: StageConfig,
+    store: MigrationStore,
+    *,
+    limit: int | None = None,
+    source_client: Any = None,
+    target_client: Any = None,
+) -> StageRun:
+    """Migrate one stage, skipping records an earlier run already created.
+
+    Args:
+        config: The migration.
+        stage: The stage to run.
+        store: Where ID mappings and failures are checkpointed.
+        limit: Stop after sending this many records (for a trial run).
+        source_client: Source CRM client (defaults to the service's own).
+        target_client: Target CRM client (defaults to the service's own).
+
+    Returns:
+        Counters for the run. ``finished`` is False if it stopped early.
+    """
+    started = time.time()
+    run = StageRun(config.name, stage.name)
+    source_client = source_client or get_source(config.source).get_client()
+    target_client = target_client or get_source(config.target).get_client()
+    writer = _writer(config.target)
+    done = store.id_map(config.name, stage.name)
+    refs = {ref: store.id_map(config.name, ref) for ref in stage.references}
+
+    def write(batch: list[MappedRecord]) -> tuple[list[MappedRecord], BatchResult]:
+        try:
+            result = writer.batch_create(
+                target_client, stage.target_object, [m.payload for m in batch]
+            )
+        except Exception as e:
+            result = BatchResult("create", stage.target_object, len(batch), errors=[(None, str(e))])
+        return batch, result
+
+    job = current_job()
+
+    def collect(future: Future) -> None:
+        batch, result = future.result()
+        created, failed = _correlate(batch, result)
+        store.record(config.name, stage.name, created, failed)
+        run.created += len(created)
+        run.failed += len(failed)
+        if job is not None:
+            job.progress(run.created + run.skipped)
+
+    pending: set[Future] = set()
+    sent = 0
+    batch: list[MappedRecord] = []
+    with ThreadPoolExecutor(max_workers=config.concurrency) as pool:
+        try:
+            for source_id, data in _read(config, stage, source_client):
+                run.read += 1
+                if source_id in done:
+                    run.skipped += 1
+                    continue
+                if stage.filter and not _matches_filter(data, stage.filter):
+                    run.filtered += 1
+                    continue
+                if limit is not None and sent >= limit:
+                    break
+                mapped = map_record(stage, source_id, data, refs)
+                run.unresolved_refs += mapped.unresolved_refs
+                sent += 1
+                if mapped.error:
+                    store.record(config.name, stage.name, [], [(source_id, mapped.error)])
+                    run.failed += 1
+                    continue
+                batch.append(mapped)
+                if len(batch) >= WRITE_CHUNK_SIZE:
+                    if job is not None:
+                        job.check_cancelled()
+                    # Writers run in the job's context, so they don't start jobs of their own
+                    pending.add(pool.submit(contextvars.copy_context().run, write, batch))
+                    batch = []
+                # Bound the records held in memory while the reader runs ahead
+                while len(pending) >= config.concurrency * 2:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        collect(future)
+            else:
+                run.finished = True
+            if batch:
+                pending.add(pool.submit(contextvars.copy_context().run, write, batch))
+        finally:
+            for future in pending:
+                collect(future)
+            run.elapsed = time.time() - started
+            store.save_run(run, started)
+    return run
+
+
+def preview_stage(
+    config: MigrationConfig,
+    stage: StageConfig,
+    store: MigrationStore,
+    sample_size: int = 3,
+    *,
+    source_client: Any = None,
+) -> str:
+    """Show how the first few source records would be written, without writing.
+
+    Returns:
+        JSON of ``{"source_id", "source", "target"}`` samples (``error``
+        instead of ``target`` for records that would fail).
+    """
+    source_client = source_client or get_source(config.source).get_client()
+    refs = {ref: store.id_map(config.name, ref) for ref in stage.references}
+    samples = []
+    for source_id, data in _read(config, stage, source_client):
+        if stage.filter and not _matches_filter(data, stage.filter):
+            continue
+        mapped = map_record(stage, source_id, data, refs)
+        sample: dict[str, Any] = {"source_id": source_id, "source": data}
+        if mapped.error:
+            sample["error"] = mapped.error
+        else:
+            sample["target"] = mapped.payload
+        samples.append(sample)
+        if len(samples) >= sample_size:
+            break
+    return json.dumps(samples, indent=2, default=str)
+
+
+def reset_stage(
+    config: MigrationConfig,
+    stage: StageConfig,
+    store: MigrationStore,
+    *,
+    target_client: Any = None,
+) -> str:
+    """Delete the records a stage created in the target and forget its mappings.
+
+    Returns:
+        Summary of what was deleted.
+    """
+    target_ids = store.target_ids(config.name, stage.name)
+    if not target_ids:
+        store.forget(config.name, stage.name)
+        return f"{stage.name}: nothing to delete."
+    target_client = target_client or get_source(config.target).get_client()
+    writer = _writer(config.target)
+    delete = getattr(writer, "batch_delete", None) or writer.batch_archive
+    result = delete(target_client, stage.target_object, target_ids)
+    if result.failed:
+        store.forget(config.name, stage.name, result.ids)
+        return (
+            f"{stage.name}: deleted {len(result.ids):,} of {len(target_ids):,} records; "
+            f"run the reset again to retry the rest.\n{result.summary()}"
+        )
+    store.forget(config.name, stage.name)
+    return f"{stage.name}: deleted {len(result.ids):,} records from {config.target}."
@@ -0,0 +1,102 @@
+"""Agent-facing migration commands: preview, run and reset stages of a config file."""
+
+from __future__ import annotations
+
+from sdrbot_cli.enrichment.batch import resolve_input_path
+from sdrbot_cli.jobs import JobCancelled, job_context
+from sdrbot_cli.migration.config import ConfigError, MigrationConfig, load_config
+from sdrbot_cli.migration.engine import preview_stage, reset_stage, run_stage, write_failures
+from sdrbot_cli.migration.store import get_migration_store
+
+
+def _load(config_file: str) -> MigrationConfig:
+    """Resolve and load a config file (relative paths are looked up in ./files/).
+
+    Raises:
+        ConfigError: If the file is missing or invalid.
+    """
+    try:
+        path = resolve_input_path(config_file)
+    except FileNotFoundError as e:
+        raise ConfigError(str(e)) from e
+    return load_config(path)
+
+
+def preview_migration(config_file: str, stage: str | None = None, sample_size: int = 3) -> str:
+    """Map the first few records of a stage (default: the first) without writing."""
+    try:
+        config = _load(config_file)
+        selected = config.stage(stage) if stage else config.stages[0]
+    except ConfigError as e:
+        return f"Error: {e}"
+    try:
+        samples = preview_stage(config, selected, get_migration_store(), max(1, sample_size))
+    except Exception as e:
+        return f"Error reading {config.source} {selected.source_object}: {e}"
+    return (
+        f"Preview of stage '{selected.name}' ({config.source} {selected.source_object} -> "
+        f"{config.target} {selected.target_object}); nothing was written:\n{samples}"
+    )
+
+
+def run_migration(config_file: str, stages: str | None = None, limit: int | None = None) -> str:
+    """Run stages in config order as a job, resuming from earlier runs.
+
+    Args:
+        config_file: Path to the migration config.
+        stages: Comma-separated stage names (default: all).
+        limit: Records to send per stage, for a trial run.
+
+    Returns:
+        Per-stage summaries, with the failures file of any stage that has failures.
+    """
+    try:
+        config = _load(config_file)
+        selected = config.select(stages)
+    except ConfigError as e:
+        return f"Error: {e}"
+
+    store = get_migration_store()
+    lines = [f"Migration '{config.name}' ({config.source} -> {config.target}):"]
+    params = {"config_file": str(config.path), "stages": stages, "limit": limit}
+    title = f"migration {config.name} ({', '.join(s.name for s in selected)})"
+    with job_context("migration", title, params) as job:
+        lines[0] += f" job #{job.id}"
+        for stage in selected:
+            missing = [
+                ref for ref in sorted(stage.references) if not store.id_map(config.name, ref)
+            ]
+            if missing:
+                lines.append(
+                    f"{stage.name}: not run; run stage {', '.join(missing)} first "
+                    "(its IDs are needed for links)."
+                )
+                break
+            try:
+                run = run_stage(config, stage, store, limit=limit)
+            except JobCancelled:
+                lines.append(f"{stage.name}: cancelled. Run again to resume.")
+                break
+            except Exception as e:
+                job.mark_incomplete(str(e))
+                lines.append(f"{stage.name}: stopped: {e}. Run again to resume.")
+                break
+            lines.append(run.summary())
+            if store.failures(config.name, stage.name):
+                lines.append(f"  Failures: {write_failures(config, stage, store)}")
+            if not run.finished:
+                break
+    return "\n".join(lines)
+
+
+def reset_migration(config_file: str, stage: str) -> str:
+    """Delete the records a stage created in the target and clear its progress."""
+    try:
+        config = _load(config_file)
+        selected = config.stage(stage)
+    except ConfigError as e:
+        return f"Error: {e}"
+    try:
+        return reset_stage(config, selected, get_migration_store())
+    except Exception as e:
+        return f"Error deleting {selected.name} records: {e}"
@@ -0,0 +1,223 @@
+"""SQLite state for migrations: the source-to-target ID map, failures and stage runs.
+
+The ID map is what makes runs resumable. A record is skipped when its
+source ID is already mapped, so an interrupted or partly failed stage
+continues where it stopped when run again. Later stages look up the new IDs
+of related records (e.g. a person's company) in the same table.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from sdrbot_cli.config import get_config_dir
+
+
+@dataclass
+class StageRun:
+    """Counters for one run of a stage."""
+
+    migration: str
+    stage: str
+    read: int = 0
+    created: int = 0
+    skipped: int = 0
+    filtered: int = 0
+    failed: int = 0
+    unresolved_refs: int = 0
+    elapsed: float = 0.0
+    finished: bool = False
+
+    @property
+    def throughput(self) -> float:
+        """Records created per second."""
+        return self.created / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """One-line summary for the agent."""
+        parts = [f"{self.read:,} read", f"{self.created:,} created"]
+        if self.skipped:
+            parts.append(f"{self.skipped:,} already migrated")
+        if self.filtered:
+            parts.append(f"{self.filtered:,} filtered out")
+        if self.failed:
+            parts.append(f"{self.failed:,} failed")
+        if self.unresolved_refs:
+            parts.append(f"{self.unresolved_refs:,} links left empty (related record not migrated)")
+        status = "" if self.finished else " (interrupted; run again to resume)"
+        return (
+            f"{self.stage}: {', '.join(parts)} in {self.elapsed:.1f}s "
+            f"({self.throughput:.1f} records/s){status}"
+        )
+
+
+class MigrationStore:
+    """ID map, failures and run history (safe to share across threads)."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS id_map (
+                migration TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (migration, stage, source_id)
+            );
+            CREATE TABLE IF NOT EXISTS failures (
+                migration TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                error TEXT NOT NULL,
+                failed_at REAL NOT NULL,
+                PRIMARY KEY (migration, stage, source_id)
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                migration TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                read INTEGER NOT NULL,
+                created INTEGER NOT NULL,
+                skipped INTEGER NOT NULL,
+                failed INTEGER NOT NULL,
+                elapsed REAL NOT NULL,
+                finished INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def id_map(self, migration: str, stage: str) -> dict[str, str]:
+        """Source ID to target ID for every record a stage has migrated."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_id, target_id FROM id_map WHERE migration = ? AND stage = ?",
+                (migration, stage),
+            ).fetchall()
+        return dict(rows)
+
+    def target_ids(self, migration: str, stage: str) -> list[str]:
+        """Target IDs created by a stage."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT target_id FROM id_map WHERE migration = ? AND stage = ?",
+                (migration, stage),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def record(
+        self,
+        migration: str,
+        stage: str,
+        created: Iterable[tuple[str, str]],
+        failed: Iterable[tuple[str, str]],
+    ) -> None:
+        """Checkpoint one written chunk: ``(source_id, target_id)`` and ``(source_id, error)``."""
+        now = time.time()
+        with self._lock:
+            for source_id, target_id in created:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO id_map VALUES (?, ?, ?, ?, ?)",
+                    (migration, stage, source_id, target_id, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM failures WHERE migration = ? AND stage = ? AND source_id = ?",
+                    (migration, stage, source_id),
+                )
+            for source_id, error in failed:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO failures VALUES (?, ?, ?, ?, ?)",
+                    (migration, stage, source_id, error, now),
+                )
+            self._conn.commit()
+
+    def failures(self, migration: str, stage: str) -> list[tuple[str, str]]:
+        """Outstanding ``(source_id, error)`` failures for a stage."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT source_id, error FROM failures WHERE migration = ? AND stage = ? "
+                "ORDER BY failed_at",
+                (migration, stage),
+            ).fetchall()
+
+    def forget(self, migration: str, stage: str, target_ids: Iterable[str] | None = None) -> None:
+        """Drop ID mappings by target ID, or all of a stage's state when ``target_ids`` is None."""
+        with self._lock:
+            if target_ids is None:
+                for table in ("id_map", "failures"):
+                    self._conn.execute(
+                        f"DELETE FROM {table} WHERE migration = ? AND stage = ?",
+                        (migration, stage),
+                    )
+            else:
+                self._conn.executemany(
+                    "DELETE FROM id_map WHERE migration = ? AND stage = ? AND target_id = ?",
+                    [(migration, stage, i) for i in target_ids],
+                )
+            self._conn.commit()
+
+    def save_run(self, run: StageRun, started_at: float) -> None:
+        """Record a finished (or interrupted) stage run."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run.migration,
+                    run.stage,
+                    started_at,
+                    run.read,
+                    run.created,
+                    run.skipped,
+                    run.failed,
+                    run.elapsed,
+                    int(run.finished),
+                ),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _store_db_path() -> Path:
+    """Return the path to the migration state database."""
+    return get_config_dir() / "migrations.db"
+
+
+# Shared store instance, re-opened if the working directory changes
+_store: MigrationStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_migration_store() -> MigrationStore:
+    """Get the shared migration store for the current project."""
+    global _store
+    db_path = _store_db_path()
+    with _store_lock:
+        if _store is None or _store.db_path != db_path:
+            if _store is not None:
+                _store.close()
+            _store = MigrationStore(db_path)
+        return _store
+
+
+def reset_migration_store() -> None:
+    """Close the shared store (useful for testing)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
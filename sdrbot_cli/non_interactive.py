@@ -12,7 +12,6 @@ Usage examples::
 
 from __future__ import annotations
 
-import asyncio
 import json
 import uuid
 from typing import Any
@@ -33,6 +32,7 @@ async def run_non_interactive(
     output_format: str = "text",
     max_turns: int = 50,
     auto_approve: bool = False,
+    profile_startup: bool = False,
 ) -> dict[str, Any]:
     """Execute *prompt* without a TUI and return structured output.
 
@@ -50,6 +50,8 @@ async def run_non_interactive(
         If ``True``, approve **all** HITL prompts automatically.
         If ``False``, only allow-listed shell commands are auto-approved;
         anything else causes the run to abort with an error.
+    profile_startup:
+        If ``True``, print agent build timings to stderr before running.
 
     Returns
     -------
@@ -85,6 +87,13 @@ async def run_non_interactive(
         )
     )
 
+    if profile_startup:
+        from sdrbot_cli.startup import get_startup_profile
+
+        profile = get_startup_profile()
+        profile.mark("agent ready")
+        console.print(profile.report())
+
     thread_id = str(uuid.uuid4())
     config = {
         "configurable": {"thread_id": thread_id},
@@ -102,7 +111,7 @@ async def run_non_interactive(
 
         for turn in range(max_turns):
             turns = turn + 1
-            result = await asyncio.to_thread(lambda: agent.invoke(input_msg, config))
+            result = await agent.ainvoke(input_msg, config)
 
             # Extract text from the last AI message
             messages = result.get("messages", [])
@@ -119,7 +128,7 @@ async def run_non_interactive(
                     break
 
             # Check for pending interrupts (HITL)
-            state = agent.get_state(config)
+            state = await agent.aget_state(config)
             if not state.next:
                 # Agent completed normally
                 break
@@ -127,7 +136,7 @@ async def run_non_interactive(
             # There are pending interrupts — handle them
             if auto_approve:
                 # Approve everything
-                agent.invoke(None, config)
+                await agent.ainvoke(None, config)
                 continue
 
             # Check if pending tools are allow-listed
@@ -161,7 +170,7 @@ async def run_non_interactive(
                 break
 
             # All pending are allowed — approve and continue
-            agent.invoke(None, config)
+            await agent.ainvoke(None, config)
 
         else:
             status = "error"
@@ -0,0 +1,528 @@
+"""Client-side rate limiting for outbound API calls.
+
+Provides a thread-safe token bucket that service clients share so that
+concurrent work (e.g. batch enrichment, bulk CRM updates) stays within a
+provider's request budget instead of tripping 429s.
+
+Every service client sends its requests through :func:`call_with_rate_limit`,
+which takes a token from the service's bucket (and from an endpoint bucket
+when one is configured), feeds the response's ``X-RateLimit-*`` /
+``Retry-After`` headers back into the bucket, and retries 429s with jittered
+exponential backoff. A 429 also halves the bucket's rate, which then creeps
+back up as requests succeed.
+
+Limits default per service (``SERVICE_LIMITS`` / ``ENDPOINT_LIMITS``) and can
+be overridden with the ``rate_limit`` service setting, e.g.::
+
+    {"rate": 5, "burst": 10, "endpoints": {"/crm/v3/objects/*/search": {"rate": 2}}}
+
+Endpoint keys are ``fnmatch`` patterns matched against the request path.
+Setting changes apply to existing buckets on their next request.
+
+Each bucket counts queued callers and the time they spent throttled; see
+:func:`get_rate_limit_stats` (shown in the TUI status bar).
+"""
+
+import asyncio
+import fnmatch
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Default (requests per second, burst) per service
+SERVICE_LIMITS: dict[str, tuple[float, int]] = {
+    "apollo": (1.0, 3),
+    "hunter": (10.0, 10),
+    "lusha": (2.0, 2),
+    "hubspot": (10.0, 10),
+    "pipedrive": (10.0, 20),
+    "attio": (25.0, 25),
+    "twenty": (1.6, 10),
+    "zohocrm": (5.0, 10),
+}
+DEFAULT_LIMIT = (5.0, 5)
+
+# Stricter per-endpoint budgets (fnmatch patterns), applied on top of the service bucket
+ENDPOINT_LIMITS: dict[str, dict[str, tuple[float, int]]] = {
+    "hubspot": {"/crm/v3/objects/*/search": (4.0, 4)},
+}
+
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+# Lowest fraction of the configured rate adaptive backoff may drop to
+MIN_RATE_FACTOR = 0.1
+# Fraction of the configured rate recovered per successful request
+RECOVERY_STEP = 0.05
+
+# Float slack when comparing token counts (refill arithmetic is not exact)
+_TOKEN_EPSILON = 1e-9
+
+
+@dataclass
+class LimiterStats:
+    """Snapshot of a limiter's counters."""
+
+    name: str
+    rate: float
+    requests: int
+    waiting: int
+    peak_waiting: int
+    throttle_seconds: float
+    throttled: int
+
+
+class RateLimiter:
+    """Thread-safe token bucket with adaptive backoff.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Each call to :meth:`acquire` consumes one token, sleeping until one
+    is available. :meth:`observe` lets server feedback pause the bucket or
+    slow it down.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None, name: str = "") -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second.
+            burst: Maximum tokens that can accumulate (defaults to ``max(1, rate)``).
+            name: Label used in metrics.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.requests = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.throttle_seconds = 0.0
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _take(self) -> float:
+        """Consume a token and return 0, or return how long to wait for one."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= 1 - _TOKEN_EPSILON:
+                self._tokens = max(0.0, self._tokens - 1)
+                self.requests += 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def _queue(self, delta: int) -> None:
+        with self._lock:
+            self.waiting += delta
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.throttle_seconds += waited
+
+    def acquire(self) -> float:
+        """Block until a token is available and consume it.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        queued = False
+        try:
+            while (delay := self._take()) > 0:
+                if not queued:
+                    queued = True
+                    self._queue(1)
+                time.sleep(delay)
+                waited += delay
+        finally:
+            if queued:
+                self._queue(-1)
+        self._record_wait(waited)
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Like :meth:`acquire`, but waits without blocking the event loop."""
+        waited = 0.0
+        queued = False
+        try:
+            while (delay := self._take()) > 0:
+                if not queued:
+                    queued = True
+                    self._queue(1)
+                await asyncio.sleep(delay)
+                waited += delay
+        finally:
+            if queued:
+                self._queue(-1)
+        self._record_wait(waited)
+        return waited
+
+    def configure(self, rate: float, burst: int) -> None:
+        """Apply a new configured rate/burst, keeping any adaptive slowdown."""
+        with self._lock:
+            if rate == self.base_rate and burst == self.burst:
+                return
+            self.rate = rate * (self.rate / self.base_rate)
+            self.base_rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (extends, never shortens).
+
+        When the pause ends exactly one request may go immediately; the rest
+        refill at the (possibly reduced) rate so callers don't stampede.
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 1.0
+                self._updated = until
+
+    def observe(self, status: int | None, headers: Mapping[str, str], attempt: int = 0) -> float:
+        """Feed a response back into the limiter.
+
+        Args:
+            status: HTTP status code (None if unknown).
+            headers: Response headers.
+            attempt: Zero-based retry attempt (drives exponential backoff).
+
+        Returns:
+            Seconds the limiter is now paused for (0 if not paused).
+        """
+        info = parse_rate_limit_headers(headers)
+
+        if status == 429:
+            with self._lock:
+                self.throttled += 1
+                self.rate = max(self.base_rate * MIN_RATE_FACTOR, self.rate / 2)
+            delay = info.retry_after
+            if delay is None:
+                delay = info.reset_after if info.remaining == 0 else None
+            if delay is None:
+                delay = backoff_delay(attempt)
+            else:
+                delay += random.uniform(0, min(1.0, delay / 2))
+            self.pause(delay)
+            return delay
+
+        if isinstance(status, int) and status < 400:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_STEP)
+
+        if info.remaining is not None:
+            if info.remaining <= 0:
+                delay = info.reset_after or info.retry_after or 1.0
+                self.pause(delay)
+                return delay
+            with self._lock:
+                # Never hand out more tokens than the server says are left
+                self._tokens = min(self._tokens, float(info.remaining))
+        return 0.0
+
+    def stats(self) -> LimiterStats:
+        """Current counters."""
+        with self._lock:
+            return LimiterStats(
+                name=self.name,
+                rate=self.rate,
+                requests=self.requests,
+                waiting=self.waiting,
+                peak_waiting=self.peak_waiting,
+                throttle_seconds=self.throttle_seconds,
+                throttled=self.throttled,
+            )
+
+
+@dataclass
+class RateLimitInfo:
+    """Rate limit hints parsed from response headers."""
+
+    remaining: int | None = None
+    reset_after: float | None = None
+    retry_after: float | None = None
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str) -> float | None:
+    """Interpret a reset header as seconds from now.
+
+    Providers send either a delta in seconds or an epoch timestamp (s or ms).
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if number > 1e12:
+        number = number / 1000 - time.time()
+    elif number > 1e9:
+        number = number - time.time()
+    return max(0.0, number)
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> RateLimitInfo:
+    """Extract remaining budget / reset / retry hints from response headers.
+
+    Understands the common ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset``
+    family (including vendor variants like ``X-HubSpot-RateLimit-Remaining``),
+    HubSpot's ``...-Interval-Milliseconds`` window and ``Retry-After``.
+    """
+    info = RateLimitInfo()
+    if not isinstance(headers, Mapping):
+        return info
+
+    window: float | None = None
+    for raw_name, raw_value in headers.items():
+        name = str(raw_name).lower()
+        value = str(raw_value).strip()
+        if name == "retry-after":
+            info.retry_after = _parse_retry_after(value)
+        elif "ratelimit" not in name:
+            continue
+        elif name.endswith("remaining"):
+            try:
+                remaining = int(float(value))
+            except ValueError:
+                continue
+            info.remaining = remaining if info.remaining is None else min(info.remaining, remaining)
+        elif name.endswith("reset"):
+            reset = _parse_reset(value)
+            if reset is not None:
+                info.reset_after = max(info.reset_after or 0.0, reset)
+        elif name.endswith("interval-milliseconds"):
+            try:
+                window = float(value) / 1000
+            except ValueError:
+                continue
+
+    if info.reset_after is None and window is not None and info.remaining == 0:
+        info.reset_after = window
+    return info
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter ("equal jitter": half fixed, half random)."""
+    ceiling = min(BACKOFF_CAP, BACKOFF_BASE * (2**attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+# Shared limiters keyed by name (e.g. "apollo", "hubspot:/crm/v3/objects/*/search")
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: int | None = None) -> RateLimiter:
+    """Get or create the shared limiter for ``name``.
+
+    The first caller's ``rate``/``burst`` win; later callers share the
+    same bucket so that all traffic to a provider is accounted together
+    (use :meth:`RateLimiter.configure` to change an existing bucket).
+
+    Args:
+        name: Limiter key, usually the service name.
+        rate: Sustained requests per second.
+        burst: Maximum burst size.
+
+    Returns:
+        The shared RateLimiter instance.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst, name=name)
+            _limiters[name] = limiter
+        return limiter
+
+
+def _configured_limits(service: str) -> dict[str, Any]:
+    """Read the ``rate_limit`` service setting (empty if unset or unreadable)."""
+    try:
+        from sdrbot_cli.services.registry import load_config
+
+        value = load_config().get_setting(service, "rate_limit", None)
+    except Exception:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def get_service_limiters(service: str, endpoint: str | None = None) -> list[RateLimiter]:
+    """Get the limiters a request to ``service``/``endpoint`` must pass through.
+
+    Always includes the service bucket; adds an endpoint bucket when the
+    endpoint matches a configured pattern. The ``rate_limit`` setting is
+    re-applied to existing buckets, so changes take effect without a restart.
+    """
+    overrides = _configured_limits(service)
+    rate, burst = SERVICE_LIMITS.get(service, DEFAULT_LIMIT)
+    service_rate = float(overrides.get("rate", rate))
+    service_burst = int(overrides.get("burst", burst))
+    limiter = get_rate_limiter(service, service_rate, service_burst)
+    limiter.configure(service_rate, service_burst)
+    limiters = [limiter]
+
+    if endpoint:
+        path = endpoint.split("?", 1)[0]
+        patterns = dict(ENDPOINT_LIMITS.get(service, {}))
+        for pattern, limit in (overrides.get("endpoints") or {}).items():
+            limit = limit if isinstance(limit, dict) else {"rate": limit}
+            default_rate, default_burst = patterns.get(pattern, (rate, burst))
+            patterns[pattern] = (
+                float(limit.get("rate", default_rate)),
+                int(limit.get("burst", default_burst)),
+            )
+        for pattern, (ep_rate, ep_burst) in patterns.items():
+            if fnmatch.fnmatch(path, pattern):
+                endpoint_limiter = get_rate_limiter(f"{service}:{pattern}", ep_rate, ep_burst)
+                endpoint_limiter.configure(ep_rate, ep_burst)
+                limiters.append(endpoint_limiter)
+                break
+
+    return limiters
+
+
+def _status_and_headers(obj: Any) -> tuple[int | None, Mapping[str, str]]:
+    """Pull the status code and headers off a response or HTTP exception."""
+    response = getattr(obj, "response", None)
+    if response is not None and not isinstance(obj, Mapping):
+        obj = response  # requests.HTTPError
+    status = getattr(obj, "status_code", None)
+    if status is None:
+        status = getattr(obj, "status", None)
+    headers = getattr(obj, "headers", None)
+    if not isinstance(headers, Mapping) and callable(getattr(obj, "getheaders", None)):
+        headers = obj.getheaders()
+    return (
+        status if isinstance(status, int) else None,
+        headers if isinstance(headers, Mapping) else {},
+    )
+
+
+def call_with_rate_limit(
+    service: str,
+    endpoint: str | None,
+    send: Callable[[], T],
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> T:
+    """Send a request through the service's limiters, retrying on 429.
+
+    ``send`` may either return a response object (``requests.Response`` or
+    similar, exposing ``status_code``/``status`` and ``headers``) or raise an
+    HTTP exception carrying them; both styles are handled.
+
+    Args:
+        service: Service name (e.g. "hubspot").
+        endpoint: Request path, used for endpoint-specific budgets.
+        send: Performs the HTTP request.
+        max_retries: Retries allowed for 429 responses.
+
+    Returns:
+        Whatever ``send`` returns (the final response after retries).
+    """
+    limiters = get_service_limiters(service, endpoint)
+    attempt = 0
+    while True:
+        for limiter in limiters:
+            limiter.acquire()
+        try:
+            response = send()
+        except Exception as e:
+            status, headers = _status_and_headers(e)
+            if status is None:
+                raise
+            for limiter in limiters:
+                limiter.observe(status, headers, attempt)
+            if status != 429 or attempt >= max_retries:
+                raise
+        else:
+            status, headers = _status_and_headers(response)
+            for limiter in limiters:
+                limiter.observe(status, headers, attempt)
+            if status != 429 or attempt >= max_retries:
+                return response
+        attempt += 1
+
+
+async def acall_with_rate_limit(
+    service: str,
+    endpoint: str | None,
+    send: Callable[[], Awaitable[T]],
+    *,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> T:
+    """Async :func:`call_with_rate_limit`: ``send`` returns an awaitable.
+
+    Waiting for a token or a 429 backoff yields to the event loop instead of
+    blocking a thread, so concurrent async tool calls share the buckets.
+    """
+    limiters = get_service_limiters(service, endpoint)
+    attempt = 0
+    while True:
+        for limiter in limiters:
+            await limiter.acquire_async()
+        try:
+            response = await send()
+        except Exception as e:
+            status, headers = _status_and_headers(e)
+            if status is None:
+                raise
+            for limiter in limiters:
+                limiter.observe(status, headers, attempt)
+            if status != 429 or attempt >= max_retries:
+                raise
+        else:
+            status, headers = _status_and_headers(response)
+            for limiter in limiters:
+                limiter.observe(status, headers, attempt)
+            if status != 429 or attempt >= max_retries:
+                return response
+        attempt += 1
+
+
+def get_rate_limit_stats() -> list[LimiterStats]:
+    """Counters for every limiter created this session."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+def reset_rate_limiters() -> None:
+    """Drop all shared limiters (useful for testing)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,261 @@
+"""Compact, token-efficient encodings for tool results.
+
+CRM search results used to come back as ``json.dumps(records, indent=2)``,
+which spends most of its tokens on indentation and on repeating every key
+for every record. The helpers here render the same data for the agent more
+cheaply:
+
+- Record lists become a CSV-style table with the header emitted once.
+  Nested objects are flattened to dotted columns (``name.firstName``) and
+  empty values are dropped.
+- Tools pass a default field set, so each row only carries the columns that
+  matter. The agent can ask for other fields.
+- Long cell values are cut at ``MAX_CELL_CHARS``. Result sets above
+  ``INLINE_RECORDS`` rows show the first rows inline. In both cases the full
+  records are written to a JSON file under ``./files/<service>/``, and the
+  result gives its path. The batch tools accept that file as input.
+- Bookkeeping that Salesforce and Attio attach to records is dropped for
+  those services only (see ``METADATA_KEYS``).
+
+Each call records how many tokens it saved compared with the indented JSON
+it replaces. The session totals are shown in the status bar.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+import threading
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import settings
+
+# Rows shown inline before the rest is spilled to a file
+INLINE_RECORDS = 25
+# Longest cell value shown inline (the spill file keeps full values)
+MAX_CELL_CHARS = 200
+
+# Bookkeeping a service attaches to its records, dropped when formatting them:
+# Salesforce's per-record "attributes" (type and URL), Attio's per-value history
+METADATA_KEYS: dict[str, frozenset[str]] = {
+    "salesforce": frozenset({"attributes"}),
+    "attio": frozenset({"active_from", "active_until", "created_by_actor", "attribute_type"}),
+}
+# All of the above, for code handling records from any CRM
+CRM_METADATA_KEYS = frozenset().union(*METADATA_KEYS.values())
+
+
+def metadata_keys(service: str | None) -> frozenset[str]:
+    """Keys to drop from a service's records (none for other services)."""
+    return METADATA_KEYS.get(service or "", frozenset())
+
+
+@dataclass
+class FormatStats:
+    """Session counters for compact result encoding."""
+
+    calls: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    last_saved: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, before: int, after: int) -> None:
+        """Record one formatted result (safe to call from worker threads)."""
+        with self._lock:
+            self.calls += 1
+            self.tokens_before += before
+            self.tokens_after += after
+            self.last_saved = before - after
+
+    @property
+    def tokens_saved(self) -> int:
+        """Tokens saved across the session."""
+        return self.tokens_before - self.tokens_after
+
+
+_stats = FormatStats()
+
+
+def get_format_stats() -> FormatStats:
+    """Get the session's compact-encoding counters."""
+    return _stats
+
+
+_token_counter: Callable[[str], int] | None = None
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def _count_tokens(text: str) -> int:
+    global _token_counter
+    if _token_counter is None:
+        try:
+            from sdrbot_cli.token_counting import count_tokens
+
+            count_tokens("")
+            _token_counter = count_tokens
+        except Exception:
+            # Tokenizer unavailable (e.g. offline without a cached encoding)
+            _token_counter = _estimate_tokens
+    return _token_counter(text)
+
+
+def _record_savings(verbose: Any, compact: str) -> None:
+    before = _count_tokens(json.dumps(verbose, indent=2, default=str))
+    _stats.record(before, _count_tokens(compact))
+
+
+def _scalar(value: Any, drop: Collection[str] = ()) -> str:
+    if isinstance(value, dict):
+        return " ".join(_scalar(v, drop) for v in flatten(value, drop=drop).values())
+    if isinstance(value, list):
+        return "; ".join(_scalar(v, drop) for v in value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def flatten(
+    record: dict[str, Any], prefix: str = "", *, drop: Collection[str] = ()
+) -> dict[str, Any]:
+    """Flatten nested objects to dotted keys, dropping empty values.
+
+    Args:
+        record: The record to flatten.
+        prefix: Prefix for the keys (used when recursing).
+        drop: Keys to leave out at any depth (see ``metadata_keys``).
+    """
+    flat: dict[str, Any] = {}
+    for key, value in record.items():
+        if key in drop or value is None or value == "" or value == [] or value == {}:
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}.", drop=drop))
+        elif isinstance(value, list):
+            flat[name] = "; ".join(_scalar(v, drop) for v in value)
+        else:
+            flat[name] = value
+    return flat
+
+
+def project(
+    record: dict[str, Any], fields: Iterable[str] | None, *, drop: Collection[str] = ()
+) -> dict[str, Any]:
+    """Flatten a record and keep only ``fields`` (plus ``id``), in that order.
+
+    A field also keeps its dotted sub-fields, so "name" keeps "name.firstName".
+    """
+    flat = flatten(record, drop=drop)
+    if not fields:
+        return flat
+    wanted = ["id", *(f for f in fields if f != "id")]
+    rank = {name: i for i, name in enumerate(wanted)}
+    kept = [(k, v) for k, v in flat.items() if k in rank or k.split(".", 1)[0] in rank]
+    kept.sort(key=lambda kv: rank.get(kv[0], rank.get(kv[0].split(".", 1)[0])))
+    return dict(kept)
+
+
+def _encode_table(rows: list[dict[str, Any]]) -> tuple[str, bool]:
+    """CSV table of flat rows, and whether any cell was cut at ``MAX_CELL_CHARS``."""
+    columns: dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    truncated = False
+    for row in rows:
+        cells = []
+        for column in columns:
+            text = _scalar(row[column]) if column in row else ""
+            if len(text) > MAX_CELL_CHARS:
+                text = text[: MAX_CELL_CHARS - 1] + "…"
+                truncated = True
+            cells.append(text)
+        writer.writerow(cells)
+    return out.getvalue().rstrip("\n"), truncated
+
+
+def encode_table(rows: list[dict[str, Any]]) -> str:
+    """Encode flat rows as CSV with one header line (columns in first-seen order)."""
+    return _encode_table(rows)[0]
+
+
+def _spill(service: str, label: str, records: list[dict[str, Any]]) -> Path:
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", label)
+    path = settings.get_files_dir() / service / f"{slug}_search_{stamp}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(records, indent=2, default=str))
+    return path
+
+
+def format_records(
+    service: str,
+    label: str,
+    records: list[dict[str, Any]],
+    total: int | None = None,
+    *,
+    fields: Iterable[str] | None = None,
+) -> str:
+    """Format search results as a compact table.
+
+    Args:
+        service: Service name (used for the spill directory).
+        label: What the records are (e.g. "contacts").
+        records: The collected records.
+        total: Total matches reported by the provider, when known.
+        fields: Columns to show (defaults to every non-empty field).
+
+    Returns:
+        "Found N <label>:" and a CSV table. Above ``INLINE_RECORDS`` rows, only
+        the first rows are shown. When rows are left out or long values are cut,
+        all records are saved to a file and its path is given.
+    """
+    count = len(records)
+    found = f"Found {count} {label}"
+    if total is not None and total > count:
+        found += f" (of {total} matching; raise max_records to fetch more)"
+
+    shown = records[:INLINE_RECORDS]
+    fields = list(fields) if fields else None
+    drop = metadata_keys(service)
+    table, truncated = _encode_table([project(r, fields, drop=drop) for r in shown])
+    if count > INLINE_RECORDS:
+        path = _spill(service, label, records)
+        found += f". Showing the first {len(shown)}; all {count} saved to {path}"
+    elif truncated:
+        path = _spill(service, label, records)
+        found += f". Long values are cut; full records saved to {path}"
+
+    text = f"{found}:\n{table}"
+    _record_savings(shown, text)
+    return text
+
+
+def format_record(title: str, record: dict[str, Any], *, service: str | None = None) -> str:
+    """Format a single record as ``field: value`` lines.
+
+    Args:
+        title: First line, e.g. "Contact 123".
+        record: The record.
+        service: Service the record comes from (drops its ``METADATA_KEYS``).
+    """
+    drop = metadata_keys(service)
+    lines = [f"{title}:"]
+    lines.extend(
+        f"{key}: {_scalar(value, drop)}" for key, value in flatten(record, drop=drop).items()
+    )
+    text = "\n".join(lines)
+    _record_savings(record, text)
+    return text
@@ -318,12 +318,22 @@ def get_enabled_tools() -> list[BaseTool]:
     - Extended: standard + extended tools
     - Privileged: all tools
 
+    A service's tool list is cached until its generated tools file or .env
+    changes, so reloads only re-import the services that were re-synced.
+
     Returns:
         List of LangChain tools from all enabled services.
     """
+    from pathlib import Path
+
+    from sdrbot_cli.agent_cache import file_stamp, get_agent_cache
+    from sdrbot_cli.config import settings
     from sdrbot_cli.services.registry import get_tool_scope_setting, load_config
     from sdrbot_cli.tools import is_tool_allowed
 
+    cache = get_agent_cache()
+    env_stamp = file_stamp(Path.cwd() / ".env")
+
     config = load_config()
     tools = []
     current_scope = get_tool_scope_setting()
@@ -342,7 +352,12 @@ def get_enabled_tools() -> list[BaseTool]:
                 f"sdrbot_cli.services.{service_name}", fromlist=["get_tools"]
             )
             if hasattr(service_module, "get_tools"):
-                service_tools = service_module.get_tools()
+                generated_path = settings.get_generated_dir() / f"{service_name}_tools.py"
+                service_tools = cache.get(
+                    ("service_tools", service_name),
+                    (file_stamp(generated_path), env_stamp),
+                    service_module.get_tools,
+                )
                 # Filter tools based on current scope
                 service_tools = [t for t in service_tools if is_tool_allowed(t, current_scope)]
                 tools.extend(service_tools)
@@ -0,0 +1,226 @@
+"""Auto-paginating Apollo search.
+
+Walks Apollo search result pages concurrently (the Apollo client applies the
+shared "apollo" rate limit) until a target number of unique records
+is collected. Rows are deduplicated and appended to a CSV in ``./files/``
+as each page arrives, so large prospect lists never pass through the
+agent's context - only a short summary and the file path do.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sdrbot_cli.config import settings
+
+PAGE_SIZE = 100
+# Apollo only serves the first 500 pages of any search
+MAX_PAGES = 500
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@dataclass
+class SearchExport:
+    """Outcome of a paginated search export."""
+
+    kind: str
+    written: int
+    duplicates: int
+    total_available: int | None
+    pages_fetched: int
+    failed_pages: list[int]
+    output_path: Path
+    elapsed: float
+    target: int | None = None
+    preview: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Compact, agent-facing summary of the export."""
+        available = (
+            f" of {self.total_available:,} matching" if self.total_available is not None else ""
+        )
+        lines = [
+            f"Saved {self.written:,} unique {self.kind}{available} to {self.output_path} "
+            f"({self.pages_fetched} pages in {self.elapsed:.1f}s).",
+        ]
+        if self.duplicates:
+            lines.append(f"Skipped {self.duplicates} duplicate records.")
+        if self.target is not None and self.written < self.target:
+            lines.append(
+                f"Requested {self.target:,} but the search ran out of results "
+                f"after {self.written:,} unique {self.kind}."
+            )
+        if self.failed_pages:
+            pages = ", ".join(str(p) for p in self.failed_pages[:10])
+            lines.append(f"Failed pages (results may be incomplete): {pages}")
+        if self.preview:
+            lines.append("First results:")
+            for row in self.preview:
+                lines.append("- " + " | ".join(str(v) for v in row.values() if v))
+        return "\n".join(lines)
+
+
+def default_output_path(kind: str) -> Path:
+    """Timestamped CSV path under ``./files/apollo/``."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return settings.get_files_dir() / "apollo" / f"{kind}_search_{stamp}.csv"
+
+
+def _dedupe_key(row: dict[str, Any]) -> str:
+    if row.get("id"):
+        return f"id:{row['id']}"
+    if row.get("linkedin_url"):
+        return f"li:{str(row['linkedin_url']).rstrip('/').lower()}"
+    return "row:" + "|".join(str(v).lower() for v in row.values())
+
+
+class _CsvStream:
+    """Thread-safe, deduplicating CSV appender."""
+
+    def __init__(self, path: Path, fieldnames: list[str], limit: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.limit = limit
+        self.written = 0
+        self.duplicates = 0
+        self.preview: list[dict[str, Any]] = []
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+        self._file = path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+
+    @property
+    def full(self) -> bool:
+        return self.written >= self.limit
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        with self._lock:
+            for row in rows:
+                if self.full:
+                    break
+                key = _dedupe_key(row)
+                if key in self._seen:
+                    self.duplicates += 1
+                    continue
+                self._seen.add(key)
+                self._writer.writerow(row)
+                self.written += 1
+                if len(self.preview) < 5:
+                    self.preview.append(row)
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _total_entries(response: dict[str, Any]) -> int | None:
+    pagination = response.get("pagination") or {}
+    total = pagination.get("total_entries", response.get("total_entries"))
+    return int(total) if total is not None else None
+
+
+def paginated_search(
+    client: Any,
+    endpoint: str,
+    params: dict[str, Any],
+    result_key: str,
+    row_fn: Callable[[dict[str, Any]], dict[str, Any]],
+    *,
+    kind: str,
+    target: int,
+    fieldnames: list[str],
+    output_path: Path | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> SearchExport:
+    """Fetch search pages concurrently and stream unique rows to a CSV.
+
+    The first page is fetched alone to learn the total result count; the
+    pages still needed to reach ``target`` are then fetched in parallel waves.
+    Duplicates dropped along the way are made up by further waves until the
+    target is met or the search runs out of pages.
+
+    Args:
+        client: Apollo client (anything with ``post(endpoint, json=...)``).
+        endpoint: Search endpoint (e.g. "/mixed_people/api_search").
+        params: Search filters (``page``/``per_page`` are set here).
+        result_key: Response key holding the records (e.g. "people").
+        row_fn: Maps a raw record to a flat output row.
+        kind: Human-readable record type for the summary ("people").
+        target: Number of unique records to collect.
+        fieldnames: CSV columns (keys produced by ``row_fn``).
+        output_path: CSV path (defaults to a timestamped file in ./files/apollo/).
+        max_concurrency: Maximum pages in flight.
+
+    Returns:
+        SearchExport describing what was written.
+
+    Raises:
+        Exception: If the first page fails (nothing would be written).
+    """
+    start = time.monotonic()
+    output_path = output_path or default_output_path(kind)
+
+    def fetch(page: int) -> tuple[list[dict[str, Any]], int | None]:
+        response = client.post(endpoint, json={**params, "page": page, "per_page": PAGE_SIZE})
+        return [row_fn(r) for r in response.get(result_key) or []], _total_entries(response)
+
+    stream = _CsvStream(output_path, fieldnames, target)
+    failed: list[int] = []
+    try:
+        rows, total = fetch(1)
+        stream.write(rows)
+        pages_fetched = 1
+
+        available_pages = math.ceil(total / PAGE_SIZE) if total is not None else MAX_PAGES
+        last_page = 1 if len(rows) < PAGE_SIZE else min(available_pages, MAX_PAGES)
+        next_page = 2
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+            while next_page <= last_page and not stream.full:
+                # Only ask for the pages still needed; duplicates trigger another wave
+                needed = math.ceil((target - stream.written) / PAGE_SIZE)
+                wave = range(next_page, min(last_page, next_page + needed - 1) + 1)
+                next_page = wave.stop
+                futures = {pool.submit(fetch, p): p for p in wave}
+                for future in as_completed(futures):
+                    try:
+                        rows, _ = future.result()
+                    except Exception:
+                        failed.append(futures[future])
+                        continue
+                    pages_fetched += 1
+                    stream.write(rows)
+                    if len(rows) < PAGE_SIZE:
+                        # A short page means the results ended early
+                        last_page = min(last_page, futures[future])
+                    if stream.full:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+    finally:
+        stream.close()
+        if not stream.written:
+            output_path.unlink(missing_ok=True)
+
+    return SearchExport(
+        kind=kind,
+        written=stream.written,
+        duplicates=stream.duplicates,
+        total_available=total,
+        pages_fetched=pages_fetched,
+        failed_pages=sorted(failed),
+        output_path=output_path,
+        elapsed=time.monotonic() - start,
+        target=target,
+        preview=stream.preview,
+    )
@@ -4,10 +4,16 @@ Apollo does not have user-specific schemas - all tools are static.
 """
 
 import json
+from pathlib import Path
 
 from langchain_core.tools import BaseTool, tool
 
 from sdrbot_cli.auth.apollo import ApolloClient
+from sdrbot_cli.config import settings
+from sdrbot_cli.enrichment import get_operation, run_batch_enrichment
+from sdrbot_cli.enrichment.cache import cached_lookup
+from sdrbot_cli.enrichment.providers import format_location
+from sdrbot_cli.services.apollo.search import PAGE_SIZE, default_output_path, paginated_search
 
 _apollo_client = None
 
@@ -26,6 +32,64 @@ def reset_client():
     _apollo_client = None
 
 
+# Columns written when search results are exported to a file
+PEOPLE_EXPORT_FIELDS = [
+    "id",
+    "name",
+    "title",
+    "seniority",
+    "company",
+    "domain",
+    "linkedin_url",
+    "location",
+]
+COMPANY_EXPORT_FIELDS = [
+    "id",
+    "name",
+    "domain",
+    "industry",
+    "employees",
+    "location",
+    "linkedin_url",
+]
+
+
+def _person_export_row(p: dict) -> dict:
+    org = p.get("organization") or {}
+    return {
+        "id": p.get("id"),
+        "name": p.get("name"),
+        "title": p.get("title"),
+        "seniority": p.get("seniority"),
+        "company": org.get("name"),
+        "domain": org.get("primary_domain"),
+        "linkedin_url": p.get("linkedin_url"),
+        "location": format_location(p),
+    }
+
+
+def _company_export_row(org: dict) -> dict:
+    return {
+        "id": org.get("id"),
+        "name": org.get("name"),
+        "domain": org.get("primary_domain"),
+        "industry": org.get("industry"),
+        "employees": org.get("estimated_num_employees"),
+        "location": format_location(org),
+        "linkedin_url": org.get("linkedin_url"),
+    }
+
+
+def _export_path(kind: str, output_file: str | None) -> Path:
+    """Resolve the export file (relative paths land in ./files/)."""
+    if not output_file:
+        return default_output_path(kind)
+    path = Path(output_file).expanduser()
+    if not path.is_absolute():
+        path = settings.get_files_dir() / output_file
+    return path.with_suffix(".csv")
+
+
 @tool
 def apollo_enrich_person(
     email: str | None = None,
@@ -86,7 +150,13 @@ def apollo_enrich_person(
                 "for person enrichment."
             )
 
-        response = client.post("/people/match", json=params)
+        response = cached_lookup(
+            "apollo",
+            "/people/match",
+            params,
+            lambda: client.post("/people/match", json=params),
+            found=lambda r: bool(r.get("person")),
+        )
         person = response.get("person", {})
 
         if not person:
@@ -162,7 +232,13 @@ def apollo_enrich_company(domain: str) -> str:
     """
     client = get_apollo()
     try:
-        response = client.post("/organizations/enrich", json={"domain": domain})
+        response = cached_lookup(
+            "apollo",
+            "/organizations/enrich",
+            {"domain": domain},
+            lambda: client.post("/organizations/enrich", json={"domain": domain}),
+            found=lambda r: bool(r.get("organization")),
+        )
         org = response.get("organization", {})
 
         if not org:
@@ -261,12 +337,19 @@ def apollo_search_people(
     org_job_posted_after: str | None = None,
     org_job_posted_before: str | None = None,
     limit: int = 10,
+    output_file: str | None = None,
+    max_concurrency: int = 4,
 ) -> str:
     """
     Search for people/prospects in Apollo's database.
 
     Note: This endpoint finds prospects but does NOT return emails/phones directly.
-    Use apollo_enrich_person on results to get contact details.
+    Use apollo_enrich_person on results to get contact details, or
+    apollo_bulk_enrich_people on an exported file.
+
+    For lists larger than 100, set ``limit`` to the number of prospects you need:
+    pages are fetched in parallel, deduplicated and saved to a CSV in ./files/,
+    and only a summary is returned. Do not page through results manually.
 
     Args:
         person_titles: Comma-separated job titles (e.g., "CEO,CTO,VP Sales").
@@ -299,10 +382,15 @@ def apollo_search_people(
         org_num_jobs_max: Maximum number of open jobs at the employer.
         org_job_posted_after: Only employers with jobs posted on/after this date (YYYY-MM-DD).
         org_job_posted_before: Only employers with jobs posted on/before this date (YYYY-MM-DD).
-        limit: Maximum results to return (default 10, max 100).
+        limit: Maximum results (default 10). Up to 100 are returned inline; more
+            (up to 50,000) are exported to a CSV file.
+        output_file: Optional CSV path for the export (relative to ./files/). Setting
+            this always exports, even for small limits.
+        max_concurrency: Maximum pages fetched in parallel when exporting (default 4).
 
     Returns:
-        List of matching people with names, titles, and companies.
+        List of matching people with names, titles, and companies, or an export
+        summary with the CSV path.
     """
     client = get_apollo()
     try:
@@ -395,6 +483,26 @@ def apollo_search_people(
             params["organization_job_posted_at_range[max]"] = org_job_posted_before
 
         # Apollo deprecated /mixed_people/search for API callers; use api_search.
+        if limit > PAGE_SIZE or output_file:
+            export = paginated_search(
+                client,
+                "/mixed_people/api_search",
+                params,
+                "people",
+                _person_export_row,
+                kind="people",
+                target=limit,
+                fieldnames=PEOPLE_EXPORT_FIELDS,
+                output_path=_export_path("people", output_file),
+                max_concurrency=max_concurrency,
+            )
+            if not export.written:
+                return "No people found matching your criteria. Try broadening your search."
+            return (
+                export.summary()
+                + "\n\nNote: Use apollo_bulk_enrich_people on this file to get emails/phones."
+            )
+
         response = client.post("/mixed_people/api_search", json=params)
         people = response.get("people", [])
 
@@ -450,10 +558,16 @@ def apollo_search_companies(
     job_posted_after: str | None = None,
     job_posted_before: str | None = None,
     limit: int = 10,
+    output_file: str | None = None,
+    max_concurrency: int = 4,
 ) -> str:
     """
     Search for companies in Apollo's database.
 
+    For lists larger than 100, set ``limit`` to the number of companies you need:
+    pages are fetched in parallel, deduplicated and saved to a CSV in ./files/,
+    and only a summary is returned. Do not page through results manually.
+
     Args:
         organization_domains: Comma-separated domains to search (e.g., "apollo.io,openai.com").
         organization_names: Comma-separated company names (e.g., "Apollo,OpenAI").
@@ -482,10 +596,14 @@ def apollo_search_companies(
         num_jobs_max: Maximum number of open jobs at the company.
         job_posted_after: Only companies with jobs posted on/after this date (YYYY-MM-DD).
         job_posted_before: Only companies with jobs posted on/before this date (YYYY-MM-DD).
-        limit: Maximum results to return (default 10, max 100).
+        limit: Maximum results (default 10). Up to 100 are returned inline; more
+            (up to 50,000) are exported to a CSV file.
+        output_file: Optional CSV path for the export (relative to ./files/). Setting
+            this always exports, even for small limits.
+        max_concurrency: Maximum pages fetched in parallel when exporting (default 4).
 
     Returns:
-        List of matching companies with basic info.
+        List of matching companies with basic info, or an export summary with the CSV path.
     """
     client = get_apollo()
     try:
@@ -574,6 +692,26 @@ def apollo_search_companies(
         if job_posted_before:
             params["organization_job_posted_at_range[max]"] = job_posted_before
 
+        if limit > PAGE_SIZE or output_file:
+            export = paginated_search(
+                client,
+                "/mixed_companies/search",
+                params,
+                "organizations",
+                _company_export_row,
+                kind="companies",
+                target=limit,
+                fieldnames=COMPANY_EXPORT_FIELDS,
+                output_path=_export_path("companies", output_file),
+                max_concurrency=max_concurrency,
+            )
+            if not export.written:
+                return "No companies found matching your criteria. Try broadening your search."
+            return (
+                export.summary()
+                + "\n\nNote: Use apollo_bulk_enrich_companies on this file for firmographics."
+            )
+
         response = client.post("/mixed_companies/search", json=params)
         organizations = response.get("organizations", [])
 
@@ -603,6 +741,53 @@ def apollo_search_companies(
         return f"Error searching companies: {str(e)}"
 
 
+@tool
+def apollo_bulk_enrich_people(
+    input_file: str,
+    reveal_personal_emails: bool = False,
+    max_concurrency: int = 4,
+) -> str:
+    """
+    Enrich a whole list of people from a file using Apollo's bulk match endpoint.
+
+    Use this instead of calling apollo_enrich_person repeatedly. Records are sent
+    10 per request, rate limited, and progress is saved so re-running with the
+    same file resumes and only retries failed records.
+
+    Args:
+        input_file: CSV, JSON or JSONL file of people (path relative to ./files/ or absolute).
+            Recognized columns include email, first_name, last_name, name, company,
+            domain and linkedin_url (common variants like "Email Address" also work).
+        reveal_personal_emails: Include personal email addresses (consumes extra credits).
+        max_concurrency: Maximum parallel requests (default 4).
+
+    Returns:
+        Summary of the job and the path of the CSV with enriched columns.
+    """
+    operation = get_operation("apollo.people", reveal_personal_emails=reveal_personal_emails)
+    return run_batch_enrichment(operation, input_file, max_concurrency=max_concurrency)
+
+
+@tool
+def apollo_bulk_enrich_companies(input_file: str, max_concurrency: int = 4) -> str:
+    """
+    Enrich a whole list of companies from a file using Apollo's bulk enrichment endpoint.
+
+    Records are sent 10 domains per request, rate limited, and progress is saved
+    so re-running with the same file resumes where it left off.
+
+    Args:
+        input_file: CSV, JSON or JSONL file with a domain/website column
+            (path relative to ./files/ or absolute).
+        max_concurrency: Maximum parallel requests (default 4).
+
+    Returns:
+        Summary of the job and the path of the CSV with enriched columns.
+    """
+    operation = get_operation("apollo.companies")
+    return run_batch_enrichment(operation, input_file, max_concurrency=max_concurrency)
+
+
 def get_static_tools() -> list[BaseTool]:
     """Get all Apollo tools.
 
@@ -614,4 +799,6 @@ def get_static_tools() -> list[BaseTool]:
         apollo_enrich_company,
         apollo_search_people,
         apollo_search_companies,
+        apollo_bulk_enrich_people,
+        apollo_bulk_enrich_companies,
     ]
@@ -21,7 +21,7 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         attio_update_company -> company
         attio_query_people -> people (search uses plural)
     """
-    match = re.match(r"attio_(?:create|update|query|get|delete)_(.+)", tool_name)
+    match = re.match(r"attio_(?:batch_)?(?:create|update|upsert|query|get|delete)_(.+)", tool_name)
     return match.group(1) if match else None
 
 
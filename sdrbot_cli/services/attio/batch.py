@@ -0,0 +1,94 @@
+"""Attio batch CRUD.
+
+Backs the generated ``attio_batch_*`` tools. Attio has no multi-record write
+endpoint, so records fan out over the single-record endpoints a few at a
+time; upserts use the assert endpoint (``PUT /objects/{object}/records``
+with a matching attribute), which creates or updates in one call.
+"""
+
+from typing import Any
+
+from sdrbot_cli.services.batch import (
+    DEFAULT_FANOUT_CONCURRENCY,
+    BatchResult,
+    load_batch_records,
+    parse_ids,
+    per_record,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+_ID_KEYS = ("record_id", "id")
+
+
+def _record_id(response: dict[str, Any]) -> str:
+    return (response.get("data") or {}).get("id", {}).get("record_id", "")
+
+
+def _fan_out(action: str, obj_slug: str, items: list, call) -> BatchResult:
+    return run_batches(
+        action, obj_slug, items, 1, per_record(call), max_concurrency=DEFAULT_FANOUT_CONCURRENCY
+    )
+
+
+@resumable("attio")
+def batch_create(client: Any, obj_slug: str, records: str | list) -> BatchResult:
+    """Create records, one ``POST /objects/{object}/records`` each."""
+
+    def create(values: dict[str, Any]) -> str:
+        response = client.request(
+            "POST", f"/objects/{obj_slug}/records", json={"data": {"values": values}}
+        )
+        return _record_id(response)
+
+    return _fan_out("create", obj_slug, load_batch_records(records), create)
+
+
+@resumable("attio")
+def batch_update(client: Any, obj_slug: str, records: str | list) -> BatchResult:
+    """Update records by record ID, one ``PATCH`` each."""
+
+    def update(record: dict[str, Any]) -> str:
+        record_id, values = split_id(record, _ID_KEYS)
+        if record_id is None:
+            raise ValueError("missing 'record_id'")
+        client.request(
+            "PATCH",
+            f"/objects/{obj_slug}/records/{record_id}",
+            json={"data": {"values": values}},
+        )
+        return record_id
+
+    return _fan_out("update", obj_slug, load_batch_records(records), update)
+
+
+@resumable("attio")
+def batch_upsert(
+    client: Any, obj_slug: str, records: str | list, matching_attribute: str
+) -> BatchResult:
+    """Create or update records matched on a unique attribute (assert)."""
+
+    def upsert(values: dict[str, Any]) -> str:
+        if values.get(matching_attribute) in (None, ""):
+            raise ValueError(f"missing '{matching_attribute}'")
+        response = client.request(
+            "PUT",
+            f"/objects/{obj_slug}/records",
+            params={"matching_attribute": matching_attribute},
+            json={"data": {"values": values}},
+        )
+        return _record_id(response)
+
+    return _fan_out("upsert", obj_slug, load_batch_records(records), upsert)
+
+
+@resumable("attio")
+def batch_delete(client: Any, obj_slug: str, ids: str | list) -> BatchResult:
+    """Delete records by record ID, one ``DELETE`` each."""
+
+    def delete(record_id: str) -> str:
+        client.request("DELETE", f"/objects/{obj_slug}/records/{record_id}")
+        return record_id
+
+    return _fan_out("delete", obj_slug, parse_ids(ids), delete)
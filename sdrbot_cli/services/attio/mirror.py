@@ -0,0 +1,66 @@
+"""Attio source for the local CRM mirror (see ``sdrbot_cli.services.mirror``).
+
+Attio's record query has no modified-since filter, so every sync re-reads
+the whole object.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from sdrbot_cli.services import pagination
+from sdrbot_cli.services.attio.tools import get_attio
+from sdrbot_cli.services.mirror import MirrorRecord, to_utc_iso
+
+DEFAULT_OBJECTS = ("people", "companies", "deals")
+
+PAGE_SIZE = 500
+
+# Per-value bookkeeping Attio attaches to every attribute value
+_VALUE_METADATA = {"active_from", "active_until", "created_by_actor", "attribute_type"}
+
+
+def get_client() -> Any:
+    """Attio client for mirror syncs."""
+    return get_attio()
+
+
+def supports_delta(object_name: str) -> bool:
+    """Attio can't list records by modification time."""
+    return False
+
+
+def _simplify(values: list[dict[str, Any]]) -> Any:
+    """Reduce an attribute's value list to plain values (a scalar when possible)."""
+    plain = []
+    for value in values:
+        body = {k: v for k, v in value.items() if k not in _VALUE_METADATA and v not in (None, "")}
+        plain.append(next(iter(body.values())) if len(body) == 1 else body)
+    return plain[0] if len(plain) == 1 else plain
+
+
+def fetch_records(client: Any, object_name: str, since: str | None) -> Iterator[MirrorRecord]:
+    """List every Attio record of an object (``since`` is ignored)."""
+
+    def fetch_page(offset, page_size):
+        offset = offset or 0
+        response = client.request(
+            "POST",
+            f"/objects/{object_name}/records/query",
+            json={"limit": page_size, "offset": offset},
+        )
+        records = response.get("data", [])
+        # Attio has no cursor; a full page means there may be more
+        return records, offset + len(records) if len(records) == page_size else None
+
+    for record in pagination.paginate(fetch_page, sys.maxsize, PAGE_SIZE):
+        record_id = record.get("id", {}).get("record_id")
+        data = {"id": record_id}
+        data.update(
+            (slug, _simplify(values)) for slug, values in record.get("values", {}).items() if values
+        )
+        yield MirrorRecord(
+            id=record_id, data=data, modified_at=to_utc_iso(record.get("created_at"))
+        )
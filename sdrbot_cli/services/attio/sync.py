@@ -10,6 +10,7 @@ from typing import Any
 
 from sdrbot_cli.auth.attio import AttioClient
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Maximum attributes per tool to keep signatures manageable
@@ -154,12 +155,20 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         "To customize, edit tools.py instead (static tools like notes).",
         '"""',
         "",
+        "import asyncio",
         "import json",
         "from typing import Optional",
         "",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.attio import AttioClient",
+        "from sdrbot_cli.services import pagination",
+        "from sdrbot_cli.services.attio import batch as attio_batch",
+        "",
+        "",
+        "# Records per query request",
+        "SEARCH_PAGE_SIZE = 500",
         "",
         "",
         "# Shared client instance",
@@ -219,6 +228,9 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         lines.extend(_generate_delete_tool(obj_slug, singular))
         lines.append("")
 
+        # Generate batch tools
+        lines.extend(_generate_batch_tools(obj_slug, singular, attributes))
+
     return "\n".join(lines)
 
 
@@ -344,7 +356,7 @@ def _generate_create_tool(obj_slug: str, singular: str, attributes: list[dict])
             f'            return "Error: At least one attribute must be provided to create a {singular}."',
             "",
             '        payload = {"data": {"values": values}}',
-            f'        response = client.request("POST", "/objects/{obj_slug}/records", json=payload)',
+            f'        response = await client.arequest("POST", "/objects/{obj_slug}/records", json=payload)',
             '        record = response.get("data", {})',
             '        record_id = record.get("id", {}).get("record_id")',
             "",
@@ -356,7 +368,7 @@ def _generate_create_tool(obj_slug: str, singular: str, attributes: list[dict])
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -403,7 +415,7 @@ def _generate_update_tool(obj_slug: str, singular: str, attributes: list[dict])
 
     # Build function body
     body = [
-        "    client = _get_attio()",
+        "    client = await asyncio.to_thread(_get_attio)",
         "    try:",
         "        # Build values dict from non-None arguments",
         "        values = {}",
@@ -429,7 +441,7 @@ def _generate_update_tool(obj_slug: str, singular: str, attributes: list[dict])
             '            return "Error: At least one attribute must be provided to update."',
             "",
             '        payload = {"data": {"values": values}}',
-            f'        client.request("PATCH", f"/objects/{obj_slug}/records/{{record_id}}", json=payload)',
+            f'        await client.arequest("PATCH", f"/objects/{obj_slug}/records/{{record_id}}", json=payload)',
             "",
             f'        return f"Successfully updated {singular} {{record_id}}"',
             "    except Exception as e:",
@@ -439,7 +451,7 @@ def _generate_update_tool(obj_slug: str, singular: str, attributes: list[dict])
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -469,7 +481,11 @@ def _generate_query_tool(obj_slug: str, singular: str, attributes: list[dict]) -
         param_type = _python_type(a["type"])
         param_name = a["api_slug"].replace("-", "_")
         params.append(f"    {param_name}: Optional[{param_type}] = None,")
-    params.append("    limit: int = 10,")
+    params.append("    max_records: int = 10,")
+    params.append("    fields: Optional[list[str]] = None,")
+
+    # Fields shown in results unless the agent asks for others
+    default_fields = [a["api_slug"] for a in attributes[:8]]
 
     params_str = "\n".join(params)
 
@@ -480,15 +496,21 @@ def _generate_query_tool(obj_slug: str, singular: str, attributes: list[dict]) -
     for a in searchable:
         param_name = a["api_slug"].replace("-", "_")
         doc_lines.append(f"        {param_name}: Filter by {a.get('title', a['api_slug'])}.")
-    doc_lines.append("        limit: Maximum results to return (default 10).")
+    doc_lines.append(
+        "        max_records: Maximum results to return (default 10). Pages are fetched as"
+    )
+    doc_lines.append("            needed; large result sets are saved to a file.")
+    doc_lines.append(
+        f"        fields: Fields to include in the results (default: {', '.join(default_fields)})."
+    )
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON string with matching {plural}.")
+    doc_lines.append(f"        CSV table of matching {plural} (one row per record).")
     doc_lines.append('    """')
 
     # Build function body
     body = [
-        "    client = _get_attio()",
+        "    client = await asyncio.to_thread(_get_attio)",
         "    try:",
         "        # Build filter from provided parameters",
         "        filters = []",
@@ -508,12 +530,19 @@ def _generate_query_tool(obj_slug: str, singular: str, attributes: list[dict]) -
             "            if value is not None:",
             '                filters.append({api_slug: {"$eq": value}})',
             "",
-            '        payload = {"limit": limit}',
+            "        payload = {}",
             "        if filters:",
             '            payload["filter"] = {"$and": filters}',
             "",
-            f'        response = client.request("POST", "/objects/{obj_slug}/records/query", json=payload)',
-            '        records = response.get("data", [])',
+            "        async def fetch_page(offset, page_size):",
+            "            offset = offset or 0",
+            '            page_payload = {**payload, "limit": page_size, "offset": offset}',
+            f'            response = await client.arequest("POST", "/objects/{obj_slug}/records/query", json=page_payload)',
+            '            records = response.get("data", [])',
+            "            # Attio has no cursor; a full page means there may be more",
+            "            return records, offset + len(records) if len(records) == page_size else None",
+            "",
+            "        records = await pagination.acollect(fetch_page, max_records, SEARCH_PAGE_SIZE)",
             "",
             "        if not records:",
             f'            return "No {plural} found."',
@@ -527,7 +556,7 @@ def _generate_query_tool(obj_slug: str, singular: str, attributes: list[dict]) -
             "                    record_data[slug] = values",
             "            results.append(record_data)",
             "",
-            f'        return f"Found {{len(records)}} {plural}:\\n" + json.dumps(results, indent=2)',
+            f'        return result_format.format_records("attio", "{plural}", results, fields=fields or {default_fields})',
             "    except Exception as e:",
             f'        return f"Error querying {plural}: {{str(e)}}"',
         ]
@@ -535,7 +564,7 @@ def _generate_query_tool(obj_slug: str, singular: str, attributes: list[dict]) -
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -557,18 +586,18 @@ def _generate_get_tool(obj_slug: str, singular: str) -> list[str]:
 
     return [
         "@tool",
-        f"def {func_name}(record_id: str) -> str:",
+        f"async def {func_name}(record_id: str) -> str:",
         f'    """Get a {singular} by ID from Attio.',
         "",
         "    Args:",
         f"        record_id: The Attio record ID of the {singular}.",
         "",
         "    Returns:",
-        f"        JSON string with the {singular} details.",
+        f"        The {singular} as field: value lines.",
         '    """',
-        "    client = _get_attio()",
+        "    client = await asyncio.to_thread(_get_attio)",
         "    try:",
-        f'        response = client.request("GET", f"/objects/{obj_slug}/records/{{record_id}}")',
+        f'        response = await client.arequest("GET", f"/objects/{obj_slug}/records/{{record_id}}")',
         '        record = response.get("data", {})',
         "",
         "        # Format for display",
@@ -577,7 +606,7 @@ def _generate_get_tool(obj_slug: str, singular: str) -> list[str]:
         "            if values:",
         "                result[slug] = values",
         "",
-        f'        return f"{singular} {{record_id}}:\\n" + json.dumps(result, indent=2)',
+        f'        return result_format.format_record(f"{singular} {{record_id}}", result, service="attio")',
         "    except Exception as e:",
         f'        return f"Error getting {singular}: {{str(e)}}"',
     ]
@@ -597,7 +626,7 @@ def _generate_delete_tool(obj_slug: str, singular: str) -> list[str]:
 
     return [
         "@tool",
-        f"def {func_name}(record_id: str) -> str:",
+        f"async def {func_name}(record_id: str) -> str:",
         f'    """Delete a {singular} from Attio.',
         "",
         "    Args:",
@@ -606,10 +635,77 @@ def _generate_delete_tool(obj_slug: str, singular: str) -> list[str]:
         "    Returns:",
         "        Success message confirming deletion.",
         '    """',
-        "    client = _get_attio()",
+        "    client = await asyncio.to_thread(_get_attio)",
         "    try:",
-        f'        client.request("DELETE", f"/objects/{obj_slug}/records/{{record_id}}")',
+        f'        await client.arequest("DELETE", f"/objects/{obj_slug}/records/{{record_id}}")',
         f'        return f"Successfully deleted {singular} {{record_id}}"',
         "    except Exception as e:",
         f'        return f"Error deleting {singular}: {{str(e)}}"',
     ]
+
+
+def _generate_batch_tools(obj_slug: str, singular: str, attributes: list[dict]) -> list[str]:
+    """Generate batch create/update/upsert/delete tools for an object.
+
+    The tools delegate to ``sdrbot_cli.services.attio.batch``; Attio has no
+    multi-record writes, so records fan out a few requests at a time and
+    upserts use the assert endpoint.
+
+    Args:
+        obj_slug: Object API slug.
+        singular: Singular noun for the object.
+        attributes: List of attributes.
+
+    Returns:
+        List of code lines.
+    """
+    token = singular.lower().replace(" ", "_")
+    slugs = ", ".join(a["api_slug"] for a in attributes[:15]) or "any writable attribute"
+    records_doc = [
+        "        records: JSON array of objects keyed by attribute slug, or a path to a",
+        f"            .csv/.json/.jsonl file. Attributes: {slugs}",
+    ]
+    note = "Sends one request per record, several at a time."
+
+    return [
+        *generate_batch_tool(
+            f"attio_batch_create_{token}",
+            "records: str",
+            f"Create many {obj_slug} records in Attio at once.",
+            records_doc,
+            f'attio_batch.batch_create(_get_attio(), "{obj_slug}", records)',
+            f"Error creating {obj_slug}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"attio_batch_update_{token}",
+            "records: str",
+            f"Update many existing {obj_slug} records in Attio.",
+            [*records_doc, "            Each record needs its 'record_id'."],
+            f'attio_batch.batch_update(_get_attio(), "{obj_slug}", records)',
+            f"Error updating {obj_slug}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"attio_batch_upsert_{token}",
+            "records: str, matching_attribute: str",
+            f"Create or update many {obj_slug} records in Attio, matched on a unique attribute.",
+            [
+                *records_doc,
+                "        matching_attribute: Unique attribute slug to match on (e.g. email_addresses,",
+                "            domains).",
+            ],
+            f'attio_batch.batch_upsert(_get_attio(), "{obj_slug}", records, matching_attribute)',
+            f"Error upserting {obj_slug}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"attio_batch_delete_{token}",
+            "ids: str",
+            f"Delete many {obj_slug} records in Attio by record ID.",
+            ["        ids: JSON array or comma-separated record IDs, or a file of IDs."],
+            f'attio_batch.batch_delete(_get_attio(), "{obj_slug}", ids)',
+            f"Error deleting {obj_slug}",
+            note,
+        ),
+    ]
@@ -0,0 +1,472 @@
+"""Shared runtime for generated CRM batch tools.
+
+Generated ``<service>_batch_*`` tools accept records as a JSON array or as a
+path to a CSV/JSON/JSONL file, split them into the provider's maximum batch
+size, and collect per-record failures instead of stopping at the first one.
+Each service's ``batch`` module supplies the HTTP call for a single chunk;
+providers without bulk endpoints send one record per chunk and fan out over
+a small thread pool (the service clients apply the shared rate limiter).
+
+Write functions decorated with :func:`resumable` run as jobs (see
+``sdrbot_cli.jobs``): each chunk's outcome is checkpointed under a hash of
+its position and content, so running the same call again (or
+``/jobs resume``) only sends chunks that didn't go through. Chunks that fail
+on a connection error are retried a couple of times before giving up.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import json
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from sdrbot_cli.config import settings
+from sdrbot_cli.enrichment.batch import load_records
+from sdrbot_cli.jobs import JobCancelled, JobHandle, current_job, job_context
+from sdrbot_cli.result_format import format_records
+
+# Concurrency for providers that only have single-record endpoints
+DEFAULT_FANOUT_CONCURRENCY = 4
+
+# Extra attempts for a chunk whose request failed on a transient error
+CHUNK_RETRIES = 2
+CHUNK_RETRY_DELAY = 1.0
+
+# Limits on what the summary lists (the counts are always complete)
+MAX_REPORTED_ERRORS = 10
+MAX_REPORTED_IDS = 20
+
+_PAST_TENSE = {
+    "create": "Created",
+    "update": "Updated",
+    "upsert": "Upserted",
+    "delete": "Deleted",
+    "get": "Fetched",
+}
+
+
+@dataclass
+class ChunkResult:
+    """Outcome of sending one chunk.
+
+    ``errors`` holds ``(position, message)`` pairs, where ``position`` is the
+    record's index within the chunk or None when the provider doesn't say
+    which record failed. ``positions`` gives the chunk index of each entry in
+    ``ids`` when the provider reports it; without it, IDs are only matched to
+    inputs when the whole chunk succeeded (in input order).
+    """
+
+    ids: list[str] = field(default_factory=list)
+    errors: list[tuple[int | None, str]] = field(default_factory=list)
+    records: list[dict[str, Any]] = field(default_factory=list)
+    positions: list[int] = field(default_factory=list)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a whole batch job.
+
+    Error positions and ``rows`` (the input row of each ID in ``ids``) are
+    1-based input rows (None when unknown). ``service`` names the CRM, for
+    formatting fetched records.
+    """
+
+    action: str
+    object_name: str
+    total: int
+    requests: int = 0
+    ids: list[str] = field(default_factory=list)
+    rows: list[int | None] = field(default_factory=list)
+    errors: list[tuple[int | None, str]] = field(default_factory=list)
+    records: list[dict[str, Any]] = field(default_factory=list)
+    job_id: int | None = None
+    service: str | None = None
+
+    @property
+    def succeeded(self) -> int:
+        """Records the provider accepted."""
+        return len(self.records) if self.action == "get" else len(self.ids)
+
+    @property
+    def failed(self) -> int:
+        """Records that were rejected or never sent."""
+        return self.total - self.succeeded
+
+    def summary(self) -> str:
+        """Compact, agent-facing summary of the job."""
+        verb = _PAST_TENSE.get(self.action, self.action.title())
+        lines = [
+            f"{verb} {self.succeeded:,} of {self.total:,} {self.object_name} "
+            f"in {self.requests} request{'s' if self.requests != 1 else ''}."
+        ]
+        if self.ids and self.action != "get":
+            shown = ", ".join(self.ids[:MAX_REPORTED_IDS])
+            more = len(self.ids) - MAX_REPORTED_IDS
+            lines.append(f"IDs: {shown}" + (f" (+{more} more)" if more > 0 else ""))
+        if self.failed:
+            lines.append(f"{self.failed:,} failed:")
+            for row, message in self.errors[:MAX_REPORTED_ERRORS]:
+                lines.append(f"- row {row}: {message}" if row else f"- {message}")
+            if len(self.errors) > MAX_REPORTED_ERRORS:
+                lines.append(f"- ... and {len(self.errors) - MAX_REPORTED_ERRORS} more errors")
+            if self.job_id is not None and any(row is None for row, _ in self.errors):
+                lines.append(
+                    f"Saved as job #{self.job_id}: repeat the call (or /jobs resume "
+                    f"{self.job_id}) to retry only the chunks that didn't go through."
+                )
+        if self.records:
+            lines.append(format_records(self.service or "batch", self.object_name, self.records))
+        return "\n".join(lines)
+
+
+def _resolve_path(value: str) -> Path:
+    path = Path(value).expanduser()
+    if not path.is_absolute() and not path.exists():
+        path = settings.get_files_dir() / value
+    if not path.exists():
+        raise ValueError(f"Records must be a JSON array or an existing file path, got '{value}'")
+    return path
+
+
+def load_batch_records(records: str | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Parse batch input into a list of records.
+
+    Args:
+        records: A JSON array (or single object), or a path to a .csv, .json or
+            .jsonl file. Relative paths are also looked up in ./files/.
+
+    Returns:
+        Records with empty values dropped, so blank CSV cells don't clear fields.
+
+    Raises:
+        ValueError: If the input can't be parsed into a list of objects.
+    """
+    if isinstance(records, str):
+        text = records.strip()
+        if text.startswith(("[", "{")):
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+            if isinstance(data, dict):
+                data = [data]
+        else:
+            data = load_records(_resolve_path(text))
+    else:
+        data = records
+
+    if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+        raise ValueError("Records must be a list of JSON objects")
+    if not data:
+        raise ValueError("No records to process")
+    return [{k: v for k, v in r.items() if v is not None and v != ""} for r in data]
+
+
+def parse_ids(ids: str | list[str]) -> list[str]:
+    """Parse record IDs from a JSON array, a comma/newline separated string or a file.
+
+    Files may be CSV/JSON/JSONL (the ``id`` column is used) or plain text with
+    one ID per line.
+
+    Raises:
+        ValueError: If no IDs are found.
+    """
+    if isinstance(ids, list):
+        values = ids
+    else:
+        text = ids.strip()
+        if text.startswith("["):
+            values = json.loads(text)
+        elif "\n" not in text and "," not in text and Path(text).suffix:
+            path = _resolve_path(text)
+            if path.suffix.lower() in (".csv", ".json", ".jsonl"):
+                values = [_record_id(r) for r in load_records(path)]
+            else:
+                values = path.read_text(encoding="utf-8").splitlines()
+        else:
+            values = text.replace("\n", ",").split(",")
+
+    cleaned = [str(v).strip() for v in values if v is not None and str(v).strip()]
+    if not cleaned:
+        raise ValueError("No record IDs provided")
+    return cleaned
+
+
+def _record_id(record: dict[str, Any]) -> Any:
+    for key in ("id", "Id", "ID", "record_id"):
+        if record.get(key):
+            return record[key]
+    return None
+
+
+def split_id(record: dict[str, Any], keys: Iterable[str]) -> tuple[str | None, dict[str, Any]]:
+    """Pull a record's ID out of the first matching key.
+
+    Returns:
+        ``(id, remaining fields)``; the ID is None when no key is present.
+    """
+    for key in keys:
+        if record.get(key) not in (None, ""):
+            rest = {k: v for k, v in record.items() if k != key}
+            return str(record[key]), rest
+    return None, dict(record)
+
+
+def expand_dotted(record: dict[str, Any]) -> dict[str, Any]:
+    """Nest ``"name.firstName"`` style keys (e.g. from CSV headers) into objects."""
+    nested: dict[str, Any] = {}
+    for key, value in record.items():
+        parts = key.split(".")
+        target = nested
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return nested
+
+
+def per_record(call: Callable[[Any], Any]) -> Callable[[list], ChunkResult]:
+    """Adapt a single-record call into a chunk sender.
+
+    Used for providers without bulk endpoints; ``call`` takes one record (or
+    ID) and returns the record's ID.
+    """
+
+    def send(chunk: list[Any]) -> ChunkResult:
+        result = ChunkResult()
+        for position, item in enumerate(chunk):
+            try:
+                result.ids.append(str(call(item)))
+                result.positions.append(position)
+            except Exception as e:
+                result.errors.append((position, str(e)))
+        return result
+
+    return send
+
+
+def _id_rows(outcome: ChunkResult, start: int, size: int) -> list[int | None]:
+    """1-based input rows of a chunk's IDs (None where unknown)."""
+    if len(outcome.positions) == len(outcome.ids):
+        return [start + position + 1 for position in outcome.positions]
+    if not outcome.errors and len(outcome.ids) == size:
+        return list(range(start + 1, start + size + 1))
+    return [None] * len(outcome.ids)
+
+
+# Job of the resumable batch call running in this context (see resumable())
+_batch_job: ContextVar[JobHandle | None] = ContextVar("sdrbot_batch_job", default=None)
+
+
+def _chunk_key(action: str, start: int, chunk: list[Any]) -> str:
+    """Idempotency key of a chunk: its position and a hash of its content."""
+    payload = json.dumps(chunk, sort_keys=True, default=str)
+    return f"{action}:{start}:{hashlib.sha256(payload.encode()).hexdigest()[:24]}"
+
+
+def _is_transient(action: str, error: Exception) -> bool:
+    """Whether resending a failed chunk is safe and likely to work.
+
+    Connection failures mean the request never arrived. Gateway errors and
+    timeouts may hide a write that went through, so they are only retried
+    for actions that can be repeated without creating duplicates.
+    """
+    if isinstance(error, ConnectionError | requests.ConnectionError):
+        return True
+    if action == "create":
+        return False
+    return isinstance(error, requests.Timeout) or any(
+        code in str(error) for code in ("502", "503", "504")
+    )
+
+
+def _send_with_retry(
+    action: str, send: Callable[[list[Any]], ChunkResult], chunk: list[Any]
+) -> ChunkResult:
+    attempt = 0
+    while True:
+        try:
+            return send(chunk)
+        except Exception as e:
+            if attempt >= CHUNK_RETRIES or not _is_transient(action, e):
+                raise
+            time.sleep(CHUNK_RETRY_DELAY * 2**attempt)
+            attempt += 1
+
+
+def run_batches(
+    action: str,
+    object_name: str,
+    items: list[Any],
+    chunk_size: int,
+    send: Callable[[list[Any]], ChunkResult],
+    *,
+    max_concurrency: int = 1,
+    service: str | None = None,
+) -> BatchResult:
+    """Send ``items`` in chunks and merge the per-chunk outcomes.
+
+    A chunk whose request raises is recorded as failed as a whole; the
+    remaining chunks are still sent. Inside a :func:`resumable` call, chunks
+    completed by an earlier run are reused instead of being sent again, and
+    ``/jobs cancel`` stops the remaining chunks from being sent.
+
+    Args:
+        action: "create", "update", "upsert", "delete" or "get".
+        object_name: Object label used in the summary.
+        items: Records (or IDs) to send.
+        chunk_size: Provider's maximum records per request.
+        send: Sends one chunk and reports per-record outcomes.
+        max_concurrency: Chunks in flight at once.
+        service: CRM the records come from (for formatting fetched records).
+
+    Returns:
+        BatchResult with IDs, fetched records and row-numbered errors.
+    """
+    result = BatchResult(action=action, object_name=object_name, total=len(items), service=service)
+    starts = range(0, len(items), chunk_size)
+    job = _batch_job.get()
+
+    def run(start: int) -> ChunkResult:
+        chunk = items[start : start + chunk_size]
+        last = start + len(chunk)
+        rows = f"row {last}" if len(chunk) == 1 else f"rows {start + 1}-{last}"
+        key = _chunk_key(action, start, chunk)
+        if job is not None:
+            saved = job.saved(key)
+            if saved is not None:
+                outcome = ChunkResult(**saved)
+                outcome.errors = [tuple(error) for error in outcome.errors]
+                return outcome
+            try:
+                job.check_cancelled()
+            except JobCancelled:
+                return ChunkResult(errors=[(None, f"{rows}: not sent (job cancelled)")])
+        try:
+            outcome = _send_with_retry(action, send, chunk)
+        except Exception as e:
+            if job is not None:
+                job.mark_incomplete(str(e))
+            return ChunkResult(errors=[(None, f"{rows}: {e}")])
+        if job is not None:
+            job.checkpoint(key, asdict(outcome))
+        return outcome
+
+    workers = max(1, min(max_concurrency, len(starts)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start, outcome in zip(starts, pool.map(run, starts), strict=True):
+            result.requests += 1
+            result.ids.extend(outcome.ids)
+            result.rows.extend(_id_rows(outcome, start, min(chunk_size, len(items) - start)))
+            result.records.extend(outcome.records)
+            result.errors.extend(
+                (start + position + 1 if position is not None else None, message)
+                for position, message in outcome.errors
+            )
+            if job is not None:
+                job.progress(min(start + chunk_size, len(items)), len(items))
+    return result
+
+
+def resumable(service: str) -> Callable:
+    """Run a service's batch write function as a resumable job.
+
+    The decorated function must take ``(client, object_name, records_or_ids,
+    *args)``. Calls made inside another job (e.g. a migration, which keeps
+    its own checkpoints) run directly.
+    """
+
+    def decorate(fn: Callable[..., BatchResult]) -> Callable[..., BatchResult]:
+        @functools.wraps(fn)
+        def wrapper(client: Any, object_name: str, items: Any, *args: Any) -> BatchResult:
+            if current_job() is not None:
+                return fn(client, object_name, items, *args)
+            params = {
+                "service": service,
+                "function": fn.__name__,
+                "object_name": object_name,
+                "items": items,
+                "args": list(args),
+            }
+            title = f"{service} {fn.__name__.removeprefix('batch_')} {object_name}"
+            with job_context("batch", title, params) as job:
+                token = _batch_job.set(job)
+                try:
+                    result = fn(client, object_name, items, *args)
+                finally:
+                    _batch_job.reset(token)
+            result.job_id = job.id
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def resume_batch_job(
+    service: str, function: str, object_name: str, items: Any, args: list[Any]
+) -> str:
+    """Runner for ``/jobs resume`` of batch jobs."""
+    from sdrbot_cli.services.mirror import get_source
+
+    module = importlib.import_module(f"sdrbot_cli.services.{service}.batch")
+    client = get_source(service).get_client()
+    return getattr(module, function)(client, object_name, items, *args).summary()
+
+
+def generate_batch_tool(
+    name: str,
+    signature: str,
+    summary: str,
+    args_doc: list[str],
+    call: str,
+    error_prefix: str,
+    chunk_note: str,
+) -> list[str]:
+    """Emit the source lines of one generated batch tool.
+
+    Used by the services' ``sync`` code generators; the tool body is a single
+    call into the service's ``batch`` module.
+
+    Args:
+        name: Tool function name.
+        signature: Parameter list source (e.g. ``"records: str"``).
+        summary: First docstring line.
+        args_doc: Docstring lines for the Args section (already indented).
+        call: Expression returning a BatchResult (e.g. ``"hubspot_batch.batch_create(...)"``).
+        error_prefix: Prefix for the error message (e.g. ``"Error creating contacts"``).
+        chunk_note: Docstring sentence on how records are sent.
+
+    Returns:
+        List of code lines, followed by two blank lines.
+    """
+    return [
+        "@tool",
+        f"def {name}({signature}) -> str:",
+        f'    """{summary}',
+        "",
+        f"    {chunk_note} Failed rows are reported",
+        "    without stopping the rest of the batch.",
+        "",
+        "    Args:",
+        *args_doc,
+        "",
+        "    Returns:",
+        "        Summary with counts, record IDs and per-row errors.",
+        '    """',
+        "    try:",
+        f"        return {call}.summary()",
+        "    except Exception as e:",
+        f'        return f"{error_prefix}: {{str(e)}}"',
+        "",
+        "",
+    ]
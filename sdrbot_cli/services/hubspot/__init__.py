@@ -20,7 +20,9 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         hubspot_create_contacts -> contacts
         hubspot_update_companies -> companies
     """
-    match = re.match(r"hubspot_(?:create|update|search|get|delete)_(.+)", tool_name)
+    match = re.match(
+        r"hubspot_(?:batch_)?(?:create|update|upsert|search|get|delete)_(.+)", tool_name
+    )
     return match.group(1) if match else None
 
 
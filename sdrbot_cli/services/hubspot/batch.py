@@ -0,0 +1,213 @@
+"""HubSpot batch CRUD through the CRM v3 batch endpoints.
+
+Backs the generated ``hubspot_batch_*`` tools: records go out 100 per request
+via ``batch/create``, ``batch/update``, ``batch/upsert``, ``batch/read`` and
+``batch/archive``.
+"""
+
+from typing import Any
+
+from hubspot.crm.objects import (
+    BatchInputSimplePublicObjectBatchInput,
+    BatchInputSimplePublicObjectBatchInputForCreate,
+    BatchInputSimplePublicObjectBatchInputUpsert,
+    BatchInputSimplePublicObjectId,
+    BatchReadInputSimplePublicObjectId,
+    SimplePublicObjectBatchInput,
+    SimplePublicObjectBatchInputForCreate,
+    SimplePublicObjectBatchInputUpsert,
+    SimplePublicObjectId,
+)
+
+from sdrbot_cli.services.batch import (
+    BatchResult,
+    ChunkResult,
+    load_batch_records,
+    parse_ids,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+# HubSpot's maximum inputs per batch request
+BATCH_SIZE = 100
+
+_ID_KEYS = ("id", "hs_object_id")
+
+
+def _properties(record: dict[str, Any]) -> dict[str, Any]:
+    # HubSpot accepts property values as strings (booleans pass through)
+    return {k: v if isinstance(v, bool) else str(v) for k, v in record.items()}
+
+
+def _errors(response: Any, ids: list[str] | None = None) -> list[tuple[int | None, str]]:
+    """Map a multi-status response's errors onto chunk positions where possible."""
+    errors = []
+    for error in getattr(response, "errors", None) or []:
+        message = getattr(error, "message", None) or str(error)
+        context_ids = (getattr(error, "context", None) or {}).get("ids") or []
+        positions = [ids.index(i) for i in context_ids if ids and i in ids]
+        if positions:
+            errors.extend((p, message) for p in positions)
+        else:
+            errors.append((None, message))
+    return errors
+
+
+def _created_positions(chunk: list[dict[str, Any]], results: list[Any]) -> list[int]:
+    """Match created records back to their inputs by property values.
+
+    HubSpot doesn't promise to return batch results in input order. Returns
+    an empty list when some result can't be matched.
+    """
+
+    def same(value: Any, echoed: Any) -> bool:
+        return str(value).strip().lower() == str(echoed).strip().lower()
+
+    unclaimed = list(range(len(chunk)))
+    positions = []
+    for result in results:
+        echoed = result.properties or {}
+        position = next(
+            (
+                p
+                for p in unclaimed
+                if all(k not in echoed or same(v, echoed[k]) for k, v in chunk[p].items())
+            ),
+            None,
+        )
+        if position is None:
+            return []
+        unclaimed.remove(position)
+        positions.append(position)
+    return positions
+
+
+@resumable("hubspot")
+def batch_create(hs: Any, object_type: str, records: str | list) -> BatchResult:
+    """Create records with ``batch/create``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        body = BatchInputSimplePublicObjectBatchInputForCreate(
+            inputs=[
+                SimplePublicObjectBatchInputForCreate(properties=_properties(r), associations=[])
+                for r in chunk
+            ]
+        )
+        response = hs.crm.objects.batch_api.create(
+            object_type=object_type,
+            batch_input_simple_public_object_batch_input_for_create=body,
+        )
+        return ChunkResult(
+            ids=[r.id for r in response.results],
+            errors=_errors(response),
+            positions=_created_positions(chunk, response.results),
+        )
+
+    return run_batches("create", object_type, rows, BATCH_SIZE, send)
+
+
+@resumable("hubspot")
+def batch_update(hs: Any, object_type: str, records: str | list) -> BatchResult:
+    """Update records by HubSpot ID with ``batch/update``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        result = ChunkResult()
+        inputs, ids, positions = [], [], []
+        for position, record in enumerate(chunk):
+            record_id, props = split_id(record, _ID_KEYS)
+            if record_id is None:
+                result.errors.append((position, "missing 'id'"))
+                continue
+            inputs.append(SimplePublicObjectBatchInput(id=record_id, properties=_properties(props)))
+            ids.append(record_id)
+            positions.append(position)
+        if inputs:
+            response = hs.crm.objects.batch_api.update(
+                object_type=object_type,
+                batch_input_simple_public_object_batch_input=(
+                    BatchInputSimplePublicObjectBatchInput(inputs=inputs)
+                ),
+            )
+            result.ids.extend(r.id for r in response.results)
+            # Error contexts name HubSpot IDs; map them back to chunk positions
+            for index, message in _errors(response, ids):
+                result.errors.append((positions[index] if index is not None else None, message))
+        return result
+
+    return run_batches("update", object_type, rows, BATCH_SIZE, send)
+
+
+@resumable("hubspot")
+def batch_upsert(hs: Any, object_type: str, records: str | list, id_property: str) -> BatchResult:
+    """Create or update records matched on a unique property with ``batch/upsert``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        result = ChunkResult()
+        inputs = []
+        for position, record in enumerate(chunk):
+            if record.get(id_property) in (None, ""):
+                result.errors.append((position, f"missing '{id_property}'"))
+                continue
+            inputs.append(
+                SimplePublicObjectBatchInputUpsert(
+                    id=str(record[id_property]),
+                    id_property=id_property,
+                    properties=_properties(record),
+                )
+            )
+        if inputs:
+            response = hs.crm.objects.batch_api.upsert(
+                object_type=object_type,
+                batch_input_simple_public_object_batch_input_upsert=(
+                    BatchInputSimplePublicObjectBatchInputUpsert(inputs=inputs)
+                ),
+            )
+            result.ids.extend(r.id for r in response.results)
+            result.errors.extend(_errors(response))
+        return result
+
+    return run_batches("upsert", object_type, rows, BATCH_SIZE, send)
+
+
+def batch_read(
+    hs: Any, object_type: str, ids: str | list, properties: list[str] | None = None
+) -> BatchResult:
+    """Fetch records by HubSpot ID with ``batch/read``."""
+    id_list = parse_ids(ids)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        response = hs.crm.objects.batch_api.read(
+            object_type=object_type,
+            batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                inputs=[SimplePublicObjectId(id=i) for i in chunk],
+                properties=properties or [],
+                properties_with_history=[],
+            ),
+        )
+        return ChunkResult(
+            records=[{"id": r.id, "properties": r.properties} for r in response.results],
+            errors=_errors(response, chunk),
+        )
+
+    return run_batches("get", object_type, id_list, BATCH_SIZE, send, service="hubspot")
+
+
+@resumable("hubspot")
+def batch_archive(hs: Any, object_type: str, ids: str | list) -> BatchResult:
+    """Archive (delete) records by HubSpot ID with ``batch/archive``."""
+    id_list = parse_ids(ids)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        hs.crm.objects.batch_api.archive(
+            object_type=object_type,
+            batch_input_simple_public_object_id=BatchInputSimplePublicObjectId(
+                inputs=[SimplePublicObjectId(id=i) for i in chunk]
+            ),
+        )
+        return ChunkResult(ids=list(chunk))
+
+    return run_batches("delete", object_type, id_list, BATCH_SIZE, send)
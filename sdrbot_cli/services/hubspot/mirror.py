@@ -0,0 +1,121 @@
+"""HubSpot source for the local CRM mirror (see ``sdrbot_cli.services.mirror``)."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from sdrbot_cli.services import pagination
+from sdrbot_cli.services.hubspot.tools import get_hs
+from sdrbot_cli.services.mirror import MirrorRecord, parse_utc, to_utc_iso
+
+DEFAULT_OBJECTS = ("contacts", "companies", "deals")
+
+# Delta syncs don't see deleted records; a weekly full sync drops them
+FULL_SYNC_DAYS = 7
+
+PAGE_SIZE = 100
+# Properties requested per record (HubSpot rejects very long property lists)
+MAX_PROPERTIES = 100
+# The search API stops at 10,000 results; delta syncs restart from the
+# newest modification seen before reaching it
+SEARCH_RESULT_LIMIT = 10_000
+
+
+def get_client() -> Any:
+    """HubSpot client for mirror syncs."""
+    return get_hs()
+
+
+def supports_delta(object_name: str) -> bool:
+    """Every HubSpot object has ``hs_lastmodifieddate``."""
+    return True
+
+
+def _properties(hs: Any, object_name: str) -> list[str]:
+    response = hs.crm.properties.core_api.get_all(object_type=object_name)
+    names = [p.name for p in response.results if not getattr(p, "hidden", False)]
+    if "hs_lastmodifieddate" in names:
+        names.remove("hs_lastmodifieddate")
+    return ["hs_lastmodifieddate", *names[: MAX_PROPERTIES - 1]]
+
+
+def _record(result: Any) -> MirrorRecord:
+    properties = result.properties or {}
+    return MirrorRecord(
+        id=str(result.id),
+        data={"id": str(result.id), **properties},
+        modified_at=to_utc_iso(properties.get("hs_lastmodifieddate") or result.updated_at),
+    )
+
+
+def _backfill(hs: Any, object_name: str, properties: list[str]) -> Iterator[MirrorRecord]:
+    def fetch_page(after, page_size):
+        response = hs.crm.objects.basic_api.get_page(
+            object_type=object_name, limit=page_size, after=after, properties=properties
+        )
+        next_page = response.paging.next if response.paging else None
+        return response.results, next_page.after if next_page else None
+
+    for result in pagination.paginate(fetch_page, sys.maxsize, PAGE_SIZE):
+        yield _record(result)
+
+
+def _modified_since(
+    hs: Any, object_name: str, properties: list[str], since: str
+) -> Iterator[MirrorRecord]:
+    from hubspot.crm.objects import PublicObjectSearchRequest
+
+    while True:
+        search_request = PublicObjectSearchRequest(
+            filter_groups=[
+                {
+                    "filters": [
+                        {
+                            "propertyName": "hs_lastmodifieddate",
+                            "operator": "GTE",
+                            "value": str(int(parse_utc(since).timestamp() * 1000)),
+                        }
+                    ]
+                }
+            ],
+            sorts=[{"propertyName": "hs_lastmodifieddate", "direction": "ASCENDING"}],
+            properties=properties,
+        )
+        seen = 0
+        newest = since
+        exhausted = True
+
+        def fetch_page(after, page_size, search_request=search_request):
+            search_request.limit = page_size
+            search_request.after = after
+            response = hs.crm.objects.search_api.do_search(
+                object_type=object_name, public_object_search_request=search_request
+            )
+            next_page = response.paging.next if response.paging else None
+            return response.results, next_page.after if next_page else None
+
+        for result in pagination.paginate(fetch_page, SEARCH_RESULT_LIMIT, PAGE_SIZE):
+            record = _record(result)
+            seen += 1
+            newest = max(newest, record.modified_at or newest)
+            yield record
+            if seen >= SEARCH_RESULT_LIMIT - PAGE_SIZE:
+                exhausted = False
+                break
+        if exhausted or newest == since:
+            return
+        since = newest
+
+
+def fetch_records(hs: Any, object_name: str, since: str | None) -> Iterator[MirrorRecord]:
+    """List HubSpot records, all of them or those modified since ``since``.
+
+    Deleted records drop out of the mirror on the next full sync.
+    """
+    properties = _properties(hs, object_name)
+    if since is None:
+        yield from _backfill(hs, object_name, properties)
+    else:
+        yield from _modified_since(hs, object_name, properties, since)
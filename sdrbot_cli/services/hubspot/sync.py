@@ -10,6 +10,7 @@ from typing import Any
 
 from sdrbot_cli.auth.hubspot import get_client
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Fallback objects if schemas API fails (common HubSpot objects)
@@ -189,7 +190,10 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         "",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.hubspot import get_client",
+        "from sdrbot_cli.services import pagination",
+        "from sdrbot_cli.services.hubspot import batch as hubspot_batch",
         "from hubspot.crm.objects import (",
         "    PublicObjectSearchRequest,",
         "    SimplePublicObjectInput,",
@@ -197,6 +201,10 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         ")",
         "",
         "",
+        "# Records per search request (API maximum)",
+        "SEARCH_PAGE_SIZE = 200",
+        "",
+        "",
         "# Shared client instance",
         "_hs_client = None",
         "",
@@ -246,6 +254,9 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         lines.extend(_generate_delete_tool(obj_type))
         lines.append("")
 
+        # Generate batch tools (bulk create/update/upsert/read/archive)
+        lines.extend(_generate_batch_tools(obj_type, create_props, search_props))
+
     return "\n".join(lines)
 
 
@@ -508,7 +519,11 @@ def _generate_search_tool(obj_type: str, properties: list[dict]) -> list[str]:
     for p in properties[:10]:  # Limit search parameters
         param_type = _python_type(p["type"])
         params.append(f"    {p['name']}: Optional[{param_type}] = None,")
-    params.append("    limit: int = 10,")
+    params.append("    max_records: int = 10,")
+    params.append("    fields: Optional[list[str]] = None,")
+
+    # Fields shown in results unless the agent asks for others
+    default_fields = [p["name"] for p in properties[:7]]
 
     params_str = "\n".join(params)
 
@@ -524,16 +539,22 @@ def _generate_search_tool(obj_type: str, properties: list[dict]) -> list[str]:
     doc_lines.append("        query: Free-text search query (searches across all fields).")
     for p in properties[:10]:
         doc_lines.append(f"        {p['name']}: Filter by {p.get('label', p['name'])}.")
-    doc_lines.append("        limit: Maximum results to return (default 10).")
+    doc_lines.append(
+        "        max_records: Maximum results to return (default 10). Pages are fetched as"
+    )
+    doc_lines.append("            needed; large result sets are saved to a file.")
+    doc_lines.append(
+        f"        fields: Fields to include in the results (default: {', '.join(default_fields)})."
+    )
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON string with matching {obj_type}.")
+    doc_lines.append(f"        CSV table of matching {obj_type} (one row per record).")
     doc_lines.append('    """')
 
     body = [
         "    hs = _get_hs()",
         "    try:",
-        "        search_request = PublicObjectSearchRequest(limit=limit)",
+        "        search_request = PublicObjectSearchRequest()",
         "",
         "        if query:",
         "            search_request.query = query",
@@ -551,18 +572,28 @@ def _generate_search_tool(obj_type: str, properties: list[dict]) -> list[str]:
         '                search_request.filter_groups = [{"filters": filters}]',
         "",
         "        # Request common properties",
-        f"        search_request.properties = {prop_names[:7]}",
+        f"        search_request.properties = fields or {default_fields}",
         "",
-        f'        response = hs.crm.objects.search_api.do_search(object_type="{obj_type}", public_object_search_request=search_request)',
+        "        meta = {}",
         "",
-        "        if not response.results:",
+        "        def fetch_page(cursor, page_size):",
+        "            search_request.limit = page_size",
+        "            search_request.after = cursor",
+        f'            response = hs.crm.objects.search_api.do_search(object_type="{obj_type}", public_object_search_request=search_request)',
+        '            meta["total"] = response.total',
+        "            next_page = response.paging.next if response.paging else None",
+        "            return response.results, next_page.after if next_page else None",
+        "",
+        "        records = pagination.collect(fetch_page, max_records, SEARCH_PAGE_SIZE)",
+        "",
+        "        if not records:",
         f'            return "No {obj_type} found."',
         "",
         "        results = []",
-        "        for r in response.results:",
-        '            results.append({"id": r.id, "properties": r.properties})',
+        "        for r in records:",
+        '            results.append({"id": r.id, **r.properties})',
         "",
-        f'        return f"Found {{response.total}} {obj_type}:\\n" + json.dumps(results, indent=2)',
+        f'        return result_format.format_records("hubspot", "{obj_type}", results, meta.get("total"), fields=fields or {default_fields})',
         "    except Exception as e:",
         f'        return f"Error searching {obj_type}: {{str(e)}}"',
     ]
@@ -598,12 +629,12 @@ def _generate_get_tool(obj_type: str) -> list[str]:
         f"        {singular}_id: The HubSpot ID of the {singular}.",
         "",
         "    Returns:",
-        f"        JSON string with the {singular} details.",
+        f"        The {singular} as field: value lines.",
         '    """',
         "    hs = _get_hs()",
         "    try:",
         f'        response = hs.crm.objects.basic_api.get_by_id(object_type="{obj_type}", object_id={singular}_id)',
-        f'        return f"{singular.title()} {{response.id}}:\\n" + json.dumps(response.properties, indent=2)',
+        f'        return result_format.format_record(f"{singular.title()} {{response.id}}", response.properties)',
         "    except Exception as e:",
         f'        return f"Error getting {singular}: {{str(e)}}"',
     ]
@@ -639,3 +670,82 @@ def _generate_delete_tool(obj_type: str) -> list[str]:
         "    except Exception as e:",
         f'        return f"Error deleting {singular}: {{str(e)}}"',
     ]
+
+
+def _generate_batch_tools(
+    obj_type: str, properties: list[dict], read_props: list[dict]
+) -> list[str]:
+    """Generate batch create/update/upsert/get/delete tools for an object type.
+
+    The tools delegate to ``sdrbot_cli.services.hubspot.batch``, which chunks
+    records into HubSpot's 100-input batch requests. Names use the same object
+    token as the single-record tools so scoping treats them alike.
+
+    Args:
+        obj_type: Object type name.
+        properties: Writable property dicts (listed in the docstrings).
+        read_props: Properties returned by the batch get tool.
+
+    Returns:
+        List of code lines.
+    """
+    singular = _singularize(obj_type)
+    prop_list = ", ".join(p["name"] for p in properties[:15]) or "any writable property"
+    read_names = [p["name"] for p in read_props[:10]]
+    records_doc = [
+        "        records: JSON array of objects keyed by property name, or a path to a",
+        f"            .csv/.json/.jsonl file. Properties: {prop_list}",
+    ]
+    ids_doc = ["        ids: JSON array or comma-separated HubSpot IDs, or a file of IDs."]
+    note = "Sends up to 100 records per request."
+
+    return [
+        *generate_batch_tool(
+            f"hubspot_batch_create_{singular}",
+            "records: str",
+            f"Create many {obj_type} in HubSpot at once.",
+            records_doc,
+            f'hubspot_batch.batch_create(_get_hs(), "{obj_type}", records)',
+            f"Error creating {obj_type}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"hubspot_batch_update_{singular}",
+            "records: str",
+            f"Update many existing {obj_type} in HubSpot at once.",
+            [*records_doc, f"            Each record needs the HubSpot {singular} 'id'."],
+            f'hubspot_batch.batch_update(_get_hs(), "{obj_type}", records)',
+            f"Error updating {obj_type}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"hubspot_batch_upsert_{singular}",
+            "records: str, id_property: str",
+            f"Create or update many {obj_type} in HubSpot, matched on a unique property.",
+            [
+                *records_doc,
+                "        id_property: Unique property to match on (e.g. email, domain).",
+            ],
+            f'hubspot_batch.batch_upsert(_get_hs(), "{obj_type}", records, id_property)',
+            f"Error upserting {obj_type}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"hubspot_batch_get_{singular}",
+            "ids: str",
+            f"Get many {obj_type} from HubSpot by ID.",
+            ids_doc,
+            f'hubspot_batch.batch_read(_get_hs(), "{obj_type}", ids, {read_names})',
+            f"Error getting {obj_type}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"hubspot_batch_delete_{singular}",
+            "ids: str",
+            f"Delete (archive) many {obj_type} in HubSpot by ID.",
+            ids_doc,
+            f'hubspot_batch.batch_archive(_get_hs(), "{obj_type}", ids)',
+            f"Error deleting {obj_type}",
+            note,
+        ),
+    ]
@@ -6,6 +6,8 @@ Hunter does not have user-specific schemas - all tools are static.
 from langchain_core.tools import BaseTool, tool
 
 from sdrbot_cli.auth.hunter import HunterClient
+from sdrbot_cli.enrichment import get_operation, run_batch_enrichment
+from sdrbot_cli.enrichment.cache import cached_lookup
 
 _hunter_client = None
 
@@ -35,7 +37,13 @@ def hunter_domain_search(domain: str, limit: int = 10, department: str = None) -
         if department:
             params["department"] = department
 
-        data = client.request("GET", "/domain-search", params=params)
+        data = cached_lookup(
+            "hunter",
+            "/domain-search",
+            params,
+            lambda: client.request("GET", "/domain-search", params=dict(params)),
+            found=lambda r: bool((r.get("data") or {}).get("emails")),
+        )
 
         if not data.get("data"):
             return f"No data returned for domain: {domain}"
@@ -73,7 +81,13 @@ def hunter_email_finder(domain: str, first_name: str, last_name: str) -> str:
     try:
         params = {"domain": domain, "first_name": first_name, "last_name": last_name}
 
-        data = client.request("GET", "/email-finder", params=params)
+        data = cached_lookup(
+            "hunter",
+            "/email-finder",
+            params,
+            lambda: client.request("GET", "/email-finder", params=dict(params)),
+            found=lambda r: bool((r.get("data") or {}).get("email")),
+        )
 
         if not data.get("data"):
             return "No email found."
@@ -104,7 +118,13 @@ def hunter_email_verifier(email: str) -> str:
     client = get_hunter()
     try:
         params = {"email": email}
-        data = client.request("GET", "/email-verifier", params=params)
+        data = cached_lookup(
+            "hunter",
+            "/email-verifier",
+            params,
+            lambda: client.request("GET", "/email-verifier", params=dict(params)),
+            found=lambda r: bool(r.get("data")),
+        )
 
         if not data.get("data"):
             return "No verification data returned."
@@ -119,6 +139,44 @@ def hunter_email_verifier(email: str) -> str:
         return f"Error verifying email: {str(e)}"
 
 
+@tool
+def hunter_bulk_find_emails(input_file: str, max_concurrency: int = 4) -> str:
+    """
+    Find email addresses for a whole list of people from a file.
+
+    Use this instead of calling hunter_email_finder repeatedly. Requests run in
+    parallel within Hunter's rate limit, and progress is saved so re-running with
+    the same file resumes and only retries failed records.
+
+    Args:
+        input_file: CSV, JSON or JSONL file (path relative to ./files/ or absolute)
+            with first_name + last_name (or name) and domain (or company) columns.
+        max_concurrency: Maximum parallel requests (default 4).
+
+    Returns:
+        Summary of the job and the path of the CSV with found emails.
+    """
+    operation = get_operation("hunter.email_finder")
+    return run_batch_enrichment(operation, input_file, max_concurrency=max_concurrency)
+
+
+@tool
+def hunter_bulk_verify_emails(input_file: str, max_concurrency: int = 4) -> str:
+    """
+    Verify the deliverability of a whole list of email addresses from a file.
+
+    Args:
+        input_file: CSV, JSON or JSONL file with an email column
+            (path relative to ./files/ or absolute).
+        max_concurrency: Maximum parallel requests (default 4).
+
+    Returns:
+        Summary of the job and the path of the CSV with verification statuses.
+    """
+    operation = get_operation("hunter.email_verifier")
+    return run_batch_enrichment(operation, input_file, max_concurrency=max_concurrency)
+
+
 def get_static_tools() -> list[BaseTool]:
     """Get all Hunter tools.
 
@@ -129,4 +187,6 @@ def get_static_tools() -> list[BaseTool]:
         hunter_domain_search,
         hunter_email_finder,
         hunter_email_verifier,
+        hunter_bulk_find_emails,
+        hunter_bulk_verify_emails,
     ]
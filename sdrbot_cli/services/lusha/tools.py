@@ -8,6 +8,8 @@ import json
 from langchain_core.tools import BaseTool, tool
 
 from sdrbot_cli.auth.lusha import LushaClient
+from sdrbot_cli.enrichment import get_operation, run_batch_enrichment
+from sdrbot_cli.enrichment.cache import cached_lookup
 
 _lusha_client = None
 
@@ -40,7 +42,13 @@ def lusha_enrich_person(linkedin_url: str = None, email: str = None) -> str:
         else:
             return "Error: Must provide either linkedin_url or email."
 
-        data = client.request("GET", "/person/enrich", params=params)
+        data = cached_lookup(
+            "lusha",
+            "/person/enrich",
+            params,
+            lambda: client.request("GET", "/person/enrich", params=params),
+            found=lambda r: bool(r.get("data")),
+        )
 
         if not data.get("data"):
             return "No data found for this person."
@@ -80,7 +88,13 @@ def lusha_enrich_company(domain: str) -> str:
     client = get_lusha()
     try:
         params = {"domain": domain}
-        data = client.request("GET", "/company/enrich", params=params)
+        data = cached_lookup(
+            "lusha",
+            "/company/enrich",
+            params,
+            lambda: client.request("GET", "/company/enrich", params=params),
+            found=lambda r: bool(r.get("data")),
+        )
 
         if not data.get("data"):
             return "No data found for this company."
@@ -148,6 +162,27 @@ def lusha_prospect(filters_json: str) -> str:
         return f"Error searching prospects: {str(e)}"
 
 
+@tool
+def lusha_bulk_enrich_people(input_file: str, max_concurrency: int = 2) -> str:
+    """
+    Get contact details for a whole list of people from a file using Lusha's bulk API.
+
+    Use this instead of calling lusha_enrich_person repeatedly. Up to 100 people
+    are sent per request and progress is saved, so re-running with the same file
+    resumes and only retries failed records.
+
+    Args:
+        input_file: CSV, JSON or JSONL file (path relative to ./files/ or absolute)
+            with email, linkedin_url, or name + company/domain columns.
+        max_concurrency: Maximum parallel requests (default 2).
+
+    Returns:
+        Summary of the job and the path of the CSV with enriched columns.
+    """
+    operation = get_operation("lusha.people")
+    return run_batch_enrichment(operation, input_file, max_concurrency=max_concurrency)
+
+
 def get_static_tools() -> list[BaseTool]:
     """Get all Lusha tools.
 
@@ -158,4 +193,5 @@ def get_static_tools() -> list[BaseTool]:
         lusha_enrich_person,
         lusha_enrich_company,
         lusha_prospect,
+        lusha_bulk_enrich_people,
     ]
@@ -0,0 +1,645 @@
+"""Local SQLite mirror of CRM records.
+
+Read-heavy work (lookups, dedupe checks, reporting) doesn't need a live API
+call for every read. The mirror keeps a copy of selected CRM objects in
+``.sdrbot/crm_mirror.db``:
+
+- The first sync of an object backfills every record. Later syncs only ask
+  the CRM for records modified (or deleted) since the previous sync started.
+  Services without a modified-since filter (Attio) are re-read in full, and
+  a full sync also drops records that no longer exist. Sources fall back to
+  a full sync when their delta API can't cover the gap: Salesforce only
+  reports deletions from the last 30 days, and HubSpot and Twenty never
+  report them, so those are re-read in full every week.
+- Change events can be queued with :meth:`CrmMirror.enqueue`, e.g. by a
+  webhook receiver. They are replayed at the start of the next sync.
+- Each mirrored object is exposed as a SQL view named ``<service>_<object>``
+  (e.g. ``hubspot_companies``) with one column per field. Agents can run
+  ad-hoc and aggregate queries the CRM APIs don't support.
+- Reads refresh an object first when its last sync is older than the
+  caller's staleness bound, or when a CRM write tool has run since then
+  (see :class:`MirrorInvalidationMiddleware`). Writes still go to the API,
+  and the next read pulls the written records back in with a delta sync.
+
+Each CRM's ``<service>/mirror.py`` module knows how to list its records; see
+:func:`get_source` for the interface.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware, AgentState, ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
+
+from sdrbot_cli.config import get_config_dir
+from sdrbot_cli.result_format import flatten, metadata_keys
+
+MIRROR_SERVICES = ("hubspot", "salesforce", "twenty", "zohocrm", "pipedrive", "attio")
+
+# Default staleness bound for reads, in minutes
+DEFAULT_MAX_AGE_MINUTES = 60
+
+# Records sampled to decide a view's columns
+VIEW_SAMPLE_SIZE = 500
+MAX_VIEW_COLUMNS = 200
+
+# Delta syncs re-read this many seconds before the previous sync started, so
+# clock skew between this machine and the CRM can't drop changes
+DELTA_OVERLAP_SECONDS = 300
+
+_WRITE_TOOL = re.compile(
+    rf"^({'|'.join(MIRROR_SERVICES)})_(?:batch_|bulk_)?(?:create|update|upsert|delete|load)"
+)
+
+
+@dataclass
+class MirrorRecord:
+    """A record as listed by a CRM source."""
+
+    id: str
+    data: dict[str, Any]
+    modified_at: str | None = None
+    deleted: bool = False
+
+
+@dataclass
+class SyncState:
+    """Sync bookkeeping for one mirrored object."""
+
+    service: str
+    object_name: str
+    cursor: str | None
+    last_sync: float
+    dirty: bool
+    # When the last full sync finished (None if unknown)
+    full_sync: float | None = None
+
+    def age_minutes(self, now: float | None = None) -> float:
+        """Minutes since the last sync."""
+        return ((now or time.time()) - self.last_sync) / 60
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one object."""
+
+    service: str
+    object_name: str
+    mode: str
+    upserted: int = 0
+    deleted: int = 0
+    replayed: int = 0
+    total: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """One-line summary for the agent."""
+        parts = [f"{self.upserted:,} updated"]
+        if self.deleted:
+            parts.append(f"{self.deleted:,} removed")
+        if self.replayed:
+            parts.append(f"{self.replayed:,} queued events replayed")
+        return (
+            f"{view_name(self.service, self.object_name)}: {self.mode} sync, "
+            f"{', '.join(parts)}; {self.total:,} records mirrored ({self.elapsed:.1f}s)"
+        )
+
+
+def to_utc_iso(value: Any) -> str | None:
+    """Normalize a CRM timestamp to ``YYYY-MM-DDTHH:MM:SSZ`` (UTC), or None."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, int | float):
+        # Epoch milliseconds
+        moment = datetime.fromtimestamp(value / 1000, tz=UTC)
+    else:
+        text = str(value).strip().replace(" ", "T", 1)
+        try:
+            moment = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_utc(value: str) -> datetime:
+    """Parse a timestamp produced by :func:`to_utc_iso`."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC)
+
+
+def view_name(service: str, object_name: str) -> str:
+    """SQL view name for a mirrored object (e.g. ``hubspot_companies``)."""
+    return re.sub(r"[^a-z0-9_]+", "_", f"{service}_{object_name}".lower())
+
+
+class CrmMirror:
+    """SQLite store for mirrored CRM records (safe to share across threads)."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                service TEXT NOT NULL,
+                object TEXT NOT NULL,
+                id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                modified_at TEXT,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (service, object, id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                service TEXT NOT NULL,
+                object TEXT NOT NULL,
+                cursor TEXT,
+                last_sync REAL NOT NULL,
+                dirty INTEGER NOT NULL DEFAULT 0,
+                full_sync REAL,
+                PRIMARY KEY (service, object)
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                service TEXT NOT NULL,
+                object TEXT NOT NULL,
+                id TEXT NOT NULL,
+                data TEXT,
+                deleted INTEGER NOT NULL DEFAULT 0,
+                received_at REAL NOT NULL
+            );
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sync_state)")}
+        if "full_sync" not in columns:
+            # Mirrors created before full syncs were tracked
+            self._conn.execute("ALTER TABLE sync_state ADD COLUMN full_sync REAL")
+        self._conn.commit()
+
+    # Records
+
+    def upsert(
+        self, service: str, object_name: str, records: Iterable[MirrorRecord]
+    ) -> tuple[int, int, str | None]:
+        """Apply records (and deletions) to the mirror.
+
+        Nothing is written unless every record is applied: an error while
+        listing them rolls back the records already written.
+
+        Returns:
+            (records upserted, records deleted, newest modified_at seen)
+        """
+        upserted = deleted = 0
+        newest = None
+        now = time.time()
+        with self._lock:
+            try:
+                for record in records:
+                    if record.modified_at and (newest is None or record.modified_at > newest):
+                        newest = record.modified_at
+                    if record.deleted:
+                        deleted += self._conn.execute(
+                            "DELETE FROM records WHERE service = ? AND object = ? AND id = ?",
+                            (service, object_name, record.id),
+                        ).rowcount
+                        continue
+                    self._conn.execute(
+                        """
+                        INSERT OR REPLACE INTO records
+                            (service, object, id, data, modified_at, synced_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            service,
+                            object_name,
+                            record.id,
+                            json.dumps(record.data, default=str),
+                            record.modified_at,
+                            now,
+                        ),
+                    )
+                    upserted += 1
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+        return upserted, deleted, newest
+
+    def prune(self, service: str, object_name: str, synced_before: float) -> int:
+        """Drop records a full sync did not see (deleted in the CRM)."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM records WHERE service = ? AND object = ? AND synced_at < ?",
+                (service, object_name, synced_before),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def count(self, service: str, object_name: str) -> int:
+        """Number of mirrored records for an object."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE service = ? AND object = ?",
+                (service, object_name),
+            ).fetchone()
+        return row[0]
+
+    def get(self, service: str, object_name: str, record_id: str) -> dict[str, Any] | None:
+        """Look up one mirrored record by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE service = ? AND object = ? AND id = ?",
+                (service, object_name, record_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def records(self, service: str, object_name: str) -> list[dict[str, Any]]:
+        """All mirrored records for an object."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE service = ? AND object = ? ORDER BY rowid",
+                (service, object_name),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    # Sync state
+
+    def state(self, service: str, object_name: str) -> SyncState | None:
+        """Sync state for an object, or None if it has never been synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cursor, last_sync, dirty, full_sync FROM sync_state "
+                "WHERE service = ? AND object = ?",
+                (service, object_name),
+            ).fetchone()
+        if row is None:
+            return None
+        return SyncState(service, object_name, row[0], row[1], bool(row[2]), row[3])
+
+    def states(self) -> list[SyncState]:
+        """Sync state for every mirrored object."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT service, object, cursor, last_sync, dirty, full_sync FROM sync_state "
+                "ORDER BY service, object"
+            ).fetchall()
+        return [SyncState(r[0], r[1], r[2], r[3], bool(r[4]), r[5]) for r in rows]
+
+    def set_state(
+        self, service: str, object_name: str, cursor: str | None, *, full: bool = False
+    ) -> None:
+        """Record a completed sync (``full`` if it re-read every record)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO sync_state (service, object, cursor, last_sync, dirty, full_sync)
+                VALUES (?, ?, ?, ?, 0, ?)
+                ON CONFLICT (service, object) DO UPDATE SET
+                    cursor = excluded.cursor,
+                    last_sync = excluded.last_sync,
+                    dirty = 0,
+                    full_sync = COALESCE(excluded.full_sync, full_sync)
+                """,
+                (service, object_name, cursor, now, now if full else None),
+            )
+            self._conn.commit()
+
+    def mark_dirty(self, service: str, object_name: str | None = None) -> None:
+        """Flag objects as changed in the CRM so the next read refreshes them."""
+        with self._lock:
+            if object_name is None:
+                self._conn.execute("UPDATE sync_state SET dirty = 1 WHERE service = ?", (service,))
+            else:
+                self._conn.execute(
+                    "UPDATE sync_state SET dirty = 1 WHERE service = ? AND object = ?",
+                    (service, object_name),
+                )
+            self._conn.commit()
+
+    # Queued change events (e.g. from a webhook receiver)
+
+    def enqueue(
+        self,
+        service: str,
+        object_name: str,
+        record_id: str,
+        data: dict[str, Any] | None = None,
+        *,
+        deleted: bool = False,
+    ) -> None:
+        """Queue a change event to be applied on the next sync."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO events (service, object, id, data, deleted, received_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    service,
+                    object_name,
+                    record_id,
+                    json.dumps(data, default=str) if data is not None else None,
+                    int(deleted),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def replay_events(self, service: str, object_name: str) -> int:
+        """Apply and clear queued events for an object, oldest first.
+
+        Events without a payload only mark the object dirty, so the sync that
+        follows picks the record up from the CRM.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, id, data, deleted FROM events "
+                "WHERE service = ? AND object = ? ORDER BY seq",
+                (service, object_name),
+            ).fetchall()
+        if not rows:
+            return 0
+        records = [
+            MirrorRecord(id=r[1], data=json.loads(r[2]) if r[2] else {}, deleted=bool(r[3]))
+            for r in rows
+            if r[2] or r[3]
+        ]
+        self.upsert(service, object_name, records)
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM events WHERE service = ? AND object = ? AND seq <= ?",
+                (service, object_name, rows[-1][0]),
+            )
+            self._conn.commit()
+        return len(rows)
+
+    # Views and queries
+
+    def refresh_view(self, service: str, object_name: str) -> str:
+        """(Re)create the ``<service>_<object>`` view with one column per field."""
+        drop = metadata_keys(service)
+        with self._lock:
+            samples = self._conn.execute(
+                "SELECT data FROM records WHERE service = ? AND object = ? "
+                "ORDER BY modified_at DESC LIMIT ?",
+                (service, object_name, VIEW_SAMPLE_SIZE),
+            ).fetchall()
+
+        columns: dict[str, None] = {}
+        for (data,) in samples:
+            columns.update(dict.fromkeys(flatten(json.loads(data), drop=drop)))
+        columns.pop("id", None)
+
+        selects = ["id", "modified_at"]
+        for column in list(columns)[:MAX_VIEW_COLUMNS]:
+            if '"' in column or "'" in column:
+                continue
+            path = "$." + ".".join(f'"{part}"' for part in column.split("."))
+            selects.append(f"json_extract(data, '{path}') AS \"{column}\"")
+
+        name = view_name(service, object_name)
+        with self._lock:
+            self._conn.execute(f'DROP VIEW IF EXISTS "{name}"')
+            self._conn.execute(
+                f'CREATE VIEW "{name}" AS SELECT {", ".join(selects)} FROM records '
+                f"WHERE service = '{service}' AND object = '{object_name}'"
+            )
+            self._conn.commit()
+        return name
+
+    def query(self, sql: str) -> tuple[list[str], list[tuple]]:
+        """Run a read-only SQL query against the mirror.
+
+        Raises:
+            sqlite3.Error: If the SQL is invalid or tries to write.
+        """
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            conn.execute("PRAGMA query_only = ON")
+            cursor = conn.execute(sql)
+            columns = [d[0] for d in cursor.description or []]
+            return columns, cursor.fetchall()
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _mirror_db_path() -> Path:
+    """Return the path to the CRM mirror database."""
+    return get_config_dir() / "crm_mirror.db"
+
+
+def mirror_exists() -> bool:
+    """Whether the current project has a CRM mirror database."""
+    return _mirror_db_path().exists()
+
+
+# Shared mirror instance, re-opened if the working directory changes
+_mirror: CrmMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror() -> CrmMirror:
+    """Get the shared CRM mirror for the current project."""
+    global _mirror
+    db_path = _mirror_db_path()
+    with _mirror_lock:
+        if _mirror is None or _mirror.db_path != db_path:
+            if _mirror is not None:
+                _mirror.close()
+            _mirror = CrmMirror(db_path)
+        return _mirror
+
+
+def reset_mirror() -> None:
+    """Close the shared mirror (useful for testing)."""
+    global _mirror
+    with _mirror_lock:
+        if _mirror is not None:
+            _mirror.close()
+        _mirror = None
+
+
+def get_source(service: str) -> ModuleType:
+    """Load a CRM's mirror source module.
+
+    Each ``sdrbot_cli.services.<service>.mirror`` module provides:
+
+    - ``DEFAULT_OBJECTS``: objects mirrored when none are named.
+    - ``get_client()``: the service's authenticated client.
+    - ``supports_delta(object_name) -> bool``: whether modified-since
+      queries work for the object.
+    - ``fetch_records(client, object_name, since) -> Iterator[MirrorRecord]``:
+      every record when ``since`` is None, else those modified at or after
+      ``since`` (a :func:`to_utc_iso` timestamp), plus deletions where the
+      API reports them.
+
+    and optionally:
+
+    - ``MAX_DELTA_DAYS``: oldest ``since`` the delta API accepts; older
+      mirrors are synced in full.
+    - ``FULL_SYNC_DAYS``: for deltas that don't report deletions, days
+      between full syncs that drop deleted records.
+
+    Raises:
+        ValueError: If the service can't be mirrored.
+    """
+    if service not in MIRROR_SERVICES:
+        raise ValueError(f"'{service}' can't be mirrored. Options: {', '.join(MIRROR_SERVICES)}")
+    return importlib.import_module(f"sdrbot_cli.services.{service}.mirror")
+
+
+def sync_object(
+    service: str,
+    object_name: str,
+    *,
+    full: bool = False,
+    mirror: CrmMirror | None = None,
+    client: Any = None,
+) -> SyncResult:
+    """Backfill or delta-sync one object into the mirror."""
+    mirror = mirror or get_mirror()
+    source = get_source(service)
+    client = client if client is not None else source.get_client()
+    state = mirror.state(service, object_name)
+    start = time.time()
+    delta = (
+        not full
+        and state is not None
+        and source.supports_delta(object_name)
+        and not _needs_full_sync(source, state, start)
+    )
+
+    result = SyncResult(service, object_name, "delta" if delta else "full")
+    result.replayed = mirror.replay_events(service, object_name)
+
+    since = state.cursor if delta else None
+    records = source.fetch_records(client, object_name, since)
+    result.upserted, result.deleted, _ = mirror.upsert(service, object_name, records)
+    if not delta:
+        result.deleted += mirror.prune(service, object_name, start)
+
+    # The next delta starts from this sync, whether or not anything changed
+    cursor = to_utc_iso(datetime.fromtimestamp(start - DELTA_OVERLAP_SECONDS, UTC))
+    mirror.set_state(service, object_name, cursor, full=not delta)
+    mirror.refresh_view(service, object_name)
+    result.total = mirror.count(service, object_name)
+    result.elapsed = time.time() - start
+    return result
+
+
+def _needs_full_sync(source: ModuleType, state: SyncState, now: float) -> bool:
+    """Whether a delta sync from ``state`` would miss changes the source can't report."""
+    if state.cursor is None:
+        return True
+    max_delta_days = getattr(source, "MAX_DELTA_DAYS", None)
+    if max_delta_days is not None:
+        oldest = datetime.fromtimestamp(now, UTC) - timedelta(days=max_delta_days)
+        if parse_utc(state.cursor) < oldest:
+            return True
+    full_sync_days = getattr(source, "FULL_SYNC_DAYS", None)
+    return full_sync_days is not None and now - (state.full_sync or 0) > full_sync_days * 86400
+
+
+def ensure_fresh(
+    service: str,
+    object_name: str,
+    max_age_minutes: float = DEFAULT_MAX_AGE_MINUTES,
+    *,
+    mirror: CrmMirror | None = None,
+) -> SyncResult | None:
+    """Delta-sync an object if it is dirty or older than ``max_age_minutes``.
+
+    Returns:
+        The sync result, or None if the mirror was fresh enough.
+    """
+    mirror = mirror or get_mirror()
+    state = mirror.state(service, object_name)
+    if state is not None and not state.dirty and state.age_minutes() <= max_age_minutes:
+        return None
+    return sync_object(service, object_name, mirror=mirror)
+
+
+def referenced_objects(sql: str, states: list[SyncState]) -> list[SyncState]:
+    """Mirrored objects whose views a SQL query mentions."""
+    names = set(re.findall(r"[A-Za-z0-9_]+", sql.lower()))
+    return [s for s in states if view_name(s.service, s.object_name) in names]
+
+
+def mirror_tables(states: list[SyncState]) -> str:
+    """Describe the mirrored views for the agent."""
+    if not states:
+        return "Nothing is mirrored yet. Run crm_mirror_sync first."
+    lines = ["Mirrored tables:"]
+    for s in states:
+        flags = " (stale: CRM changed since)" if s.dirty else ""
+        lines.append(
+            f"- {view_name(s.service, s.object_name)}: synced {s.age_minutes():.0f} min ago{flags}"
+        )
+    return "\n".join(lines)
+
+
+class MirrorInvalidationMiddleware(AgentMiddleware[AgentState, Any]):
+    """Mark a CRM's mirror dirty after one of its write tools runs."""
+
+    def __init__(self, *, exists: Callable[[], bool] | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            exists: Whether a mirror database exists (defaults to checking
+                ``.sdrbot/crm_mirror.db``), so writes never create one.
+        """
+        super().__init__()
+        self._exists = exists or mirror_exists
+
+    def _note(self, request: ToolCallRequest, result: ToolMessage | Command) -> None:
+        match = _WRITE_TOOL.match(request.tool_call["name"])
+        if not match or not self._exists():
+            return
+        if isinstance(result, ToolMessage) and result.status == "error":
+            return
+        try:
+            get_mirror().mark_dirty(match.group(1))
+        except sqlite3.Error:
+            pass
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        """Run the tool, then flag the mirror if it wrote to a CRM."""
+        result = handler(request)
+        self._note(request, result)
+        return result
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        """Async version of :meth:`wrap_tool_call`."""
+        result = await handler(request)
+        self._note(request, result)
+        return result
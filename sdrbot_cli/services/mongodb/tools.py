@@ -1,12 +1,20 @@
 """MongoDB Tools."""
 
+from __future__ import annotations
+
 import json
+from typing import TYPE_CHECKING
 
 from langchain_core.tools import BaseTool, tool
-from pymongo import MongoClient
-from pymongo.database import Database
 
 from sdrbot_cli.config import settings
+from sdrbot_cli.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+    from pymongo.database import Database
+
+pymongo = lazy_import("pymongo")
 
 # Shared connection instance (lazy loaded)
 _mongo_client: MongoClient | None = None
@@ -25,7 +33,7 @@ def get_mongo_db() -> Database:
             if settings.mongodb_tls:
                 connect_kwargs["tls"] = True
 
-            _mongo_client = MongoClient(settings.mongodb_uri, **connect_kwargs)
+            _mongo_client = pymongo.MongoClient(settings.mongodb_uri, **connect_kwargs)
             # Force connection verification
             _mongo_client.admin.command("ping")
         except Exception as e:
@@ -1,9 +1,12 @@
 """MySQL Tools."""
 
-import pymysql
 from langchain_core.tools import BaseTool, tool
 
 from sdrbot_cli.config import settings
+from sdrbot_cli.lazy import lazy_import
+
+pymysql = lazy_import("pymysql")
+pymysql_cursors = lazy_import("pymysql.cursors")
 
 # Shared connection instance (lazy loaded)
 _mysql_conn = None
@@ -23,7 +26,7 @@ def get_mysql_connection():
                 "user": settings.mysql_user,
                 "password": settings.mysql_password,
                 "database": settings.mysql_db,
-                "cursorclass": pymysql.cursors.DictCursor,
+                "cursorclass": pymysql_cursors.DictCursor,
             }
             # Enable SSL if configured
             if settings.mysql_ssl:
@@ -0,0 +1,75 @@
+"""Shared pagination for CRM search tools.
+
+Generated ``<service>_search_*`` tools describe how to fetch one page of
+results as ``fetch_page(cursor, page_size) -> (records, next_cursor)`` and
+hand it to :func:`paginate`, which follows the cursor until ``max_records``
+are collected or the results run out. While the caller works through one
+page the next is already being fetched on a background thread.
+
+Async generated tools pass a coroutine ``fetch_page`` to :func:`acollect`
+instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# fetch_page(cursor, page_size) -> (records, next_cursor or None when done)
+PageFetcher = Callable[[Any, int], tuple[list[dict[str, Any]], Any]]
+AsyncPageFetcher = Callable[[Any, int], Awaitable[tuple[list[dict[str, Any]], Any]]]
+
+
+def paginate(
+    fetch_page: PageFetcher,
+    max_records: int,
+    page_size: int,
+    *,
+    cursor: Any = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield up to ``max_records`` records, prefetching the next page.
+
+    Args:
+        fetch_page: Fetches one page starting at ``cursor``.
+        max_records: Total records to yield.
+        page_size: The provider's maximum page size.
+        cursor: Starting cursor (None for the first page).
+    """
+    if max_records <= 0:
+        return
+
+    def size(remaining: int) -> int:
+        return max(1, min(page_size, remaining))
+
+    remaining = max_records
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="paginate") as executor:
+        pending = executor.submit(fetch_page, cursor, size(remaining))
+        while pending is not None:
+            records, cursor = pending.result()
+            records = records[:remaining]
+            remaining -= len(records)
+            pending = None
+            if cursor is not None and records and remaining > 0:
+                pending = executor.submit(fetch_page, cursor, size(remaining))
+            yield from records
+
+
+def collect(fetch_page: PageFetcher, max_records: int, page_size: int) -> list[dict[str, Any]]:
+    """Fetch up to ``max_records`` records into a list."""
+    return list(paginate(fetch_page, max_records, page_size))
+
+
+async def acollect(
+    fetch_page: AsyncPageFetcher, max_records: int, page_size: int
+) -> list[dict[str, Any]]:
+    """Async :func:`collect`: await pages until ``max_records`` are collected."""
+    records: list[dict[str, Any]] = []
+    cursor = None
+    while len(records) < max_records:
+        remaining = max_records - len(records)
+        page, cursor = await fetch_page(cursor, max(1, min(page_size, remaining)))
+        records.extend(page[:remaining])
+        if cursor is None or not page:
+            break
+    return records
@@ -19,7 +19,9 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         pipedrive_create_deal -> deal
         pipedrive_update_person -> person
     """
-    match = re.match(r"pipedrive_(?:create|update|search|get|delete)_(.+)", tool_name)
+    match = re.match(
+        r"pipedrive_(?:batch_)?(?:create|update|upsert|search|get|delete)_(.+)", tool_name
+    )
     return match.group(1) if match else None
 
 
@@ -0,0 +1,78 @@
+"""Pipedrive batch CRUD.
+
+Backs the generated ``pipedrive_batch_*`` tools. Pipedrive has no
+multi-record create or update endpoint, so those fan out over the
+single-record endpoints a few at a time. Deals, persons, organizations and
+activities support bulk deletes (``DELETE /{object}?ids=...``); other objects
+fall back to one delete per record.
+"""
+
+from typing import Any
+
+from sdrbot_cli.services.batch import (
+    DEFAULT_FANOUT_CONCURRENCY,
+    BatchResult,
+    ChunkResult,
+    load_batch_records,
+    parse_ids,
+    per_record,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+# Objects with a bulk delete endpoint, and the IDs sent per request
+BULK_DELETE_OBJECTS = {"deals", "persons", "organizations", "activities"}
+DELETE_BATCH_SIZE = 100
+
+
+def _fan_out(action: str, obj_type: str, items: list, call) -> BatchResult:
+    return run_batches(
+        action, obj_type, items, 1, per_record(call), max_concurrency=DEFAULT_FANOUT_CONCURRENCY
+    )
+
+
+@resumable("pipedrive")
+def batch_create(client: Any, obj_type: str, records: str | list) -> BatchResult:
+    """Create records, one ``POST /{object}`` each."""
+
+    def create(record: dict[str, Any]) -> str:
+        response = client.post(f"/{obj_type}", json=record)
+        return str((response.get("data") or {}).get("id", ""))
+
+    return _fan_out("create", obj_type, load_batch_records(records), create)
+
+
+@resumable("pipedrive")
+def batch_update(client: Any, obj_type: str, records: str | list) -> BatchResult:
+    """Update records by ID, one ``PUT /{object}/{id}`` each."""
+
+    def update(record: dict[str, Any]) -> str:
+        record_id, fields = split_id(record, ("id",))
+        if record_id is None:
+            raise ValueError("missing 'id'")
+        client.put(f"/{obj_type}/{record_id}", json=fields)
+        return record_id
+
+    return _fan_out("update", obj_type, load_batch_records(records), update)
+
+
+@resumable("pipedrive")
+def batch_delete(client: Any, obj_type: str, ids: str | list) -> BatchResult:
+    """Delete records by ID, in bulk where Pipedrive supports it."""
+    id_list = parse_ids(ids)
+
+    if obj_type not in BULK_DELETE_OBJECTS:
+
+        def delete(record_id: str) -> str:
+            client.delete(f"/{obj_type}/{record_id}")
+            return record_id
+
+        return _fan_out("delete", obj_type, id_list, delete)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        response = client.delete(f"/{obj_type}", params={"ids": ",".join(chunk)})
+        deleted = (response.get("data") or {}).get("id") or chunk
+        return ChunkResult(ids=[str(i) for i in deleted])
+
+    return run_batches("delete", obj_type, id_list, DELETE_BATCH_SIZE, send)
@@ -0,0 +1,76 @@
+"""Pipedrive source for the local CRM mirror (see ``sdrbot_cli.services.mirror``)."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from sdrbot_cli.services import pagination
+from sdrbot_cli.services.mirror import MirrorRecord, parse_utc, to_utc_iso
+from sdrbot_cli.services.pipedrive.tools import get_pipedrive
+
+DEFAULT_OBJECTS = ("persons", "organizations", "deals")
+
+PAGE_SIZE = 500
+
+# /recents item type for each object that supports modified-since listing
+_RECENTS_ITEMS = {
+    "persons": "person",
+    "organizations": "organization",
+    "deals": "deal",
+    "activities": "activity",
+    "products": "product",
+    "notes": "note",
+}
+
+
+def get_client() -> Any:
+    """Pipedrive client for mirror syncs."""
+    return get_pipedrive()
+
+
+def supports_delta(object_name: str) -> bool:
+    """Objects covered by the ``/recents`` endpoint can be delta-synced."""
+    return object_name in _RECENTS_ITEMS
+
+
+def _pages(pipedrive: Any, endpoint: str, params: dict) -> Iterator[dict[str, Any]]:
+    def fetch_page(start, page_size):
+        response = pipedrive.get(
+            endpoint, params={**params, "start": start or 0, "limit": page_size}
+        )
+        page = (response.get("additional_data") or {}).get("pagination") or {}
+        next_start = page.get("next_start") if page.get("more_items_in_collection") else None
+        return response.get("data") or [], next_start
+
+    yield from pagination.paginate(fetch_page, sys.maxsize, PAGE_SIZE)
+
+
+def _record(data: dict[str, Any]) -> MirrorRecord:
+    return MirrorRecord(
+        id=str(data["id"]), data=data, modified_at=to_utc_iso(data.get("update_time"))
+    )
+
+
+def fetch_records(pipedrive: Any, object_name: str, since: str | None) -> Iterator[MirrorRecord]:
+    """List Pipedrive records, all of them or those changed since ``since``.
+
+    Delta syncs also report deleted records.
+    """
+    if since is None:
+        for data in _pages(pipedrive, f"/{object_name}", {}):
+            yield _record(data)
+        return
+
+    # /recents takes UTC "YYYY-MM-DD HH:MM:SS"
+    params = {
+        "since_timestamp": parse_utc(since).strftime("%Y-%m-%d %H:%M:%S"),
+        "items": _RECENTS_ITEMS[object_name],
+    }
+    for item in _pages(pipedrive, "/recents", params):
+        data = item.get("data")
+        if not data or data.get("deleted") or data.get("active_flag") is False:
+            yield MirrorRecord(id=str(item["id"]), data={}, deleted=True)
+        else:
+            yield _record(data)
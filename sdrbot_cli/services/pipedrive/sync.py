@@ -10,6 +10,8 @@ from typing import Any
 
 from sdrbot_cli.auth.pipedrive import get_pipedrive_client
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
+from sdrbot_cli.services.pipedrive.batch import BULK_DELETE_OBJECTS
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Standard Pipedrive objects and their field endpoints
@@ -370,10 +372,18 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         "DO NOT EDIT - This file is regenerated when you run /sync pipedrive",
         '"""',
         "",
+        "import asyncio",
         "import json",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.pipedrive import get_pipedrive_client",
+        "from sdrbot_cli.services import pagination",
+        "from sdrbot_cli.services.pipedrive import batch as pipedrive_batch",
+        "",
+        "",
+        "# Records per search request (API maximum)",
+        "SEARCH_PAGE_SIZE = 500",
         "",
         "",
         "def _get_pipedrive():",
@@ -441,6 +451,9 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         lines.extend(_generate_delete_tool(obj_type, singular))
         lines.append("")
 
+        # Generate batch tools
+        lines.extend(_generate_batch_tools(obj_type, singular, create_fields))
+
     return "\n".join(lines)
 
 
@@ -678,7 +691,7 @@ def _generate_create_tool(obj_type: str, singular: str, fields: list[dict]) -> l
             "        if not data:",
             f'            return "Error: At least one field must be provided to create a {singular}."',
             "",
-            f'        response = pipedrive.post("/{obj_type}", json=data)',
+            f'        response = await pipedrive.apost("/{obj_type}", json=data)',
             '        result = response.get("data", {})',
             '        record_id = result.get("id", "unknown")',
             "",
@@ -690,7 +703,7 @@ def _generate_create_tool(obj_type: str, singular: str, fields: list[dict]) -> l
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -732,7 +745,7 @@ def _generate_update_tool(obj_type: str, singular: str, fields: list[dict]) -> l
 
     # Build function body
     body = [
-        "    pipedrive = _get_pipedrive()",
+        "    pipedrive = await asyncio.to_thread(_get_pipedrive)",
         "    try:",
         "        data = {}",
         "        local_vars = locals()",
@@ -774,7 +787,7 @@ def _generate_update_tool(obj_type: str, singular: str, fields: list[dict]) -> l
             "        if not data:",
             '            return "Error: At least one field must be provided to update."',
             "",
-            f'        response = pipedrive.put(f"/{obj_type}/{{{singular}_id}}", json=data)',
+            f'        response = await pipedrive.aput(f"/{obj_type}/{{{singular}_id}}", json=data)',
             "",
             f'        return f"Successfully updated {singular} {{{singular}_id}}"',
             "    except Exception as e:",
@@ -784,7 +797,7 @@ def _generate_update_tool(obj_type: str, singular: str, fields: list[dict]) -> l
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -801,7 +814,11 @@ def _generate_search_tool(
     # For Pipedrive, search is done via the search endpoint
     # Build function signature
     params = ["    term: str | None = None,"]
-    params.append("    limit: int = 10,")
+    params.append("    max_records: int = 10,")
+    params.append("    fields: list[str] | None = None,")
+
+    # Fields shown in results unless the agent asks for others
+    default_fields = [f["key"] for f in output_fields[:8]]
 
     params_str = "\n".join(params)
 
@@ -810,10 +827,16 @@ def _generate_search_tool(
     doc_lines.append("")
     doc_lines.append("    Args:")
     doc_lines.append(f"        term: Search term to look for in {obj_type}.")
-    doc_lines.append("        limit: Maximum results to return (default 10).")
+    doc_lines.append(
+        "        max_records: Maximum results to return (default 10). Pages are fetched as"
+    )
+    doc_lines.append("            needed; large result sets are saved to a file.")
+    doc_lines.append(
+        f"        fields: Fields to include in the results (default: {', '.join(default_fields)})."
+    )
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON array of {obj_type}. Each object contains:")
+    doc_lines.append(f"        CSV table of {obj_type} (one row per record) with columns:")
     doc_lines.append("        - id: Record identifier (use for get/update/delete)")
     # List top output fields (skip id since we already mentioned it)
     # Use param_name for human-readable output, not the raw API key (which may be a hash)
@@ -836,32 +859,37 @@ def _generate_search_tool(
     item_type = item_type_map.get(obj_type, singular)
 
     body = [
-        "    pipedrive = _get_pipedrive()",
+        "    pipedrive = await asyncio.to_thread(_get_pipedrive)",
         "    try:",
-        "        if term:",
-        "            # Use search endpoint",
-        f'            response = pipedrive.get("/itemSearch", params={{"term": term, "item_types": "{item_type}", "limit": limit}})',
-        '            items = response.get("data", {}).get("items", [])',
-        "            if not items:",
-        f"                return f\"No {obj_type} found matching '{{term}}'\"",
-        '            records = [item.get("item", {}) for item in items]',
-        "        else:",
-        "            # Get recent records",
-        f'            response = pipedrive.get("/{obj_type}", params={{"limit": limit}})',
-        '            records = response.get("data", [])',
-        "            if not records:",
-        f'                return "No {obj_type} found."',
         "",
-        '        results = [{"id": r.get("id"), **{k: v for k, v in r.items() if k != "id" and not k.startswith("$")}} for r in records[:limit]]',
+        "        async def fetch_page(start, page_size):",
+        '            params = {"start": start or 0, "limit": page_size}',
+        "            if term:",
+        "                # Use search endpoint",
+        f'                params.update({{"term": term, "item_types": "{item_type}"}})',
+        '                response = await pipedrive.aget("/itemSearch", params=params)',
+        '                records = [item.get("item", {}) for item in (response.get("data") or {}).get("items", [])]',
+        "            else:",
+        "                # Get recent records",
+        f'                response = await pipedrive.aget("/{obj_type}", params=params)',
+        '                records = response.get("data") or []',
+        '            page = (response.get("additional_data") or {}).get("pagination") or {}',
+        '            return records, page.get("next_start") if page.get("more_items_in_collection") else None',
+        "",
+        "        records = await pagination.acollect(fetch_page, max_records, SEARCH_PAGE_SIZE)",
+        "        if not records:",
+        f'            return f"No {obj_type} found matching \'{{term}}\'" if term else "No {obj_type} found."',
+        "",
+        '        results = [{"id": r.get("id"), **{k: v for k, v in r.items() if k != "id" and not k.startswith("$")}} for r in records]',
         "",
-        f'        return f"Found {{len(results)}} {obj_type}:\\n" + json.dumps(results, indent=2)',
+        f'        return result_format.format_records("pipedrive", "{obj_type}", results, fields=fields or (None if term else {default_fields}))',
         "    except Exception as e:",
         f'        return f"Error searching {obj_type}: {{str(e)}}"',
     ]
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -882,7 +910,7 @@ def _generate_get_tool(obj_type: str, singular: str, output_fields: list[dict])
     doc_lines.append(f"        {singular}_id: The ID of the {singular} to retrieve.")
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON object with {singular} data containing:")
+    doc_lines.append(f"        The {singular} as field: value lines, including:")
     doc_lines.append("        - id: Record identifier")
     # Use param_name for human-readable output, not the raw API key (which may be a hash)
     for f in output_fields[:5]:
@@ -894,9 +922,9 @@ def _generate_get_tool(obj_type: str, singular: str, output_fields: list[dict])
     doc_lines.append('    """')
 
     body = [
-        "    pipedrive = _get_pipedrive()",
+        "    pipedrive = await asyncio.to_thread(_get_pipedrive)",
         "    try:",
-        f'        response = pipedrive.get(f"/{obj_type}/{{{singular}_id}}")',
+        f'        response = await pipedrive.aget(f"/{obj_type}/{{{singular}_id}}")',
         '        record = response.get("data", {})',
         "",
         "        if not record:",
@@ -904,14 +932,14 @@ def _generate_get_tool(obj_type: str, singular: str, output_fields: list[dict])
         "",
         '        result = {k: v for k, v in record.items() if not k.startswith("$")}',
         "",
-        f'        return f"{singular.title()} {{{singular}_id}}:\\n" + json.dumps(result, indent=2)',
+        f'        return result_format.format_record(f"{singular.title()} {{{singular}_id}}", result)',
         "    except Exception as e:",
         f'        return f"Error getting {singular}: {{str(e)}}"',
     ]
 
     return [
         "@tool",
-        f"def {func_name}({singular}_id: {id_type}) -> str:",
+        f"async def {func_name}({singular}_id: {id_type}) -> str:",
         *doc_lines,
         *body,
     ]
@@ -933,9 +961,9 @@ def _generate_delete_tool(obj_type: str, singular: str) -> list[str]:
     doc_lines.append('    """')
 
     body = [
-        "    pipedrive = _get_pipedrive()",
+        "    pipedrive = await asyncio.to_thread(_get_pipedrive)",
         "    try:",
-        f'        pipedrive.delete(f"/{obj_type}/{{{singular}_id}}")',
+        f'        await pipedrive.adelete(f"/{obj_type}/{{{singular}_id}}")',
         f'        return f"Successfully deleted {singular} {{{singular}_id}}"',
         "    except Exception as e:",
         f'        return f"Error deleting {singular}: {{str(e)}}"',
@@ -943,7 +971,62 @@ def _generate_delete_tool(obj_type: str, singular: str) -> list[str]:
 
     return [
         "@tool",
-        f"def {func_name}({singular}_id: {id_type}) -> str:",
+        f"async def {func_name}({singular}_id: {id_type}) -> str:",
         *doc_lines,
         *body,
     ]
+
+
+def _generate_batch_tools(obj_type: str, singular: str, fields: list[dict]) -> list[str]:
+    """Generate batch create/update/delete tools for an object type.
+
+    The tools delegate to ``sdrbot_cli.services.pipedrive.batch``. Records use
+    Pipedrive's API field keys (custom fields use their hash keys).
+
+    Args:
+        obj_type: Object type (e.g. "persons").
+        singular: Singular name (e.g. "person").
+        fields: Writable field dicts (listed in the docstrings).
+
+    Returns:
+        List of code lines.
+    """
+    keys = ", ".join(f"{f['key']} ({f.get('name', f['key'])})" for f in fields[:10])
+    records_doc = [
+        "        records: JSON array of objects keyed by API field key, or a path to a",
+        f"            .csv/.json/.jsonl file. Fields: {keys or 'any writable field'}",
+    ]
+    fanout = "Sends one request per record, several at a time."
+    delete_note = (
+        "Deletes up to 100 records per request." if obj_type in BULK_DELETE_OBJECTS else fanout
+    )
+
+    return [
+        *generate_batch_tool(
+            f"pipedrive_batch_create_{singular}",
+            "records: str",
+            f"Create many {obj_type} in Pipedrive.",
+            records_doc,
+            f'pipedrive_batch.batch_create(_get_pipedrive(), "{obj_type}", records)',
+            f"Error creating {obj_type}",
+            fanout,
+        ),
+        *generate_batch_tool(
+            f"pipedrive_batch_update_{singular}",
+            "records: str",
+            f"Update many existing {obj_type} in Pipedrive.",
+            [*records_doc, "            Each record needs its 'id'."],
+            f'pipedrive_batch.batch_update(_get_pipedrive(), "{obj_type}", records)',
+            f"Error updating {obj_type}",
+            fanout,
+        ),
+        *generate_batch_tool(
+            f"pipedrive_batch_delete_{singular}",
+            "ids: str",
+            f"Delete many {obj_type} in Pipedrive by ID.",
+            [f"        ids: JSON array or comma-separated {singular} IDs, or a file of IDs."],
+            f'pipedrive_batch.batch_delete(_get_pipedrive(), "{obj_type}", ids)',
+            f"Error deleting {obj_type}",
+            delete_note,
+        ),
+    ]
@@ -1,9 +1,11 @@
 """PostgreSQL Tools."""
 
-import psycopg2
 from langchain_core.tools import BaseTool, tool
 
 from sdrbot_cli.config import settings
+from sdrbot_cli.lazy import lazy_import
+
+psycopg2 = lazy_import("psycopg2")
 
 # Shared connection instance (lazy loaded)
 _pg_conn = None
@@ -19,7 +19,9 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         salesforce_create_lead -> lead
         salesforce_update_account -> account
     """
-    match = re.match(r"salesforce_(?:create|update|search|get|delete)_(.+)", tool_name)
+    match = re.match(
+        r"salesforce_(?:batch_)?(?:create|update|upsert|search|get|delete)_(.+)", tool_name
+    )
     return match.group(1).lower() if match else None
 
 
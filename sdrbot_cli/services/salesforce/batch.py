@@ -0,0 +1,148 @@
+"""Salesforce batch CRUD through the sObject Collections API.
+
+Backs the generated ``salesforce_batch_*`` tools. Writes go out 200 records
+per ``composite/sobjects`` request with ``allOrNone`` off, so one bad row
+doesn't roll back the rest; reads fetch up to 2,000 records per request.
+"""
+
+from typing import Any
+
+from sdrbot_cli.services.batch import (
+    BatchResult,
+    ChunkResult,
+    load_batch_records,
+    parse_ids,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+# sObject Collections limits
+WRITE_BATCH_SIZE = 200
+READ_BATCH_SIZE = 2000
+
+_ID_KEYS = ("Id", "id")
+
+
+def _collect(results: list[dict[str, Any]], positions: list[int] | None = None) -> ChunkResult:
+    """Turn per-record SaveResults into a ChunkResult."""
+    chunk = ChunkResult()
+    for index, item in enumerate(results or []):
+        position = positions[index] if positions else index
+        if item.get("success"):
+            chunk.ids.append(item.get("id"))
+            chunk.positions.append(position)
+        else:
+            messages = (
+                "; ".join(e.get("message", str(e)) for e in item.get("errors") or [])
+                or "Unknown error"
+            )
+            chunk.errors.append((position, messages))
+    return chunk
+
+
+def _with_type(obj_name: str, record: dict[str, Any]) -> dict[str, Any]:
+    return {"attributes": {"type": obj_name}, **record}
+
+
+@resumable("salesforce")
+def batch_create(sf: Any, obj_name: str, records: str | list) -> BatchResult:
+    """Create records with ``POST composite/sobjects``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        results = sf.restful(
+            "composite/sobjects",
+            method="POST",
+            json={"allOrNone": False, "records": [_with_type(obj_name, r) for r in chunk]},
+        )
+        return _collect(results)
+
+    return run_batches("create", obj_name, rows, WRITE_BATCH_SIZE, send)
+
+
+@resumable("salesforce")
+def batch_update(sf: Any, obj_name: str, records: str | list) -> BatchResult:
+    """Update records by Salesforce ID with ``PATCH composite/sobjects``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        result = ChunkResult()
+        payload, positions = [], []
+        for position, record in enumerate(chunk):
+            record_id, fields = split_id(record, _ID_KEYS)
+            if record_id is None:
+                result.errors.append((position, "missing 'Id'"))
+                continue
+            payload.append(_with_type(obj_name, {"Id": record_id, **fields}))
+            positions.append(position)
+        if payload:
+            results = sf.restful(
+                "composite/sobjects",
+                method="PATCH",
+                json={"allOrNone": False, "records": payload},
+            )
+            sent = _collect(results, positions)
+            result.ids.extend(sent.ids)
+            result.positions.extend(sent.positions)
+            result.errors.extend(sent.errors)
+        return result
+
+    return run_batches("update", obj_name, rows, WRITE_BATCH_SIZE, send)
+
+
+@resumable("salesforce")
+def batch_upsert(
+    sf: Any, obj_name: str, records: str | list, external_id_field: str
+) -> BatchResult:
+    """Create or update records matched on an external ID field."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        results = sf.restful(
+            f"composite/sobjects/{obj_name}/{external_id_field}",
+            method="PATCH",
+            json={"allOrNone": False, "records": [_with_type(obj_name, r) for r in chunk]},
+        )
+        return _collect(results)
+
+    return run_batches("upsert", obj_name, rows, WRITE_BATCH_SIZE, send)
+
+
+def batch_get(sf: Any, obj_name: str, ids: str | list, fields: list[str]) -> BatchResult:
+    """Fetch records by ID with ``POST composite/sobjects/{object}``."""
+    id_list = parse_ids(ids)
+    fields = ["Id", *(f for f in fields if f != "Id")]
+
+    def send(chunk: list[str]) -> ChunkResult:
+        results = sf.restful(
+            f"composite/sobjects/{obj_name}",
+            method="POST",
+            json={"ids": chunk, "fields": fields},
+        )
+        result = ChunkResult()
+        for position, record in enumerate(results or []):
+            if record is None:
+                result.errors.append((position, f"{chunk[position]} not found"))
+                continue
+            record.pop("attributes", None)
+            result.records.append(record)
+        return result
+
+    return run_batches("get", obj_name, id_list, READ_BATCH_SIZE, send, service="salesforce")
+
+
+@resumable("salesforce")
+def batch_delete(sf: Any, obj_name: str, ids: str | list) -> BatchResult:
+    """Delete records by ID with ``DELETE composite/sobjects``."""
+    id_list = parse_ids(ids)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        results = sf.restful(
+            "composite/sobjects",
+            method="DELETE",
+            params={"ids": ",".join(chunk), "allOrNone": "false"},
+        )
+        return _collect(results)
+
+    return run_batches("delete", obj_name, id_list, WRITE_BATCH_SIZE, send)
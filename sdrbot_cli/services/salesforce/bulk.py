@@ -0,0 +1,460 @@
+"""Salesforce Bulk API 2.0 jobs.
+
+Large exports and loads run as server-side Bulk API 2.0 jobs instead of
+paging records through ``sf.query`` or writing them one request at a time:
+
+- Query jobs are submitted, polled until complete, and their CSV result
+  pages are streamed straight into a single file under ``./files/salesforce/``
+  (the header is kept once), so millions of rows never sit in memory.
+- Ingest jobs upload a CSV (split into several jobs above the 100 MB upload
+  limit), are polled until complete, and their failed rows are downloaded to
+  a ``*_failed.csv`` file next to the input with Salesforce's error per row.
+
+Polling backs off from ``POLL_INITIAL`` to ``POLL_MAX`` seconds. When a job
+outlives the caller's wait budget the job ID is returned so the caller can
+check on it later with :func:`wait_for_job` / :func:`job_report`.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from sdrbot_cli.config import settings
+from sdrbot_cli.rate_limit import call_with_rate_limit
+
+# Bulk API 2.0 accepts up to 150 MB of base64 per upload (~100 MB raw CSV)
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+# Rows per query result page
+RESULT_PAGE_SIZE = 50_000
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+POLL_INITIAL = 2.0
+POLL_MAX = 30.0
+DEFAULT_WAIT_SECONDS = 600
+
+INGEST_OPERATIONS = ("insert", "update", "upsert", "delete", "hardDelete")
+TERMINAL_STATES = ("JobComplete", "Failed", "Aborted")
+
+# Failed rows quoted in the report (the full list is in the failures file)
+MAX_REPORTED_FAILURES = 10
+
+
+class BulkJobError(Exception):
+    """Raised when the Bulk API rejects a request or a job fails."""
+
+
+@dataclass
+class BulkJobReport:
+    """Outcome of a bulk query or ingest job (or several, for split uploads)."""
+
+    kind: str
+    object_name: str
+    job_ids: list[str]
+    state: str
+    operation: str = "query"
+    processed: int = 0
+    failed: int = 0
+    output_path: Path | None = None
+    failures_path: Path | None = None
+    sample_failures: list[str] = field(default_factory=list)
+    error_message: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def done(self) -> bool:
+        """Whether every job reached a terminal state."""
+        return self.state in TERMINAL_STATES
+
+    def summary(self) -> str:
+        """Compact, agent-facing summary of the job."""
+        jobs = ", ".join(self.job_ids)
+        if not self.done:
+            return (
+                f"Bulk {self.operation} job for {self.object_name} is still {self.state} "
+                f"after {self.elapsed:.0f}s ({self.processed:,} records processed so far). "
+                f"Check again with salesforce_bulk_job_status("
+                f"job_id='{','.join(self.job_ids)}', job_type='{self.kind}')."
+            )
+        if self.kind == "query":
+            if self.state != "JobComplete":
+                return f"Bulk export {jobs} {self.state}: {self.error_message or 'no details'}"
+            return (
+                f"Exported {self.processed:,} {self.object_name} records to {self.output_path} "
+                f"(job {jobs}, {self.elapsed:.0f}s)."
+            )
+
+        succeeded = self.processed - self.failed
+        lines = [
+            f"Bulk {self.operation} of {self.object_name}: {succeeded:,} succeeded, "
+            f"{self.failed:,} failed (job {jobs}, state {self.state}, {self.elapsed:.0f}s)."
+        ]
+        if self.error_message:
+            lines.append(f"Job error: {self.error_message}")
+        if self.failures_path:
+            lines.append(f"Failed rows with errors: {self.failures_path}")
+            lines.extend(f"- {message}" for message in self.sample_failures)
+        return "\n".join(lines)
+
+
+class Bulk2Client:
+    """Thin Bulk API 2.0 client sharing a simple_salesforce session."""
+
+    def __init__(self, sf: Any) -> None:
+        """Initialize from an authenticated ``simple_salesforce.Salesforce``."""
+        self.sf = sf
+        self.base_url = f"{sf.base_url}jobs"
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        headers = {"Authorization": f"Bearer {self.sf.session_id}", **kwargs.pop("headers", {})}
+        url = f"{self.base_url}/{path}"
+        response = call_with_rate_limit(
+            "salesforce",
+            f"/jobs/{path.split('/')[0]}",
+            lambda: self.sf.session.request(method, url, headers=headers, **kwargs),
+        )
+        if not response.ok:
+            try:
+                detail = "; ".join(e.get("message", str(e)) for e in response.json())
+            except Exception:
+                detail = response.text
+            raise BulkJobError(f"Bulk API error ({response.status_code}): {detail}")
+        return response
+
+    def _json(self, method: str, path: str, body: dict | None = None) -> dict[str, Any]:
+        response = self._request(method, path, json=body)
+        return response.json() if response.text else {}
+
+    # Query jobs
+
+    def create_query_job(self, soql: str, include_deleted: bool = False) -> str:
+        """Submit a query job and return its ID."""
+        operation = "queryAll" if include_deleted else "query"
+        return self._json("POST", "query", {"operation": operation, "query": soql})["id"]
+
+    def iter_result_pages(self, job_id: str) -> Iterator[requests.Response]:
+        """Yield streamed CSV result pages, following the ``Sforce-Locator`` header."""
+        locator = None
+        while True:
+            params: dict[str, Any] = {"maxRecords": RESULT_PAGE_SIZE}
+            if locator:
+                params["locator"] = locator
+            response = self._request(
+                "GET",
+                f"query/{job_id}/results",
+                params=params,
+                headers={"Accept": "text/csv"},
+                stream=True,
+            )
+            yield response
+            locator = response.headers.get("Sforce-Locator")
+            if not locator or locator == "null":
+                return
+
+    # Ingest jobs
+
+    def create_ingest_job(
+        self,
+        object_name: str,
+        operation: str,
+        external_id_field: str | None = None,
+        line_ending: str = "LF",
+    ) -> str:
+        """Open an ingest job and return its ID.
+
+        ``line_ending`` ("LF" or "CRLF") must match the CSV that's uploaded.
+        """
+        body = {
+            "object": object_name,
+            "operation": operation,
+            "contentType": "CSV",
+            "lineEnding": line_ending,
+        }
+        if operation == "upsert":
+            body["externalIdFieldName"] = external_id_field or "Id"
+        return self._json("POST", "ingest", body)["id"]
+
+    def upload(self, job_id: str, csv_path: Path) -> None:
+        """Stream a CSV file into an open ingest job and mark the upload complete."""
+        with csv_path.open("rb") as f:
+            self._request(
+                "PUT",
+                f"ingest/{job_id}/batches",
+                data=f,
+                headers={"Content-Type": "text/csv"},
+            )
+        self._json("PATCH", f"ingest/{job_id}", {"state": "UploadComplete"})
+
+    def download(self, path: str, destination: Path, *, skip_header: bool = False) -> None:
+        """Stream a CSV result endpoint to ``destination`` (appending)."""
+        response = self._request("GET", path, headers={"Accept": "text/csv"}, stream=True)
+        _write_stream(response, destination, skip_header=skip_header)
+
+    # Both
+
+    def job_info(self, kind: str, job_id: str) -> dict[str, Any]:
+        """Fetch a job's state and counters (``kind`` is "query" or "ingest")."""
+        return self._json("GET", f"{kind}/{job_id}")
+
+    def abort(self, kind: str, job_id: str) -> None:
+        """Abort a running job."""
+        self._json("PATCH", f"{kind}/{job_id}", {"state": "Aborted"})
+
+
+def _write_stream(response: requests.Response, destination: Path, *, skip_header: bool) -> None:
+    """Append a streamed CSV body to a file, optionally dropping its header line."""
+    with destination.open("ab") as out:
+        pending_header = skip_header
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+            if pending_header:
+                newline = chunk.find(b"\n")
+                if newline < 0:
+                    continue
+                chunk = chunk[newline + 1 :]
+                pending_header = False
+            out.write(chunk)
+
+
+def wait_for_job(
+    client: Bulk2Client, kind: str, job_id: str, timeout: float = DEFAULT_WAIT_SECONDS
+) -> dict[str, Any]:
+    """Poll a job with backoff until it finishes or ``timeout`` seconds pass.
+
+    Returns:
+        The latest job info (check ``state`` to see whether it finished).
+    """
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL
+    while True:
+        info = client.job_info(kind, job_id)
+        remaining = deadline - time.monotonic()
+        if info.get("state") in TERMINAL_STATES or remaining <= 0:
+            return info
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, POLL_MAX)
+
+
+def _default_path(object_name: str, kind: str) -> Path:
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return settings.get_files_dir() / "salesforce" / f"{object_name}_{kind}_{stamp}.csv"
+
+
+def object_from_soql(soql: str) -> str:
+    """Best-effort object name from a SOQL ``FROM`` clause."""
+    words = soql.replace(",", " , ").split()
+    for i, word in enumerate(words[:-1]):
+        if word.upper() == "FROM":
+            return words[i + 1]
+    return "records"
+
+
+def export_query(
+    client: Bulk2Client,
+    soql: str,
+    output_path: Path | None = None,
+    *,
+    include_deleted: bool = False,
+    wait_seconds: float = DEFAULT_WAIT_SECONDS,
+) -> BulkJobReport:
+    """Run a bulk query and stream every result row into one CSV file."""
+    start = time.monotonic()
+    job_id = client.create_query_job(soql, include_deleted=include_deleted)
+    report = query_report(client, job_id, output_path, soql=soql, wait_seconds=wait_seconds)
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+def query_report(
+    client: Bulk2Client,
+    job_id: str,
+    output_path: Path | None = None,
+    *,
+    soql: str | None = None,
+    wait_seconds: float = DEFAULT_WAIT_SECONDS,
+) -> BulkJobReport:
+    """Wait for a query job and download its results once complete."""
+    start = time.monotonic()
+    info = wait_for_job(client, "query", job_id, wait_seconds)
+    object_name = info.get("object") or object_from_soql(soql or info.get("query", ""))
+    report = BulkJobReport(
+        kind="query",
+        object_name=object_name,
+        job_ids=[job_id],
+        state=info.get("state", "Unknown"),
+        processed=int(info.get("numberRecordsProcessed") or 0),
+        error_message=info.get("errorMessage"),
+    )
+    if report.state == "JobComplete":
+        path = output_path or _default_path(object_name, "export")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+        written = 0
+        for page_number, response in enumerate(client.iter_result_pages(job_id)):
+            _write_stream(response, path, skip_header=page_number > 0)
+            written += int(response.headers.get("Sforce-NumberOfRecords") or 0)
+        report.processed = written or report.processed
+        report.output_path = path
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+def line_ending(path: Path) -> str:
+    """The Bulk API ``lineEnding`` of a CSV: "CRLF" if its header ends in CRLF, else "LF".
+
+    Excel exports and Python's csv module (by default) write CRLF.
+    """
+    with path.open("rb") as f:
+        first_line = f.readline()
+    return "CRLF" if first_line.endswith(b"\r\n") else "LF"
+
+
+def _encoded_row(row: list[str]) -> bytes:
+    line = io.StringIO()
+    csv.writer(line, lineterminator="\n").writerow(row)
+    return line.getvalue().encode("utf-8")
+
+
+def split_csv(path: Path, max_bytes: int = MAX_UPLOAD_BYTES) -> list[Path]:
+    """Split a CSV into parts under ``max_bytes``, repeating the header in each.
+
+    Rows are split with the csv module so quoted newlines stay intact, and
+    sized by their UTF-8 encoding. Parts use LF line endings. Files already
+    under the limit are returned unchanged (see :func:`line_ending`).
+    """
+    if path.stat().st_size <= max_bytes:
+        return [path]
+
+    parts: list[Path] = []
+    with path.open(newline="", encoding="utf-8-sig") as source:
+        reader = csv.reader(source)
+        header = _encoded_row(next(reader))
+        out = None
+        size = 0
+        for row in reader:
+            line = _encoded_row(row)
+            if out is None or size + len(line) > max_bytes:
+                if out:
+                    out.close()
+                part = path.with_name(f"{path.stem}.part{len(parts) + 1}.csv")
+                parts.append(part)
+                out = part.open("wb")
+                out.write(header)
+                size = len(header)
+            out.write(line)
+            size += len(line)
+        if out:
+            out.close()
+    return parts
+
+
+def load_csv(
+    client: Bulk2Client,
+    object_name: str,
+    input_path: Path,
+    operation: str = "upsert",
+    *,
+    external_id_field: str = "Id",
+    wait_seconds: float = DEFAULT_WAIT_SECONDS,
+) -> BulkJobReport:
+    """Load a CSV into Salesforce with one ingest job per upload-sized part.
+
+    Raises:
+        ValueError: If the operation is not a Bulk API ingest operation.
+    """
+    if operation not in INGEST_OPERATIONS:
+        raise ValueError(f"operation must be one of: {', '.join(INGEST_OPERATIONS)}")
+
+    start = time.monotonic()
+    parts = split_csv(input_path)
+    job_ids = []
+    try:
+        for part in parts:
+            job_id = client.create_ingest_job(
+                object_name, operation, external_id_field, line_ending(part)
+            )
+            job_ids.append(job_id)
+            client.upload(job_id, part)
+    finally:
+        for part in parts:
+            if part != input_path:
+                part.unlink(missing_ok=True)
+
+    report = ingest_report(
+        client,
+        job_ids,
+        object_name=object_name,
+        operation=operation,
+        failures_path=input_path.with_name(f"{input_path.stem}_failed.csv"),
+        wait_seconds=wait_seconds,
+    )
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+def ingest_report(
+    client: Bulk2Client,
+    job_ids: list[str],
+    *,
+    object_name: str | None = None,
+    operation: str | None = None,
+    failures_path: Path | None = None,
+    wait_seconds: float = DEFAULT_WAIT_SECONDS,
+) -> BulkJobReport:
+    """Wait for ingest jobs and collect their counters and failed rows."""
+    start = time.monotonic()
+    deadline = start + wait_seconds
+    infos = [
+        wait_for_job(client, "ingest", job_id, max(0.0, deadline - time.monotonic()))
+        for job_id in job_ids
+    ]
+    first = infos[0]
+    object_name = object_name or first.get("object", "records")
+    states = [info.get("state", "Unknown") for info in infos]
+    # Report the least-finished state across split jobs
+    pending = [s for s in states if s not in TERMINAL_STATES]
+    failed = [s for s in states if s != "JobComplete"]
+    report = BulkJobReport(
+        kind="ingest",
+        object_name=object_name,
+        job_ids=job_ids,
+        operation=operation or first.get("operation", "ingest"),
+        state=(pending or failed or states)[0],
+        processed=sum(int(i.get("numberRecordsProcessed") or 0) for i in infos),
+        failed=sum(int(i.get("numberRecordsFailed") or 0) for i in infos),
+        error_message="; ".join(i["errorMessage"] for i in infos if i.get("errorMessage")) or None,
+    )
+
+    if report.done and report.failed:
+        path = failures_path or _default_path(object_name, "failed")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+        wrote_header = False
+        for info, job_id in zip(infos, job_ids, strict=True):
+            if int(info.get("numberRecordsFailed") or 0):
+                client.download(f"ingest/{job_id}/failedResults", path, skip_header=wrote_header)
+                wrote_header = True
+        report.failures_path = path
+        report.sample_failures = _sample_failures(path)
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+def _sample_failures(path: Path) -> list[str]:
+    """Quote the first few failed rows as "<first input value>: <error>"."""
+    samples = []
+    with path.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if len(samples) >= MAX_REPORTED_FAILURES:
+                break
+            values = [v for k, v in row.items() if k and not k.startswith("sf__") and v]
+            label = values[0] if values else "row"
+            samples.append(f"{label}: {row.get('sf__Error') or 'unknown error'}")
+    return samples
@@ -0,0 +1,58 @@
+"""Salesforce source for the local CRM mirror (see ``sdrbot_cli.services.mirror``)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from sdrbot_cli.services.mirror import MirrorRecord, parse_utc, to_utc_iso
+from sdrbot_cli.services.salesforce.tools import get_sf
+
+DEFAULT_OBJECTS = ("Account", "Contact", "Lead", "Opportunity")
+
+# getDeleted() only reaches 30 days back; older mirrors need a full sync
+MAX_DELTA_DAYS = 29
+
+# Compound fields duplicate their components and can't be filtered on
+_SKIPPED_FIELD_TYPES = {"address", "location", "base64"}
+
+
+def get_client() -> Any:
+    """Salesforce client for mirror syncs."""
+    return get_sf()
+
+
+def supports_delta(object_name: str) -> bool:
+    """Every queryable Salesforce object has ``SystemModstamp``."""
+    return True
+
+
+def _fields(sf: Any, object_name: str) -> list[str]:
+    describe = getattr(sf, object_name).describe()
+    return [f["name"] for f in describe["fields"] if f.get("type") not in _SKIPPED_FIELD_TYPES]
+
+
+def fetch_records(sf: Any, object_name: str, since: str | None) -> Iterator[MirrorRecord]:
+    """List Salesforce records, all of them or those modified since ``since``.
+
+    Delta syncs also report records deleted since then (``since`` must be
+    within the last 30 days; see ``MAX_DELTA_DAYS``).
+    """
+    fields = _fields(sf, object_name)
+    soql = f"SELECT {', '.join(fields)} FROM {object_name}"
+    if since is not None:
+        soql += f" WHERE SystemModstamp >= {since}"
+
+    for row in sf.query_all_iter(soql):
+        data = {k: v for k, v in row.items() if k != "attributes"}
+        yield MirrorRecord(
+            id=data["Id"],
+            data=data,
+            modified_at=to_utc_iso(data.get("SystemModstamp") or data.get("LastModifiedDate")),
+        )
+
+    if since is not None:
+        deleted = getattr(sf, object_name).deleted(parse_utc(since), datetime.now(UTC))
+        for item in deleted.get("deletedRecords", []):
+            yield MirrorRecord(id=item["id"], data={}, deleted=True)
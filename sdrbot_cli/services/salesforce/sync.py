@@ -10,6 +10,7 @@ from typing import Any
 
 from sdrbot_cli.auth.salesforce import get_client
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Standard Salesforce objects to sync by default
@@ -188,7 +189,9 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         "",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.salesforce import get_client",
+        "from sdrbot_cli.services.salesforce import batch as salesforce_batch",
         "",
         "",
         "# Shared client instance",
@@ -232,6 +235,12 @@ def _generate_tools_code(schema: dict[str, list[dict]]) -> str:
         lines.extend(_generate_delete_tool(obj_name))
         lines.append("")
 
+        # Generate batch tools (sObject Collections)
+        read_fields = _prioritize_fields(fields, obj_name)[:MAX_FIELDS_PER_TOOL]
+        lines.extend(
+            _generate_batch_tools(obj_name, createable_fields, updateable_fields, read_fields)
+        )
+
     return "\n".join(lines)
 
 
@@ -481,15 +490,12 @@ def _generate_get_tool(obj_name: str) -> list[str]:
         f"        record_id: The Salesforce ID of the {obj_name}.",
         "",
         "    Returns:",
-        f"        JSON string with the {obj_name} details.",
+        f"        The {obj_name} as field: value lines.",
         '    """',
         "    sf = _get_sf()",
         "    try:",
         f'        result = sf.restful(f"sobjects/{obj_name}/{{record_id}}")',
-        "        # Remove metadata",
-        '        if "attributes" in result:',
-        '            del result["attributes"]',
-        f'        return f"{obj_name} {{record_id}}:\\n" + json.dumps(result, indent=2)',
+        f'        return result_format.format_record(f"{obj_name} {{record_id}}", result, service="salesforce")',
         "    except Exception as e:",
         f'        return f"Error getting {obj_name}: {{str(e)}}"',
     ]
@@ -524,3 +530,100 @@ def _generate_delete_tool(obj_name: str) -> list[str]:
         "    except Exception as e:",
         f'        return f"Error deleting {obj_name}: {{str(e)}}"',
     ]
+
+
+def _generate_batch_tools(
+    obj_name: str,
+    createable_fields: list[dict],
+    updateable_fields: list[dict],
+    read_fields: list[dict],
+) -> list[str]:
+    """Generate batch create/update/upsert/get/delete tools for an object.
+
+    The tools delegate to ``sdrbot_cli.services.salesforce.batch`` (sObject
+    Collections, 200 records per write request).
+
+    Args:
+        obj_name: Object API name.
+        createable_fields: Createable fields (listed in the create docstring).
+        updateable_fields: Updateable fields (listed in the update docstring).
+        read_fields: Fields returned by the batch get tool.
+
+    Returns:
+        List of code lines.
+    """
+    token = obj_name.lower().replace("__c", "")
+    note = "Sends up to 200 records per request."
+    ids_doc = [f"        ids: JSON array or comma-separated {obj_name} IDs, or a file of IDs."]
+    read_names = [f["name"] for f in read_fields]
+
+    def records_doc(fields: list[dict]) -> list[str]:
+        names = ", ".join(f["name"] for f in fields[:15]) or "any writable field"
+        return [
+            "        records: JSON array of objects keyed by field API name, or a path to a",
+            f"            .csv/.json/.jsonl file. Fields: {names}",
+        ]
+
+    lines = []
+    if createable_fields:
+        lines.extend(
+            generate_batch_tool(
+                f"salesforce_batch_create_{token}",
+                "records: str",
+                f"Create many {obj_name} records in Salesforce at once.",
+                records_doc(createable_fields),
+                f'salesforce_batch.batch_create(_get_sf(), "{obj_name}", records)',
+                f"Error creating {obj_name} records",
+                note,
+            )
+        )
+        lines.extend(
+            generate_batch_tool(
+                f"salesforce_batch_upsert_{token}",
+                "records: str, external_id_field: str",
+                f"Create or update many {obj_name} records, matched on an external ID field.",
+                [
+                    *records_doc(createable_fields),
+                    "        external_id_field: External ID field to match on (or Id).",
+                ],
+                f'salesforce_batch.batch_upsert(_get_sf(), "{obj_name}", records, '
+                "external_id_field)",
+                f"Error upserting {obj_name} records",
+                note,
+            )
+        )
+    if updateable_fields:
+        lines.extend(
+            generate_batch_tool(
+                f"salesforce_batch_update_{token}",
+                "records: str",
+                f"Update many existing {obj_name} records in Salesforce at once.",
+                [*records_doc(updateable_fields), "            Each record needs its 'Id'."],
+                f'salesforce_batch.batch_update(_get_sf(), "{obj_name}", records)',
+                f"Error updating {obj_name} records",
+                note,
+            )
+        )
+    lines.extend(
+        generate_batch_tool(
+            f"salesforce_batch_get_{token}",
+            "ids: str",
+            f"Get many {obj_name} records from Salesforce by ID.",
+            ids_doc,
+            f'salesforce_batch.batch_get(_get_sf(), "{obj_name}", ids, {read_names})',
+            f"Error getting {obj_name} records",
+            "Fetches up to 2,000 records per request.",
+        )
+    )
+    lines.extend(
+        generate_batch_tool(
+            f"salesforce_batch_delete_{token}",
+            "ids: str",
+            f"Delete many {obj_name} records from Salesforce by ID.",
+            ids_doc,
+            f'salesforce_batch.batch_delete(_get_sf(), "{obj_name}", ids)',
+            f"Error deleting {obj_name} records",
+            note,
+        )
+    )
+    return lines
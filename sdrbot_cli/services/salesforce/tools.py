@@ -5,10 +5,18 @@ Schema-dependent CRUD tools are generated in tools.generated.py after sync.
 """
 
 import json
+from pathlib import Path
 
 from langchain_core.tools import BaseTool, tool
 
+from sdrbot_cli import result_format
 from sdrbot_cli.auth.salesforce import get_client
+from sdrbot_cli.config import settings
+from sdrbot_cli.services import pagination
+from sdrbot_cli.services.salesforce import bulk
+
+# Records per query page (Salesforce's default batch size)
+SOQL_PAGE_SIZE = 2000
 
 # Shared client instance (lazy loaded)
 _sf_client = None
@@ -29,13 +37,15 @@ def reset_client() -> None:
 
 
 @tool
-def salesforce_soql_query(query: str) -> str:
+def salesforce_soql_query(query: str, max_records: int = SOQL_PAGE_SIZE) -> str:
     """
     Execute a SOQL query against Salesforce.
     Use this for complex queries, reporting, or when you need to join data across objects.
 
     Args:
         query: SOQL query string (e.g., "SELECT Id, Name, Email FROM Contact WHERE Name LIKE 'John%' LIMIT 10")
+        max_records: Maximum records to return (default 2000). Further pages are fetched
+                     as needed; large result sets are saved to a file.
 
     Note: Only SELECT queries are allowed for safety.
     """
@@ -45,22 +55,23 @@ def salesforce_soql_query(query: str) -> str:
         if not query.strip().upper().startswith("SELECT"):
             return "Error: Only SELECT queries are allowed via this tool."
 
-        results = sf.query(query)
+        meta = {}
+
+        def fetch_page(next_url, page_size):
+            # Salesforce picks the page size; follow nextRecordsUrl until done
+            if next_url:
+                page = sf.query_more(next_url, identifier_is_url=True)
+            else:
+                page = sf.query(query)
+            meta.setdefault("total", page.get("totalSize"))
+            return page.get("records", []), page.get("nextRecordsUrl")
 
-        records = results.get("records", [])
+        records = pagination.collect(fetch_page, max_records, SOQL_PAGE_SIZE)
         if not records:
             return "Query returned 0 records."
 
-        # Clean up attributes metadata to save tokens
-        clean_records = []
-        for rec in records:
-            if "attributes" in rec:
-                del rec["attributes"]
-            clean_records.append(rec)
-
-        return (
-            f"Query returned {results['totalSize']} records:\n{json.dumps(clean_records, indent=2)}"
-        )
+        # Salesforce's "attributes" metadata is dropped by the formatter, at any depth
+        return result_format.format_records("salesforce", "records", records, meta["total"])
     except Exception as e:
         return f"SOQL Error: {str(e)}"
 
@@ -411,6 +422,146 @@ def salesforce_count_records(object_name: str | None = None) -> str:
     return "\n".join(lines)
 
 
+# Compound fields the Bulk API can't export (their components are exported instead)
+_BULK_UNSUPPORTED_TYPES = {"address", "location"}
+
+
+def _bulk_path(value: str) -> Path:
+    """Resolve a user-supplied CSV path, falling back to ./files/."""
+    path = Path(value).expanduser()
+    if not path.is_absolute() and not path.exists():
+        path = settings.get_files_dir() / value
+    return path
+
+
+def _export_path(output_file: str | None) -> Path | None:
+    """Resolve the export file (relative paths land in ./files/)."""
+    if not output_file:
+        return None  # bulk.export_query picks ./files/salesforce/<Object>_export_<time>.csv
+    path = Path(output_file).expanduser()
+    if not path.is_absolute():
+        path = settings.get_files_dir() / output_file
+    return path.with_suffix(".csv")
+
+
+@tool
+def salesforce_bulk_export(
+    object_or_soql: str,
+    output_file: str | None = None,
+    include_deleted: bool = False,
+    wait_seconds: int = bulk.DEFAULT_WAIT_SECONDS,
+) -> str:
+    """Export a large result set to CSV with the Bulk API 2.0.
+
+    Use this instead of salesforce_soql_query when you need more than a few
+    thousand records (e.g. "export all Contacts"). Results stream to a CSV
+    file, so only a summary comes back.
+
+    Args:
+        object_or_soql: An object API name (exports every field, e.g. "Contact")
+                        or a full SOQL query.
+        output_file: Optional CSV path (relative to ./files/). Defaults to
+                     ./files/salesforce/<Object>_export_<time>.csv.
+        include_deleted: Include deleted and archived records (queryAll).
+        wait_seconds: How long to wait for the job before returning its ID.
+
+    Returns:
+        Record count and output path, or the job ID if it is still running.
+    """
+    sf = get_sf()
+    try:
+        soql = object_or_soql.strip()
+        if " " not in soql:
+            fields = [
+                f["name"]
+                for f in getattr(sf, soql).describe()["fields"]
+                if f["type"] not in _BULK_UNSUPPORTED_TYPES
+            ]
+            soql = f"SELECT {', '.join(fields)} FROM {object_or_soql.strip()}"
+        report = bulk.export_query(
+            bulk.Bulk2Client(sf),
+            soql,
+            _export_path(output_file),
+            include_deleted=include_deleted,
+            wait_seconds=wait_seconds,
+        )
+        return report.summary()
+    except Exception as e:
+        return f"Error running bulk export: {str(e)}"
+
+
+@tool
+def salesforce_bulk_load(
+    object_name: str,
+    input_file: str,
+    operation: str = "upsert",
+    external_id_field: str = "Id",
+    wait_seconds: int = bulk.DEFAULT_WAIT_SECONDS,
+) -> str:
+    """Insert, update, upsert or delete records from a CSV with the Bulk API 2.0.
+
+    Use this for loads of thousands of rows. The CSV header must use field
+    API names (e.g. "Email,LastName,Company"); updates and deletes need an
+    Id column. Failed rows are written to <input>_failed.csv with an
+    sf__Error column explaining each failure.
+
+    Args:
+        object_name: The object API name (e.g., "Contact").
+        input_file: Path to the CSV file (relative paths are also looked up in ./files/).
+        operation: One of "insert", "update", "upsert", "delete", "hardDelete".
+        external_id_field: Field to match on for upserts (e.g. "Email__c"). Defaults to Id.
+        wait_seconds: How long to wait for the job before returning its ID.
+
+    Returns:
+        Success and failure counts with sample errors, or the job ID if still running.
+    """
+    sf = get_sf()
+    try:
+        input_path = _bulk_path(input_file)
+        if not input_path.exists():
+            return f"Error: File not found: {input_file}"
+        report = bulk.load_csv(
+            bulk.Bulk2Client(sf),
+            object_name,
+            input_path,
+            operation,
+            external_id_field=external_id_field,
+            wait_seconds=wait_seconds,
+        )
+        return report.summary()
+    except Exception as e:
+        return f"Error running bulk {operation}: {str(e)}"
+
+
+@tool
+def salesforce_bulk_job_status(
+    job_id: str, job_type: str = "ingest", wait_seconds: int = 60
+) -> str:
+    """Check on a Bulk API job that was still running, and collect its results.
+
+    Args:
+        job_id: The job ID (several comma-separated IDs for a split load).
+        job_type: "query" for exports, "ingest" for loads.
+        wait_seconds: How long to keep waiting for the job to finish.
+
+    Returns:
+        The job summary; exports are downloaded and load failures saved once done.
+    """
+    sf = get_sf()
+    client = bulk.Bulk2Client(sf)
+    job_ids = [j.strip() for j in job_id.split(",") if j.strip()]
+    try:
+        if job_type == "query":
+            report = bulk.query_report(client, job_ids[0], wait_seconds=wait_seconds)
+        elif job_type == "ingest":
+            report = bulk.ingest_report(client, job_ids, wait_seconds=wait_seconds)
+        else:
+            return "Error: job_type must be 'query' or 'ingest'"
+        return report.summary()
+    except Exception as e:
+        return f"Error checking bulk job {job_id}: {str(e)}"
+
+
 def get_static_tools() -> list[BaseTool]:
     """Get all static Salesforce tools.
 
@@ -431,4 +582,8 @@ def get_static_tools() -> list[BaseTool]:
         salesforce_search_records,
         salesforce_get_record,
         salesforce_count_records,
+        # Bulk API 2.0
+        salesforce_bulk_export,
+        salesforce_bulk_load,
+        salesforce_bulk_job_status,
     ]
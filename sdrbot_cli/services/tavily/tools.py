@@ -1,9 +1,18 @@
 """Tavily Tools."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from langchain_core.tools import BaseTool, tool
-from tavily import TavilyClient
 
 from sdrbot_cli.config import settings
+from sdrbot_cli.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from tavily import TavilyClient
+
+tavily = lazy_import("tavily")
 
 # Shared client instance (lazy loaded)
 _tavily_client: TavilyClient | None = None
@@ -15,7 +24,7 @@ def get_tavily_client() -> TavilyClient:
     if _tavily_client is None:
         if not settings.tavily_api_key:
             raise RuntimeError("Tavily API key not configured (TAVILY_API_KEY).")
-        _tavily_client = TavilyClient(api_key=settings.tavily_api_key)
+        _tavily_client = tavily.TavilyClient(api_key=settings.tavily_api_key)
     return _tavily_client
 
 
@@ -20,7 +20,9 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         twenty_update_company -> company
         twenty_search_customobj -> customobj
     """
-    match = re.match(r"twenty_(?:create|update|search|get|delete)_(.+)", tool_name)
+    match = re.match(
+        r"twenty_(?:batch_)?(?:create|update|upsert|search|get|delete)_(.+)", tool_name
+    )
     return match.group(1) if match else None
 
 
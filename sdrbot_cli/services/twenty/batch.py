@@ -0,0 +1,73 @@
+"""Twenty batch CRUD.
+
+Backs the generated ``twenty_batch_*`` tools. Creates use the REST batch
+endpoint (``POST /batch/{plural}``, 60 records per request). Twenty's batch
+update/delete mutations apply one change to a filter, not per-record values,
+so updates and deletes fan out over the single-record endpoints instead.
+
+Dotted keys such as ``"name.firstName"`` (e.g. CSV headers) are nested into
+Twenty's composite field objects.
+"""
+
+from typing import Any
+
+from sdrbot_cli.services.batch import (
+    DEFAULT_FANOUT_CONCURRENCY,
+    BatchResult,
+    ChunkResult,
+    expand_dotted,
+    load_batch_records,
+    parse_ids,
+    per_record,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+# Twenty's maximum records per batch request
+BATCH_SIZE = 60
+
+
+@resumable("twenty")
+def batch_create(client: Any, plural: str, records: str | list) -> BatchResult:
+    """Create records with ``POST /batch/{plural}``."""
+    rows = [expand_dotted(r) for r in load_batch_records(records)]
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        response = client.post(f"/batch/{plural}", json=chunk)
+        data = response.get("data") or {}
+        created = next((v for v in data.values() if isinstance(v, list)), [])
+        return ChunkResult(ids=[str(r.get("id")) for r in created])
+
+    return run_batches("create", plural, rows, BATCH_SIZE, send)
+
+
+@resumable("twenty")
+def batch_update(client: Any, plural: str, records: str | list) -> BatchResult:
+    """Update records by ID, one ``PATCH /{plural}/{id}`` per record."""
+    rows = [expand_dotted(r) for r in load_batch_records(records)]
+
+    def update(record: dict[str, Any]) -> str:
+        record_id, fields = split_id(record, ("id",))
+        if record_id is None:
+            raise ValueError("missing 'id'")
+        client.patch(f"/{plural}/{record_id}", json=fields)
+        return record_id
+
+    return run_batches(
+        "update", plural, rows, 1, per_record(update), max_concurrency=DEFAULT_FANOUT_CONCURRENCY
+    )
+
+
+@resumable("twenty")
+def batch_delete(client: Any, plural: str, ids: str | list) -> BatchResult:
+    """Delete records by ID, one ``DELETE /{plural}/{id}`` per record."""
+    id_list = parse_ids(ids)
+
+    def delete(record_id: str) -> str:
+        client.delete(f"/{plural}/{record_id}")
+        return record_id
+
+    return run_batches(
+        "delete", plural, id_list, 1, per_record(delete), max_concurrency=DEFAULT_FANOUT_CONCURRENCY
+    )
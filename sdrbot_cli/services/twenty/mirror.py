@@ -0,0 +1,55 @@
+"""Twenty source for the local CRM mirror (see ``sdrbot_cli.services.mirror``)."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from sdrbot_cli.services import pagination
+from sdrbot_cli.services.mirror import MirrorRecord, to_utc_iso
+from sdrbot_cli.services.twenty.tools import get_twenty
+
+DEFAULT_OBJECTS = ("people", "companies", "opportunities")
+
+# Delta syncs don't see deleted records; a weekly full sync drops them
+FULL_SYNC_DAYS = 7
+
+# Records per request (API maximum)
+PAGE_SIZE = 60
+
+
+def get_client() -> Any:
+    """Twenty client for mirror syncs."""
+    return get_twenty()
+
+
+def supports_delta(object_name: str) -> bool:
+    """Every Twenty object has ``updatedAt``."""
+    return True
+
+
+def fetch_records(client: Any, object_name: str, since: str | None) -> Iterator[MirrorRecord]:
+    """List Twenty records, all of them or those updated since ``since``.
+
+    Deleted records drop out of the mirror on the next full sync.
+    """
+    params: dict[str, Any] = {"order_by": "updatedAt[AscNullsFirst]"}
+    if since is not None:
+        params["filter"] = f'updatedAt[gte]:"{since}"'
+
+    def fetch_page(cursor, page_size):
+        page_params = {**params, "limit": page_size}
+        if cursor:
+            page_params["starting_after"] = cursor
+        response = client.get(f"/{object_name}", params=page_params)
+        records = response.get(object_name, []) or response.get("data", {}).get(object_name, [])
+        page_info = response.get("pageInfo") or {}
+        return records, page_info.get("endCursor") if page_info.get("hasNextPage") else None
+
+    for record in pagination.paginate(fetch_page, sys.maxsize, PAGE_SIZE):
+        yield MirrorRecord(
+            id=str(record["id"]),
+            data=record,
+            modified_at=to_utc_iso(record.get("updatedAt")),
+        )
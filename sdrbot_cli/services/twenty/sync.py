@@ -13,6 +13,7 @@ import requests
 
 from sdrbot_cli.auth.twenty import TwentyClient
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Maximum fields per tool to keep signatures manageable
@@ -417,12 +418,20 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         "To customize, edit tools.py instead (static tools like notes).",
         '"""',
         "",
+        "import asyncio",
         "import json",
         "from typing import Optional",
         "",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.twenty import TwentyClient",
+        "from sdrbot_cli.services import pagination",
+        "from sdrbot_cli.services.twenty import batch as twenty_batch",
+        "",
+        "",
+        "# Records per search request (API maximum)",
+        "SEARCH_PAGE_SIZE = 60",
         "",
         "",
         "# Shared client instance",
@@ -469,6 +478,9 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         lines.extend(_generate_delete_tool(singular, plural))
         lines.append("")
 
+        # Generate batch tools
+        lines.extend(_generate_batch_tools(singular, plural, fields))
+
     return "\n".join(lines)
 
 
@@ -638,7 +650,7 @@ def _generate_create_tool(singular: str, plural: str, fields: list[dict]) -> lis
             "        if not data:",
             f'            return "Error: At least one field must be provided to create a {singular}."',
             "",
-            f'        response = client.post("/{plural}", json=data)',
+            f'        response = await client.apost("/{plural}", json=data)',
             f'        record_id = response.get("data", {{}}).get("create{singular.capitalize()}", {{}}).get("id")',
             "",
             f'        return f"Successfully created {singular} with ID: {{record_id}}"',
@@ -649,7 +661,7 @@ def _generate_create_tool(singular: str, plural: str, fields: list[dict]) -> lis
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -708,7 +720,7 @@ def _generate_update_tool(singular: str, plural: str, fields: list[dict]) -> lis
 
     # Build function body
     body = [
-        "    client = _get_twenty()",
+        "    client = await asyncio.to_thread(_get_twenty)",
         "    try:",
         "        data = {}",
         "        local_vars = locals()",
@@ -742,7 +754,7 @@ def _generate_update_tool(singular: str, plural: str, fields: list[dict]) -> lis
             "        if not data:",
             '            return "Error: At least one field must be provided to update."',
             "",
-            f'        client.patch(f"/{plural}/{{{singular}_id}}", json=data)',
+            f'        await client.apatch(f"/{plural}/{{{singular}_id}}", json=data)',
             "",
             f'        return f"Successfully updated {singular} {{{singular}_id}}"',
             "    except Exception as e:",
@@ -752,7 +764,7 @@ def _generate_update_tool(singular: str, plural: str, fields: list[dict]) -> lis
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -785,7 +797,11 @@ def _generate_search_tool(
         param_type = _python_type(f["type"])
         param_name = _safe_param_name(f["name"])
         params.append(f"    {param_name}: Optional[{param_type}] = None,")
-    params.append("    limit: int = 10,")
+    params.append("    max_records: int = 10,")
+    params.append("    fields: Optional[list[str]] = None,")
+
+    # Fields shown in results unless the agent asks for others
+    default_fields = [f["name"] for f in output_fields[:8]]
 
     params_str = "\n".join(params)
 
@@ -796,10 +812,16 @@ def _generate_search_tool(
     for f in searchable:
         param_name = _safe_param_name(f["name"])
         doc_lines.append(f"        {param_name}: Filter by {f.get('label', f['name'])}.")
-    doc_lines.append("        limit: Maximum results to return (default 10).")
+    doc_lines.append(
+        "        max_records: Maximum results to return (default 10). Pages are fetched as"
+    )
+    doc_lines.append("            needed; large result sets are saved to a file.")
+    doc_lines.append(
+        f"        fields: Fields to include in the results (default: {', '.join(default_fields)})."
+    )
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON array of {plural}. Each object contains:")
+    doc_lines.append(f"        CSV table of {plural} (one row per record) with columns:")
     doc_lines.append("        - id: Record identifier (use for get/update/delete)")
     # List top output fields (skip id since we already mentioned it)
     for f in output_fields[:5]:
@@ -813,9 +835,9 @@ def _generate_search_tool(
     # Twenty filter format: field[operator]:"value" or or(filter1,filter2)
     # For nested fields, use dot notation: name.firstName[ilike]:"%value%"
     body = [
-        "    client = _get_twenty()",
+        "    client = await asyncio.to_thread(_get_twenty)",
         "    try:",
-        '        params = {"limit": limit}',
+        "        params = {}",
         "",
         "        # Build filter from field parameters",
         "        # Twenty uses query-string filter format: field[op]:value",
@@ -850,9 +872,20 @@ def _generate_search_tool(
             "            else:",
             '                params["filter"] = f\'and({",".join(filters)})\'',
             "",
-            f'        response = client.get("/{plural}", params=params)',
-            f"        # Try flat response first, then nested under data.{plural}",
-            f'        records = response.get("{plural}", []) or response.get("data", {{}}).get("{plural}", [])',
+            "        meta = {}",
+            "",
+            "        async def fetch_page(cursor, page_size):",
+            '            page_params = {**params, "limit": page_size}',
+            "            if cursor:",
+            '                page_params["starting_after"] = cursor',
+            f'            response = await client.aget("/{plural}", params=page_params)',
+            '            meta["total"] = response.get("totalCount")',
+            f"            # Try flat response first, then nested under data.{plural}",
+            f'            records = response.get("{plural}", []) or response.get("data", {{}}).get("{plural}", [])',
+            '            page_info = response.get("pageInfo") or {}',
+            '            return records, page_info.get("endCursor") if page_info.get("hasNextPage") else None',
+            "",
+            "        records = await pagination.acollect(fetch_page, max_records, SEARCH_PAGE_SIZE)",
             "",
             "        if not records:",
             f'            return "No {plural} found matching the criteria."',
@@ -866,7 +899,7 @@ def _generate_search_tool(
             "                    record_data[key] = value",
             "            results.append(record_data)",
             "",
-            f'        return f"Found {{len(records)}} {plural}:\\n" + json.dumps(results, indent=2)',
+            f'        return result_format.format_records("twenty", "{plural}", results, meta.get("total"), fields=fields or {default_fields})',
             "    except Exception as e:",
             f'        return f"Error searching {plural}: {{str(e)}}"',
         ]
@@ -874,7 +907,7 @@ def _generate_search_tool(
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -897,7 +930,7 @@ def _generate_get_tool(singular: str, plural: str, output_fields: list[dict]) ->
 
     # Build returns docstring with field info
     returns_lines = [
-        f"        JSON object with {singular} data containing:",
+        f"        The {singular} as field: value lines, including:",
         "        - id: Record identifier",
     ]
     for f in output_fields[:5]:
@@ -908,7 +941,7 @@ def _generate_get_tool(singular: str, plural: str, output_fields: list[dict]) ->
 
     return [
         "@tool",
-        f"def {func_name}({singular}_id: str) -> str:",
+        f"async def {func_name}({singular}_id: str) -> str:",
         f'    """Get a {singular} by ID from Twenty.',
         "",
         "    Args:",
@@ -917,16 +950,16 @@ def _generate_get_tool(singular: str, plural: str, output_fields: list[dict]) ->
         "    Returns:",
         *returns_lines,
         '    """',
-        "    client = _get_twenty()",
+        "    client = await asyncio.to_thread(_get_twenty)",
         "    try:",
-        f'        response = client.get(f"/{plural}/{{{singular}_id}}")',
+        f'        response = await client.aget(f"/{plural}/{{{singular}_id}}")',
         f"        # Try flat response (has id at root), then nested under data.{singular}",
         f'        record = response if response.get("id") else response.get("data", {{}}).get("{singular}", {{}})',
         "",
         "        if not record:",
         f'            return f"{singular.title()} not found: {{{singular}_id}}"',
         "",
-        f'        return f"{singular.title()} {{{singular}_id}}:\\n" + json.dumps(record, indent=2)',
+        f'        return result_format.format_record(f"{singular.title()} {{{singular}_id}}", record)',
         "    except Exception as e:",
         f'        return f"Error getting {singular}: {{str(e)}}"',
     ]
@@ -946,7 +979,7 @@ def _generate_delete_tool(singular: str, plural: str) -> list[str]:
 
     return [
         "@tool",
-        f"def {func_name}({singular}_id: str) -> str:",
+        f"async def {func_name}({singular}_id: str) -> str:",
         f'    """Delete a {singular} from Twenty.',
         "",
         "    Args:",
@@ -955,10 +988,70 @@ def _generate_delete_tool(singular: str, plural: str) -> list[str]:
         "    Returns:",
         "        Success message confirming deletion.",
         '    """',
-        "    client = _get_twenty()",
+        "    client = await asyncio.to_thread(_get_twenty)",
         "    try:",
-        f'        client.delete(f"/{plural}/{{{singular}_id}}")',
+        f'        await client.adelete(f"/{plural}/{{{singular}_id}}")',
         f'        return f"Successfully deleted {singular} {{{singular}_id}}"',
         "    except Exception as e:",
         f'        return f"Error deleting {singular}: {{str(e)}}"',
     ]
+
+
+def _generate_batch_tools(singular: str, plural: str, fields: list[dict]) -> list[str]:
+    """Generate batch create/update/delete tools for an object.
+
+    The tools delegate to ``sdrbot_cli.services.twenty.batch``. Composite
+    fields are documented with dotted keys (e.g. ``name.firstName``), which the
+    batch module nests back into objects.
+
+    Args:
+        singular: Object singular name.
+        plural: Object plural name.
+        fields: List of writable fields.
+
+    Returns:
+        List of code lines.
+    """
+    token = singular.lower()
+    keys = [
+        f"{f['parent_field']}.{f.get('api_field', f['name'])}"
+        if f.get("parent_field")
+        else f["name"]
+        for f in fields[:15]
+    ]
+    records_doc = [
+        "        records: JSON array of objects keyed by field name, or a path to a",
+        f"            .csv/.json/.jsonl file. Fields: {', '.join(keys) or 'any writable field'}",
+    ]
+    ids_doc = [f"        ids: JSON array or comma-separated {plural} IDs, or a file of IDs."]
+    fanout = "Sends one request per record, several at a time."
+
+    return [
+        *generate_batch_tool(
+            f"twenty_batch_create_{token}",
+            "records: str",
+            f"Create many {plural} in Twenty at once.",
+            records_doc,
+            f'twenty_batch.batch_create(_get_twenty(), "{plural}", records)',
+            f"Error creating {plural}",
+            "Sends up to 60 records per request.",
+        ),
+        *generate_batch_tool(
+            f"twenty_batch_update_{token}",
+            "records: str",
+            f"Update many existing {plural} in Twenty.",
+            [*records_doc, "            Each record needs its 'id'."],
+            f'twenty_batch.batch_update(_get_twenty(), "{plural}", records)',
+            f"Error updating {plural}",
+            fanout,
+        ),
+        *generate_batch_tool(
+            f"twenty_batch_delete_{token}",
+            "ids: str",
+            f"Delete many {plural} in Twenty by ID.",
+            ids_doc,
+            f'twenty_batch.batch_delete(_get_twenty(), "{plural}", ids)',
+            f"Error deleting {plural}",
+            fanout,
+        ),
+    ]
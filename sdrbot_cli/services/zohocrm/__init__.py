@@ -20,7 +20,9 @@ def _extract_object_from_tool_name(tool_name: str) -> str | None:
         zohocrm_create_leads -> leads
         zohocrm_update_contacts -> contacts
     """
-    match = re.match(r"zohocrm_(?:create|update|search|get|delete)_(.+)", tool_name)
+    match = re.match(
+        r"zohocrm_(?:batch_)?(?:create|update|upsert|search|get|delete)_(.+)", tool_name
+    )
     return match.group(1).lower() if match else None
 
 
@@ -0,0 +1,122 @@
+"""Zoho CRM batch CRUD through the multi-record endpoints.
+
+Backs the generated ``zohocrm_batch_*`` tools. Zoho accepts up to 100 records
+per insert, update, upsert, read or delete request and reports a status for
+each record in the response.
+"""
+
+from typing import Any
+
+from sdrbot_cli.services.batch import (
+    BatchResult,
+    ChunkResult,
+    load_batch_records,
+    parse_ids,
+    resumable,
+    run_batches,
+    split_id,
+)
+
+# Zoho's maximum records per request
+BATCH_SIZE = 100
+
+
+def _collect(response: dict[str, Any], positions: list[int] | None = None) -> ChunkResult:
+    """Turn Zoho's per-record ``data`` statuses into a ChunkResult."""
+    chunk = ChunkResult()
+    for index, item in enumerate(response.get("data") or []):
+        position = positions[index] if positions else index
+        if item.get("status") == "success":
+            chunk.ids.append(str((item.get("details") or {}).get("id", "")))
+            chunk.positions.append(position)
+        else:
+            detail = item.get("details") or {}
+            field = detail.get("api_name")
+            message = item.get("message") or item.get("code") or "Unknown error"
+            chunk.errors.append((position, f"{message} ({field})" if field else message))
+    return chunk
+
+
+@resumable("zohocrm")
+def batch_create(zoho: Any, module_name: str, records: str | list) -> BatchResult:
+    """Insert records with ``POST /{module}``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        return _collect(zoho.post(f"/{module_name}", json={"data": chunk}))
+
+    return run_batches("create", module_name, rows, BATCH_SIZE, send)
+
+
+@resumable("zohocrm")
+def batch_update(zoho: Any, module_name: str, records: str | list) -> BatchResult:
+    """Update records by ID with ``PUT /{module}``."""
+    rows = load_batch_records(records)
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        result = ChunkResult()
+        payload, positions = [], []
+        for position, record in enumerate(chunk):
+            record_id, fields = split_id(record, ("id",))
+            if record_id is None:
+                result.errors.append((position, "missing 'id'"))
+                continue
+            payload.append({"id": record_id, **fields})
+            positions.append(position)
+        if payload:
+            sent = _collect(zoho.put(f"/{module_name}", json={"data": payload}), positions)
+            result.ids.extend(sent.ids)
+            result.positions.extend(sent.positions)
+            result.errors.extend(sent.errors)
+        return result
+
+    return run_batches("update", module_name, rows, BATCH_SIZE, send)
+
+
+@resumable("zohocrm")
+def batch_upsert(
+    zoho: Any, module_name: str, records: str | list, duplicate_check_fields: str
+) -> BatchResult:
+    """Insert or update records with ``POST /{module}/upsert``."""
+    rows = load_batch_records(records)
+    check_fields = [f.strip() for f in duplicate_check_fields.split(",") if f.strip()]
+
+    def send(chunk: list[dict[str, Any]]) -> ChunkResult:
+        payload: dict[str, Any] = {"data": chunk}
+        if check_fields:
+            payload["duplicate_check_fields"] = check_fields
+        return _collect(zoho.post(f"/{module_name}/upsert", json=payload))
+
+    return run_batches("upsert", module_name, rows, BATCH_SIZE, send)
+
+
+def batch_get(zoho: Any, module_name: str, ids: str | list, fields: list[str]) -> BatchResult:
+    """Fetch records by ID with ``GET /{module}?ids=...``."""
+    id_list = parse_ids(ids)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        response = zoho.get(
+            f"/{module_name}", params={"ids": ",".join(chunk), "fields": ",".join(fields)}
+        )
+        records = [
+            {k: v for k, v in r.items() if not k.startswith("$")}
+            for r in response.get("data") or []
+        ]
+        found = {str(r.get("id")) for r in records}
+        return ChunkResult(
+            records=records,
+            errors=[(i, f"{rid} not found") for i, rid in enumerate(chunk) if rid not in found],
+        )
+
+    return run_batches("get", module_name, id_list, BATCH_SIZE, send, service="zohocrm")
+
+
+@resumable("zohocrm")
+def batch_delete(zoho: Any, module_name: str, ids: str | list) -> BatchResult:
+    """Delete records by ID with ``DELETE /{module}?ids=...``."""
+    id_list = parse_ids(ids)
+
+    def send(chunk: list[str]) -> ChunkResult:
+        return _collect(zoho.delete(f"/{module_name}", params={"ids": ",".join(chunk)}))
+
+    return run_batches("delete", module_name, id_list, BATCH_SIZE, send)
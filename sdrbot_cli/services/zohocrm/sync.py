@@ -10,6 +10,7 @@ from typing import Any
 
 from sdrbot_cli.auth.zohocrm import get_zoho_client
 from sdrbot_cli.config import settings
+from sdrbot_cli.services.batch import generate_batch_tool
 from sdrbot_cli.services.registry import compute_schema_hash
 
 # Standard Zoho CRM modules - used as fallback if API discovery fails
@@ -242,12 +243,20 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         "To customize, edit tools.py instead (static tools).",
         '"""',
         "",
+        "import asyncio",
         "import json",
         "from typing import Optional",
         "",
         "from langchain_core.tools import tool",
         "",
+        "from sdrbot_cli import result_format",
         "from sdrbot_cli.auth.zohocrm import get_zoho_client",
+        "from sdrbot_cli.services import pagination",
+        "from sdrbot_cli.services.zohocrm import batch as zohocrm_batch",
+        "",
+        "",
+        "# Records per search request (API maximum)",
+        "SEARCH_PAGE_SIZE = 200",
         "",
         "",
         "# Shared client instance",
@@ -305,6 +314,9 @@ def _generate_tools_code(schema: dict[str, dict]) -> str:
         lines.extend(_generate_delete_tool(module_name, singular))
         lines.append("")
 
+        # Generate batch tools (100 records per request)
+        lines.extend(_generate_batch_tools(module_name, plural, create_fields, output_fields))
+
     return "\n".join(lines)
 
 
@@ -471,7 +483,7 @@ def _generate_create_tool(module_name: str, singular: str, fields: list[dict]) -
             "        if not data:",
             f'            return "Error: At least one field must be provided to create a {singular}."',
             "",
-            f'        response = zoho.post("/{module_name}", json={{"data": [data]}})',
+            f'        response = await zoho.apost("/{module_name}", json={{"data": [data]}})',
             '        result = response.get("data", [{}])[0]',
             '        record_id = result.get("details", {}).get("id", "unknown")',
             "",
@@ -483,7 +495,7 @@ def _generate_create_tool(module_name: str, singular: str, fields: list[dict]) -
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -530,7 +542,7 @@ def _generate_update_tool(module_name: str, singular: str, fields: list[dict]) -
 
     # Build function body
     body = [
-        "    zoho = _get_zoho()",
+        "    zoho = await asyncio.to_thread(_get_zoho)",
         "    try:",
         "        # Build data dict from non-None arguments",
         "        data = {}",
@@ -552,7 +564,7 @@ def _generate_update_tool(module_name: str, singular: str, fields: list[dict]) -
             "        if not data:",
             '            return "Error: At least one field must be provided to update."',
             "",
-            f'        response = zoho.put(f"/{module_name}/{{{func_name_part}_id}}", json={{"data": [data]}})',
+            f'        response = await zoho.aput(f"/{module_name}/{{{func_name_part}_id}}", json={{"data": [data]}})',
             "",
             f'        return f"Successfully updated {singular} {{{func_name_part}_id}}"',
             "    except Exception as e:",
@@ -562,7 +574,7 @@ def _generate_update_tool(module_name: str, singular: str, fields: list[dict]) -
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -591,7 +603,11 @@ def _generate_search_tool(
     for f in fields[:10]:  # Limit search parameters
         param_type = _python_type(f["data_type"])
         params.append(f"    {f['api_name']}: Optional[{param_type}] = None,")
-    params.append("    limit: int = 10,")
+    params.append("    max_records: int = 10,")
+    params.append("    fields: Optional[list[str]] = None,")
+
+    # Fields shown in results unless the agent asks for others
+    default_fields = [f["api_name"] for f in output_fields[:8]]
 
     params_str = "\n".join(params)
 
@@ -611,10 +627,16 @@ def _generate_search_tool(
         doc_lines.append(
             f"        {f['api_name']}: Filter by {f.get('field_label', f['api_name'])}."
         )
-    doc_lines.append("        limit: Maximum results to return (default 10).")
+    doc_lines.append(
+        "        max_records: Maximum results to return (default 10). Pages are fetched as"
+    )
+    doc_lines.append("            needed; large result sets are saved to a file.")
+    doc_lines.append(
+        f"        fields: Fields to include in the results (default: {', '.join(default_fields)})."
+    )
     doc_lines.append("")
     doc_lines.append("    Returns:")
-    doc_lines.append(f"        JSON array of {plural}. Each object contains:")
+    doc_lines.append(f"        CSV table of {plural} (one row per record) with columns:")
     doc_lines.append("        - id: Record identifier (use for get/update/delete)")
     # List top output fields (skip id since we already mentioned it)
     for f in output_fields[:5]:
@@ -625,8 +647,9 @@ def _generate_search_tool(
     doc_lines.append('    """')
 
     body = [
-        "    zoho = _get_zoho()",
+        "    zoho = await asyncio.to_thread(_get_zoho)",
         "    try:",
+        "        search_criteria = None",
         "        if criteria:",
         "            # Use provided COQL criteria",
         "            search_criteria = criteria",
@@ -642,31 +665,40 @@ def _generate_search_tool(
         "",
         "            if conditions:",
         '                search_criteria = " and ".join(conditions)',
-        "            else:",
-        "                # No criteria - get recent records",
-        f'                response = zoho.get(f"/{module_name}?per_page={{limit}}")',
-        '                records = response.get("data", [])',
-        "                if not records:",
-        f'                    return "No {plural} found."',
-        '                results = [{"id": r.get("id"), **{k: v for k, v in r.items() if not k.startswith("$")}} for r in records[:limit]]',
-        f'                return f"Found {{len(results)}} {plural}:\\n" + json.dumps(results, indent=2)',
         "",
-        "        # Search with criteria",
-        f'        response = zoho.get(f"/{module_name}/search?criteria={{search_criteria}}&per_page={{limit}}")',
-        '        records = response.get("data", [])',
+        "        # Without criteria, list recent records",
+        f'        endpoint = "/{module_name}/search" if search_criteria else "/{module_name}"',
+        "",
+        "        # Page numbers only line up if per_page stays the same on every request",
+        "        per_page = max(1, min(max_records, SEARCH_PAGE_SIZE))",
+        "",
+        "        async def fetch_page(cursor, page_size):",
+        '            params = {"per_page": per_page, **(cursor or {})}',
+        "            if search_criteria:",
+        '                params["criteria"] = search_criteria',
+        "            response = await zoho.aget(endpoint, params=params)",
+        '            info = response.get("info") or {}',
+        '            if not info.get("more_records"):',
+        '                return response.get("data", []), None',
+        "            # Listing past 2,000 records needs page_token; search pages by number",
+        '            if info.get("next_page_token"):',
+        '                return response.get("data", []), {"page_token": info["next_page_token"]}',
+        '            return response.get("data", []), {"page": info.get("page", 1) + 1}',
+        "",
+        "        records = await pagination.acollect(fetch_page, max_records, SEARCH_PAGE_SIZE)",
         "",
         "        if not records:",
-        f'            return "No {plural} found matching criteria."',
+        f'            return "No {plural} found matching criteria." if search_criteria else "No {plural} found."',
         "",
         '        results = [{"id": r.get("id"), **{k: v for k, v in r.items() if not k.startswith("$")}} for r in records]',
-        f'        return f"Found {{len(results)}} {plural}:\\n" + json.dumps(results, indent=2)',
+        f'        return result_format.format_records("zohocrm", "{plural}", results, fields=fields or {default_fields})',
         "    except Exception as e:",
         f'        return f"Error searching {plural}: {{str(e)}}"',
     ]
 
     return [
         "@tool",
-        f"def {func_name}(",
+        f"async def {func_name}(",
         params_str,
         ") -> str:",
         *doc_lines,
@@ -690,7 +722,7 @@ def _generate_get_tool(module_name: str, singular: str, output_fields: list[dict
 
     # Build returns docstring with field info
     returns_lines = [
-        f"        JSON object with {singular} data containing:",
+        f"        The {singular} as field: value lines, including:",
         "        - id: Record identifier",
     ]
     for f in output_fields[:5]:
@@ -703,7 +735,7 @@ def _generate_get_tool(module_name: str, singular: str, output_fields: list[dict
 
     return [
         "@tool",
-        f"def {func_name}({func_name_part}_id: str) -> str:",
+        f"async def {func_name}({func_name_part}_id: str) -> str:",
         f'    """Get a {singular} by ID from Zoho CRM.',
         "",
         "    Args:",
@@ -712,13 +744,13 @@ def _generate_get_tool(module_name: str, singular: str, output_fields: list[dict
         "    Returns:",
         *returns_lines,
         '    """',
-        "    zoho = _get_zoho()",
+        "    zoho = await asyncio.to_thread(_get_zoho)",
         "    try:",
-        f'        response = zoho.get(f"/{module_name}/{{{func_name_part}_id}}")',
+        f'        response = await zoho.aget(f"/{module_name}/{{{func_name_part}_id}}")',
         '        record = response.get("data", [{}])[0]',
         "        # Filter out internal fields",
         '        filtered = {k: v for k, v in record.items() if not k.startswith("$")}',
-        f'        return f"{singular} {{{func_name_part}_id}}:\\n" + json.dumps(filtered, indent=2)',
+        f'        return result_format.format_record(f"{singular} {{{func_name_part}_id}}", filtered)',
         "    except Exception as e:",
         f'        return f"Error getting {singular}: {{str(e)}}"',
     ]
@@ -739,7 +771,7 @@ def _generate_delete_tool(module_name: str, singular: str) -> list[str]:
 
     return [
         "@tool",
-        f"def {func_name}({func_name_part}_id: str) -> str:",
+        f"async def {func_name}({func_name_part}_id: str) -> str:",
         f'    """Delete a {singular} from Zoho CRM.',
         "",
         "    Args:",
@@ -748,10 +780,91 @@ def _generate_delete_tool(module_name: str, singular: str) -> list[str]:
         "    Returns:",
         "        Success message confirming deletion.",
         '    """',
-        "    zoho = _get_zoho()",
+        "    zoho = await asyncio.to_thread(_get_zoho)",
         "    try:",
-        f'        zoho.delete(f"/{module_name}/{{{func_name_part}_id}}")',
+        f'        await zoho.adelete(f"/{module_name}/{{{func_name_part}_id}}")',
         f'        return f"Successfully deleted {singular} {{{func_name_part}_id}}"',
         "    except Exception as e:",
         f'        return f"Error deleting {singular}: {{str(e)}}"',
     ]
+
+
+def _generate_batch_tools(
+    module_name: str, plural: str, fields: list[dict], output_fields: list[dict]
+) -> list[str]:
+    """Generate batch create/update/upsert/get/delete tools for a module.
+
+    The tools delegate to ``sdrbot_cli.services.zohocrm.batch``, which sends
+    up to 100 records per request.
+
+    Args:
+        module_name: Module API name.
+        plural: Plural label for the module.
+        fields: Writable field dicts (listed in the docstrings).
+        output_fields: Fields returned by the batch get tool.
+
+    Returns:
+        List of code lines.
+    """
+    func_name_part = _safe_func_name(module_name)
+    names = ", ".join(f["api_name"] for f in fields[:15]) or "any writable field"
+    read_names = [f["api_name"] for f in output_fields[:MAX_FIELDS_PER_TOOL]] or ["id"]
+    records_doc = [
+        "        records: JSON array of objects keyed by field API name, or a path to a",
+        f"            .csv/.json/.jsonl file. Fields: {names}",
+    ]
+    ids_doc = [f"        ids: JSON array or comma-separated {plural} IDs, or a file of IDs."]
+    note = "Sends up to 100 records per request."
+
+    return [
+        *generate_batch_tool(
+            f"zohocrm_batch_create_{func_name_part}",
+            "records: str",
+            f"Create many {plural} in Zoho CRM at once.",
+            records_doc,
+            f'zohocrm_batch.batch_create(_get_zoho(), "{module_name}", records)',
+            f"Error creating {plural}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"zohocrm_batch_update_{func_name_part}",
+            "records: str",
+            f"Update many existing {plural} in Zoho CRM at once.",
+            [*records_doc, "            Each record needs its Zoho 'id'."],
+            f'zohocrm_batch.batch_update(_get_zoho(), "{module_name}", records)',
+            f"Error updating {plural}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"zohocrm_batch_upsert_{func_name_part}",
+            'records: str, duplicate_check_fields: str = ""',
+            f"Insert or update many {plural} in Zoho CRM, matched on duplicate-check fields.",
+            [
+                *records_doc,
+                "        duplicate_check_fields: Comma-separated fields to match existing",
+                "            records on (defaults to the module's unique fields).",
+            ],
+            f'zohocrm_batch.batch_upsert(_get_zoho(), "{module_name}", records, '
+            "duplicate_check_fields)",
+            f"Error upserting {plural}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"zohocrm_batch_get_{func_name_part}",
+            "ids: str",
+            f"Get many {plural} from Zoho CRM by ID.",
+            ids_doc,
+            f'zohocrm_batch.batch_get(_get_zoho(), "{module_name}", ids, {read_names})',
+            f"Error getting {plural}",
+            note,
+        ),
+        *generate_batch_tool(
+            f"zohocrm_batch_delete_{func_name_part}",
+            "ids: str",
+            f"Delete many {plural} from Zoho CRM by ID.",
+            ids_doc,
+            f'zohocrm_batch.batch_delete(_get_zoho(), "{module_name}", ids)',
+            f"Error deleting {plural}",
+            note,
+        ),
+    ]
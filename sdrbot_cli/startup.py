@@ -0,0 +1,117 @@
+"""Background agent prebuild and startup profiling.
+
+The TUI takes input as soon as it mounts and builds the agent behind the
+splash. :func:`prebuild_agent_components` runs the slow parts at the same
+time: creating the model client, connecting MCP servers, opening the session
+store, and loading service tools (after the schema sync) along with their
+token counts. The ``create_agent_with_config`` call that follows then only
+assembles cached components (see :mod:`sdrbot_cli.agent_cache`).
+
+``sdrbot --profile-startup`` reports the timings kept in :class:`StartupProfile`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+# main.py imports this module first, so this is close to process start
+PROCESS_START = time.perf_counter()
+
+T = TypeVar("T")
+
+
+@dataclass
+class StartupProfile:
+    """Startup milestones (since process start) and prebuild phase durations."""
+
+    marks: dict[str, float] = field(default_factory=dict)
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def mark(self, event: str) -> None:
+        """Record the first time ``event`` happens."""
+        self.marks.setdefault(event, time.perf_counter() - PROCESS_START)
+
+    async def timed(self, phase: str, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable``, recording how long it took as ``phase``."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.phases[phase] = time.perf_counter() - start
+
+    def report(self) -> str:
+        """Human-readable summary of the timings."""
+        lines = ["Startup profile (ms since process start):"]
+        lines.extend(f"  {event:<28}{at * 1000:>8.0f}" for event, at in self.marks.items())
+        if self.phases:
+            lines.append("Agent build phases (ms, prebuild phases run concurrently):")
+            lines.extend(
+                f"  {phase:<28}{seconds * 1000:>8.0f}" for phase, seconds in self.phases.items()
+            )
+        return "\n".join(lines)
+
+
+_profile: StartupProfile | None = None
+
+
+def get_startup_profile() -> StartupProfile:
+    """Get the profile for this process."""
+    global _profile
+    if _profile is None:
+        _profile = StartupProfile()
+    return _profile
+
+
+@dataclass
+class PrebuiltComponents:
+    """What the agent build needs beyond the cached components."""
+
+    model: Any
+    checkpointer: Any
+    failed_mcp_servers: list[str]
+
+
+async def prebuild_agent_components() -> PrebuiltComponents:
+    """Prepare the model, MCP servers, session store and service tools concurrently.
+
+    Returns:
+        The model and checkpointer to build the agent with, and the MCP
+        servers that failed to connect.
+    """
+    from sdrbot_cli.agent_cache import get_agent_cache, model_stamp
+    from sdrbot_cli.config import create_model
+    from sdrbot_cli.mcp.manager import initialize_mcp
+    from sdrbot_cli.services import get_enabled_tools, sync_enabled_services_if_needed
+    from sdrbot_cli.token_counting import count_tool_tokens
+
+    profile = get_startup_profile()
+
+    def create_cached_model():
+        return get_agent_cache().get("model", model_stamp(), create_model)
+
+    def load_service_tools() -> None:
+        # Sync first: it may regenerate the tool files that get loaded
+        sync_enabled_services_if_needed()
+        count_tool_tokens(None, get_enabled_tools())
+
+    async def open_checkpointer():
+        try:
+            from sdrbot_cli.sessions import get_checkpointer
+
+            return await get_checkpointer()
+        except Exception:
+            return None  # Fall back to InMemorySaver inside create_agent_with_config
+
+    model, (_, failed_mcp_servers), checkpointer, _ = await asyncio.gather(
+        profile.timed("model client", asyncio.to_thread(create_cached_model)),
+        profile.timed("MCP servers", initialize_mcp()),
+        profile.timed("session store", open_checkpointer()),
+        profile.timed("service tools + tokens", asyncio.to_thread(load_service_tools)),
+    )
+    return PrebuiltComponents(
+        model=model, checkpointer=checkpointer, failed_mcp_servers=failed_mcp_servers
+    )
@@ -0,0 +1,206 @@
+"""Incremental markdown rendering for streamed replies.
+
+Re-rendering a whole reply on every token costs time quadratic in its
+length. :class:`MarkdownStream` instead splits the text into top-level
+blocks - paragraphs, headings, list items, code fences - as they complete.
+Each completed block is rendered once and written to the chat log; only the
+trailing open block is re-rendered, at most once per frame, as a preview.
+
+Blocks are rendered separately, so :class:`MarkdownBlock` restores the
+spacing Rich would put between them had the reply been rendered whole.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.markdown import Markdown
+from rich.segment import Segment
+
+# Seconds between re-renders of the open block (30 frames per second)
+FRAME_INTERVAL = 1 / 30
+
+# Top-level block openers; indented ones belong to the block above
+_FENCE = re.compile(r"^(`{3,}|~{3,})")
+_HEADING = re.compile(r"^#{1,6}(?:\s|$)")
+_LIST_ITEM = re.compile(r"^(?:([-*+])|(\d{1,9})([.)]))(?:\s|$)")
+
+
+class MarkdownBlock:
+    """One top-level block of a reply, spaced as if rendered with the rest of it."""
+
+    def __init__(
+        self,
+        markdown: RenderableType,
+        *,
+        first: bool = False,
+        fence: bool = False,
+        continues_list: bool = False,
+    ) -> None:
+        """Initialize the block.
+
+        Args:
+            markdown: The block's rendered markdown
+            first: Whether it's the first block of the reply (no spacing above)
+            fence: Whether it's a code fence
+            continues_list: Whether it's a list item continuing the list above
+        """
+        self.markdown = markdown
+        self.first = first
+        self.fence = fence
+        self.continues_list = continues_list
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        lines = console.render_lines(self.markdown, options, pad=False)
+        # Rich opens lists, quotes and tables with the blank line that separates blocks
+        separated = bool(lines) and not self.fence and not _plain(lines[0]).strip()
+        if self.continues_list and separated:
+            lines = lines[1:]
+        elif not (self.first or separated):
+            yield Segment.line()
+        for line in lines:
+            yield from line
+            yield Segment.line()
+
+
+class MarkdownStream:
+    """Splits streamed markdown into completed blocks and an open tail."""
+
+    def __init__(self, markdown: Callable[[str], RenderableType] = Markdown) -> None:
+        """Initialize the stream.
+
+        Args:
+            markdown: Makes a renderable from markdown source
+        """
+        self._markdown = markdown
+        self._text = ""
+        # Complete lines of the open block, and the state they leave it in
+        self._lines: list[str] = []
+        self._fence: str | None = None
+        self._wrote_any = False
+        # List marker of the last written block
+        self._list: str | None = None
+        self._tail_dirty = False
+        self._tail_at = 0.0
+        # Whether a preview of the open block is showing
+        self.previewing = False
+
+    def feed(self, text: str) -> list[MarkdownBlock]:
+        """Add streamed text.
+
+        Args:
+            text: The next chunk of the reply
+
+        Returns:
+            Blocks the chunk completed, in order
+        """
+        self._text += text
+        self._tail_dirty = True
+        *complete, self._text = self._text.split("\n")
+        return self._add_lines(complete)
+
+    def tail(self, *, force: bool = False) -> RenderableType | None:
+        """Preview of the open block, when it changed and a frame has passed.
+
+        Args:
+            force: Skip the frame rate limit
+
+        Returns:
+            The block to show below the completed ones, or None to keep the last preview
+        """
+        now = time.monotonic()
+        if not self._tail_dirty or (not force and now - self._tail_at < FRAME_INTERVAL):
+            return None
+        self._tail_dirty = False
+        self._tail_at = now
+        source = "\n".join([*self._lines, self._text]).strip("\n")
+        if not source.strip():
+            return None
+        self.previewing = True
+        return self._block(source)
+
+    def finish(self) -> list[MarkdownBlock]:
+        """Close the reply and return its remaining blocks."""
+        blocks = self._add_lines([self._text]) if self._text else []
+        self._text = ""
+        self._tail_dirty = False
+        return blocks + self._close_block()
+
+    def _add_lines(self, lines: list[str]) -> list[MarkdownBlock]:
+        blocks = []
+        for line in lines:
+            if self._starts_block(line):
+                blocks.extend(self._close_block())
+            self._lines.append(line)
+            if self._ends_block(line):
+                blocks.extend(self._close_block())
+        return blocks
+
+    def _starts_block(self, line: str) -> bool:
+        """Whether ``line`` opens a new block rather than continuing the open one."""
+        if self._fence is not None or not self._lines:
+            return False
+        previous = self._lines[-1]
+        if not previous.strip():
+            return bool(line.strip()) and not line[0].isspace()
+        if _FENCE.match(line) or _HEADING.match(line):
+            return True
+        item = _LIST_ITEM.match(line)
+        if item is None:
+            return False
+        # A list item interrupts a paragraph, but "2." there is just text
+        in_list = _LIST_ITEM.match(self._lines[0]) is not None
+        return in_list or item.group(2) in (None, "1")
+
+    def _ends_block(self, line: str) -> bool:
+        """Whether ``line`` completes the open block, tracking code fences."""
+        fence = _FENCE.match(line)
+        if self._fence is not None:
+            closes = (
+                fence is not None
+                and fence.group(1)[0] == self._fence[0]
+                and len(fence.group(1)) >= len(self._fence)
+                and not line[fence.end() :].strip()
+            )
+            if closes:
+                self._fence = None
+            return closes
+        if fence is not None:
+            self._fence = fence.group(1)
+            return False
+        return _HEADING.match(line) is not None
+
+    def _close_block(self) -> list[MarkdownBlock]:
+        lines, self._lines = self._lines, []
+        self._fence = None
+        source = "\n".join(lines).strip("\n")
+        if not source.strip():
+            return []
+        block = self._block(source)
+        self._wrote_any = True
+        self._list = _list_kind(source)
+        return [block]
+
+    def _block(self, source: str) -> MarkdownBlock:
+        kind = _list_kind(source)
+        return MarkdownBlock(
+            self._markdown(source),
+            first=not self._wrote_any,
+            fence=_FENCE.match(source) is not None,
+            continues_list=kind is not None and kind == self._list,
+        )
+
+
+def _plain(line: list[Segment]) -> str:
+    return "".join(segment.text for segment in line)
+
+
+def _list_kind(source: str) -> str | None:
+    """The marker of the list ``source`` starts, or None; another marker starts a new list."""
+    item = _LIST_ITEM.match(source)
+    if item is None:
+        return None
+    return item.group(1) or item.group(3)
@@ -6,19 +6,36 @@ middleware threshold calculations.
 """
 
 import json
+from functools import cache
 
-import tiktoken
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage, SystemMessage
 from langchain_core.tools import BaseTool
 
-# Use cl100k_base encoding (used by GPT-4, Claude, etc.)
-_ENCODING = tiktoken.get_encoding("cl100k_base")
+from sdrbot_cli.lazy import lazy_import
+
+tiktoken = lazy_import("tiktoken")
+
+
+@cache
+def _encoding():
+    """The cl100k_base encoding (used by GPT-4, Claude, etc.), loaded on first use.
+
+    Returns None if it can't be loaded (tiktoken downloads it on first use, so
+    this fails offline); the failure is cached rather than retried per call.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
 
 
 def count_tokens(text: str) -> int:
-    """Count tokens in a string using tiktoken."""
-    return len(_ENCODING.encode(text))
+    """Count tokens in a string using tiktoken (or a rough estimate without it)."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
 
 
 def count_message_tokens(model: BaseChatModel, messages: list[BaseMessage]) -> int:
@@ -44,11 +61,47 @@ def count_message_tokens(model: BaseChatModel, messages: list[BaseMessage]) -> i
         return total
 
 
+# Token count per tool object, with the tool kept alive so its id isn't reused
+_tool_token_counts: dict[int, tuple[object, int]] = {}
+_MAX_CACHED_TOOLS = 4096
+
+
+def _count_one_tool(tool) -> int:
+    """Count tokens in a single tool definition."""
+    try:
+        # Handle BaseTool instances
+        if hasattr(tool, "get_input_schema"):
+            schema = tool.get_input_schema().schema()
+            tool_def = json.dumps(
+                {
+                    "name": tool.name,
+                    "description": tool.description or "",
+                    "parameters": schema,
+                },
+                separators=(",", ":"),
+            )
+            return count_tokens(tool_def)
+        # Handle raw functions (decorated with @tool or similar)
+        if callable(tool):
+            # Get function name and docstring
+            name = getattr(tool, "__name__", "unknown")
+            doc = getattr(tool, "__doc__", "") or ""
+            # Count tokens using tiktoken + schema overhead
+            tool_text = f"{name}: {doc}"
+            return count_tokens(tool_text) + 50  # +50 for schema overhead
+        # Unknown type, use fallback
+        return 100
+    except Exception:
+        # Fallback estimate if anything fails
+        return 100
+
+
 def count_tool_tokens(model: BaseChatModel, tools: list) -> int:
     """Count tokens in tool definitions.
 
     Serializes each tool to its JSON schema representation and counts tokens.
-    This approximates how the API receives tool definitions.
+    This approximates how the API receives tool definitions. Counts are
+    remembered per tool object, so an agent reload only counts new tools.
 
     Args:
         model: LangChain model instance with get_num_tokens support
@@ -60,36 +113,16 @@ def count_tool_tokens(model: BaseChatModel, tools: list) -> int:
     if not tools:
         return 0
 
-    total = 0
+    if len(_tool_token_counts) > _MAX_CACHED_TOOLS:
+        _tool_token_counts.clear()
 
+    total = 0
     for tool in tools:
-        try:
-            # Handle BaseTool instances
-            if hasattr(tool, "get_input_schema"):
-                schema = tool.get_input_schema().schema()
-                tool_def = json.dumps(
-                    {
-                        "name": tool.name,
-                        "description": tool.description or "",
-                        "parameters": schema,
-                    },
-                    separators=(",", ":"),
-                )
-                total += count_tokens(tool_def)
-            # Handle raw functions (decorated with @tool or similar)
-            elif callable(tool):
-                # Get function name and docstring
-                name = getattr(tool, "__name__", "unknown")
-                doc = getattr(tool, "__doc__", "") or ""
-                # Count tokens using tiktoken + schema overhead
-                tool_text = f"{name}: {doc}"
-                total += count_tokens(tool_text) + 50  # +50 for schema overhead
-            else:
-                # Unknown type, use fallback
-                total += 100
-        except Exception:
-            # Fallback estimate if anything fails
-            total += 100
+        cached = _tool_token_counts.get(id(tool))
+        if cached is None:
+            cached = (tool, _count_one_tool(tool))
+            _tool_token_counts[id(tool)] = cached
+        total += cached[1]
 
     return total
 
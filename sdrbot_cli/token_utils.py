@@ -50,9 +50,17 @@ def calculate_baseline_tokens(
 
     # Use unified counting (includes tools)
     try:
+        from sdrbot_cli.agent_cache import get_agent_cache
         from sdrbot_cli.token_counting import count_system_prompt_tokens, count_tool_tokens
 
-        system_tokens = count_system_prompt_tokens(model, full_system_prompt)
+        # Some providers count tokens with an API call; only recount on change
+        model_name = getattr(model, "model_name", None) or getattr(model, "model", None)
+        system_tokens = get_agent_cache().get(
+            "system_prompt_tokens",
+            (type(model).__qualname__, model_name, full_system_prompt),
+            lambda: count_system_prompt_tokens(model, full_system_prompt),
+            variants=4,
+        )
         tool_tokens = count_tool_tokens(model, tools)
         return system_tokens + tool_tokens
     except Exception:
@@ -0,0 +1,338 @@
+"""Middleware that reuses results of read-only tool calls.
+
+Agents often repeat the same read-only call within a session: listing
+pipelines or owners, describing an object, counting records, searching an
+MCP server. ``ToolResultCacheMiddleware`` answers a repeat from memory
+while the first result is younger than the tool's TTL.
+
+A tool opts in through its ``metadata``: ``cache_ttl`` (seconds) or
+``read_only`` (the default TTL). MCP tools declaring ``readOnlyHint`` get
+``read_only``. Built-in service tools are matched against ``CACHEABLE_TOOLS``.
+
+Each entry is tagged with its service (the tool name's prefix, or the MCP
+server) and the object type it concerns, taken from arguments such as
+``object_type``. Any other call to a service counts as a write, unless the
+tool's name says it reads (MCP tools: unless it's read-only). A write drops
+the service's entries for the same object type and those without one, or
+all of them when its object type is unknown. Error results are never cached.
+
+Hit rates are kept in :func:`get_tool_cache_stats` (shown in the TUI status bar).
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware, AgentState, ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
+
+# Seconds a result of a tool with ``read_only`` metadata is reused
+DEFAULT_TTL = 300.0
+
+# Built-in read-only tools worth caching (fnmatch patterns) and their TTL in seconds
+CACHEABLE_TOOLS: dict[str, float] = {
+    # Schema and workspace metadata
+    "*_admin_list_*": 600.0,
+    "*_admin_get_*": 600.0,
+    "*_list_pipelines": 600.0,
+    "*_list_users": 600.0,
+    "*_list_labels": 600.0,
+    "pipedrive_get_lead_labels": 600.0,
+    "*_list_tables": 600.0,
+    "*_describe_table": 600.0,
+    "mongodb_list_collections": 600.0,
+    "*_list_folders": 300.0,
+    # Records change under us (other users, workflows), so keep these short
+    "*_count_records": 60.0,
+}
+
+MAX_ENTRIES = 512
+
+# Arguments naming the object type a call concerns
+OBJECT_ARGS = (
+    "object_type",
+    "object_name",
+    "object_slug",
+    "object_id",
+    "module_api_name",
+    "module",
+    "table_name",
+    "collection",
+)
+
+# Tools named like this only read, so they never invalidate anything
+_READ_TOOL = re.compile(
+    r"_(?:get|list|search|count|describe|find|lookup|read|fetch|view|preview|check)(?:_|$)"
+)
+# Generated CRM write tools name their object: hubspot_create_contact, ...
+_WRITE_OBJECT = re.compile(r"^[a-z]+_(?:batch_|bulk_)?[a-z]+_([a-z0-9]+)$")
+
+
+@dataclass
+class ToolCacheStats:
+    """Session counters for the tool result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    by_tool: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def record(self, tool_name: str, hit: bool) -> None:
+        """Record a lookup of a cacheable tool."""
+        counters = self.by_tool.setdefault(tool_name, {"hits": 0, "misses": 0})
+        if hit:
+            self.hits += 1
+            counters["hits"] += 1
+        else:
+            self.misses += 1
+            counters["misses"] += 1
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    content: Any
+    service: str
+    object_type: str | None
+    expires_at: float
+
+
+def _singular(name: str) -> str:
+    name = name.strip().lower()
+    if name == "people":
+        return "person"
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    if name.endswith("s") and not name.endswith("ss"):
+        return name[:-1]
+    return name
+
+
+class ToolResultCache:
+    """Results of cacheable tool calls, by tool name and arguments."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.stats = ToolCacheStats()
+
+    def get(self, key: tuple[str, str]) -> Any | None:
+        """Return the cached content for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and entry.expires_at > time.monotonic()
+            if entry is not None and not hit:
+                del self._entries[key]
+            if hit:
+                self._entries.move_to_end(key)
+            self.stats.record(key[0], hit)
+            return entry.content if hit else None
+
+    def put(
+        self, key: tuple[str, str], content: Any, service: str, object_type: str | None, ttl: float
+    ) -> None:
+        """Store a result for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[key] = _Entry(content, service, object_type, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, service: str, object_type: str | None = None) -> int:
+        """
+        Drop a service's results after a write.
+
+        Args:
+            service: The written service (tool prefix or ``mcp_<server>``)
+            object_type: The written object type; None drops all the service's results
+
+        Returns:
+            Number of results dropped
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.service == service
+                and (
+                    object_type is None
+                    or entry.object_type is None
+                    or entry.object_type == object_type
+                )
+            ]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self.stats.invalidations += 1
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = ToolCacheStats()
+
+
+_cache: ToolResultCache | None = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get the process-wide tool result cache (shared with subagents)."""
+    global _cache
+    if _cache is None:
+        _cache = ToolResultCache()
+    return _cache
+
+
+def reset_tool_result_cache() -> None:
+    """Forget all cached results and counters."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def get_tool_cache_stats() -> ToolCacheStats:
+    """Get this session's tool cache counters."""
+    return get_tool_result_cache().stats
+
+
+def cache_ttl(tool_name: str, tool: Any = None) -> float | None:
+    """Seconds a tool's results may be reused, or None if it doesn't opt in."""
+    metadata = getattr(tool, "metadata", None) or {}
+    if metadata.get("cache_ttl") is not None:
+        return float(metadata["cache_ttl"])
+    if metadata.get("read_only"):
+        return DEFAULT_TTL
+    if getattr(tool, "server_name", None) is not None:
+        return None  # MCP tools opt in through their annotations only
+    for pattern, ttl in CACHEABLE_TOOLS.items():
+        if fnmatch.fnmatchcase(tool_name, pattern):
+            return ttl
+    return None
+
+
+def _service(tool_name: str, tool: Any) -> str:
+    server = getattr(tool, "server_name", None)
+    if server is not None:
+        return f"mcp_{server}"
+    return tool_name.split("_", 1)[0]
+
+
+def _object_type(tool_name: str, args: dict[str, Any], *, write: bool) -> str | None:
+    for arg in OBJECT_ARGS:
+        value = args.get(arg)
+        if isinstance(value, str) and value:
+            return _singular(value)
+    if write:
+        match = _WRITE_OBJECT.match(tool_name)
+        if match:
+            return _singular(match.group(1))
+    return None
+
+
+def _cacheable_result(result: ToolMessage | Command) -> bool:
+    if not isinstance(result, ToolMessage) or result.status == "error":
+        return False
+    content = result.content
+    return not (isinstance(content, str) and content.startswith("Error"))
+
+
+class ToolResultCacheMiddleware(AgentMiddleware[AgentState, Any]):
+    """Answer repeated read-only tool calls from a TTL cache; drop it on writes."""
+
+    def __init__(self, *, cache: ToolResultCache | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            cache: Where results are kept. Defaults to the process-wide cache,
+                shared by the main agent and its subagents.
+        """
+        super().__init__()
+        self._cache = cache
+
+    @property
+    def cache(self) -> ToolResultCache:
+        return self._cache if self._cache is not None else get_tool_result_cache()
+
+    def _lookup(self, request: ToolCallRequest) -> tuple[tuple[str, str], float] | ToolMessage:
+        """The cache key and TTL of a cacheable call, or its cached result."""
+        call = request.tool_call
+        ttl = cache_ttl(call["name"], request.tool)
+        key = (call["name"], json.dumps(call.get("args") or {}, sort_keys=True, default=str))
+        if ttl is not None:
+            content = self.cache.get(key)
+            if content is not None:
+                return ToolMessage(content=content, tool_call_id=call["id"], name=call["name"])
+        return key, ttl
+
+    def _after(
+        self,
+        request: ToolCallRequest,
+        key: tuple[str, str],
+        ttl: float | None,
+        result: ToolMessage | Command,
+    ) -> None:
+        """Cache a read's result, or invalidate what a write may have changed."""
+        name = request.tool_call["name"]
+        args = request.tool_call.get("args") or {}
+        service = _service(name, request.tool)
+
+        if ttl is not None:
+            if ttl > 0 and _cacheable_result(result):
+                object_type = _object_type(name, args, write=False)
+                self.cache.put(key, result.content, service, object_type, ttl)
+            return
+
+        if getattr(request.tool, "server_name", None) is None and _READ_TOOL.search(name):
+            return
+        self.cache.invalidate(service, _object_type(name, args, write=True))
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        """Return a cached result, or run the tool and cache or invalidate."""
+        lookup = self._lookup(request)
+        if isinstance(lookup, ToolMessage):
+            return lookup
+        result = handler(request)
+        self._after(request, *lookup, result)
+        return result
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        """Async version of :meth:`wrap_tool_call`."""
+        lookup = self._lookup(request)
+        if isinstance(lookup, ToolMessage):
+            return lookup
+        result = await handler(request)
+        self._after(request, *lookup, result)
+        return result
+
+
+__all__ = [
+    "ToolResultCacheMiddleware",
+    "get_tool_cache_stats",
+    "get_tool_result_cache",
+    "reset_tool_result_cache",
+]
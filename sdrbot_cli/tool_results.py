@@ -0,0 +1,158 @@
+"""Middleware that moves large tool results out of the conversation.
+
+CRM searches, SQL queries and MCP calls can return tens of thousands of
+tokens. Kept in the message history, they crowd the context window, force
+more frequent summarization, and slow down every later model call.
+
+``ToolResultOffloadMiddleware`` intercepts tool results above a token
+budget, writes the full text to ``/tmp/tool_results/<tool_call_id>`` through
+the agent's backend, and puts a short stand-in in its place: the size, a
+sketch of the data's shape (JSON keys or table columns), a preview, and the
+path. The agent can then ``grep`` or ``read_file`` (with offset/limit) just
+the slices it needs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from deepagents.backends.protocol import BackendProtocol
+from langchain.agents.middleware.types import AgentMiddleware, AgentState, ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
+
+OFFLOAD_DIR = "/tmp/tool_results"
+
+# Results above this many (estimated) tokens are offloaded
+DEFAULT_TOKEN_BUDGET = 4_000
+CHARS_PER_TOKEN = 4
+
+PREVIEW_LINES = 10
+PREVIEW_CHARS = 1_500
+
+# Reading an offloaded file back must not offload it again
+EXCLUDED_TOOLS = {"read_file", "grep", "glob", "ls", "write_file", "edit_file"}
+
+
+def _text(content: Any) -> str | None:
+    """Plain text of a ToolMessage's content, or None for non-text content."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list) and all(
+        isinstance(block, str) or (isinstance(block, dict) and block.get("type") == "text")
+        for block in content
+    ):
+        return "\n".join(b if isinstance(b, str) else b.get("text", "") for b in content)
+    return None
+
+
+def _json_shape(value: Any, depth: int = 0) -> str:
+    if isinstance(value, dict):
+        if depth >= 2:
+            return "{...}"
+        fields = ", ".join(f"{k}: {_json_shape(v, depth + 1)}" for k, v in list(value.items())[:15])
+        more = ", ..." if len(value) > 15 else ""
+        return "{" + fields + more + "}"
+    if isinstance(value, list):
+        inner = _json_shape(value[0], depth + 1) if value else ""
+        return f"[{inner}] ({len(value)} items)"
+    return type(value).__name__
+
+
+def describe(text: str) -> str:
+    """Sketch the shape of a tool result so the agent knows what to look for."""
+    lines = text.splitlines()
+    body = text.strip()
+
+    # JSON, possibly after a "Found N records:" style heading
+    start = min((i for i in (body.find("["), body.find("{")) if i >= 0), default=-1)
+    if start >= 0:
+        try:
+            return f"JSON: {_json_shape(json.loads(body[start:]))}"
+        except ValueError:
+            pass
+
+    # CSV-style tables (see result_format.encode_table)
+    for index, line in enumerate(lines[:3]):
+        columns = line.count(",")
+        following = lines[index + 1 : index + 2]
+        if columns and following and following[0].count(",") >= columns:
+            rows = len(lines) - index - 1
+            return f"Table: {rows:,} rows, columns: {line}"
+
+    return f"Text: {len(lines):,} lines"
+
+
+class ToolResultOffloadMiddleware(AgentMiddleware[AgentState, Any]):
+    """Write oversized tool results to the virtual filesystem and return a handle."""
+
+    def __init__(
+        self,
+        *,
+        backend: BackendProtocol,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        excluded_tools: set[str] | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            backend: Backend the agent's file tools read from (``/tmp`` is
+                routed to a virtual filesystem in local mode).
+            token_budget: Largest result, in estimated tokens, kept in context.
+            excluded_tools: Tools whose results are never offloaded.
+                Defaults to the file tools used to read offloaded results.
+        """
+        super().__init__()
+        self._backend = backend
+        self._max_chars = token_budget * CHARS_PER_TOKEN
+        self._excluded = EXCLUDED_TOOLS if excluded_tools is None else excluded_tools
+
+    def _offload(
+        self, request: ToolCallRequest, result: ToolMessage | Command
+    ) -> ToolMessage | Command:
+        if not isinstance(result, ToolMessage) or request.tool_call["name"] in self._excluded:
+            return result
+        text = _text(result.content)
+        if text is None or len(text) <= self._max_chars:
+            return result
+
+        tool_call_id = result.tool_call_id or request.tool_call.get("id") or "result"
+        path = f"{OFFLOAD_DIR}/{re.sub(r'[^A-Za-z0-9_-]', '_', tool_call_id)}"
+        written = self._backend.write(path, text)
+        if getattr(written, "error", None):
+            # Keep the full result rather than lose it
+            return result
+
+        preview = "\n".join(text.splitlines()[:PREVIEW_LINES])[:PREVIEW_CHARS]
+        summary = (
+            f"Result too large for context (~{len(text) // CHARS_PER_TOKEN:,} tokens, "
+            f"{len(text):,} chars); full output saved to {path}\n"
+            f"{describe(text)}\n"
+            f"Preview:\n{preview}\n...\n"
+            f"Use grep or read_file with offset/limit on {path} to read the parts you need."
+        )
+        return result.model_copy(update={"content": summary})
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        """Run the tool and offload its result if it is over budget."""
+        return self._offload(request, handler(request))
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        """Async version of :meth:`wrap_tool_call`."""
+        result = await handler(request)
+        return await asyncio.to_thread(self._offload, request, result)
+
+
+__all__ = ["ToolResultOffloadMiddleware"]
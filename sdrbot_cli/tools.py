@@ -6,7 +6,10 @@ from typing import Any
 import requests
 from langchain_core.tools import BaseTool
 from langchain_core.tools import tool as langchain_tool
-from markdownify import markdownify
+
+from sdrbot_cli.lazy import lazy_import
+
+markdownify = lazy_import("markdownify")
 
 # Tool scope levels (hierarchy: standard < extended < privileged)
 SCOPE_STANDARD = "standard"
@@ -268,6 +271,217 @@ def sync_crm_schema(service_name: str | None = None) -> str:
     return f"Synced {len(enabled_syncable)} service(s):\n" + "\n".join(results)
 
 
+def enrich_waterfall(
+    input_file: str,
+    order: str = "cost",
+    required_fields: str = "email,verified_email,phone,title",
+    max_concurrency: int = 4,
+) -> str:
+    """Enrich a lead list through several providers, filling gaps in order.
+
+    Each lead is sent to the next provider only while it is still missing a
+    required field, so credits are spent only on the gaps. Only enabled
+    providers (apollo, hunter, lusha) are used. Results are cached, so
+    re-running the same file does not bill the same lookups twice.
+
+    Args:
+        input_file: CSV, JSON or JSONL file of leads (absolute, or relative to ./files/).
+            Recognizes columns like email, first_name, last_name, company, domain, linkedin.
+        order: "cost" (cheapest first), "precision" (Apollo + Lusha first), "speed"
+            (all in parallel), or a custom order such as "apollo+lusha, hunter, verify"
+            ("," separates stages, "+" runs providers in parallel).
+        required_fields: Comma-separated fields a lead needs to be complete
+            (e.g. "email,verified_email,phone,title").
+        max_concurrency: Maximum in-flight requests per provider (1-16).
+
+    Returns:
+        Summary with fill rates and provider usage, plus the output CSV path.
+    """
+    from sdrbot_cli.enrichment.waterfall import run_waterfall_enrichment
+
+    return run_waterfall_enrichment(
+        input_file, order, required_fields, max_concurrency=max_concurrency
+    )
+
+
+def dedupe_records(
+    source: str,
+    against: str | None = None,
+    kind: str = "auto",
+    threshold: float = 0.85,
+) -> str:
+    """Find duplicate people or companies, or match one list against another.
+
+    Emails, domains, phone numbers and names are normalized (case, accents,
+    "+tags", "Inc."/"GmbH", phone formats) before comparing, and fuzzy name
+    matches are scored. Handles hundreds of thousands of records. Use it
+    instead of writing comparison scripts.
+
+    Args:
+        source: CSV/JSON/JSONL file (absolute, or relative to ./files/), or a
+            local CRM mirror table such as "hubspot_contacts" (see crm_mirror_sync).
+        against: Optional second file or mirror table. When given, each source
+            record is matched to its best counterpart there (e.g. to find which
+            records already exist in the target CRM before a migration or import)
+            instead of deduplicating the source.
+        kind: "person", "company", or "auto" to detect from the columns.
+        threshold: Minimum similarity (0-1) for fuzzy matches. Lower finds more
+            duplicates but more false positives.
+
+    Returns:
+        Summary with the merge plan (or match) file paths, or error message.
+    """
+    from sdrbot_cli.dedupe import run_dedupe
+
+    return run_dedupe(source, against, kind, threshold)
+
+
+def crm_mirror_sync(service: str, objects: str | None = None, full: bool = False) -> str:
+    """Copy CRM records into the local mirror, or bring it up to date.
+
+    The first sync of an object downloads every record; later syncs only fetch
+    records changed since the last one. Query the mirror with crm_mirror_query.
+
+    Salesforce, Zoho and Pipedrive syncs also remove records deleted in the
+    CRM. HubSpot and Twenty don't report deletions, so deleted records stay in
+    the mirror until the next full sync (automatic every 7 days, or pass
+    full=True). Salesforce mirrors not synced for 29 days are re-read in full.
+
+    Args:
+        service: CRM to mirror ("hubspot", "salesforce", "twenty", "zohocrm",
+            "pipedrive" or "attio").
+        objects: Comma-separated objects to sync, e.g. "contacts,companies" or
+            "Account,Contact". Defaults to the CRM's main objects.
+        full: Re-download everything (also removes records deleted in the CRM).
+
+    Returns:
+        One summary line per object, or error message.
+    """
+    from sdrbot_cli.services.mirror import get_source, sync_object
+
+    try:
+        source = get_source(service)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    names = [o.strip() for o in objects.split(",") if o.strip()] if objects else None
+    lines = []
+    for name in names or source.DEFAULT_OBJECTS:
+        try:
+            lines.append(sync_object(service, name, full=full).summary())
+        except Exception as e:
+            lines.append(f"Error syncing {service} {name}: {e!s}")
+    return "\n".join(lines)
+
+
+def crm_mirror_query(sql: str, max_age_minutes: int = 60) -> str:
+    """Run a read-only SQL query against the local CRM mirror.
+
+    Each mirrored object is a table named <service>_<object> (e.g.
+    hubspot_companies, salesforce_account) with an id column, a modified_at
+    column and one column per field (nested fields as "parent.child"). Use it
+    for lookups, duplicate checks and aggregates (GROUP BY, COUNT, joins)
+    without API calls. Tables the query uses are delta-synced first if they
+    are older than max_age_minutes or a CRM write has happened since.
+
+    Args:
+        sql: A SELECT (or WITH ... SELECT) statement in SQLite syntax.
+        max_age_minutes: Oldest mirror data acceptable for this query
+            (0 always syncs first).
+
+    Returns:
+        CSV table of result rows, or error message listing the mirrored tables.
+    """
+    import sqlite3
+
+    from sdrbot_cli.result_format import format_records
+    from sdrbot_cli.services.mirror import (
+        ensure_fresh,
+        get_mirror,
+        mirror_tables,
+        referenced_objects,
+    )
+
+    mirror = get_mirror()
+    states = mirror.states()
+    if not sql.lstrip().lower().startswith(("select", "with")):
+        return f"Error: Only SELECT queries are allowed.\n{mirror_tables(states)}"
+
+    notes = []
+    for state in referenced_objects(sql, states):
+        try:
+            ensure_fresh(state.service, state.object_name, max_age_minutes, mirror=mirror)
+        except Exception as e:
+            notes.append(
+                f"Note: couldn't refresh {state.service} {state.object_name} ({e!s}); "
+                f"using data from {state.age_minutes():.0f} min ago."
+            )
+
+    try:
+        columns, rows = mirror.query(sql)
+    except sqlite3.Error as e:
+        return f"Error: {e}\n{mirror_tables(mirror.states())}"
+
+    if not rows:
+        return "\n".join([*notes, "No rows returned."])
+    result = format_records(
+        "mirror", "rows", [dict(zip(columns, row, strict=True)) for row in rows]
+    )
+    return "\n".join([*notes, result])
+
+
+def crm_migration_preview(config_file: str, stage: str | None = None, sample_size: int = 3) -> str:
+    """Show how a migration stage would map the first few source records, without writing.
+
+    Args:
+        config_file: Migration config JSON (absolute, or relative to ./files/).
+        stage: Stage name (default: the first stage).
+        sample_size: Number of source records to map.
+
+    Returns:
+        Source records next to the payloads that would be created, or error message.
+    """
+    from sdrbot_cli.migration import preview_migration
+
+    return preview_migration(config_file, stage, sample_size)
+
+
+def crm_migration_run(config_file: str, stages: str | None = None, limit: int | None = None) -> str:
+    """Run a CRM-to-CRM migration from its config file.
+
+    Records stream from the source CRM, are mapped by the config's field rules
+    and are written to the target with bulk endpoints. Progress is saved after
+    every chunk: running again skips records already migrated, so an
+    interrupted run resumes and failed records are retried.
+
+    Args:
+        config_file: Migration config JSON (absolute, or relative to ./files/).
+        stages: Comma-separated stage names to run (default: all, in config order).
+        limit: Records to send per stage, for a trial run.
+
+    Returns:
+        Per-stage counts, throughput and failures file paths, or error message.
+    """
+    from sdrbot_cli.migration import run_migration
+
+    return run_migration(config_file, stages, limit)
+
+
+def crm_migration_reset(config_file: str, stage: str) -> str:
+    """Delete the records a migration stage created in the target CRM and clear its progress.
+
+    Args:
+        config_file: Migration config JSON (absolute, or relative to ./files/).
+        stage: Stage to undo.
+
+    Returns:
+        Summary of deleted records, or error message.
+    """
+    from sdrbot_cli.migration import reset_migration
+
+    return reset_migration(config_file, stage)
+
+
 def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
     """Fetch content from a URL and convert HTML to markdown format.
 
@@ -302,7 +516,7 @@ def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
         response.raise_for_status()
 
         # Convert HTML content to markdown
-        markdown_content = markdownify(response.text)
+        markdown_content = markdownify.markdownify(response.text)
 
         return {
             "url": str(response.url),
@@ -1,14 +1,19 @@
-"""Tracing callback handlers for LangSmith, Langfuse, and Opik."""
+"""Tracing callback handlers for LangSmith, Langfuse, and Opik.
+
+The tracing SDKs are imported only when their tracer is enabled.
+"""
 
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.tracers import LangChainTracer
-from langfuse.langchain import CallbackHandler as LangfuseHandler
-from langsmith import Client as LangSmithClient
-from opik.integrations.langchain import OpikTracer
 
 from sdrbot_cli.config import COLORS, console, settings
+from sdrbot_cli.lazy import lazy_import
 from sdrbot_cli.services.registry import load_config
 
+langsmith = lazy_import("langsmith")
+langchain_tracers = lazy_import("langchain_core.tracers")
+langfuse_langchain = lazy_import("langfuse.langchain")
+opik_langchain = lazy_import("opik.integrations.langchain")
+
 
 def get_tracing_callbacks() -> list[BaseCallbackHandler]:
     """Create and return configured tracing callback handlers.
@@ -25,8 +30,8 @@ def get_tracing_callbacks() -> list[BaseCallbackHandler]:
     # LangSmith
     if config.is_enabled("langsmith") and settings.has_langsmith:
         try:
-            client = LangSmithClient(api_key=settings.langsmith_api_key)
-            tracer = LangChainTracer(
+            client = langsmith.Client(api_key=settings.langsmith_api_key)
+            tracer = langchain_tracers.LangChainTracer(
                 project_name=settings.langsmith_project or "SDRbot",
                 client=client,
             )
@@ -38,7 +43,7 @@ def get_tracing_callbacks() -> list[BaseCallbackHandler]:
     # Langfuse
     if config.is_enabled("langfuse") and settings.has_langfuse:
         try:
-            handler = LangfuseHandler(
+            handler = langfuse_langchain.CallbackHandler(
                 public_key=settings.langfuse_public_key,
                 secret_key=settings.langfuse_secret_key,
                 host=settings.langfuse_host,  # None uses default cloud
@@ -51,7 +56,7 @@ def get_tracing_callbacks() -> list[BaseCallbackHandler]:
     # Opik
     if config.is_enabled("opik") and settings.has_opik:
         try:
-            tracer = OpikTracer(
+            tracer = opik_langchain.OpikTracer(
                 project_name=settings.opik_project or "SDRbot",
             )
             callbacks.append(tracer)
@@ -9,9 +9,7 @@ from rich.console import RenderableType
 from rich.text import Text
 from textual.worker import Worker
 
-from sdrbot_cli.commands import handle_command
 from sdrbot_cli.config import COLORS, DEEP_AGENTS_ASCII, SessionState
-from sdrbot_cli.execution import execute_task
 from sdrbot_cli.tui.messages import (
     AgentExit,
     AgentMessage,
@@ -20,6 +18,7 @@ from sdrbot_cli.tui.messages import (
     ImageCountUpdate,
     SkillCountUpdate,
     StatusUpdate,
+    StreamingTail,
     TaskListUpdate,
     TokenUpdate,
     ToolApprovalRequest,
@@ -350,19 +349,7 @@ class AgentWorker(Worker):
         self._display_splash_and_greeting(show_tips=False)
 
         # Display warning about failed MCP servers
-        if failed_mcp_servers:
-            servers_list = ", ".join(failed_mcp_servers)
-            self._send_message_to_app(
-                Text.from_markup(
-                    f"[bold red]Warning:[/bold red] [yellow]Failed to connect to MCP server(s): {servers_list}[/yellow]"
-                )
-            )
-            self._send_message_to_app(
-                Text.from_markup(
-                    "[dim]These servers have been disabled. Use /mcp to reconfigure.[/dim]"
-                )
-            )
-            self._send_message_to_app(Text(""))
+        self.show_failed_mcp_servers(failed_mcp_servers)
 
         tips = "/help to view the user guide"
         self._send_message_to_app(Text(tips, style=COLORS["dim"]))
@@ -374,6 +361,23 @@ class AgentWorker(Worker):
         # Set up post-reload callback to update counts after agent reload
         self.session_state.set_post_reload_callback(self._send_counts)
 
+    def show_failed_mcp_servers(self, failed_mcp_servers: list[str] | None) -> None:
+        """Warn about MCP servers that failed to connect (and were disabled)."""
+        if not failed_mcp_servers:
+            return
+        servers_list = ", ".join(failed_mcp_servers)
+        self._send_message_to_app(
+            Text.from_markup(
+                f"[bold red]Warning:[/bold red] [yellow]Failed to connect to MCP server(s): {servers_list}[/yellow]"
+            )
+        )
+        self._send_message_to_app(
+            Text.from_markup(
+                "[dim]These servers have been disabled. Use /mcp to reconfigure.[/dim]"
+            )
+        )
+        self._send_message_to_app(Text(""))
+
     async def process_user_input(self, user_input: str) -> None:
         """Process user input received from the app."""
         user_input = user_input.strip()
@@ -498,6 +502,8 @@ class AgentWorker(Worker):
                     self.app.post_message(TokenUpdate(0))
                     return
                 else:
+                    from sdrbot_cli.commands import handle_command
+
                     result = await handle_command(
                         user_input, self.session_state, self.token_tracker
                     )
@@ -541,7 +547,9 @@ class AgentWorker(Worker):
                 self.app.image_tracker.clear()
                 self.app.post_message(ImageCountUpdate(0))  # Update UI
 
-            # Execute agent task
+            # Execute agent task (imported here to keep langchain off the first paint)
+            from sdrbot_cli.execution import execute_task
+
             await execute_task(
                 user_input,
                 self.session_state.agent,
@@ -550,6 +558,7 @@ class AgentWorker(Worker):
                 self.token_tracker,
                 backend=self.session_state.backend,
                 ui_callback=self._send_message_to_app,
+                stream_callback=lambda tail: self.app.post_message(StreamingTail(tail)),
                 todo_callback=lambda todos: self.app.post_message(TaskListUpdate(todos)),
                 approval_callback=self._request_tool_approval,
                 auto_approve_callback=lambda enabled: self.app.post_message(
@@ -10,7 +10,7 @@ from textual.widgets import Header, OptionList, Static, TextArea
 from textual.widgets.option_list import Option
 
 from sdrbot_cli.auth.oauth_server import shutdown_server as shutdown_oauth_server
-from sdrbot_cli.config import TUI_COMMANDS, SessionState
+from sdrbot_cli.config import COLORS, TUI_COMMANDS, SessionState
 from sdrbot_cli.image_utils import (
     ImageTracker,
     get_clipboard_image,
@@ -28,6 +28,7 @@ from sdrbot_cli.tui.messages import (
     ImageCountUpdate,
     SkillCountUpdate,
     StatusUpdate,
+    StreamingTail,
     TaskListUpdate,
     TokenUpdate,
     ToolApprovalRequest,
@@ -383,6 +384,11 @@ class SDRBotTUI(App[None]):
         self.assistant_id = assistant_id
         self.agent_worker: AgentWorker | None = None
         self.image_tracker = ImageTracker()  # Track pasted images for multimodal messages
+        # Input sent while the agent is still being built at startup
+        self._agent_ready = False
+        self._queued_input: str | None = None
+        # MCP servers that finished connecting before the agent was ready
+        self._late_mcp_servers: list[tuple[str, bool]] = []
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -512,7 +518,10 @@ class SDRBotTUI(App[None]):
 
     async def on_mount(self) -> None:
         """Called when app is mounted."""
+        from sdrbot_cli.startup import get_startup_profile
+
         self.query_one("#main_input", ChatInput).focus()
+        get_startup_profile().mark("input ready")
 
         # Check for updates after a delay (non-blocking)
         self.set_timer(2.0, self._check_for_updates_sync)
@@ -557,128 +566,208 @@ class SDRBotTUI(App[None]):
             pass  # Silently ignore update check failures
 
     async def _initialize_on_startup(self) -> None:
-        """Initialize services, MCP, and agent on normal startup."""
-        import asyncio
-
-        from sdrbot_cli.config import create_model
-        from sdrbot_cli.mcp.manager import initialize_mcp, reinitialize_mcp
-        from sdrbot_cli.services import sync_enabled_services_if_needed
-
-        # Show loading screen
-        loading = LoadingScreen(title="Starting", message="Loading...")
-        self.push_screen(loading)
+        """Initialize services, MCP, and agent on normal startup.
 
-        failed_mcp_servers: list[str] = []
-
-        try:
-            loop = asyncio.get_event_loop()
-
-            # Sync services
-            loading.update_message("Syncing services...")
-            await loop.run_in_executor(None, sync_enabled_services_if_needed)
-
-            # Initialize MCP
-            loading.update_message("Initializing MCP servers...")
-            _, failed_mcp_servers = await initialize_mcp()
+        The splash and input are live right away; the agent is built in the
+        background (see ``sdrbot_cli.startup``). A message sent meanwhile is
+        queued and processed once the agent is ready.
+        """
+        import asyncio
 
-            # Initialize model
-            loading.update_message("Initializing model...")
-            model = await loop.run_in_executor(None, create_model)
+        from sdrbot_cli.mcp.manager import get_mcp_manager, reinitialize_mcp
+        from sdrbot_cli.startup import get_startup_profile, prebuild_agent_components
 
-            # Create agent
-            from sdrbot_cli.agent import create_agent_with_config
-            from sdrbot_cli.tools import fetch_url, http_request, sync_crm_schema
+        profile = get_startup_profile()
+        get_mcp_manager().on_late_connect = self._on_late_mcp_server
+        get_mcp_manager().on_tools_changed = self._on_mcp_tools_changed
 
-            # Get sandbox backend if provided
-            sandbox_backend = getattr(self.session_state, "sandbox_backend", None)
-            sandbox_type = getattr(self.session_state, "sandbox_type", None)
-            # Convert "none" string to actual None
-            if sandbox_type == "none":
-                sandbox_type = None
+        # Splash and greeting first, so the user can start typing
+        self._update_model_display()
+        self.agent_worker = AgentWorker(self, self.session_state, self.assistant_id)
+        await self.agent_worker._run_agent_loop()
+        self.query_one("#status_display", StatusDisplay).set_status("Starting")
+
+        loop = asyncio.get_event_loop()
+        prebuilt = await prebuild_agent_components()
+        model = prebuilt.model
+
+        # Create agent
+        from sdrbot_cli.agent import create_agent_with_config
+        from sdrbot_cli.tools import (
+            crm_migration_preview,
+            crm_migration_reset,
+            crm_migration_run,
+            crm_mirror_query,
+            crm_mirror_sync,
+            dedupe_records,
+            enrich_waterfall,
+            fetch_url,
+            http_request,
+            sync_crm_schema,
+        )
 
-            # Use SQLite-backed checkpointer for session persistence
-            sqlite_checkpointer = None
-            try:
-                from sdrbot_cli.sessions import get_checkpointer
+        # Get sandbox backend if provided
+        sandbox_backend = getattr(self.session_state, "sandbox_backend", None)
+        sandbox_type = getattr(self.session_state, "sandbox_type", None)
+        # Convert "none" string to actual None
+        if sandbox_type == "none":
+            sandbox_type = None
+
+        # SQLite-backed checkpointer for session persistence (None falls back to memory)
+        sqlite_checkpointer = prebuilt.checkpointer
+
+        def create_agent():
+            tools = [
+                http_request,
+                fetch_url,
+                sync_crm_schema,
+                enrich_waterfall,
+                crm_mirror_sync,
+                crm_mirror_query,
+                dedupe_records,
+                crm_migration_preview,
+                crm_migration_run,
+                crm_migration_reset,
+            ]
+            return create_agent_with_config(
+                model,
+                self.assistant_id,
+                tools,
+                sandbox=sandbox_backend,
+                sandbox_type=sandbox_type,
+                checkpointer=sqlite_checkpointer,
+                session_state=self.session_state,
+            )
 
-                sqlite_checkpointer = await get_checkpointer()
-            except Exception:
-                pass  # Fall back to InMemorySaver inside create_agent_with_config
+        # Mostly cached components by now (see prebuild_agent_components)
+        (
+            agent,
+            composite_backend,
+            tool_count,
+            skill_count,
+            checkpointer,
+            baseline_tokens,
+        ) = await profile.timed("agent graph", loop.run_in_executor(None, create_agent))
+        self.session_state.agent = agent
+        self.session_state.backend = composite_backend
+        self.session_state.checkpointer = checkpointer
+        self.session_state.tool_count = tool_count
+        self.session_state.skill_count = skill_count
+        self.session_state.baseline_tokens = baseline_tokens
+
+        # Set up reload callback
+        async def reload_agent():
+            from pathlib import Path
+
+            import dotenv
+
+            from sdrbot_cli.agent_cache import get_agent_cache, model_stamp
+            from sdrbot_cli.config import create_model as create_fresh_model
+            from sdrbot_cli.config import settings as app_settings
+
+            # Reload environment to pick up any config changes
+            dotenv.load_dotenv(Path.cwd() / ".env", override=True)
+            app_settings.reload()
 
-            def create_agent():
-                tools = [http_request, fetch_url, sync_crm_schema]
-                return create_agent_with_config(
-                    model,
+            _, new_failed = await reinitialize_mcp()
+            # Re-create model if its config changed (don't use stale closure)
+            fresh_model = await loop.run_in_executor(
+                None,
+                lambda: get_agent_cache().get("model", model_stamp(), create_fresh_model),
+            )
+            tools = [
+                http_request,
+                fetch_url,
+                sync_crm_schema,
+                enrich_waterfall,
+                crm_mirror_sync,
+                crm_mirror_query,
+                dedupe_records,
+                crm_migration_preview,
+                crm_migration_run,
+                crm_migration_reset,
+            ]
+            # Pass existing checkpointer to preserve conversation history
+            new_agent, new_backend, new_tool_count, new_skill_count, _, new_baseline = (
+                create_agent_with_config(
+                    fresh_model,
                     self.assistant_id,
                     tools,
                     sandbox=sandbox_backend,
                     sandbox_type=sandbox_type,
-                    checkpointer=sqlite_checkpointer,
+                    checkpointer=self.session_state.checkpointer,
                     session_state=self.session_state,
                 )
+            )
+            self.session_state.agent = new_agent
+            self.session_state.backend = new_backend
+            self.session_state.tool_count = new_tool_count
+            self.session_state.skill_count = new_skill_count
+            self.session_state.baseline_tokens = new_baseline
+            return new_failed
 
-            loading.update_message("Initializing agent...")
-            (
-                agent,
-                composite_backend,
-                tool_count,
-                skill_count,
-                checkpointer,
-                baseline_tokens,
-            ) = await loop.run_in_executor(None, create_agent)
-            self.session_state.agent = agent
-            self.session_state.backend = composite_backend
-            self.session_state.checkpointer = checkpointer
-            self.session_state.tool_count = tool_count
-            self.session_state.skill_count = skill_count
-            self.session_state.baseline_tokens = baseline_tokens
+        self.session_state.set_reload_callback(reload_agent)
 
-            # Set up reload callback
-            async def reload_agent():
-                from pathlib import Path
+        profile.mark("agent ready")
+        self._on_agent_ready(prebuilt.failed_mcp_servers)
 
-                import dotenv
+    def _on_agent_ready(self, failed_mcp_servers: list[str]) -> None:
+        """Finish startup: report failed MCP servers and send any queued message."""
+        self._agent_ready = True
+        self.agent_worker.show_failed_mcp_servers(failed_mcp_servers)
+        self.agent_worker._send_counts()
 
-                from sdrbot_cli.config import create_model as create_fresh_model
-                from sdrbot_cli.config import settings as app_settings
+        self._attach_late_mcp_servers()
 
-                # Reload environment to pick up any config changes
-                dotenv.load_dotenv(Path.cwd() / ".env", override=True)
-                app_settings.reload()
+        if getattr(self.session_state, "profile_startup", False):
+            from sdrbot_cli.startup import get_startup_profile
 
-                _, new_failed = await reinitialize_mcp()
-                # Re-create model from current config (don't use stale closure)
-                fresh_model = await loop.run_in_executor(None, create_fresh_model)
-                tools = [http_request, fetch_url, sync_crm_schema]
-                # Pass existing checkpointer to preserve conversation history
-                new_agent, new_backend, new_tool_count, new_skill_count, _, new_baseline = (
-                    create_agent_with_config(
-                        fresh_model,
-                        self.assistant_id,
-                        tools,
-                        sandbox=sandbox_backend,
-                        sandbox_type=sandbox_type,
-                        checkpointer=self.session_state.checkpointer,
-                        session_state=self.session_state,
-                    )
-                )
-                self.session_state.agent = new_agent
-                self.session_state.backend = new_backend
-                self.session_state.tool_count = new_tool_count
-                self.session_state.skill_count = new_skill_count
-                self.session_state.baseline_tokens = new_baseline
-                return new_failed
+            self.agent_worker._send_message_to_app(
+                Text(get_startup_profile().report(), style=COLORS["dim"])
+            )
 
-            self.session_state.set_reload_callback(reload_agent)
+        queued, self._queued_input = self._queued_input, None
+        if queued is None:
+            self.post_message(StatusUpdate("Idle"))
+            return
+        self.query_one("#thinking_indicator", ThinkingIndicator).show("Thinking...")
+        # Scheduled, not started here: an exclusive worker would cancel the startup one
+        self.call_later(
+            self.run_worker, self.agent_worker.process_user_input(queued), exclusive=True
+        )
 
-        finally:
-            self.pop_screen()
+    def _attach_late_mcp_servers(self) -> None:
+        """Handle MCP servers that finished connecting while the agent was being built."""
+        late, self._late_mcp_servers = self._late_mcp_servers, []
+        for name, connected in late:
+            self._on_late_mcp_server(name, connected)
+
+    def _on_late_mcp_server(self, name: str, connected: bool) -> None:
+        """Attach a slow MCP server's tools to the running agent once it connects."""
+        if not self._agent_ready or self.agent_worker is None:
+            # Picked up by _on_agent_ready (the build may have missed it)
+            self._late_mcp_servers.append((name, connected))
+            return
 
-        # Store failed servers to display after agent worker starts
-        self._failed_mcp_servers = failed_mcp_servers
+        if connected:
+            message = f"MCP server {name} connected, loading its tools"
+            self.agent_worker._send_message_to_app(Text(message, style=COLORS["dim"]))
+        else:
+            # Drops its tools if they were registered from the tool cache
+            self.agent_worker.show_failed_mcp_servers([name])
+        # Own group so a new message (an exclusive worker) doesn't cancel the reload
+        self.run_worker(self._reload_existing_agent(), group="mcp_late_connect")
+
+    def _on_mcp_tools_changed(self, name: str) -> None:
+        """Reload the agent after an MCP server's tool list changed."""
+        if not self._agent_ready or self.agent_worker is None:
+            self._late_mcp_servers.append((name, True))
+            return
 
-        # Start the agent worker
-        self._start_agent_worker()
+        self.agent_worker._send_message_to_app(
+            Text(f"MCP server {name} changed its tools, reloading", style=COLORS["dim"])
+        )
+        self.run_worker(self._reload_existing_agent(), group="mcp_late_connect")
 
     async def _reload_existing_agent(self) -> None:
         """Reload the existing agent after setup changes."""
@@ -696,9 +785,12 @@ class SDRBotTUI(App[None]):
         import dotenv
 
         from sdrbot_cli.config import create_model, settings
-        from sdrbot_cli.mcp.manager import initialize_mcp, reinitialize_mcp
+        from sdrbot_cli.mcp.manager import get_mcp_manager, initialize_mcp, reinitialize_mcp
         from sdrbot_cli.services import sync_enabled_services_if_needed
 
+        get_mcp_manager().on_late_connect = self._on_late_mcp_server
+        get_mcp_manager().on_tools_changed = self._on_mcp_tools_changed
+
         # Show loading screen
         loading = LoadingScreen(title="Initializing", message="Loading configuration...")
         self.push_screen(loading)
@@ -725,10 +817,32 @@ class SDRBotTUI(App[None]):
 
             # Now we need to create the agent
             from sdrbot_cli.agent import create_agent_with_config
-            from sdrbot_cli.tools import fetch_url, http_request, sync_crm_schema
+            from sdrbot_cli.tools import (
+                crm_migration_preview,
+                crm_migration_reset,
+                crm_migration_run,
+                crm_mirror_query,
+                crm_mirror_sync,
+                dedupe_records,
+                enrich_waterfall,
+                fetch_url,
+                http_request,
+                sync_crm_schema,
+            )
 
             def create_agent():
-                tools = [http_request, fetch_url, sync_crm_schema]
+                tools = [
+                    http_request,
+                    fetch_url,
+                    sync_crm_schema,
+                    enrich_waterfall,
+                    crm_mirror_sync,
+                    crm_mirror_query,
+                    dedupe_records,
+                    crm_migration_preview,
+                    crm_migration_run,
+                    crm_migration_reset,
+                ]
                 return create_agent_with_config(
                     model,
                     self.assistant_id,
@@ -761,6 +875,7 @@ class SDRBotTUI(App[None]):
 
                 import dotenv
 
+                from sdrbot_cli.agent_cache import get_agent_cache, model_stamp
                 from sdrbot_cli.config import create_model as create_fresh_model
                 from sdrbot_cli.config import settings as app_settings
 
@@ -769,9 +884,23 @@ class SDRBotTUI(App[None]):
                 app_settings.reload()
 
                 _, new_failed = await reinitialize_mcp()
-                # Re-create model from current config (don't use stale closure)
-                fresh_model = await loop.run_in_executor(None, create_fresh_model)
-                tools = [http_request, fetch_url, sync_crm_schema]
+                # Re-create model if its config changed (don't use stale closure)
+                fresh_model = await loop.run_in_executor(
+                    None,
+                    lambda: get_agent_cache().get("model", model_stamp(), create_fresh_model),
+                )
+                tools = [
+                    http_request,
+                    fetch_url,
+                    sync_crm_schema,
+                    enrich_waterfall,
+                    crm_mirror_sync,
+                    crm_mirror_query,
+                    dedupe_records,
+                    crm_migration_preview,
+                    crm_migration_run,
+                    crm_migration_reset,
+                ]
                 # Pass existing checkpointer to preserve conversation history
                 new_agent, new_backend, new_tool_count, new_skill_count, _, new_baseline = (
                     create_agent_with_config(
@@ -812,12 +941,14 @@ class SDRBotTUI(App[None]):
         # Update model display
         self._update_model_display()
 
+        self._agent_ready = True
         self.agent_worker = AgentWorker(self, self.session_state, self.assistant_id)
         # Start the initial agent loop (splash, greetings etc.)
         self.run_worker(
             self.agent_worker._run_agent_loop(failed_mcp_servers=failed_mcp_servers),
             exclusive=True,
         )
+        self._attach_late_mcp_servers()
 
     def on_chat_input_submitted(self, event: ChatInput.Submitted) -> None:
         """Handle chat input submission."""
@@ -833,6 +964,13 @@ class SDRBotTUI(App[None]):
         # Update status to "Thinking" and show thinking indicator
         self.query_one("#status_display", StatusDisplay).set_status("Thinking")
         self.query_one("#main_input", ChatInput).display = False
+
+        if not self._agent_ready:
+            # Still starting up: sent by _on_agent_ready once the agent is built
+            self._queued_input = value
+            self.query_one("#thinking_indicator", ThinkingIndicator).show("Starting agent...")
+            return
+
         self.query_one("#thinking_indicator", ThinkingIndicator).show("Thinking...")
 
         if self.agent_worker:
@@ -852,6 +990,11 @@ class SDRBotTUI(App[None]):
         chat_log = self.query_one("#chat_log", CopyableRichLog)
         chat_log.write(message.renderable)
 
+    async def on_streaming_tail(self, message: StreamingTail) -> None:
+        """Show the unfinished end of a streaming reply at the end of the chat log."""
+        chat_log = self.query_one("#chat_log", CopyableRichLog)
+        chat_log.write_tail(message.renderable)
+
     async def on_agent_exit(self, message: AgentExit) -> None:
         """Handle agent exit message."""
         self.exit()
@@ -68,6 +68,7 @@ class HelpScreen(ModalScreen[None]):
                 yield Static("  /mcp        Manage MCP servers", classes="help-item")
                 yield Static("  /tools      View all loaded tools", classes="help-item")
                 yield Static("  /sync       Re-sync service schemas", classes="help-item")
+                yield Static("  /jobs       List, resume or cancel jobs", classes="help-item")
                 yield Static("  /tokens     View token usage stats", classes="help-item")
                 yield Static("  /models     Configure LLM provider", classes="help-item")
                 yield Static("  /tracing    Configure tracing", classes="help-item")
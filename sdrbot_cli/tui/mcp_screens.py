@@ -24,6 +24,7 @@ from sdrbot_cli.mcp.config import (
     remove_mcp_server,
     update_server_tool_count,
 )
+from sdrbot_cli.mcp.manager import get_mcp_manager
 
 # Path to shared CSS
 SETUP_CSS_PATH = Path(__file__).parent / "setup_common.tcss"
@@ -95,8 +96,14 @@ class MCPSetupScreen(Screen[bool | None]):
                 enabled = server_config.get("enabled", False)
                 tool_count = server_config.get("tool_count", "?")
 
-                if enabled:
+                health = get_mcp_manager().get_health(name)
+                if enabled and health is not None and health.state != "connected":
+                    status_text = f"● {health.summary()}"
+                    status_class = "status-configured"
+                elif enabled:
                     status_text = f"● {tool_count} tools"
+                    if health is not None and health.summary():
+                        status_text += f" · {health.summary()}"
                     status_class = "status-active"
                 else:
                     status_text = "Disabled"
@@ -764,7 +771,14 @@ class ManageMCPServerScreen(ModalScreen[bool]):
                 info = info[:47] + "..."
 
         info_label = self.query_one("#server-info", Static)
-        info_label.update(f"Transport: {transport}\n{info}\nTools: {tool_count}")
+        info_lines = [f"Transport: {transport}", info, f"Tools: {tool_count}"]
+        health = get_mcp_manager().get_health(self.server_name)
+        if health is not None:
+            info_lines.append(f"Health: {health.summary() or health.state}")
+            info_lines.append(f"Calls: {health.calls}, reconnects: {health.reconnects}")
+            if health.last_error:
+                info_lines.append(f"Last error: {health.last_error[:50]}")
+        info_label.update("\n".join(info_lines))
 
         # Build action list
         list_view = self.query_one("#manage-list", ListView)
@@ -12,6 +12,14 @@ class AgentMessage(Message):
         super().__init__()
 
 
+class StreamingTail(Message):
+    """Message replacing the unfinished end of a streaming reply in the chat log."""
+
+    def __init__(self, renderable: RenderableType | None) -> None:
+        self.renderable = renderable  # None drops it
+        super().__init__()
+
+
 class AgentExit(Message):
     """Message indicating the agent has exited."""
 
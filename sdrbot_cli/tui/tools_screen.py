@@ -50,6 +50,13 @@ def get_grouped_tools() -> dict[str, dict[str, list[tuple[str, str]]]]:
 
     # SDRbot core tools
     sdrbot_tools = [
+        ("crm_migration_preview", "Preview how a migration stage maps records"),
+        ("crm_migration_reset", "Delete the records a migration stage created"),
+        ("crm_migration_run", "Run a CRM-to-CRM migration from its config"),
+        ("crm_mirror_query", "Query the local CRM mirror with SQL"),
+        ("crm_mirror_sync", "Copy CRM records into the local mirror"),
+        ("dedupe_records", "Find duplicates or match records across lists"),
+        ("enrich_waterfall", "Enrich leads across providers, filling gaps in order"),
         ("fetch_url", "Fetch and parse web page content"),
         ("http_request", "Make HTTP requests to external APIs"),
         ("sync_crm_schema", "Sync CRM schema and regenerate tools"),
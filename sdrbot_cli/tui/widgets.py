@@ -3,8 +3,10 @@
 from collections import defaultdict
 
 import pyperclip
+from rich.console import RenderableType
 from rich.text import Text
 from textual.events import Click
+from textual.geometry import Size
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
@@ -71,7 +73,36 @@ class OrderedFooter(Footer):
 
 
 class CopyableRichLog(RichLog):
-    """RichLog that copies content to clipboard on right-click."""
+    """RichLog that copies content to clipboard on right-click.
+
+    The last lines may be a provisional tail (the open block of a streaming
+    reply), replaced by each :meth:`write_tail` and dropped before any write.
+    """
+
+    _tail_lines = 0
+
+    def write(self, content, *args, **kwargs):
+        """Write to the log, dropping the provisional tail first."""
+        self.write_tail(None)
+        return super().write(content, *args, **kwargs)
+
+    def write_tail(self, renderable: RenderableType | None) -> None:
+        """Replace the provisional tail.
+
+        Args:
+            renderable: The new tail, or None to just drop the current one
+        """
+        if self._tail_lines:
+            del self.lines[-self._tail_lines :]
+            self._tail_lines = 0
+            self._line_cache.clear()
+            self.virtual_size = Size(self._widest_line_width, len(self.lines))
+            self.refresh()
+        if renderable is None or not self._size_known:
+            return  # Before the first layout there's nothing to preview in
+        before = len(self.lines)
+        super().write(renderable)
+        self._tail_lines = len(self.lines) - before
 
     def on_click(self, event: Click) -> None:
         """Handle click events - right-click copies content to clipboard."""
@@ -288,6 +319,10 @@ class StatusDisplay(Static):
     status = reactive("Idle")
     total_tokens = reactive(0)
     model_name = reactive("...")
+    cache_summary = reactive("")
+    rate_limit_summary = reactive("")
+    compact_summary = reactive("")
+    tool_cache_summary = reactive("")
     _frame_index = reactive(0)
 
     class ModelClicked(Message):
@@ -301,8 +336,61 @@ class StatusDisplay(Static):
         self._timer = None
 
     def on_mount(self) -> None:
-        """Start the animation timer when mounted."""
+        """Start the animation and stats timers when mounted."""
         self._timer = self.set_interval(1 / 12, self._advance_frame)
+        self.set_interval(1.0, self._refresh_cache_summary)
+        self.set_interval(1.0, self._refresh_rate_limit_summary)
+        self.set_interval(1.0, self._refresh_compact_summary)
+        self.set_interval(1.0, self._refresh_tool_cache_summary)
+
+    def _refresh_cache_summary(self) -> None:
+        """Pull the enrichment cache counters for this session."""
+        from sdrbot_cli.enrichment.cache import get_cache_stats
+
+        stats = get_cache_stats()
+        if not stats.lookups:
+            self.cache_summary = ""
+            return
+        self.cache_summary = (
+            f"Enrich cache: {stats.hits}/{stats.lookups} hits, "
+            f"{stats.credits_saved:g} credits saved"
+        )
+
+    def _refresh_rate_limit_summary(self) -> None:
+        """Pull client-side rate limiter queue depth and throttle time."""
+        from sdrbot_cli.rate_limit import get_rate_limit_stats
+
+        stats = [s for s in get_rate_limit_stats() if s.throttle_seconds or s.waiting]
+        if not stats:
+            self.rate_limit_summary = ""
+            return
+        waiting = sum(s.waiting for s in stats)
+        throttled = sum(s.throttle_seconds for s in stats)
+        self.rate_limit_summary = f"Rate limited: {waiting} queued, {throttled:.1f}s waited"
+
+    def _refresh_compact_summary(self) -> None:
+        """Pull the tokens saved by compact tool-result encoding."""
+        from sdrbot_cli.result_format import get_format_stats
+
+        stats = get_format_stats()
+        if stats.tokens_saved <= 0:
+            self.compact_summary = ""
+            return
+        self.compact_summary = (
+            f"Compact results: {format_token_count(stats.tokens_saved)} tokens saved"
+        )
+
+    def _refresh_tool_cache_summary(self) -> None:
+        """Pull the read-only tool result cache counters."""
+        from sdrbot_cli.tool_cache import get_tool_cache_stats
+
+        stats = get_tool_cache_stats()
+        if not stats.hits:
+            self.tool_cache_summary = ""
+            return
+        self.tool_cache_summary = (
+            f"Tool cache: {stats.hits}/{stats.lookups} hits ({stats.hit_rate:.0%})"
+        )
 
     def _advance_frame(self) -> None:
         """Advance to the next spinner frame when not idle."""
@@ -327,6 +415,14 @@ class StatusDisplay(Static):
         model_part = f"[dim]Model:[/] [@click=show_models]{self.model_name}[/]"
 
         markup = f"{status_part} [dim]|[/] {tokens_part} [dim]|[/] {model_part}"
+        if self.cache_summary:
+            markup += f" [dim]|[/] [dim]{self.cache_summary}[/]"
+        if self.compact_summary:
+            markup += f" [dim]|[/] [dim]{self.compact_summary}[/]"
+        if self.tool_cache_summary:
+            markup += f" [dim]|[/] [dim]{self.tool_cache_summary}[/]"
+        if self.rate_limit_summary:
+            markup += f" [dim]|[/] [yellow]{self.rate_limit_summary}[/]"
         return Text.from_markup(markup)
 
     def action_show_models(self) -> None:
@@ -13,6 +13,9 @@ from rich.text import Text
 from .config import COLORS, COMMANDS, DEEP_AGENTS_ASCII, MAX_ARG_LENGTH
 from .file_ops import FileOperationRecord
 
+# Lines of a rendered diff per chat log write
+DIFF_CHUNK_LINES = 40
+
 
 def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     """Truncate a string value if it exceeds max_length."""
@@ -297,6 +300,10 @@ def render_file_operation(record: FileOperationRecord) -> list[RenderableType]:
         if span:
             detail = f"{detail} {span}"
         output_renderables.append(_get_detail_text(detail))
+    elif record.snapshot_skipped:
+        verb = "Wrote" if record.tool_name == "write_file" else "Edited"
+        size = record.metrics.bytes_written / (1024 * 1024)
+        output_renderables.append(_get_detail_text(f"{verb} {size:.1f} MB (too large to diff)"))
     else:
         if record.tool_name == "write_file":
             added = record.metrics.lines_added
@@ -460,7 +467,11 @@ def format_diff_rich(diff_lines: list[str]) -> str:
 
 
 def render_diff_block(diff: str, title: str) -> list[RenderableType]:
-    """Render a diff string with line numbers and colors."""
+    """Render a diff string with line numbers and colors.
+
+    The diff is split into renderables of ``DIFF_CHUNK_LINES`` lines, so the
+    chat log takes it in small writes instead of one long stall.
+    """
     output_renderables = []
     try:
         # Parse diff into lines and format with line numbers
@@ -472,7 +483,10 @@ def render_diff_block(diff: str, title: str) -> list[RenderableType]:
         output_renderables.append(
             Text(f"[bold {COLORS['primary']}]═══ {title} ═══[/bold {COLORS['primary']}]")
         )
-        output_renderables.append(Text(formatted_diff))
+        formatted_lines = formatted_diff.split("\n")
+        for start in range(0, len(formatted_lines), DIFF_CHUNK_LINES):
+            chunk = formatted_lines[start : start + DIFF_CHUNK_LINES]
+            output_renderables.append(Text("\n".join(chunk)))
         output_renderables.append(Text(""))
     except (ValueError, AttributeError, IndexError, OSError):
         # Fallback to simple rendering if formatting fails
@@ -574,6 +588,12 @@ def show_interactive_help() -> list[RenderableType]:
             style=COLORS["dim"],
         )
     )
+    output_renderables.append(
+        Text(
+            "  /jobs [resume|cancel <id>]  List, resume or cancel long-running jobs",
+            style=COLORS["dim"],
+        )
+    )
     output_renderables.append(Text(""))
 
     output_renderables.append(Text("[bold]Agent Commands:[/bold]", style=COLORS["primary"]))
@@ -816,6 +836,12 @@ def show_help() -> list[RenderableType]:
             style=COLORS["dim"],
         )
     )
+    output_renderables.append(
+        Text(
+            "  /jobs [resume|cancel <id>]  List, resume or cancel long-running jobs",
+            style=COLORS["dim"],
+        )
+    )
     output_renderables.append(Text(""))
 
     output_renderables.append(Text("[bold]Agent Commands:[/bold]", style=COLORS["primary"]))
@@ -15,6 +15,66 @@ def load_env():
     dotenv.load_dotenv(Path(__file__).parent.parent / ".env")
 
 
+@pytest.fixture(autouse=True)
+def isolated_enrichment_cache(tmp_path, monkeypatch):
+    """Give every test its own empty enrichment cache."""
+    from sdrbot_cli.enrichment import cache
+
+    cache.reset_enrichment_cache()
+    monkeypatch.setattr(cache, "_cache_db_path", lambda: tmp_path / "enrichment_cache.db")
+    yield
+    cache.reset_enrichment_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_store(tmp_path, monkeypatch):
+    """Give every test its own empty job store."""
+    from sdrbot_cli import jobs
+
+    jobs.reset_job_store()
+    monkeypatch.setattr(jobs, "_jobs_db_path", lambda: tmp_path / "jobs.db")
+    yield
+    jobs.reset_job_store()
+
+
+@pytest.fixture(autouse=True)
+def isolated_mcp_tool_cache(tmp_path, monkeypatch):
+    """Give every test its own empty MCP tool listing cache."""
+    from sdrbot_cli.mcp import cache
+
+    monkeypatch.setattr(cache, "_tool_cache_path", lambda: tmp_path / "mcp_tools_cache.json")
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters():
+    """Start every test with full, untouched rate limit buckets."""
+    from sdrbot_cli.rate_limit import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+@pytest.fixture(autouse=True)
+def fresh_tool_result_cache():
+    """Start every test without cached tool results or hit counters."""
+    from sdrbot_cli.tool_cache import reset_tool_result_cache
+
+    reset_tool_result_cache()
+    yield
+    reset_tool_result_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_agent_cache():
+    """Start every test without cached agent components (service tools etc.)."""
+    from sdrbot_cli.agent_cache import reset_agent_cache
+
+    reset_agent_cache()
+    yield
+    reset_agent_cache()
+
+
 @pytest.fixture
 def mock_hubspot_client():
     """Create a mock HubSpot client for unit tests."""
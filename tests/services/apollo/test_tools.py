@@ -16,7 +16,7 @@ class TestApolloToolLoading:
 
         tools = get_static_tools()
 
-        assert len(tools) == 4
+        assert len(tools) == 6
         tool_names = [t.name for t in tools]
         assert "apollo_enrich_person" in tool_names
         assert "apollo_enrich_company" in tool_names
@@ -599,3 +599,91 @@ class TestApolloToolsIntegration:
 
         # Should either return results or handle gracefully
         assert "companies" in result.lower() or "error" in result.lower()
+
+
+class TestApolloPaginatedSearch:
+    """Tests for auto-paginated Apollo search exports."""
+
+    @pytest.fixture
+    def patch_apollo_client(self):
+        import sdrbot_cli.services.apollo.tools as tools_module
+
+        mock_client = MagicMock()
+        original_client = tools_module._apollo_client
+        tools_module._apollo_client = None
+        with patch("sdrbot_cli.services.apollo.tools.ApolloClient", return_value=mock_client):
+            yield mock_client
+        tools_module._apollo_client = original_client
+
+    @staticmethod
+    def _page_response(endpoint, json):
+        page = json["page"]
+        # Page 3 repeats one person from page 2 to exercise dedupe
+        ids = [f"p{(page - 1) * 100 + i}" for i in range(100)]
+        if page == 3:
+            ids[0] = "p199"
+        return {
+            "people": [
+                {"id": pid, "name": f"Person {pid}", "organization": {"name": "Acme"}}
+                for pid in ids
+            ],
+            "total_entries": 1000,
+        }
+
+    def test_large_limit_exports_to_file(self, patch_apollo_client, tmp_path):
+        import csv
+
+        from sdrbot_cli.services.apollo.tools import apollo_search_people
+
+        patch_apollo_client.post.side_effect = self._page_response
+        out = tmp_path / "vps.csv"
+
+        result = apollo_search_people.invoke(
+            {"person_titles": "VP Sales", "limit": 250, "output_file": str(out)}
+        )
+
+        assert "Saved 250 unique people of 1,000 matching" in result
+        assert str(out) in result
+        pages = sorted(c.kwargs["json"]["page"] for c in patch_apollo_client.post.call_args_list)
+        assert pages == [1, 2, 3]
+        assert all(
+            c.kwargs["json"]["per_page"] == 100 for c in patch_apollo_client.post.call_args_list
+        )
+
+        with out.open() as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 250
+        assert len({r["id"] for r in rows}) == 250
+        assert rows[0]["company"] == "Acme"
+
+    def test_duplicates_are_made_up_from_later_pages(self, patch_apollo_client, tmp_path):
+        from sdrbot_cli.services.apollo.tools import apollo_search_people
+
+        patch_apollo_client.post.side_effect = self._page_response
+
+        result = apollo_search_people.invoke(
+            {"limit": 300, "output_file": str(tmp_path / "vps.csv")}
+        )
+
+        assert "Saved 300 unique people" in result
+        assert "Skipped 1 duplicate" in result
+        assert "ran out of results" not in result
+        pages = sorted(c.kwargs["json"]["page"] for c in patch_apollo_client.post.call_args_list)
+        assert pages == [1, 2, 3, 4]
+
+    def test_export_stops_at_last_page(self, patch_apollo_client, tmp_path):
+        from sdrbot_cli.services.apollo.tools import apollo_search_companies
+
+        patch_apollo_client.post.return_value = {
+            "organizations": [{"id": "o1", "name": "Acme", "primary_domain": "acme.com"}],
+            "pagination": {"total_entries": 1},
+        }
+
+        result = apollo_search_companies.invoke(
+            {"limit": 500, "output_file": str(tmp_path / "orgs")}
+        )
+
+        assert "Saved 1 unique companies of 1 matching" in result
+        assert "Requested 500 but the search ran out of results" in result
+        assert patch_apollo_client.post.call_count == 1
+        assert (tmp_path / "orgs.csv").exists()
@@ -214,7 +214,7 @@ class TestAssociationToolsIntegration:
         gen_module._hs_client = None
 
         # Find a contact to test with
-        search_result = hubspot_search_contacts.invoke({"limit": 1})
+        search_result = hubspot_search_contacts.invoke({"max_records": 1})
 
         if "No contacts found" in search_result:
             pytest.skip("No contacts in HubSpot to test with")
@@ -348,7 +348,7 @@ class TestHubSpotCRUDIntegration:
             pytest.skip("Generated tools not found. Run 'sdrbot services sync hubspot' first.")
 
         gen_module._hs_client = None
-        result = hubspot_search_contacts.invoke({"limit": 1})
+        result = hubspot_search_contacts.invoke({"max_records": 1})
         assert "contacts" in result.lower() or "found" in result.lower()
 
     def test_get_contact_real(self, real_hubspot_client):
@@ -367,7 +367,7 @@ class TestHubSpotCRUDIntegration:
         gen_module._hs_client = None
 
         # First find a contact
-        search_result = hubspot_search_contacts.invoke({"limit": 1})
+        search_result = hubspot_search_contacts.invoke({"max_records": 1})
 
         if "No contacts found" in search_result:
             pytest.skip("No contacts in HubSpot to test with")
@@ -16,7 +16,7 @@ class TestHunterToolLoading:
 
         tools = get_static_tools()
 
-        assert len(tools) == 3
+        assert len(tools) == 5
         tool_names = [t.name for t in tools]
         assert "hunter_domain_search" in tool_names
         assert "hunter_email_finder" in tool_names
@@ -145,6 +145,24 @@ class TestHunterToolsUnit:
         assert "john.doe@example.com" in result
         assert "95%" in result
 
+    def test_email_finder_uses_cache(self, patch_hunter_client):
+        """email_finder should not call Hunter again for a cached lookup."""
+        patch_hunter_client.request.return_value = {
+            "data": {"email": "john.doe@example.com", "score": 95}
+        }
+
+        import sdrbot_cli.services.hunter.tools as tools_module
+        from sdrbot_cli.services.hunter.tools import hunter_email_finder
+
+        tools_module._hunter_client = None
+
+        args = {"domain": "example.com", "first_name": "John", "last_name": "Doe"}
+        first = hunter_email_finder.invoke(args)
+        second = hunter_email_finder.invoke({**args, "domain": "Example.com"})
+
+        assert first == second
+        assert patch_hunter_client.request.call_count == 1
+
     def test_email_finder_not_found(self, patch_hunter_client):
         """email_finder should handle not found."""
         patch_hunter_client.request.return_value = {"data": {"email": None}}
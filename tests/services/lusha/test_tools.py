@@ -15,7 +15,7 @@ class TestLushaToolLoading:
 
         tools = get_static_tools()
 
-        assert len(tools) == 3
+        assert len(tools) == 4
         tool_names = [t.name for t in tools]
         assert "lusha_enrich_person" in tool_names
         assert "lusha_enrich_company" in tool_names
@@ -0,0 +1,170 @@
+"""Tests for the Salesforce Bulk API 2.0 engine."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sdrbot_cli.services.salesforce import bulk
+
+
+def _response(body=b"", headers=None, json_body=None, status=200):
+    response = MagicMock()
+    response.ok = status < 400
+    response.status_code = status
+    response.headers = headers or {}
+    response.text = "x" if json_body is not None else ""
+    response.json.return_value = json_body
+    response.iter_content.side_effect = lambda chunk_size: iter(
+        [body[i : i + 7] for i in range(0, len(body), 7)]
+    )
+    return response
+
+
+@pytest.fixture
+def sf():
+    client = MagicMock()
+    client.base_url = "https://example.my.salesforce.com/services/data/v59.0/"
+    client.session_id = "token"
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(bulk.time, "sleep", lambda seconds: None)
+
+
+def test_export_streams_all_pages_into_one_file(sf, tmp_path):
+    pages = {
+        None: _response(
+            b'"Id","Email"\n"1","a@b.com"\n',
+            {"Sforce-Locator": "abc", "Sforce-NumberOfRecords": "1"},
+        ),
+        "abc": _response(
+            b'"Id","Email"\n"2","c@d.com"\n',
+            {"Sforce-Locator": "null", "Sforce-NumberOfRecords": "1"},
+        ),
+    }
+    states = iter(["UploadComplete", "InProgress", "JobComplete"])
+
+    def request(method, url, headers=None, params=None, **kwargs):
+        if method == "POST":
+            assert kwargs["json"] == {
+                "operation": "query",
+                "query": "SELECT Id, Email FROM Contact",
+            }
+            return _response(json_body={"id": "750Q"})
+        if url.endswith("/results"):
+            assert kwargs["stream"] is True
+            return pages[params.get("locator")]
+        return _response(json_body={"state": next(states), "object": "Contact"})
+
+    sf.session.request.side_effect = request
+    output = tmp_path / "contacts.csv"
+
+    report = bulk.export_query(bulk.Bulk2Client(sf), "SELECT Id, Email FROM Contact", output)
+
+    assert output.read_text() == '"Id","Email"\n"1","a@b.com"\n"2","c@d.com"\n'
+    assert report.processed == 2
+    assert report.summary().startswith(f"Exported 2 Contact records to {output}")
+
+
+def test_export_still_running_returns_job_id(sf):
+    sf.session.request.side_effect = lambda method, url, **kwargs: _response(
+        json_body={"id": "750Q"} if method == "POST" else {"state": "InProgress"}
+    )
+
+    report = bulk.export_query(bulk.Bulk2Client(sf), "SELECT Id FROM Lead", wait_seconds=0)
+
+    assert not report.done
+    assert "salesforce_bulk_job_status(job_id='750Q', job_type='query')" in report.summary()
+
+
+def test_load_reports_failed_rows(sf, tmp_path):
+    source = tmp_path / "leads.csv"
+    source.write_text("Email,LastName\na@b.com,A\nbad,B\n")
+    calls = []
+
+    def request(method, url, headers=None, **kwargs):
+        calls.append((method, url.rsplit("/jobs/", 1)[1]))
+        if method == "POST":
+            assert kwargs["json"]["externalIdFieldName"] == "Email"
+            return _response(json_body={"id": "750I"})
+        if url.endswith("/failedResults"):
+            return _response(b'"sf__Id","sf__Error",Email,LastName\n"","INVALID_EMAIL",bad,B\n')
+        if method == "GET":
+            return _response(
+                json_body={
+                    "state": "JobComplete",
+                    "numberRecordsProcessed": 2,
+                    "numberRecordsFailed": 1,
+                }
+            )
+        return _response(json_body={})
+
+    sf.session.request.side_effect = request
+
+    report = bulk.load_csv(
+        bulk.Bulk2Client(sf), "Lead", source, "upsert", external_id_field="Email"
+    )
+
+    assert ("PUT", "ingest/750I/batches") in calls
+    assert ("PATCH", "ingest/750I") in calls
+    assert report.failures_path == tmp_path / "leads_failed.csv"
+    summary = report.summary()
+    assert "1 succeeded, 1 failed" in summary
+    assert "- bad: INVALID_EMAIL" in summary
+
+
+def test_split_csv_keeps_header_and_quoted_newlines(tmp_path):
+    source = tmp_path / "big.csv"
+    source.write_text('Name,Notes\nA,"line one\nline two"\nB,x\nC,y\n')
+
+    parts = bulk.split_csv(source, max_bytes=30)
+
+    assert len(parts) > 1
+    rows = []
+    for part in parts:
+        lines = part.read_text().split("\n", 1)
+        assert lines[0] == "Name,Notes"
+        rows.append(lines[1])
+    assert 'A,"line one\nline two"\n' in rows[0]
+
+
+def test_api_errors_raise(sf):
+    sf.session.request.return_value = _response(
+        json_body=[{"errorCode": "INVALIDJOB", "message": "Invalid job id"}], status=404
+    )
+
+    with pytest.raises(bulk.BulkJobError, match="Invalid job id"):
+        bulk.Bulk2Client(sf).job_info("ingest", "nope")
+
+
+def test_load_declares_crlf_line_endings(sf, tmp_path):
+    source = tmp_path / "export.csv"
+    source.write_bytes(b"Email,LastName\r\na@b.com,A\r\n")
+    jobs = []
+
+    def request(method, url, headers=None, **kwargs):
+        if method == "POST":
+            jobs.append(kwargs["json"])
+            return _response(json_body={"id": "750I"})
+        if method == "GET" and not url.endswith("Results"):
+            return _response(json_body={"state": "JobComplete", "numberRecordsProcessed": 1})
+        return _response(json_body={})
+
+    sf.session.request.side_effect = request
+
+    bulk.load_csv(bulk.Bulk2Client(sf), "Lead", source, "insert")
+
+    assert jobs[0]["lineEnding"] == "CRLF"
+    assert bulk.line_ending(bulk.split_csv(source, max_bytes=20)[0]) == "LF"
+
+
+def test_split_csv_sizes_parts_by_encoded_bytes(tmp_path):
+    source = tmp_path / "names.csv"
+    source.write_text("Name\n" + "Zoë Ångström Ñúñez\n" * 20, encoding="utf-8")
+
+    parts = bulk.split_csv(source, max_bytes=100)
+
+    assert all(part.stat().st_size <= 100 for part in parts)
+    assert sum(len(part.read_text().splitlines()) - 1 for part in parts) == 20
@@ -16,7 +16,7 @@ class TestSalesforceToolLoading:
 
         tools = get_static_tools()
 
-        assert len(tools) == 9
+        assert len(tools) == 12
         tool_names = [t.name for t in tools]
         # Query tools
         assert "salesforce_soql_query" in tool_names
@@ -31,6 +31,10 @@ class TestSalesforceToolLoading:
         # Generic tools
         assert "salesforce_search_records" in tool_names
         assert "salesforce_get_record" in tool_names
+        # Bulk API tools
+        assert "salesforce_bulk_export" in tool_names
+        assert "salesforce_bulk_load" in tool_names
+        assert "salesforce_bulk_job_status" in tool_names
 
     def test_tools_are_base_tool_instances(self):
         """All tools should be BaseTool instances."""
@@ -119,6 +123,23 @@ class TestSalesforceToolsUnit:
         # Attributes should be stripped
         assert "attributes" not in result
 
+    def test_bulk_export_writes_relative_paths_under_files(
+        self, patch_sf_client, tmp_path, monkeypatch
+    ):
+        """A relative output_file lands in ./files/, like the other export tools."""
+        import sdrbot_cli.services.salesforce.tools as tools_module
+
+        monkeypatch.chdir(tmp_path)
+        tools_module._sf_client = None
+        export = MagicMock(return_value=MagicMock(summary=lambda: "Exported"))
+        monkeypatch.setattr(tools_module.bulk, "export_query", export)
+
+        tools_module.salesforce_bulk_export.invoke(
+            {"object_or_soql": "SELECT Id FROM Contact", "output_file": "contacts"}
+        )
+
+        assert export.call_args.args[2] == tmp_path / "files" / "contacts.csv"
+
     def test_soql_query_no_results(self, patch_sf_client):
         """soql_query should handle empty results."""
         patch_sf_client.query.return_value = {"totalSize": 0, "records": []}
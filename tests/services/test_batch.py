@@ -0,0 +1,195 @@
+"""Tests for the generated batch CRUD tools' shared runtime and service modules."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from sdrbot_cli.services.batch import (
+    ChunkResult,
+    expand_dotted,
+    load_batch_records,
+    parse_ids,
+    run_batches,
+)
+
+
+class TestInputs:
+    def test_load_records_from_json_and_file(self, tmp_path):
+        assert load_batch_records('{"email": "a@b.com"}') == [{"email": "a@b.com"}]
+
+        csv_path = tmp_path / "leads.csv"
+        csv_path.write_text("email,phone\na@b.com,\nc@d.com,555\n")
+        # Blank cells are dropped so they don't clear CRM fields
+        assert load_batch_records(str(csv_path)) == [
+            {"email": "a@b.com"},
+            {"email": "c@d.com", "phone": "555"},
+        ]
+
+        with pytest.raises(ValueError, match="existing file path"):
+            load_batch_records("missing.csv")
+
+    def test_parse_ids(self, tmp_path):
+        assert parse_ids('["1", 2]') == ["1", "2"]
+        assert parse_ids("1, 2,\n3") == ["1", "2", "3"]
+
+        ids_path = tmp_path / "ids.csv"
+        ids_path.write_text("id,name\n10,a\n11,b\n")
+        assert parse_ids(str(ids_path)) == ["10", "11"]
+
+    def test_expand_dotted(self):
+        assert expand_dotted({"name.firstName": "Ada", "name.lastName": "L", "city": "X"}) == {
+            "name": {"firstName": "Ada", "lastName": "L"},
+            "city": "X",
+        }
+
+
+class TestRunBatches:
+    def test_chunks_and_reports_row_numbers(self):
+        sizes = []
+
+        def send(chunk):
+            sizes.append(len(chunk))
+            result = ChunkResult(ids=[r["n"] for r in chunk if r["n"] != "4"])
+            result.errors = [(i, "bad email") for i, r in enumerate(chunk) if r["n"] == "4"]
+            return result
+
+        records = [{"n": str(i)} for i in range(1, 8)]
+        result = run_batches("update", "contacts", records, 3, send)
+
+        assert sizes == [3, 3, 1]
+        assert result.requests == 3
+        assert result.succeeded == 6
+        assert result.errors == [(4, "bad email")]
+        summary = result.summary()
+        assert summary.startswith("Updated 6 of 7 contacts in 3 requests.")
+        assert "- row 4: bad email" in summary
+
+    def test_failed_request_does_not_stop_other_chunks(self):
+        def send(chunk):
+            if chunk[0] == "c":
+                raise RuntimeError("502 Bad Gateway")
+            return ChunkResult(ids=list(chunk))
+
+        result = run_batches("delete", "deals", list("abcd"), 2, send)
+
+        assert result.ids == ["a", "b"]
+        assert result.errors == [(None, "rows 3-4: 502 Bad Gateway")]
+        assert result.failed == 2
+
+    def test_ids_are_matched_to_input_rows(self):
+        def send(chunk):
+            if chunk == ["c", "d"]:
+                # Partial failure without positions: rows can't be inferred
+                return ChunkResult(ids=["id-c"], errors=[(None, "one failed")])
+            if chunk == ["e"]:
+                return ChunkResult(ids=["id-e"], positions=[0])
+            return ChunkResult(ids=[f"id-{r}" for r in chunk])
+
+        result = run_batches("create", "deals", list("abcde"), 2, send)
+
+        assert result.ids == ["id-a", "id-b", "id-c", "id-e"]
+        assert result.rows == [1, 2, None, 5]
+
+
+class TestServiceBatches:
+    def test_hubspot_update_maps_errors_to_rows(self):
+        from sdrbot_cli.services.hubspot.batch import batch_update
+
+        hs = MagicMock()
+        hs.crm.objects.batch_api.update.return_value = SimpleNamespace(
+            results=[SimpleNamespace(id="101")],
+            errors=[SimpleNamespace(message="Property does not exist", context={"ids": ["102"]})],
+        )
+        records = json.dumps(
+            [{"id": "101", "firstname": "A"}, {"id": "102", "bogus": "x"}, {"firstname": "C"}]
+        )
+
+        result = batch_update(hs, "contacts", records)
+
+        batch_input = hs.crm.objects.batch_api.update.call_args.kwargs[
+            "batch_input_simple_public_object_batch_input"
+        ]
+        assert [i.id for i in batch_input.inputs] == ["101", "102"]
+        assert result.ids == ["101"]
+        assert sorted(result.errors) == [(2, "Property does not exist"), (3, "missing 'id'")]
+
+    def test_zohocrm_create_sends_100_per_request(self):
+        from sdrbot_cli.services.zohocrm.batch import batch_create
+
+        zoho = MagicMock()
+        zoho.post.side_effect = lambda endpoint, json: {
+            "data": [
+                {"status": "success", "details": {"id": r["Last_Name"]}}
+                if r["Last_Name"] != "bad"
+                else {
+                    "status": "error",
+                    "message": "invalid data",
+                    "details": {"api_name": "Email"},
+                }
+                for r in json["data"]
+            ]
+        }
+        records = [{"Last_Name": f"n{i}"} for i in range(149)] + [{"Last_Name": "bad"}]
+
+        result = batch_create(zoho, "Leads", records)
+
+        assert zoho.post.call_count == 2
+        assert result.succeeded == 149
+        assert result.errors == [(150, "invalid data (Email)")]
+
+    def test_salesforce_create_uses_sobject_collections(self):
+        from sdrbot_cli.services.salesforce.batch import batch_create
+
+        sf = MagicMock()
+        sf.restful.return_value = [
+            {"id": "00Q1", "success": True, "errors": []},
+            {"success": False, "errors": [{"message": "Required fields are missing: [LastName]"}]},
+        ]
+
+        result = batch_create(sf, "Lead", '[{"LastName": "A"}, {"Company": "B"}]')
+
+        args, kwargs = sf.restful.call_args
+        assert args == ("composite/sobjects",)
+        assert kwargs["json"]["allOrNone"] is False
+        assert kwargs["json"]["records"][0]["attributes"] == {"type": "Lead"}
+        assert result.ids == ["00Q1"]
+        assert result.errors == [(2, "Required fields are missing: [LastName]")]
+
+    def test_attio_upsert_asserts_each_record(self):
+        from sdrbot_cli.services.attio.batch import batch_upsert
+
+        client = MagicMock()
+        client.request.return_value = {"data": {"id": {"record_id": "r1"}}}
+
+        result = batch_upsert(
+            client, "people", '[{"email_addresses": "a@b.com"}, {}]', "email_addresses"
+        )
+
+        client.request.assert_called_once_with(
+            "PUT",
+            "/objects/people/records",
+            params={"matching_attribute": "email_addresses"},
+            json={"data": {"values": {"email_addresses": "a@b.com"}}},
+        )
+        assert result.ids == ["r1"]
+        assert result.errors == [(2, "missing 'email_addresses'")]
+
+    def test_large_get_spills_records_to_file(self, tmp_path, monkeypatch):
+        from sdrbot_cli.services.salesforce.batch import batch_get
+
+        monkeypatch.chdir(tmp_path)
+        sf = MagicMock()
+        sf.restful.side_effect = lambda endpoint, method, json: [
+            {"attributes": {"type": "Lead"}, "Id": record_id, "LastName": f"L{record_id}"}
+            for record_id in json["ids"]
+        ]
+
+        summary = batch_get(sf, "Lead", [f"00Q{i}" for i in range(60)], ["LastName"]).summary()
+
+        (spilled,) = (tmp_path / "files" / "salesforce").glob("Lead_*.json")
+        assert summary.startswith("Fetched 60 of 60 Lead in 1 request.")
+        assert f"all 60 saved to {spilled}" in summary
+        assert "00Q59" not in summary
+        assert len(json.loads(spilled.read_text())) == 60
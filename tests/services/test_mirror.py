@@ -0,0 +1,296 @@
+"""Tests for the local CRM mirror."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import ToolMessage
+
+from sdrbot_cli.services import mirror as mirror_module
+from sdrbot_cli.services.mirror import (
+    CrmMirror,
+    MirrorInvalidationMiddleware,
+    MirrorRecord,
+    ensure_fresh,
+    sync_object,
+    to_utc_iso,
+)
+
+
+class FakeSource:
+    """In-memory CRM: records keyed by id, with modification timestamps."""
+
+    DEFAULT_OBJECTS = ("companies",)
+
+    def __init__(self, delta=True):
+        self.records = {}
+        self.deleted = []
+        self.delta = delta
+        self.calls = []
+
+    def get_client(self):
+        return object()
+
+    def supports_delta(self, object_name):
+        return self.delta
+
+    def fetch_records(self, client, object_name, since):
+        self.calls.append(since)
+        for record_id, (data, modified_at) in self.records.items():
+            if since is None or modified_at >= since:
+                yield MirrorRecord(record_id, {"id": record_id, **data}, modified_at)
+        if since is not None:
+            for record_id in self.deleted:
+                yield MirrorRecord(record_id, {}, deleted=True)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CrmMirror(tmp_path / "mirror.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    source = FakeSource()
+    monkeypatch.setattr(mirror_module, "get_source", lambda service: source)
+    return source
+
+
+def test_to_utc_iso_normalizes_crm_timestamps():
+    assert to_utc_iso("2024-05-01T10:00:00+02:00") == "2024-05-01T08:00:00Z"
+    assert to_utc_iso("2024-05-01T08:00:00.123Z") == "2024-05-01T08:00:00Z"
+    assert to_utc_iso("2024-05-01 08:00:00") == "2024-05-01T08:00:00Z"
+    assert to_utc_iso(1714550400000) == "2024-05-01T08:00:00Z"
+    assert to_utc_iso("") is None
+    assert to_utc_iso("not a date") is None
+
+
+def test_backfill_then_delta_sync(store, source):
+    source.records = {
+        "1": ({"name": "Acme", "address": {"city": "Paris"}}, "2024-01-01T00:00:00Z"),
+        "2": ({"name": "Globex", "address": {"city": "Berlin"}}, "2024-01-02T00:00:00Z"),
+    }
+    first = sync_object("hubspot", "companies", mirror=store)
+    assert (first.mode, first.upserted, first.total) == ("full", 2, 2)
+
+    cursor = store.state("hubspot", "companies").cursor
+
+    source.records["2"] = ({"name": "Globex Corp"}, "9999-01-01T00:00:00Z")
+    source.deleted = ["1"]
+    second = sync_object("hubspot", "companies", mirror=store)
+
+    assert source.calls == [None, cursor]
+    assert (second.mode, second.upserted, second.deleted, second.total) == ("delta", 1, 1, 1)
+    assert store.get("hubspot", "companies", "2")["name"] == "Globex Corp"
+
+
+def test_delta_cursor_follows_sync_time_not_records(monkeypatch, store, source):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(mirror_module.time, "time", lambda: now[0])
+    source.records = {"1": ({"name": "Acme"}, "2020-01-01T00:00:00Z")}
+    sync_object("salesforce", "Account", mirror=store)
+
+    now[0] += 86400
+    sync_object("salesforce", "Account", mirror=store)
+
+    # A quiet object still moves its cursor (and Salesforce's deletion window) forward
+    assert source.calls == [None, "2023-11-14T22:08:20Z"]
+    assert store.state("salesforce", "Account").cursor == "2023-11-15T22:08:20Z"
+
+
+def test_stale_cursor_falls_back_to_full_sync(monkeypatch, store, source):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(mirror_module.time, "time", lambda: now[0])
+    source.MAX_DELTA_DAYS = 29
+    source.records = {"1": ({"name": "Acme"}, "2020-01-01T00:00:00Z")}
+    sync_object("salesforce", "Account", mirror=store)
+
+    now[0] += 28 * 86400
+    assert sync_object("salesforce", "Account", mirror=store).mode == "delta"
+    now[0] += 30 * 86400
+    del source.records["1"]
+    result = sync_object("salesforce", "Account", mirror=store)
+
+    assert (result.mode, result.deleted, source.calls[-1]) == ("full", 1, None)
+
+
+def test_sources_without_deletions_resync_in_full_periodically(monkeypatch, store, source):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(mirror_module.time, "time", lambda: now[0])
+    source.FULL_SYNC_DAYS = 7
+    source.records = {"1": ({"name": "Acme"}, "2020-01-01T00:00:00Z")}
+    sync_object("hubspot", "companies", mirror=store)
+
+    modes = []
+    for _ in range(8):
+        now[0] += 86400
+        modes.append(sync_object("hubspot", "companies", mirror=store).mode)
+
+    assert modes == ["delta"] * 7 + ["full"]
+
+
+def test_failed_fetch_writes_nothing(store, source):
+    source.records = {"1": ({"name": "Acme"}, "2024-01-01T00:00:00Z")}
+    sync_object("hubspot", "companies", mirror=store)
+    before = store.state("hubspot", "companies")
+
+    def failing_fetch(client, object_name, since):
+        yield MirrorRecord("2", {"id": "2", "name": "Globex"}, "2024-01-02T00:00:00Z")
+        raise RuntimeError("INVALID_REPLICATION_DATE")
+
+    source.fetch_records = failing_fetch
+    with pytest.raises(RuntimeError):
+        sync_object("hubspot", "companies", mirror=store)
+    store.set_state("hubspot", "other", None)  # Commits on the shared connection
+
+    assert store.get("hubspot", "companies", "2") is None
+    assert store.state("hubspot", "companies") == before
+
+
+def test_full_sync_prunes_records_missing_from_crm(store, source):
+    source.delta = False
+    source.records = {"1": ({"name": "Acme"}, None), "2": ({"name": "Globex"}, None)}
+    sync_object("attio", "companies", mirror=store)
+
+    del source.records["1"]
+    result = sync_object("attio", "companies", mirror=store)
+
+    assert result.deleted == 1
+    assert store.get("attio", "companies", "1") is None
+
+
+def test_view_exposes_nested_fields_for_sql(store, source):
+    source.records = {
+        "1": ({"name": "Acme", "address": {"city": "Paris"}}, "2024-01-01T00:00:00Z"),
+        "2": ({"name": "Initech", "address": {"city": "Paris"}}, "2024-01-01T00:00:00Z"),
+        "3": ({"name": "Globex", "address": {"city": "Berlin"}}, "2024-01-01T00:00:00Z"),
+    }
+    sync_object("twenty", "companies", mirror=store)
+
+    columns, rows = store.query(
+        'SELECT "address.city", COUNT(*) AS n FROM twenty_companies '
+        'GROUP BY "address.city" ORDER BY n DESC'
+    )
+
+    assert columns == ["address.city", "n"]
+    assert rows == [("Paris", 2), ("Berlin", 1)]
+
+
+def test_query_is_read_only(store, source):
+    source.records = {"1": ({"name": "Acme"}, "2024-01-01T00:00:00Z")}
+    sync_object("hubspot", "companies", mirror=store)
+
+    with pytest.raises(Exception, match="readonly|read-only"):
+        store.query("DELETE FROM records")
+    assert store.count("hubspot", "companies") == 1
+
+
+def test_queued_events_are_replayed_before_sync(store, source):
+    sync_object("hubspot", "companies", mirror=store)
+    store.enqueue("hubspot", "companies", "9", {"id": "9", "name": "Hooli"})
+
+    result = sync_object("hubspot", "companies", mirror=store)
+
+    assert result.replayed == 1
+    assert store.get("hubspot", "companies", "9")["name"] == "Hooli"
+
+
+def test_ensure_fresh_respects_staleness_and_dirty_flag(store, source):
+    sync_object("hubspot", "companies", mirror=store)
+    assert ensure_fresh("hubspot", "companies", 60, mirror=store) is None
+
+    store.mark_dirty("hubspot")
+    assert ensure_fresh("hubspot", "companies", 60, mirror=store) is not None
+    assert not store.state("hubspot", "companies").dirty
+    assert ensure_fresh("hubspot", "companies", 0, mirror=store) is not None
+
+
+def test_write_tools_mark_mirror_dirty(monkeypatch, store, source):
+    sync_object("hubspot", "companies", mirror=store)
+    monkeypatch.setattr(mirror_module, "get_mirror", lambda: store)
+    middleware = MirrorInvalidationMiddleware(exists=lambda: True)
+
+    def run(name, status="success"):
+        request = SimpleNamespace(tool_call={"name": name, "id": "call_1", "args": {}})
+        message = ToolMessage(content="ok", tool_call_id="call_1", status=status)
+        middleware.wrap_tool_call(request, lambda r: message)
+        return store.state("hubspot", "companies").dirty
+
+    assert run("hubspot_search_companies") is False
+    assert run("hubspot_update_company", status="error") is False
+    assert run("hubspot_batch_update_companies") is True
+
+
+def test_write_tools_never_create_a_mirror(monkeypatch):
+    middleware = MirrorInvalidationMiddleware(exists=lambda: False)
+    get_mirror = MagicMock()
+    monkeypatch.setattr(mirror_module, "get_mirror", get_mirror)
+    request = SimpleNamespace(tool_call={"name": "hubspot_create_contact", "id": "c", "args": {}})
+
+    middleware.wrap_tool_call(request, lambda r: ToolMessage(content="ok", tool_call_id="c"))
+
+    get_mirror.assert_not_called()
+
+
+def test_pipedrive_delta_uses_recents_and_reports_deletions():
+    from sdrbot_cli.services.pipedrive import mirror as pipedrive_mirror
+
+    client = MagicMock()
+    client.get.return_value = {
+        "data": [
+            {"item": "person", "id": 1, "data": {"id": 1, "update_time": "2024-03-01 10:00:00"}},
+            {"item": "person", "id": 2, "data": {"id": 2, "active_flag": False}},
+        ]
+    }
+
+    records = list(pipedrive_mirror.fetch_records(client, "persons", "2024-03-01T09:00:00Z"))
+
+    endpoint = client.get.call_args.args[0]
+    params = client.get.call_args.kwargs["params"]
+    assert endpoint == "/recents"
+    assert params["since_timestamp"] == "2024-03-01 09:00:00"
+    assert params["items"] == "person"
+    assert [(r.id, r.deleted, r.modified_at) for r in records] == [
+        ("1", False, "2024-03-01T10:00:00Z"),
+        ("2", True, None),
+    ]
+
+
+def test_twenty_delta_filters_on_updated_at():
+    from sdrbot_cli.services.twenty import mirror as twenty_mirror
+
+    client = MagicMock()
+    client.get.return_value = {
+        "data": {"people": [{"id": "a", "updatedAt": "2024-03-01T10:00:00.000Z"}]},
+        "pageInfo": {"hasNextPage": False},
+    }
+
+    records = list(twenty_mirror.fetch_records(client, "people", "2024-03-01T09:00:00Z"))
+
+    params = client.get.call_args.kwargs["params"]
+    assert params["filter"] == 'updatedAt[gte]:"2024-03-01T09:00:00Z"'
+    assert [(r.id, r.modified_at) for r in records] == [("a", "2024-03-01T10:00:00Z")]
+
+
+def test_attio_values_are_simplified():
+    from sdrbot_cli.services.attio import mirror as attio_mirror
+
+    client = MagicMock()
+    client.request.return_value = {
+        "data": [
+            {
+                "id": {"record_id": "r1"},
+                "values": {
+                    "name": [{"value": "Acme", "attribute_type": "text", "active_from": "x"}],
+                    "domains": [{"domain": "acme.com"}, {"domain": "acme.io"}],
+                    "empty": [],
+                },
+            }
+        ]
+    }
+
+    (record,) = attio_mirror.fetch_records(client, "companies", None)
+
+    assert record.data == {"id": "r1", "name": "Acme", "domains": ["acme.com", "acme.io"]}
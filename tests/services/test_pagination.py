@@ -0,0 +1,57 @@
+"""Tests for the shared search pagination helpers."""
+
+import asyncio
+
+from sdrbot_cli.services import pagination
+
+
+def _pages(total, page_size_seen):
+    """A fake provider with ``total`` records behind an offset cursor."""
+
+    def fetch_page(cursor, page_size):
+        page_size_seen.append(page_size)
+        start = cursor or 0
+        records = [{"n": n} for n in range(start, min(start + page_size, total))]
+        return records, start + page_size if start + page_size < total else None
+
+    return fetch_page
+
+
+class TestPaginate:
+    def test_follows_cursor_until_max_records(self):
+        sizes = []
+
+        records = pagination.collect(_pages(1000, sizes), 250, 100)
+
+        assert [r["n"] for r in records] == list(range(250))
+        # The last request only asks for what is still needed
+        assert sizes == [100, 100, 50]
+
+    def test_stops_when_results_run_out(self):
+        sizes = []
+
+        records = pagination.collect(_pages(120, sizes), 500, 100)
+
+        assert len(records) == 120
+        assert sizes == [100, 100]
+
+    def test_truncates_oversized_pages(self):
+        # Some providers ignore the requested page size
+        def fetch_page(cursor, page_size):
+            return [{"n": n} for n in range(2000)], "next"
+
+        assert len(pagination.collect(fetch_page, 10, 2000)) == 10
+
+
+class TestAsyncCollect:
+    def test_awaits_pages_until_max_records(self):
+        sizes = []
+        fetch = _pages(1000, sizes)
+
+        async def fetch_page(cursor, page_size):
+            return fetch(cursor, page_size)
+
+        records = asyncio.run(pagination.acollect(fetch_page, 250, 100))
+
+        assert [r["n"] for r in records] == list(range(250))
+        assert sizes == [100, 100, 50]
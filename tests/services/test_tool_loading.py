@@ -143,7 +143,7 @@ class TestToolLoadingWithConfig:
         tool_names = [t.name for t in tools]
 
         hunter_tools = [n for n in tool_names if n.startswith("hunter_")]
-        assert len(hunter_tools) == 3, f"Expected 3 Hunter tools, got {hunter_tools}"
+        assert len(hunter_tools) == 5, f"Expected 5 Hunter tools, got {hunter_tools}"
 
 
 class TestToolNaming:
@@ -1,8 +1,10 @@
 """Tests for Twenty schema sync."""
 
+import asyncio
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -168,11 +170,124 @@ class TestTwentySyncUnit:
         assert "twenty_search_people" in code
         assert "twenty_get_person" in code
         assert "twenty_delete_person" in code
+        assert "twenty_batch_create_person" in code
+        assert "twenty_batch_update_person" in code
+        assert "twenty_batch_delete_person" in code
 
         # Verify return docstrings include field info
         assert "- id: Record identifier" in code
         assert "- email: Email" in code
 
+    def test_generated_search_follows_cursor(self):
+        """Generated search tools should page through results up to max_records."""
+        from sdrbot_cli.services.twenty.sync import _generate_tools_code
+
+        fields = [{"name": "city", "label": "City", "type": "TEXT", "options": []}]
+        code = _generate_tools_code(
+            {
+                "person": {
+                    "name_singular": "person",
+                    "name_plural": "people",
+                    "fields": fields,
+                    "output_fields": fields,
+                }
+            }
+        )
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+
+        client = MagicMock()
+        client.aget = AsyncMock(
+            side_effect=[
+                {
+                    "data": {"people": [{"id": "1"}, {"id": "2"}]},
+                    "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                    "totalCount": 5,
+                },
+                {
+                    "data": {"people": [{"id": "3"}]},
+                    "pageInfo": {"hasNextPage": True, "endCursor": "c2"},
+                    "totalCount": 5,
+                },
+            ]
+        )
+        namespace["_twenty_client"] = client
+
+        search = namespace["twenty_search_people"]
+        result = asyncio.run(search.ainvoke({"city": "Oslo", "max_records": 3}))
+
+        first, second = (c.kwargs["params"] for c in client.aget.call_args_list)
+        assert first == {"filter": 'city[ilike]:"%Oslo%"', "limit": 3}
+        assert second == {"filter": 'city[ilike]:"%Oslo%"', "limit": 1, "starting_after": "c1"}
+        assert result.startswith("Found 3 people (of 5 matching")
+
+    def test_generated_tools_run_concurrently(self):
+        """Generated tools are async, so parallel calls share the event loop."""
+        from sdrbot_cli.services.twenty.sync import _generate_tools_code
+
+        code = _generate_tools_code(
+            {
+                "person": {
+                    "name_singular": "person",
+                    "name_plural": "people",
+                    "fields": [],
+                    "output_fields": [],
+                }
+            }
+        )
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+        in_flight = []
+
+        async def slow_get(endpoint, **kwargs):
+            in_flight.append(endpoint)
+            await asyncio.sleep(0.05)
+            return {"id": endpoint.rsplit("/", 1)[-1], "city": "Oslo"}
+
+        client = MagicMock()
+        client.aget = slow_get
+        namespace["_twenty_client"] = client
+        get_person = namespace["twenty_get_person"]
+
+        async def run_parallel():
+            calls = [get_person.ainvoke({"person_id": str(i)}) for i in range(5)]
+            return await asyncio.wait_for(asyncio.gather(*calls), timeout=0.2)
+
+        results = asyncio.run(run_parallel())
+
+        assert get_person.coroutine is not None
+        assert len(in_flight) == 5
+        assert all("city: Oslo" in r for r in results)
+
+    def test_generated_tools_create_the_client_off_the_event_loop(self):
+        """Client setup may block on auth, so async tools run it in a worker thread."""
+        from sdrbot_cli.services.twenty.sync import _generate_tools_code
+
+        code = _generate_tools_code(
+            {
+                "person": {
+                    "name_singular": "person",
+                    "name_plural": "people",
+                    "fields": [],
+                    "output_fields": [],
+                }
+            }
+        )
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+        client = MagicMock()
+        client.aget = AsyncMock(return_value={"id": "1"})
+        threads = []
+
+        def get_twenty():
+            threads.append(threading.current_thread())
+            return client
+
+        namespace["_get_twenty"] = get_twenty
+        asyncio.run(namespace["twenty_get_person"].ainvoke({"person_id": "1"}))
+
+        assert threads and threads[0] is not threading.main_thread()
+
     def test_generate_tools_code_multiple_objects(self):
         """_generate_tools_code should handle multiple objects."""
         from sdrbot_cli.services.twenty.sync import _generate_tools_code
@@ -0,0 +1,105 @@
+"""Tests for the component cache behind incremental agent reloads."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sdrbot_cli import token_counting
+from sdrbot_cli.agent_cache import ComponentCache
+from sdrbot_cli.mcp import manager as mcp_manager
+from sdrbot_cli.mcp.client import MCPServerConnection
+from sdrbot_cli.mcp.manager import MCPManager
+from sdrbot_cli.services import get_enabled_tools
+from sdrbot_cli.services.registry import ServiceConfig, clear_config_cache
+
+GENERATED_TOOL = '''
+from langchain_core.tools import tool
+
+
+@tool
+def twenty_search_person(query: str) -> str:
+    """Search people."""
+    return query
+'''
+
+
+def test_component_rebuilt_only_when_key_changes():
+    cache = ComponentCache()
+    builds = []
+
+    def build(value):
+        return lambda: builds.append(value) or value
+
+    assert cache.get("tools", 1, build("a")) == "a"
+    assert cache.get("tools", 1, build("b")) == "a"
+    assert cache.get("tools", 2, build("c")) == "c"
+    assert builds == ["a", "c"]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Extra variants survive a toggle back to an earlier key
+    for key in (1, 2, 3, 1, 2):
+        cache.get("agent", key, build(key), variants=3)
+    assert builds == ["a", "c", 1, 2, 3]
+
+
+@pytest.fixture
+def twenty_enabled(tmp_path):
+    config_path = tmp_path / ".sdrbot" / "services.json"
+    config = ServiceConfig()
+    config.enable("twenty")
+    config.save(config_path)
+
+    with (
+        patch("sdrbot_cli.services.registry.get_config_path", return_value=config_path),
+        patch("sdrbot_cli.config.settings.get_generated_dir", return_value=tmp_path),
+    ):
+        clear_config_cache()
+        yield tmp_path
+    clear_config_cache()
+
+
+def test_service_tools_reloaded_when_generated_file_changes(twenty_enabled):
+    first = get_enabled_tools()
+    assert all(a is b for a, b in zip(get_enabled_tools(), first, strict=True))
+
+    (twenty_enabled / "twenty_tools.py").write_text(GENERATED_TOOL)
+    names = [t.name for t in get_enabled_tools()]
+
+    assert "twenty_search_person" in names
+    assert len(names) == len(first) + 1
+
+
+def test_tool_tokens_counted_once_per_tool(twenty_enabled, monkeypatch):
+    counted = []
+    monkeypatch.setattr(token_counting, "_count_one_tool", lambda t: counted.append(t) or 10)
+    monkeypatch.setattr(token_counting, "_tool_token_counts", {})
+    tools = get_enabled_tools()
+
+    assert token_counting.count_tool_tokens(None, tools) == 10 * len(tools)
+    assert token_counting.count_tool_tokens(None, tools) == 10 * len(tools)
+    assert len(counted) == len(tools)
+
+
+def test_mcp_reload_reconnects_only_changed_servers(monkeypatch):
+    def server(command, tool_count=0):
+        return {"command": command, "enabled": True, "tool_count": tool_count}
+
+    unchanged = MCPServerConnection(name="a", config=server("run-a"))
+    changed = MCPServerConnection(name="b", config=server("run-b"))
+    manager = MCPManager(connections={"a": unchanged, "b": changed})
+
+    config = {"servers": {"a": server("run-a", 5), "b": server("run-b --v2"), "c": server("c")}}
+    monkeypatch.setattr(mcp_manager, "MCP_AVAILABLE", True)
+    monkeypatch.setattr(mcp_manager, "load_mcp_config", lambda: config)
+    monkeypatch.setattr(mcp_manager, "update_server_tool_count", lambda name, count: None)
+    monkeypatch.setattr(MCPServerConnection, "connect", AsyncMock(return_value=True))
+    monkeypatch.setattr(MCPServerConnection, "disconnect", AsyncMock())
+
+    connected, failed = asyncio.run(manager.sync_enabled_servers())
+
+    assert (connected, failed) == (2, [])
+    assert manager.connections["a"] is unchanged
+    assert manager.connections["b"] is not changed
+    assert manager.connections["b"].config["command"] == "run-b --v2"
+    assert set(manager.connections) == {"a", "b", "c"}
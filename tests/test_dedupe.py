@@ -0,0 +1,168 @@
+"""Tests for the dedupe / entity resolution engine."""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+
+from sdrbot_cli.dedupe import find_duplicates, match_records, run_dedupe
+from sdrbot_cli.dedupe.normalize import (
+    KIND_COMPANY,
+    KIND_PERSON,
+    detect_kind,
+    normalize_company,
+    normalize_domain,
+    normalize_email,
+    normalize_entity,
+    normalize_phone,
+)
+
+
+class TestNormalize:
+    def test_email(self):
+        assert normalize_email(" John.Doe+crm@GoogleMail.com ") == "johndoe@gmail.com"
+        assert normalize_email("jane+x@acme.com") == "jane@acme.com"
+        assert normalize_email("not-an-email") == ""
+
+    def test_domain(self):
+        assert normalize_domain("https://www.Acme.com/about?x=1") == "acme.com"
+        assert normalize_domain("acme.io:8080") == "acme.io"
+        assert normalize_domain("Acme Inc") == ""
+
+    def test_phone(self):
+        assert normalize_phone("+1 (415) 555-0100") == "4155550100"
+        assert normalize_phone("415.555.0100 x23") == "4155550100"
+        assert normalize_phone("123") == ""
+
+    def test_company(self):
+        assert normalize_company("ACME, Inc.") == "acme"
+        assert normalize_company("Müller & Söhne GmbH") == "muller and sohne"
+        assert normalize_company("The Company") == "the company"
+
+    def test_entity_from_crm_export_shapes(self):
+        twenty = {
+            "id": "p1",
+            "name": {"firstName": "Ana", "lastName": "Gómez"},
+            "emails": {"primaryEmail": "Ana@Acme.com"},
+        }
+        entity = normalize_entity(0, twenty, KIND_PERSON)
+        assert (entity.id, entity.first_name, entity.last_name) == ("p1", "ana", "gomez")
+        assert (entity.email, entity.domain) == ("ana@acme.com", "acme.com")
+
+        salesforce = {"Id": "001", "Name": "Acme Corp", "Website": "http://acme.com"}
+        entity = normalize_entity(0, salesforce, KIND_COMPANY)
+        assert (entity.id, entity.company, entity.domain) == ("001", "acme", "acme.com")
+
+    def test_free_mail_domain_is_not_a_company_domain(self):
+        entity = normalize_entity(0, {"email": "bob@gmail.com"}, KIND_PERSON)
+        assert entity.domain == ""
+
+    def test_detect_kind(self):
+        assert detect_kind([{"Email": "a@b.com", "First Name": "A"}]) == KIND_PERSON
+        assert detect_kind([{"name": "Acme", "domain": "acme.com"}]) == KIND_COMPANY
+
+
+class TestFindDuplicates:
+    def test_exact_and_fuzzy_people(self):
+        records = [
+            {"id": "1", "first_name": "Jonathan", "last_name": "Smith", "email": "jon@acme.com"},
+            {"id": "2", "first_name": "Jon", "last_name": "Smith", "email": "JON+x@acme.com"},
+            {"id": "3", "first_name": "Jonathon", "last_name": "Smith", "company": "Acme Inc"},
+            {"id": "4", "first_name": "Jane", "last_name": "Doe", "email": "jane@other.com"},
+        ]
+        records[2]["email"] = ""
+        records[2]["website"] = "acme.com"
+
+        clusters = find_duplicates(records, threshold=0.8)
+
+        assert len(clusters) == 1
+        ids = {clusters[0].survivor.id, *(m.right.id for m in clusters[0].duplicates)}
+        assert ids == {"1", "2", "3"}
+        reasons = {m.right.id: m.reason for m in clusters[0].duplicates}
+        assert any(r == "same email" for r in reasons.values())
+
+    def test_companies_by_domain_and_name(self):
+        records = [
+            {"id": "a", "name": "Acme Inc", "domain": "acme.com", "phone": "", "industry": "SaaS"},
+            {"id": "b", "name": "ACME", "website": "https://www.acme.com"},
+            {"id": "c", "name": "Acme Incorporated"},
+            {"id": "d", "name": "Globex", "domain": "globex.com"},
+        ]
+
+        (cluster,) = find_duplicates(records, kind="company")
+
+        assert cluster.survivor.id == "a"  # most complete
+        assert {m.right.id for m in cluster.duplicates} == {"b", "c"}
+
+    def test_different_domains_block_fuzzy_company_match(self):
+        records = [
+            {"name": "Acme Labs", "domain": "acmelabs.com"},
+            {"name": "Acme Lab", "domain": "acme-lab.de"},
+        ]
+        assert find_duplicates(records, kind="company") == []
+
+    def test_survivor_fills_from_duplicates(self):
+        records = [
+            {"id": "1", "email": "a@x.com", "first_name": "A", "last_name": "B", "title": "CEO"},
+            {"id": "2", "email": "a@x.com", "phone": "555-111-2222"},
+        ]
+        (cluster,) = find_duplicates(records)
+        assert cluster.survivor.id == "1"
+        assert cluster.fills() == {"phone": {"value": "555-111-2222", "from": "2"}}
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError, match="Unknown entity kind"):
+            find_duplicates([{"name": "x"}], kind="deal")
+
+
+class TestMatchRecords:
+    def test_best_match_per_left_record(self):
+        source = [
+            {"id": "s1", "name": "Acme Corporation"},
+            {"id": "s2", "name": "Initech", "website": "initech.com"},
+            {"id": "s3", "name": "Umbrella"},
+        ]
+        target = [
+            {"id": "t1", "name": "ACME Corp."},
+            {"id": "t2", "name": "Initech LLC", "domain": "initech.com"},
+        ]
+
+        results = [
+            (e.id, m.right.id if m else None) for e, m in match_records(source, target, "company")
+        ]
+
+        assert results == [("s1", "t1"), ("s2", "t2"), ("s3", None)]
+
+
+class TestRunDedupe:
+    def test_writes_merge_plan(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "files").mkdir()
+        leads = tmp_path / "files" / "leads.json"
+        leads.write_text(
+            json.dumps(
+                [
+                    {"id": "1", "email": "a@x.com", "name": "Ann Lee"},
+                    {"id": "2", "email": "A@X.com", "name": "Ann Lee"},
+                    {"id": "3", "email": "b@y.com", "name": "Bo Kim"},
+                ]
+            )
+        )
+
+        summary = run_dedupe("leads.json")
+
+        assert "Found 1 duplicates in 1 clusters among 3 records" in summary
+        (plan_csv,) = (tmp_path / "files" / "dedupe").glob("leads_merge_plan_*.csv")
+        rows = list(csv.DictReader(plan_csv.open()))
+        assert [(r["action"], r["record_id"], r["survivor_id"]) for r in rows] == [
+            ("keep", "1", "1"),
+            ("merge", "2", "1"),
+        ]
+        plan = json.loads(plan_csv.with_suffix(".json").read_text())
+        assert plan[0]["duplicates"][0]["reason"] == "same email"
+
+    def test_missing_source(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert run_dedupe("nope_contacts").startswith("Error: 'nope_contacts' is neither")
@@ -0,0 +1,358 @@
+"""Tests for the batch enrichment engine."""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from sdrbot_cli.enrichment.batch import BatchJob, load_records, normalize_record
+from sdrbot_cli.enrichment.cache import (
+    CacheStats,
+    EnrichmentCache,
+    cached_lookup,
+    get_cache_stats,
+    make_cache_key,
+)
+from sdrbot_cli.enrichment.providers import EnrichmentOperation, get_operation
+
+
+def _write_csv(path: Path, rows: list[dict]) -> Path:
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _fake_operation(calls: list[list[dict]], fail_emails: set[str] | None = None):
+    fail_emails = fail_emails or set()
+
+    def call(chunk):
+        calls.append(chunk)
+        if any(r.get("email") in fail_emails for r in chunk):
+            raise RuntimeError("boom")
+        return [{"title": "CEO"} if not r["email"].startswith("nobody") else None for r in chunk]
+
+    return EnrichmentOperation(
+        key="fake.people",
+        provider="fake",
+        batch_size=2,
+        requires=(("email",),),
+        call=call,
+    )
+
+
+class TestNormalizeRecord:
+    def test_maps_aliases_case_insensitively(self):
+        rec = normalize_record(
+            {"Email Address": "Jane@Acme.com ", "First Name": "Jane", "Company": "Acme"}
+        )
+        assert rec == {
+            "email": "jane@acme.com",
+            "first_name": "Jane",
+            "organization_name": "Acme",
+            "domain": "acme.com",
+        }
+
+    def test_cleans_website_into_domain(self):
+        rec = normalize_record({"website": "https://www.Example.com/about"})
+        assert rec["domain"] == "example.com"
+
+    def test_ignores_unknown_and_empty_columns(self):
+        assert normalize_record({"notes": "x", "email": ""}) == {}
+
+
+class TestLoadRecords:
+    def test_json_wrapper_object(self, tmp_path):
+        p = tmp_path / "leads.json"
+        p.write_text(json.dumps({"records": [{"email": "a@b.com"}]}))
+        assert load_records(p) == [{"email": "a@b.com"}]
+
+    def test_jsonl(self, tmp_path):
+        p = tmp_path / "leads.jsonl"
+        p.write_text('{"email": "a@b.com"}\n\n{"email": "c@d.com"}\n')
+        assert len(load_records(p)) == 2
+
+    def test_unsupported_format(self, tmp_path):
+        p = tmp_path / "leads.txt"
+        p.write_text("a@b.com")
+        with pytest.raises(ValueError):
+            load_records(p)
+
+
+class TestBatchJob:
+    def test_chunks_skips_and_writes_output(self, tmp_path):
+        src = _write_csv(
+            tmp_path / "leads.csv",
+            [
+                {"Email": "a@acme.com", "Notes": "hot"},
+                {"Email": "nobody@acme.com", "Notes": ""},
+                {"Email": "", "Notes": "no email"},
+                {"Email": "c@acme.com", "Notes": ""},
+            ],
+        )
+        calls: list[list[dict]] = []
+        job = BatchJob(
+            _fake_operation(calls),
+            src,
+            progress_dir=tmp_path / "progress",
+            output_dir=tmp_path / "out",
+        )
+        result = job.run()
+
+        assert result.total == 4
+        assert result.enriched == 2
+        assert result.not_found == 1
+        assert result.skipped == 1
+        assert sum(len(c) for c in calls) == 3
+        assert all(len(c) <= 2 for c in calls)
+
+        with result.output_path.open() as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["Notes"] == "hot"
+        assert rows[0]["fake_status"] == "enriched"
+        assert rows[0]["fake_title"] == "CEO"
+        assert rows[2]["fake_status"] == "skipped"
+
+    def test_resume_retries_only_failed_records(self, tmp_path):
+        src = _write_csv(
+            tmp_path / "leads.csv",
+            [{"email": "a@acme.com"}, {"email": "b@acme.com"}, {"email": "bad@acme.com"}],
+        )
+        progress_dir = tmp_path / "progress"
+
+        first_calls: list[list[dict]] = []
+        op = _fake_operation(first_calls, fail_emails={"bad@acme.com"})
+        op.batch_size = 1
+        first = BatchJob(op, src, progress_dir=progress_dir, output_dir=tmp_path).run()
+        assert first.failed == 1
+        assert "retry" in first.summary()
+
+        second_calls: list[list[dict]] = []
+        op = _fake_operation(second_calls)
+        op.batch_size = 1
+        second = BatchJob(op, src, progress_dir=progress_dir, output_dir=tmp_path).run()
+
+        assert second.resumed == 2
+        assert second.failed == 0
+        assert second.enriched == 3
+        assert [c[0]["email"] for c in second_calls] == ["bad@acme.com"]
+
+    def test_job_id_depends_on_options(self, tmp_path):
+        src = _write_csv(tmp_path / "leads.csv", [{"email": "a@acme.com"}])
+        plain = BatchJob(get_operation("apollo.people"), src, progress_dir=tmp_path)
+        reveal = BatchJob(
+            get_operation("apollo.people", reveal_personal_emails=True), src, progress_dir=tmp_path
+        )
+        assert plain.job_id != reveal.job_id
+
+
+def test_unknown_operation():
+    with pytest.raises(ValueError, match="Unknown enrichment operation"):
+        get_operation("clearbit.people")
+
+
+class TestEnrichmentCache:
+    def test_key_normalizes_case_and_empty_values(self):
+        assert make_cache_key({"email": " Jane@Acme.com", "domain": None}) == make_cache_key(
+            {"email": "jane@acme.com"}
+        )
+
+    def test_positive_and_negative_ttl(self, tmp_path):
+        cache = EnrichmentCache(tmp_path / "c.db")
+        cache.set("apollo", "/people/match", {"email": "a@b.com"}, {"person": {"name": "A"}})
+        cache.set("apollo", "/people/match", {"email": "x@b.com"}, {"person": {}}, found=False)
+
+        hit = cache.get("apollo", "/people/match", {"email": "A@B.com"})
+        assert hit is not None and hit.found
+        assert hit.value == {"person": {"name": "A"}}
+
+        ten_days = time.time() + 10 * 86_400
+        assert cache.get("apollo", "/people/match", {"email": "a@b.com"}, now=ten_days)
+        assert cache.get("apollo", "/people/match", {"email": "x@b.com"}, now=ten_days) is None
+
+    def test_cached_lookup_counts_hits_and_skips_errors(self):
+        fetch = MagicMock(side_effect=[RuntimeError("down"), {"data": {"email": "a@b.com"}}])
+
+        with pytest.raises(RuntimeError):
+            cached_lookup("hunter", "/email-finder", {"domain": "b.com"}, fetch)
+        for _ in range(3):
+            result = cached_lookup("hunter", "/email-finder", {"domain": "b.com"}, fetch)
+
+        assert result == {"data": {"email": "a@b.com"}}
+        assert fetch.call_count == 2
+        stats = get_cache_stats()
+        assert stats.hits == 2
+        assert stats.misses == 2
+        assert stats.credits_saved == 2
+
+    def test_stats_record_is_thread_safe(self):
+        stats = CacheStats()
+
+        def work():
+            for _ in range(2000):
+                stats.record("hunter", hit=True)
+                stats.record("hunter", hit=False)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(8):
+                pool.submit(work)
+
+        assert stats.hits == stats.misses == 16000
+        assert stats.by_provider["hunter"] == {"hits": 16000, "misses": 16000}
+
+    def test_batch_job_only_sends_uncached_records(self, tmp_path):
+        src = _write_csv(tmp_path / "leads.csv", [{"email": "a@acme.com"}, {"email": "b@acme.com"}])
+        BatchJob(_fake_operation([]), src, progress_dir=tmp_path / "p1", output_dir=tmp_path).run()
+
+        src2 = _write_csv(
+            tmp_path / "more.csv",
+            [{"email": "b@acme.com"}, {"email": "c@acme.com"}, {"email": "a@acme.com"}],
+        )
+        calls: list[list[dict]] = []
+        result = BatchJob(
+            _fake_operation(calls), src2, progress_dir=tmp_path / "p2", output_dir=tmp_path
+        ).run()
+
+        assert result.cached == 2
+        assert result.enriched == 3
+        assert [r["email"] for c in calls for r in c] == ["c@acme.com"]
+
+
+class TestWaterfall:
+    @staticmethod
+    def _operations(calls: dict[str, list[str]]):
+        def person_op(key, answers):
+            def call(chunk):
+                calls.setdefault(key, []).extend(r.get("email") or r["name"] for r in chunk)
+                return [answers.get(r.get("email") or r["name"]) for r in chunk]
+
+            return EnrichmentOperation(
+                key=key,
+                provider=key.split(".")[0],
+                batch_size=10,
+                requires=(("email",), ("name", "domain")),
+                call=call,
+                provides=("email", "email_status", "phone", "title"),
+            )
+
+        def verifier_call(chunk):
+            calls.setdefault("hunter.email_verifier", []).extend(r["email"] for r in chunk)
+            return [{"email": r["email"], "email_status": "valid"} for r in chunk]
+
+        return {
+            "apollo.people": person_op(
+                "apollo.people",
+                {
+                    "Jane Doe": {
+                        "email": "jane@acme.com",
+                        "email_status": "guessed",
+                        "title": "VP",
+                    },
+                    "bob@acme.com": {"title": "CTO", "phone": "+1 555", "email_status": "verified"},
+                },
+            ),
+            "lusha.people": person_op(
+                "lusha.people",
+                {"jane@acme.com": {"phone": "+1 777", "title": "Director"}},
+            ),
+            "hunter.email_verifier": EnrichmentOperation(
+                key="hunter.email_verifier",
+                provider="hunter",
+                batch_size=1,
+                requires=(("email",),),
+                call=verifier_call,
+                provides=("email_status",),
+            ),
+        }
+
+    def test_parse_order(self):
+        from sdrbot_cli.enrichment.waterfall import parse_order
+
+        assert parse_order("apollo + lusha, verify") == [
+            ["apollo.people", "lusha.people"],
+            ["hunter.email_verifier"],
+        ]
+        assert parse_order("precision")[0] == ["lusha.people", "apollo.people"]
+        with pytest.raises(ValueError, match="Unknown enrichment operation"):
+            parse_order("apollo, clearbit")
+
+    def test_only_gaps_reach_later_stages(self, tmp_path, monkeypatch):
+        from sdrbot_cli.enrichment import waterfall
+
+        calls: dict[str, list[str]] = {}
+        operations = self._operations(calls)
+        monkeypatch.setattr(waterfall, "get_operation", lambda key: operations[key])
+
+        src = _write_csv(
+            tmp_path / "leads.csv",
+            [
+                {"name": "Jane Doe", "domain": "acme.com", "email": ""},
+                {"name": "", "domain": "", "email": "bob@acme.com"},
+            ],
+        )
+        job = waterfall.WaterfallJob(
+            src,
+            [["apollo.people"], ["hunter.email_verifier"], ["lusha.people"]],
+            output_dir=tmp_path / "out",
+        )
+        result = job.run()
+
+        # Bob was complete after Apollo; Jane's email came from Apollo and was then verified
+        assert calls["hunter.email_verifier"] == ["jane@acme.com"]
+        assert calls["lusha.people"] == ["jane@acme.com"]
+        assert result.complete == 2
+        assert result.fill_counts["verified_email"] == 2
+
+        with result.output_path.open() as f:
+            rows = list(csv.DictReader(f))
+        jane = rows[0]
+        assert jane["enriched_title"] == "VP"
+        assert jane["title_source"] == "apollo.people"
+        assert jane["enriched_email_status"] == "valid"
+        assert jane["email_status_source"] == "hunter.email_verifier"
+        assert jane["enriched_phone"] == "+1 777"
+        assert jane["phone_source"] == "lusha.people"
+        assert jane["waterfall_status"] == "complete"
+        assert rows[1]["email_source"] == "input"
+
+    def test_existing_email_is_verified_not_found_again(self, tmp_path, monkeypatch):
+        from sdrbot_cli.enrichment import waterfall
+
+        calls: dict[str, list[str]] = {}
+        operations = self._operations(calls)
+
+        def finder_call(chunk):
+            calls.setdefault("hunter.email_finder", []).extend(r["name"] for r in chunk)
+            return [{"email": "other@acme.com", "email_status": "valid"} for _ in chunk]
+
+        operations["hunter.email_finder"] = EnrichmentOperation(
+            key="hunter.email_finder",
+            provider="hunter",
+            batch_size=1,
+            requires=(("name", "domain"),),
+            call=finder_call,
+            provides=("email", "email_status"),
+        )
+        monkeypatch.setattr(waterfall, "get_operation", lambda key: operations[key])
+
+        src = _write_csv(
+            tmp_path / "leads.csv",
+            [{"name": "Jane Doe", "domain": "acme.com", "email": "jane@acme.com"}],
+        )
+        result = waterfall.WaterfallJob(
+            src,
+            [["hunter.email_finder"], ["hunter.email_verifier"]],
+            required=("verified_email",),
+            output_dir=tmp_path / "out",
+        ).run()
+
+        assert "hunter.email_finder" not in calls
+        assert calls["hunter.email_verifier"] == ["jane@acme.com"]
+        assert result.complete == 1
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import difflib
+import threading
 from pathlib import Path
 
+from sdrbot_cli import file_ops
 from sdrbot_cli.file_ops import (
     FileOpTracker,
     _safe_read,
     compute_unified_diff,
+    diff_contents,
 )
 
 # ---------------------------------------------------------------------------
@@ -102,3 +107,67 @@ def test_compute_unified_diff_max_lines() -> None:
     diff = compute_unified_diff(before, after, "test.txt", max_lines=10)
     assert diff is not None
     assert diff.endswith("...")
+
+
+def test_large_files_get_the_same_diff_with_exact_counts() -> None:
+    before = [f"line {i}" for i in range(3000)]
+    after = [*before[:10], "line ten", *before[11:2000], *before[2001:], "the end"]
+    assert len(before) + len(after) > file_ops.FAST_DIFF_LINES
+
+    result = diff_contents("\n".join(before), "\n".join(after), "big.txt", max_lines=None)
+
+    expected = difflib.unified_diff(
+        before, after, "big.txt (before)", "big.txt (after)", lineterm=""
+    )
+    assert result.diff == "\n".join(expected)
+    assert (result.added, result.removed) == (2, 2)
+    truncated = diff_contents("\n".join(before), "\n".join(after), "big.txt", max_lines=5)
+    assert truncated.diff.endswith("...")
+    assert (truncated.added, truncated.removed) == (2, 2)
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+
+def test_huge_files_are_not_snapshotted_or_diffed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(file_ops, "MAX_SNAPSHOT_BYTES", 100)
+    path = tmp_path / "big.csv"
+    path.write_text("id,name\n" * 50)
+    tracker = FileOpTracker(assistant_id=None)
+
+    tracker.start_operation("edit_file", {"file_path": str(path)}, "call-1")
+    path.write_text("id,name\n" * 60)
+    record = tracker.complete_with_message(_FakeToolMessage("call-1", "Updated"))
+
+    assert not record.before_content and record.after_content is None
+    assert record.snapshot_skipped
+    assert record.status == "success"
+    assert record.diff is None
+    assert record.metrics.bytes_written == 480
+
+
+def test_async_methods_run_off_the_event_loop_thread(tmp_path: Path) -> None:
+    path = tmp_path / "notes.md"
+    path.write_text("a\nb\n")
+    tracker = FileOpTracker(assistant_id=None)
+    threads = []
+    read = tracker._read_content
+
+    def tracking_read(record, path_str):
+        threads.append(threading.current_thread().name)
+        return read(record, path_str)
+
+    tracker._read_content = tracking_read
+
+    async def run():
+        await tracker.astart_operation("write_file", {"file_path": str(path)}, "call-1")
+        path.write_text("a\nc\n")
+        return await tracker.acomplete_with_message(_FakeToolMessage("call-1", "Updated"))
+
+    record = asyncio.run(run())
+
+    assert (record.metrics.lines_added, record.metrics.lines_removed) == (1, 1)
+    assert len(threads) == 2
+    assert all(name.startswith("file-ops") for name in threads)
@@ -0,0 +1,143 @@
+"""Tests for resumable jobs and their use by the batch runtime."""
+
+import pytest
+
+from sdrbot_cli import jobs
+from sdrbot_cli.jobs import (
+    STATUS_CANCELLED,
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_INTERRUPTED,
+    cancel_job,
+    get_job_store,
+    job_context,
+    resume_job,
+)
+from sdrbot_cli.services import batch as batch_module
+from sdrbot_cli.services.batch import ChunkResult, resumable, run_batches
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(batch_module, "CHUNK_RETRY_DELAY", 0)
+
+
+def flaky_writer(down, sent):
+    """Batch write function whose chunks fail while their first item is in ``down``."""
+
+    def batch_update(client, object_name, items):
+        def send(chunk):
+            if chunk[0] in down:
+                raise RuntimeError("500 Internal Server Error")
+            sent.extend(chunk)
+            return ChunkResult(ids=[f"id-{i}" for i in chunk])
+
+        return run_batches("update", object_name, items, 2, send)
+
+    return batch_update
+
+
+def test_job_context_records_outcome():
+    store = get_job_store()
+
+    with job_context("test", "ok", {"n": 1}) as job:
+        job.progress(3, 4)
+    assert store.get(job.id).status == STATUS_DONE
+    assert (store.get(job.id).done, store.get(job.id).total) == (3, 4)
+
+    with pytest.raises(ValueError), job_context("test", "boom", {"n": 2}) as failed:
+        raise ValueError("boom")
+    assert store.get(failed.id).status == STATUS_FAILED
+
+    with pytest.raises(KeyboardInterrupt), job_context("test", "ctrl-c", {"n": 3}) as stopped:
+        raise KeyboardInterrupt
+    assert store.get(stopped.id).status == STATUS_INTERRUPTED
+
+
+def test_unfinished_job_is_reused_with_its_checkpoints():
+    with pytest.raises(RuntimeError), job_context("test", "t", {"n": 1}) as first:
+        first.checkpoint("a", {"x": 1})
+        raise RuntimeError("network down")
+
+    with job_context("test", "t", {"n": 1}) as second:
+        assert second.id == first.id
+        assert second.saved("a") == {"x": 1}
+
+    # Once done, the same params start a new job
+    with job_context("test", "t", {"n": 1}) as third:
+        assert third.id != first.id
+        assert not third.resumed
+
+
+def test_rerun_sends_only_failed_chunks():
+    down, sent = {"c"}, []
+    write = resumable("hubspot")(flaky_writer(down, sent))
+
+    first = write(None, "contacts", list("abcdef"))
+    assert first.succeeded == 4
+    assert first.errors == [(None, "rows 3-4: 500 Internal Server Error")]
+    assert "/jobs resume" in first.summary()
+    assert get_job_store().get(first.job_id).status == STATUS_FAILED
+
+    down.clear()
+    sent.clear()
+    second = write(None, "contacts", list("abcdef"))
+
+    assert second.job_id == first.job_id
+    assert sent == ["c", "d"]
+    assert second.ids == [f"id-{i}" for i in "abcdef"]
+    assert get_job_store().get(first.job_id).status == STATUS_DONE
+
+
+def test_connection_errors_are_retried():
+    attempts = []
+
+    def send(chunk):
+        attempts.append(chunk)
+        if len(attempts) == 1:
+            raise ConnectionError("reset by peer")
+        return ChunkResult(ids=list(chunk))
+
+    result = run_batches("create", "deals", ["a"], 10, send)
+    assert result.ids == ["a"]
+    assert len(attempts) == 2
+
+    # Other errors on create may hide a write that went through: no retry
+    attempts.clear()
+    result = run_batches("create", "deals", ["a"], 10, lambda c: attempts.append(c) or 1 / 0)
+    assert len(attempts) == 1 and result.failed == 1
+
+
+def test_cancel_stops_remaining_chunks():
+    @resumable("hubspot")
+    def write(client, object_name, items):
+        def send(chunk):
+            # /jobs cancel while the first chunk is in flight
+            cancel_job(get_job_store().list()[0].id)
+            return ChunkResult(ids=list(chunk))
+
+        return run_batches("update", object_name, items, 2, send)
+
+    result = write(None, "contacts", list("abcdef"))
+
+    assert result.ids == ["a", "b"]
+    assert result.errors == [
+        (None, "rows 3-4: not sent (job cancelled)"),
+        (None, "rows 5-6: not sent (job cancelled)"),
+    ]
+    assert get_job_store().get(result.job_id).status == STATUS_CANCELLED
+
+
+def test_resume_job_runs_the_registered_runner(monkeypatch):
+    calls = []
+    monkeypatch.setitem(jobs.RUNNERS, "test", "unused:runner")
+    monkeypatch.setattr(jobs, "_runner", lambda kind: lambda **params: calls.append(params) or "ok")
+
+    with pytest.raises(RuntimeError), job_context("test", "t", {"n": 1}) as job:
+        raise RuntimeError("down")
+
+    assert resume_job(job.id) == "ok"
+    assert calls == [{"n": 1}]
+    assert resume_job(999).startswith("Error")
+    assert cancel_job(job.id).endswith("won't be resumed.")
+    assert resume_job(job.id) == f"Error: job {job.id} is cancelled"
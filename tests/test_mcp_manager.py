@@ -0,0 +1,229 @@
+"""Tests for concurrent MCP server connection and the tool listing cache."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from langchain_core.tools import ToolException
+from mcp.types import ToolListChangedNotification
+
+from sdrbot_cli.mcp import manager as mcp_manager
+from sdrbot_cli.mcp.cache import CachedTool, load_cached_tools, save_cached_tools
+from sdrbot_cli.mcp.client import MCPServerConnection
+from sdrbot_cli.mcp.manager import MCPManager
+
+# Seconds each fake server takes to connect (None: never finishes)
+CONNECT_DELAYS = {"fast": 0.3, "medium": 0.4, "slow": 1.0, "hung": None}
+PING = SimpleNamespace(name="ping", description="Ping", inputSchema={})
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    """Fake MCP config and connections.
+
+    Returns a function that enables the given servers and returns the list
+    of servers disabled after failing to connect.
+    """
+    disabled = []
+    config = {"servers": {}}
+
+    async def connect(self):
+        delay = CONNECT_DELAYS[self.name]
+        await asyncio.sleep(3600 if delay is None else delay)
+        self.tools = [PING]
+        self.session = SimpleNamespace(
+            call_tool=AsyncMock(return_value=SimpleNamespace(content="pong")),
+            send_ping=AsyncMock(),
+        )
+        return True
+
+    async def disconnect(self):
+        self.tools = []
+        self.session = None
+
+    monkeypatch.setattr(mcp_manager, "MCP_AVAILABLE", True)
+    monkeypatch.setattr(mcp_manager, "load_mcp_config", lambda: config)
+    monkeypatch.setattr(mcp_manager, "update_server_tool_count", lambda name, count: None)
+    monkeypatch.setattr(mcp_manager, "disable_mcp_server", disabled.append)
+    monkeypatch.setattr(MCPServerConnection, "connect", connect)
+    monkeypatch.setattr(MCPServerConnection, "disconnect", disconnect)
+
+    def enable(*names):
+        config["servers"] = {name: {"command": name, "enabled": True} for name in names}
+        return disabled
+
+    return enable
+
+
+def test_servers_connect_concurrently(servers):
+    servers("fast", "medium")
+    manager = MCPManager()
+
+    start = time.perf_counter()
+    connected, failed = asyncio.run(manager.connect_enabled_servers())
+
+    # One after the other would take 0.7s
+    assert time.perf_counter() - start < 0.6
+    assert (connected, failed) == (2, [])
+    assert set(manager.connections) == {"fast", "medium"}
+
+
+def test_slow_server_attaches_after_startup(servers):
+    servers("fast", "slow")
+    late = []
+    manager = MCPManager(on_late_connect=lambda name, ok: late.append((name, ok)))
+
+    async def run():
+        result = await manager.connect_enabled_servers(wait=0.5)
+        assert "slow" not in manager.connections
+        await asyncio.sleep(0.8)
+        return result
+
+    assert asyncio.run(run()) == (1, [])
+    assert late == [("slow", True)]
+    assert len(manager.get_all_tools()) == 2
+
+
+def test_hung_server_times_out_and_is_disabled(servers, monkeypatch):
+    disabled = servers("fast", "hung")
+    monkeypatch.setattr(mcp_manager, "CONNECT_TIMEOUT", 0.5)
+
+    connected, failed = asyncio.run(MCPManager().connect_enabled_servers())
+
+    assert (connected, failed) == (1, ["hung"])
+    assert disabled == ["hung"]
+
+
+def test_cached_tools_registered_before_server_connects(servers):
+    servers("slow")
+    asyncio.run(MCPManager().connect_enabled_servers())
+    late, changed = [], []
+    manager = MCPManager(
+        on_late_connect=lambda *args: late.append(args), on_tools_changed=changed.append
+    )
+
+    async def run():
+        start = time.perf_counter()
+        result = await manager.connect_enabled_servers()
+        assert time.perf_counter() - start < 0.5
+        assert [t.name for t in manager.get_all_tools()] == ["mcp_slow_ping"]
+
+        # A call made before the server is up waits for it
+        assert await manager.connections["slow"].call_tool("ping", {}) == "pong"
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == (1, [])
+    assert late == changed == []
+
+
+def test_changed_tool_listing_replaces_cached_one(servers):
+    servers("fast")
+    save_cached_tools("fast", {"command": "fast"}, [CachedTool("pong", "Pong", {})])
+    changed = []
+    manager = MCPManager(on_tools_changed=changed.append)
+
+    async def run():
+        await manager.connect_enabled_servers()
+        assert [t.name for t in manager.get_all_tools()] == ["mcp_fast_pong"]
+        await asyncio.sleep(0.5)
+
+    asyncio.run(run())
+
+    assert changed == ["fast"]
+    assert [t.name for t in manager.get_all_tools()] == ["mcp_fast_ping"]
+    assert [t.name for t in load_cached_tools("fast", {"command": "fast"})] == ["ping"]
+
+
+def test_failed_cached_server_is_unregistered(servers, monkeypatch):
+    disabled = servers("hung")
+    monkeypatch.setattr(mcp_manager, "CONNECT_TIMEOUT", 0.3)
+    save_cached_tools("hung", {"command": "hung"}, [PING])
+    late = []
+    manager = MCPManager(on_late_connect=lambda *args: late.append(args))
+
+    async def run():
+        assert await manager.connect_enabled_servers() == (1, [])
+        await asyncio.sleep(0.5)
+
+    asyncio.run(run())
+
+    assert manager.connections == {}
+    assert late == [("hung", False)]
+    assert disabled == ["hung"]
+
+
+def test_tool_list_changed_notification_refreshes_tools(servers):
+    servers("fast")
+    changed = []
+    manager = MCPManager(on_tools_changed=changed.append)
+
+    async def run():
+        await manager.connect_enabled_servers()
+        conn = manager.connections["fast"]
+        new_tools = [PING, SimpleNamespace(name="echo", description="Echo", inputSchema={})]
+        conn.session.list_tools = AsyncMock(return_value=SimpleNamespace(tools=new_tools))
+        await conn._handle_message(ToolListChangedNotification())
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert changed == ["fast"]
+    assert [t.name for t in manager.get_all_tools()] == ["mcp_fast_ping", "mcp_fast_echo"]
+    assert [t.name for t in load_cached_tools("fast", {"command": "fast"})] == ["ping", "echo"]
+
+
+def test_failed_call_reconnects_server_in_background(servers, monkeypatch):
+    disabled = servers("fast")
+    manager = MCPManager()
+    monkeypatch.setattr(mcp_manager, "_manager", manager)
+
+    async def run():
+        await manager.connect_enabled_servers()
+        (tool,) = manager.get_all_tools()
+        conn = manager.connections["fast"]
+        conn.session.call_tool.side_effect = ConnectionError("broken pipe")
+        conn.session.send_ping.side_effect = ConnectionError("broken pipe")
+
+        with pytest.raises(ToolException, match="checking the connection in the background"):
+            await tool.ainvoke({})
+        await manager._checks["fast"]
+
+        # Same connection object, new session: the existing tool works again
+        assert manager.connections["fast"] is tool.connection
+        assert await tool.ainvoke({}) == "pong"
+        return conn.health
+
+    health = asyncio.run(run())
+
+    assert (health.state, health.reconnects, health.calls) == ("connected", 1, 2)
+    assert health.error_rate == 0.5
+    assert disabled == []
+
+
+def test_unreachable_server_reconnects_with_backoff(servers, monkeypatch):
+    servers("fast")
+    manager = MCPManager()
+
+    async def run():
+        await manager.connect_enabled_servers()
+        conn = manager.connections["fast"]
+        conn.session.send_ping.side_effect = ConnectionError("gone")
+        reconnect = AsyncMock(return_value=False)
+        monkeypatch.setattr(MCPServerConnection, "connect", reconnect)
+
+        await manager.check_server("fast")
+        await manager.check_server("fast")  # Too soon to try again
+        assert reconnect.await_count == 1
+        assert conn.health.summary().startswith("down, retry in")
+
+        conn.health.retry_at = 0.0
+        await manager.check_server("fast")
+        assert reconnect.await_count == 2
+        return conn.health
+
+    health = asyncio.run(run())
+
+    assert (health.state, health.failures) == ("down", 2)
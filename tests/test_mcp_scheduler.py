@@ -0,0 +1,106 @@
+"""Tests for concurrent MCP tool calls."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.tools import ToolException
+
+from sdrbot_cli.mcp.client import MCPServerConnection
+from sdrbot_cli.mcp.scheduler import CallScheduler
+from sdrbot_cli.mcp.tools import create_langchain_tool
+
+PING = SimpleNamespace(name="ping", description="Ping", inputSchema={})
+
+
+class FakeSession:
+    """Answers every call after ``delay`` seconds, tracking how many overlap."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def call_tool(self, name, arguments):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(content=[SimpleNamespace(text="pong")])
+
+
+def connected(session, max_concurrent=8, timeout=5.0):
+    conn = MCPServerConnection(name="srv", config={"command": "srv"}, session=session)
+    conn.scheduler = CallScheduler(max_concurrent, timeout)
+    conn.loop = asyncio.get_running_loop()
+    return conn
+
+
+def test_calls_to_one_server_run_concurrently_up_to_limit():
+    session = FakeSession(delay=0.2)
+
+    async def run():
+        tool = create_langchain_tool("srv", PING, connected(session, max_concurrent=3))
+        return await asyncio.gather(*(tool.ainvoke({}) for _ in range(6)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+
+    assert results == ["pong"] * 6
+    assert session.max_in_flight == 3
+    # Two rounds of three; one at a time would take 1.2s
+    assert time.perf_counter() - start < 0.8
+
+
+def test_timed_out_call_is_cancelled_without_reconnecting():
+    session = FakeSession(delay=10)
+
+    async def run():
+        conn = connected(session, timeout=0.1)
+        tool = create_langchain_tool("srv", PING, conn)
+        with pytest.raises(ToolException, match="timed out after 0.1s"):
+            await tool._arun()
+        return conn
+
+    conn = asyncio.run(run())
+
+    assert session.cancelled == 1
+    assert conn.session is session
+
+
+def test_cancelling_caller_cancels_request():
+    session = FakeSession(delay=10)
+
+    async def run():
+        tool = create_langchain_tool("srv", PING, connected(session))
+        task = asyncio.create_task(tool.ainvoke({}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert session.cancelled == 1
+
+
+def test_sync_calls_from_threads_run_on_the_connection_loop():
+    session = FakeSession(delay=0.2)
+
+    async def run():
+        tool = create_langchain_tool("srv", PING, connected(session))
+        # LangChain runs sync tools in worker threads while the loop keeps going
+        return await asyncio.gather(*(asyncio.to_thread(tool.invoke, {}) for _ in range(4)))
+
+    start = time.perf_counter()
+
+    assert asyncio.run(run()) == ["pong"] * 4
+    assert session.max_in_flight == 4
+    assert time.perf_counter() - start < 0.6
@@ -0,0 +1,254 @@
+"""Tests for the native CRM migration engine."""
+
+import itertools
+import json
+
+import pytest
+
+from sdrbot_cli.migration import engine as engine_module
+from sdrbot_cli.migration import runner as runner_module
+from sdrbot_cli.migration.config import ConfigError, FieldRule, parse_config
+from sdrbot_cli.migration.engine import map_record, preview_stage, reset_stage, run_stage
+from sdrbot_cli.migration.store import MigrationStore
+from sdrbot_cli.services.batch import per_record, run_batches
+from sdrbot_cli.services.mirror import MirrorRecord
+
+CONFIG = {
+    "name": "test",
+    "source": "pipedrive",
+    "target": "twenty",
+    "concurrency": 2,
+    "stages": [
+        {
+            "name": "companies",
+            "source_object": "organizations",
+            "target_object": "companies",
+            "fields": {"name": {"from": "name", "required": True}},
+        },
+        {
+            "name": "people",
+            "source_object": "persons",
+            "target_object": "people",
+            "fields": {
+                "name.firstName": {"from": "name", "transform": "first_word"},
+                "name.lastName": {"from": "name", "transform": "rest_words"},
+                "emails.primaryEmail": {"from": "email.value", "transform": "email"},
+                "companyId": {"ref": "companies", "from": "org_id.value"},
+            },
+        },
+    ],
+}
+
+
+class FakeSource:
+    """Source CRM: records per object."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def get_client(self):
+        return object()
+
+    def fetch_records(self, client, object_name, since):
+        for record in self.objects.get(object_name, []):
+            yield MirrorRecord(str(record["id"]), record)
+
+
+class FakeTarget:
+    """Target CRM writer: assigns IDs, fails records named in ``reject``."""
+
+    def __init__(self):
+        self.created = {}
+        self.reject = set()
+        self.deleted = []
+        self._ids = itertools.count(1)
+
+    def batch_create(self, client, object_name, records):
+        def create(record):
+            if str(record.get("name")) in self.reject:
+                raise ValueError("rejected")
+            target_id = f"t{next(self._ids)}"
+            self.created[target_id] = record
+            return target_id
+
+        return run_batches("create", object_name, records, 10, per_record(create))
+
+    def batch_delete(self, client, object_name, ids):
+        self.deleted.extend(ids)
+        return run_batches("delete", object_name, ids, 10, per_record(lambda i: i))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MigrationStore(tmp_path / "migrations.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    source = FakeSource()
+    source.objects["organizations"] = [{"id": i, "name": f"Org {i}"} for i in range(1, 451)]
+    source.objects["persons"] = [
+        {
+            "id": 1,
+            "name": "Ada Lovelace",
+            "email": [{"value": "ADA@x.com", "primary": True}],
+            "org_id": {"value": 2},
+        },
+        {"id": 2, "name": "Alan Turing", "email": [], "org_id": {"value": 999}},
+    ]
+    monkeypatch.setattr(engine_module, "get_source", lambda service: source)
+    return source
+
+
+@pytest.fixture
+def target(monkeypatch):
+    target = FakeTarget()
+    monkeypatch.setattr(engine_module, "_writer", lambda service: target)
+    return target
+
+
+def test_parse_config_validates_services_and_refs():
+    config = parse_config(CONFIG)
+    assert [s.name for s in config.stages] == ["companies", "people"]
+    assert config.stage("people").references == {"companies"}
+
+    with pytest.raises(ConfigError, match="Unsupported target"):
+        parse_config({**CONFIG, "target": "excel"})
+    reversed_stages = {**CONFIG, "stages": list(reversed(CONFIG["stages"]))}
+    with pytest.raises(ConfigError, match="earlier stage"):
+        parse_config(reversed_stages)
+    bad_transform = {
+        "source": "hubspot",
+        "target": "twenty",
+        "stages": [
+            {
+                "source_object": "a",
+                "target_object": "b",
+                "fields": {"x": {"from": "y", "transform": "nope"}},
+            }
+        ],
+    }
+    with pytest.raises(ConfigError, match="unknown transform"):
+        parse_config(bad_transform)
+
+
+def test_field_rule_transforms_maps_and_defaults():
+    record = {"stage": "Won", "amount": "$1,200.50", "tags": "a; b", "first": "", "last": "Smith"}
+    no_refs = lambda ref, value: None  # noqa: E731
+
+    assert (
+        FieldRule.parse("x", {"from": "amount", "transform": "float"}).apply(record, no_refs)
+        == 1200.5
+    )
+    stage_rule = FieldRule.parse("x", {"from": "stage", "map": {"Won": "CLOSED_WON"}})
+    assert stage_rule.apply(record, no_refs) == "CLOSED_WON"
+    assert FieldRule.parse("x", {"from": ["first", "last"]}).apply(record, no_refs) == "Smith"
+    assert FieldRule.parse("x", {"from": "tags", "transform": "list"}).apply(record, no_refs) == [
+        "a",
+        "b",
+    ]
+    assert (
+        FieldRule.parse("x", {"from": "missing", "default": "n/a"}).apply(record, no_refs) == "n/a"
+    )
+    assert FieldRule.parse("x", {"value": "USD"}).apply(record, no_refs) == "USD"
+
+
+def test_map_record_nests_fields_and_reports_missing_required():
+    stage = parse_config(CONFIG).stage("people")
+    refs = {"companies": {"2": "t2"}}
+    record = {
+        "name": "Ada King Lovelace",
+        "email": [{"value": "ADA@x.com"}],
+        "org_id": {"value": 2},
+    }
+
+    mapped = map_record(stage, "1", record, refs)
+    assert mapped.payload == {
+        "name": {"firstName": "Ada", "lastName": "King Lovelace"},
+        "emails": {"primaryEmail": "ada@x.com"},
+        "companyId": "t2",
+    }
+
+    unlinked = map_record(stage, "2", {"name": "Alan", "org_id": {"value": 9}}, refs)
+    assert unlinked.unresolved_refs == 1
+    assert "companyId" not in unlinked.payload
+
+    companies = parse_config(CONFIG).stage("companies")
+    assert map_record(companies, "3", {"name": ""}, {}).error == "name is required but empty"
+
+
+def test_run_stage_writes_in_chunks_and_maps_ids(store, source, target):
+    config = parse_config(CONFIG)
+    run = run_stage(config, config.stage("companies"), store, target_client=object())
+
+    assert (run.read, run.created, run.failed, run.finished) == (450, 450, 0, True)
+    id_map = store.id_map("test", "companies")
+    assert len(id_map) == 450
+    # Every source ID points at the target record built from it
+    assert all(target.created[t]["name"] == f"Org {s}" for s, t in id_map.items())
+
+
+def test_run_stage_resumes_and_retries_failures(store, source, target):
+    config = parse_config(CONFIG)
+    stage = config.stage("companies")
+    target.reject = {"Org 5", "Org 7"}
+
+    first = run_stage(config, stage, store, target_client=object())
+    assert (first.created, first.failed) == (448, 2)
+    assert {s for s, _ in store.failures("test", "companies")} == {"5", "7"}
+
+    target.reject = set()
+    second = run_stage(config, stage, store, target_client=object())
+    assert (second.skipped, second.created, second.failed) == (448, 2, 0)
+    assert store.failures("test", "companies") == []
+    assert len(target.created) == 450
+
+
+def test_run_stage_limit_stops_early(store, source, target):
+    config = parse_config(CONFIG)
+    run = run_stage(config, config.stage("companies"), store, limit=3, target_client=object())
+    assert (run.created, run.finished) == (3, False)
+
+
+def test_later_stage_resolves_references(store, source, target):
+    config = parse_config(CONFIG)
+    run_stage(config, config.stage("companies"), store, target_client=object())
+    run = run_stage(config, config.stage("people"), store, target_client=object())
+
+    assert (run.created, run.unresolved_refs) == (2, 1)
+    ada = next(r for r in target.created.values() if r.get("emails"))
+    assert ada["companyId"] == store.id_map("test", "companies")["2"]
+
+
+def test_preview_writes_nothing(store, source, target):
+    config = parse_config(CONFIG)
+    samples = json.loads(preview_stage(config, config.stage("companies"), store, 2))
+    assert [s["target"] for s in samples] == [{"name": "Org 1"}, {"name": "Org 2"}]
+    assert target.created == {}
+
+
+def test_reset_deletes_created_records(store, source, target):
+    config = parse_config(CONFIG)
+    stage = config.stage("companies")
+    run_stage(config, stage, store, limit=5, target_client=object())
+
+    summary = reset_stage(config, stage, store, target_client=object())
+    assert "deleted 5 records" in summary
+    assert sorted(target.deleted) == sorted(target.created)
+    assert store.id_map("test", "companies") == {}
+
+
+def test_run_migration_requires_referenced_stages(tmp_path, store, source, target, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "test.json"
+    path.write_text(json.dumps(CONFIG))
+    monkeypatch.setattr(runner_module, "get_migration_store", lambda: store)
+
+    blocked = runner_module.run_migration(str(path), stages="people")
+    assert "run stage companies first" in blocked
+
+    result = runner_module.run_migration(str(path))
+    assert "companies: 450 read, 450 created" in result
+    assert "people: 2 read, 2 created" in result
@@ -0,0 +1,164 @@
+"""Tests for the shared client-side rate limiter."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from sdrbot_cli import rate_limit
+from sdrbot_cli.rate_limit import (
+    RateLimiter,
+    acall_with_rate_limit,
+    call_with_rate_limit,
+    get_rate_limit_stats,
+    get_service_limiters,
+    parse_rate_limit_headers,
+)
+
+
+def _response(status: int, headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Record sleeps instead of waiting."""
+    sleeps: list[float] = []
+    clock = [1000.0]
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    return sleeps
+
+
+class TestParseHeaders:
+    def test_standard_headers(self):
+        info = parse_rate_limit_headers(
+            {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "12", "Retry-After": "5"}
+        )
+        assert info.remaining == 3
+        assert info.reset_after == 12
+        assert info.retry_after == 5
+
+    def test_vendor_variants_take_tightest_budget(self):
+        info = parse_rate_limit_headers(
+            {
+                "X-HubSpot-RateLimit-Remaining": "90",
+                "X-HubSpot-RateLimit-Secondly-Remaining": "0",
+                "X-HubSpot-RateLimit-Interval-Milliseconds": "10000",
+            }
+        )
+        assert info.remaining == 0
+        assert info.reset_after == 10
+
+    def test_epoch_reset(self):
+        info = parse_rate_limit_headers({"x-ratelimit-reset": str(int(time.time()) + 30)})
+        assert 28 <= info.reset_after <= 30
+
+    def test_ignores_garbage(self):
+        assert parse_rate_limit_headers({"X-RateLimit-Remaining": "n/a"}).remaining is None
+        assert parse_rate_limit_headers(MagicMock()).remaining is None
+
+
+class TestRateLimiter:
+    def test_waits_for_tokens_and_counts_throttle_time(self, no_sleep):
+        limiter = RateLimiter(rate=2, burst=1)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(0.5)
+        stats = limiter.stats()
+        assert stats.requests == 2
+        assert stats.throttle_seconds == pytest.approx(0.5)
+        assert stats.peak_waiting == 1
+        assert stats.waiting == 0
+
+    def test_429_pauses_and_halves_rate(self, no_sleep):
+        limiter = RateLimiter(rate=10, burst=10)
+        limiter.observe(429, {"Retry-After": "4"})
+        assert limiter.rate == 5
+        assert limiter.acquire() >= 4
+        assert limiter.stats().throttled == 1
+
+        for _ in range(20):
+            limiter.observe(200, {})
+        assert limiter.rate == 10
+
+    def test_exhausted_budget_pauses_until_reset(self, no_sleep):
+        limiter = RateLimiter(rate=100, burst=100)
+        assert limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}) == 3
+        assert limiter.acquire() == pytest.approx(3)
+
+
+class TestCallWithRateLimit:
+    def test_retries_429_then_returns(self, no_sleep):
+        send = MagicMock(side_effect=[_response(429, {"Retry-After": "2"}), _response(200)])
+        response = call_with_rate_limit("hunter", "/email-finder", send)
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert sum(no_sleep) >= 2
+
+    def test_gives_up_after_max_retries(self, no_sleep):
+        send = MagicMock(return_value=_response(429))
+        response = call_with_rate_limit("hunter", "/email-finder", send, max_retries=2)
+        assert response.status_code == 429
+        assert send.call_count == 3
+
+    def test_retries_http_errors_raised_by_send(self, no_sleep):
+        send = MagicMock(side_effect=[requests.HTTPError(response=_response(429)), "ok"])
+        assert call_with_rate_limit("zohocrm", "/Leads", send) == "ok"
+
+        not_found = MagicMock(side_effect=requests.HTTPError(response=_response(404)))
+        with pytest.raises(requests.HTTPError):
+            call_with_rate_limit("zohocrm", "/Leads", not_found)
+        assert not_found.call_count == 1
+
+    def test_async_retries_429_without_blocking(self, no_sleep, monkeypatch):
+        async def fake_sleep(seconds):
+            rate_limit.time.sleep(seconds)  # the no_sleep fake: advances the clock
+
+        monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+        responses = iter([_response(429, {"Retry-After": "2"}), _response(200)])
+
+        async def send():
+            return next(responses)
+
+        response = asyncio.run(acall_with_rate_limit("hunter", "/email-finder", send))
+        assert response.status_code == 200
+        assert sum(no_sleep) >= 2
+
+    def test_pattern_does_not_match_path_prefix(self):
+        config = MagicMock()
+        config.get_setting.return_value = {"endpoints": {"/people": 2}}
+        with patch("sdrbot_cli.services.registry.load_config", return_value=config):
+            assert len(get_service_limiters("apollo", "/people_search")) == 1
+            assert len(get_service_limiters("apollo", "/people")) == 2
+
+    def test_setting_changes_apply_to_existing_bucket(self):
+        config = MagicMock()
+        config.get_setting.return_value = {"rate": 20}
+        with patch("sdrbot_cli.services.registry.load_config", return_value=config):
+            assert get_service_limiters("hunter", "/domain-search")[0].rate == 20
+            config.get_setting.return_value = {"rate": 5}
+            assert get_service_limiters("hunter", "/domain-search")[0].rate == 5
+
+    def test_endpoint_bucket_and_settings_override(self):
+        config = MagicMock()
+        config.get_setting.return_value = {"rate": 50, "endpoints": {"/people/*": 2}}
+        with patch("sdrbot_cli.services.registry.load_config", return_value=config):
+            limiters = get_service_limiters("apollo", "/people/match")
+
+        assert [lim.name for lim in limiters] == ["apollo", "apollo:/people/*"]
+        assert limiters[0].rate == 50
+        assert limiters[1].rate == 2
+
+        hubspot = get_service_limiters("hubspot", "/crm/v3/objects/contacts/search")
+        assert hubspot[1].rate == 4
+        assert {s.name for s in get_rate_limit_stats()} >= {"apollo", "hubspot"}
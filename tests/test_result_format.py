@@ -0,0 +1,131 @@
+"""Tests for compact tool-result encoding."""
+
+import json
+
+import pytest
+
+from sdrbot_cli import result_format
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    monkeypatch.setattr(result_format, "_stats", result_format.FormatStats())
+
+
+class TestEncoding:
+    def test_table_has_one_header_and_flattened_columns(self):
+        records = [
+            {"id": "1", "name": {"firstName": "Ada", "lastName": "L"}, "city": None},
+            {"id": "2", "name": {"firstName": "Bo"}, "city": "Oslo", "tags": ["a", "b"]},
+        ]
+
+        table = result_format.encode_table([result_format.flatten(r) for r in records])
+
+        assert table.splitlines() == [
+            "id,name.firstName,name.lastName,city,tags",
+            "1,Ada,L,,",
+            "2,Bo,,Oslo,a; b",
+        ]
+
+    def test_projection_keeps_default_fields_and_sub_fields(self):
+        record = {"id": "1", "notes": "x" * 500, "name": {"firstName": "Ada"}, "email": "a@b.c"}
+
+        assert result_format.project(record, ["email", "name"]) == {
+            "id": "1",
+            "email": "a@b.c",
+            "name.firstName": "Ada",
+        }
+
+    def test_long_values_are_truncated(self):
+        table = result_format.encode_table([{"notes": "x" * 1000}])
+
+        assert len(table.splitlines()[1]) == result_format.MAX_CELL_CHARS
+
+    def test_attio_value_metadata_is_dropped_for_attio_only(self):
+        record = {
+            "email_addresses": [
+                {
+                    "active_from": "2024-01-01",
+                    "active_until": None,
+                    "created_by_actor": {"type": "user", "id": "u1"},
+                    "attribute_type": "email-address",
+                    "email_address": "a@b.com",
+                }
+            ]
+        }
+
+        attio = result_format.format_record("Person 1", record, service="attio")
+        other = result_format.format_record("Person 1", record, service="twenty")
+
+        assert attio == "Person 1:\nemail_addresses: a@b.com"
+        assert "2024-01-01" in other and "email-address" in other
+
+    def test_salesforce_attributes_are_dropped_at_any_depth(self):
+        record = {
+            "attributes": {"type": "Contact"},
+            "Id": "003",
+            "Account": {"attributes": {"type": "Account"}, "Name": "Acme"},
+        }
+
+        result = result_format.format_records("salesforce", "records", [record])
+
+        assert result.splitlines()[1:] == ["Id,Account.Name", "003,Acme"]
+        kept = result_format.format_records("hubspot", "contacts", [record])
+        assert "attributes.type" in kept
+
+
+class TestFormatRecords:
+    def test_small_results_are_inline_and_save_tokens(self):
+        records = [
+            {"id": str(n), "email": f"user{n}@example.com", "phone": None} for n in range(10)
+        ]
+
+        result = result_format.format_records("twenty", "people", records, total=30)
+
+        header, *rows = result.splitlines()
+        assert header == "Found 10 people (of 30 matching; raise max_records to fetch more):"
+        assert rows[0] == "id,email"
+        assert len(rows) == 11
+        stats = result_format.get_format_stats()
+        assert stats.calls == 1
+        assert stats.tokens_saved > 0
+
+    def test_large_results_spill_to_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        records = [{"id": str(n)} for n in range(result_format.INLINE_RECORDS + 5)]
+
+        result = result_format.format_records("hubspot", "contacts", records)
+
+        spilled = list((tmp_path / "files" / "hubspot").glob("contacts_search_*.json"))
+        assert len(spilled) == 1
+        assert json.loads(spilled[0].read_text()) == records
+        assert f"all {len(records)} saved to {spilled[0]}" in result
+        assert len(result.splitlines()) == result_format.INLINE_RECORDS + 2
+
+    def test_truncated_values_spill_to_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        records = [{"id": "1", "content": "x" * 500}]
+
+        result = result_format.format_records("hubspot", "notes", records)
+
+        (spilled,) = (tmp_path / "files" / "hubspot").glob("notes_search_*.json")
+        assert json.loads(spilled.read_text()) == records
+        assert f"full records saved to {spilled}" in result
+
+    def test_format_record(self):
+        result = result_format.format_record("Contact 1", {"Email": "a@b.c", "Phone": None})
+
+        assert result == "Contact 1:\nEmail: a@b.c"
+
+
+class TestMCPResults:
+    def test_mcp_text_is_returned_unchanged(self):
+        from types import SimpleNamespace
+
+        from sdrbot_cli.mcp.tools import create_langchain_tool
+
+        spec = SimpleNamespace(name="get_page", description="Get", inputSchema={})
+        tool = create_langchain_tool("docs", spec, connection=None)
+        text = json.dumps([{"id": 1, "attributes": {"a": 1}, "content": "x" * 500}])
+
+        assert tool._format_result([SimpleNamespace(text=text)]) == text
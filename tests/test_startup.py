@@ -0,0 +1,153 @@
+"""Startup-time budget for the sdrbot entry point, and the background prebuild.
+
+Each budget case runs in a fresh interpreter under ``python -X importtime``.
+The first paint of the TUI is measured as the import of ``sdrbot_cli.tui.app``:
+everything else before the app renders is Textual itself.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from sdrbot_cli.lazy import is_available, lazy_import
+from sdrbot_cli.startup import get_startup_profile, prebuild_agent_components
+
+# Import time in seconds, with generous headroom over a local run
+# (--version: ~0.12s, TUI app: ~0.4s; both were over 1s before lazy imports)
+VERSION_BUDGET = 0.75
+FIRST_PAINT_BUDGET = 2.0
+
+# Dependencies only needed once the agent is running (or a tool is called)
+HEAVY_MODULES = (
+    "anthropic",
+    "openai",
+    "langchain",
+    "langchain_core",
+    "langgraph",
+    "langsmith",
+    "deepagents",
+    "mcp",
+    "tiktoken",
+    "langfuse",
+    "opik",
+    "hubspot",
+    "simple_salesforce",
+    "pymongo",
+    "psycopg2",
+    "pymysql",
+    "tavily",
+    "markdownify",
+)
+
+VERSION_SCRIPT = """
+import sys
+sys.argv = ["sdrbot", "--version"]
+from sdrbot_cli.main import cli_main
+try:
+    cli_main()
+except SystemExit:
+    pass
+"""
+
+FIRST_PAINT_SCRIPT = "import sdrbot_cli.tui.app"
+
+REPORT = """
+import sys
+heavy = {heavy!r}
+print("loaded:" + ",".join(m for m in heavy if m in sys.modules))
+"""
+
+
+def run_with_importtime(script: str) -> tuple[float, list[str]]:
+    """Run ``script`` in a fresh interpreter.
+
+    Returns:
+        Seconds spent importing from the first ``sdrbot_cli`` module on, and
+        the heavy modules loaded by the end of the script.
+    """
+    code = script + REPORT.format(heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    # Lines look like "import time:   self [us] | cumulative | <indent>module";
+    # top-level imports have one space before the module name.
+    total_us = 0
+    seen_sdrbot = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        seen_sdrbot = seen_sdrbot or "sdrbot_cli" in name
+        if seen_sdrbot and not name.startswith("  "):
+            total_us += int(parts[1])
+
+    loaded = proc.stdout.rsplit("loaded:", 1)[-1].strip()
+    return total_us / 1_000_000, [m for m in loaded.split(",") if m]
+
+
+@pytest.mark.parametrize(
+    ("script", "budget"),
+    [(VERSION_SCRIPT, VERSION_BUDGET), (FIRST_PAINT_SCRIPT, FIRST_PAINT_BUDGET)],
+    ids=["version", "first-paint"],
+)
+def test_startup_within_budget(script, budget):
+    seconds, loaded = run_with_importtime(script)
+
+    assert loaded == [], f"imported on the startup path: {', '.join(loaded)}"
+    assert 0 < seconds < budget, f"startup imports took {seconds:.2f}s (budget {budget}s)"
+
+
+def test_lazy_import_defers_until_first_use():
+    module = lazy_import("json")
+    assert "not loaded" in repr(module)
+
+    assert module.dumps([1]) == "[1]"
+    assert "loaded" in repr(module) and "not loaded" not in repr(module)
+
+    assert is_available("json")
+    assert not is_available("sdrbot_no_such_module")
+
+
+def test_prebuild_runs_startup_phases_concurrently(monkeypatch):
+    def slow(result):
+        def run(*args, **kwargs):
+            time.sleep(0.3)
+            return result
+
+        return run
+
+    async def connect_mcp():
+        await asyncio.sleep(0.3)
+        return None, ["broken"]
+
+    async def open_sessions():
+        await asyncio.sleep(0.3)
+        return "checkpointer"
+
+    monkeypatch.setattr("sdrbot_cli.config.create_model", slow("model"))
+    monkeypatch.setattr("sdrbot_cli.mcp.manager.initialize_mcp", connect_mcp)
+    monkeypatch.setattr("sdrbot_cli.sessions.get_checkpointer", open_sessions)
+    monkeypatch.setattr("sdrbot_cli.services.sync_enabled_services_if_needed", slow(None))
+    monkeypatch.setattr("sdrbot_cli.services.get_enabled_tools", lambda: [])
+
+    start = time.perf_counter()
+    prebuilt = asyncio.run(prebuild_agent_components())
+
+    assert time.perf_counter() - start < 0.9
+    assert (prebuilt.model, prebuilt.checkpointer) == ("model", "checkpointer")
+    assert prebuilt.failed_mcp_servers == ["broken"]
+
+    report = get_startup_profile().report()
+    for phase in ("model client", "MCP servers", "session store", "service tools"):
+        assert phase in report
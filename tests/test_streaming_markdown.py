@@ -0,0 +1,86 @@
+"""Tests for incremental markdown rendering of streamed replies."""
+
+from rich.console import Console
+from rich.markdown import Markdown
+
+from sdrbot_cli import streaming_markdown
+from sdrbot_cli.streaming_markdown import MarkdownStream
+
+REPLY = """Found **3 deals** closing this month:
+
+1. Acme - $12k
+2. Globex - $8k
+
+   Waiting on legal.
+3. Initech - $5k
+
+## Next steps
+- Email Acme
+  - attach the quote
+- Call Globex
+
+```python
+deals = search(stage="closing")
+
+print(deals)
+```
+
+> Totals exclude lost deals.
+
+| Deal | Amount |
+|------|--------|
+| Acme | 12k |
+
+Anything else?"""
+
+
+def _lines(renderable):
+    console = Console(width=60, color_system=None)
+    lines = console.render_lines(renderable, console.options, pad=False)
+    return ["".join(segment.text for segment in line).rstrip() for line in lines]
+
+
+def _stream(text, chunk_size):
+    stream = MarkdownStream()
+    blocks = []
+    for start in range(0, len(text), chunk_size):
+        blocks += stream.feed(text[start : start + chunk_size])
+    return blocks + stream.finish()
+
+
+def test_streamed_blocks_render_like_the_whole_reply():
+    whole = _lines(Markdown(REPLY))
+
+    for chunk_size in (1, 7, len(REPLY)):
+        blocks = _stream(REPLY, chunk_size)
+        assert [line for block in blocks for line in _lines(block)] == whole
+
+    assert len(blocks) == 11
+
+
+def test_blocks_are_written_as_they_complete():
+    stream = MarkdownStream()
+
+    assert stream.feed("First paragraph\nstill first") == []
+    assert stream.feed("\n\n") == []
+    (paragraph,) = stream.feed("Second\n")
+    assert paragraph.markdown.markup == "First paragraph\nstill first"
+
+    (second,) = stream.feed("\n\n```\nx = 1\n\ny = 2\n")
+    assert second.markdown.markup == "Second"
+    (code,) = stream.feed("```\n")
+    assert code.markdown.markup == "```\nx = 1\n\ny = 2\n```"
+
+
+def test_open_block_preview_is_throttled_to_frame_rate(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(streaming_markdown.time, "monotonic", lambda: now[0])
+    stream = MarkdownStream()
+
+    stream.feed("Hel")
+    assert _lines(stream.tail()) == ["Hel"]
+    stream.feed("lo")
+    assert stream.tail() is None
+    now[0] += 0.05
+    assert _lines(stream.tail()) == ["Hello"]
+    assert stream.tail() is None  # Nothing new
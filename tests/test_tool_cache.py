@@ -0,0 +1,135 @@
+"""Tests for reusing results of read-only tool calls."""
+
+import asyncio
+from types import SimpleNamespace
+
+from langchain_core.messages import ToolMessage
+
+from sdrbot_cli import tool_cache
+from sdrbot_cli.mcp.tools import create_langchain_tool
+from sdrbot_cli.tool_cache import ToolResultCacheMiddleware, get_tool_cache_stats
+
+
+def _request(name, call_id="call_1", tool=None, **args):
+    return SimpleNamespace(tool_call={"name": name, "id": call_id, "args": args}, tool=tool)
+
+
+class Tool:
+    """Handler counting how often the tool really ran."""
+
+    def __init__(self, content="ok", status="success"):
+        self.content = content
+        self.status = status
+        self.runs = 0
+
+    def __call__(self, request):
+        self.runs += 1
+        call = request.tool_call
+        return ToolMessage(
+            content=self.content, tool_call_id=call["id"], name=call["name"], status=self.status
+        )
+
+
+def test_repeated_read_only_call_is_answered_from_cache():
+    middleware = ToolResultCacheMiddleware()
+    pipelines = Tool("Sales Pipeline: Prospecting, Won")
+
+    first = middleware.wrap_tool_call(_request("hubspot_list_pipelines"), pipelines)
+    again = middleware.wrap_tool_call(_request("hubspot_list_pipelines", "call_2"), pipelines)
+    other_args = middleware.wrap_tool_call(
+        _request("hubspot_list_pipelines", "call_3", object_type="tickets"), pipelines
+    )
+
+    assert pipelines.runs == 2
+    assert again.content == first.content
+    assert (again.tool_call_id, other_args.tool_call_id) == ("call_2", "call_3")
+    stats = get_tool_cache_stats()
+    assert (stats.hits, stats.lookups) == (1, 3)
+
+
+def test_tools_without_opt_in_always_run():
+    middleware = ToolResultCacheMiddleware()
+    search = Tool()
+
+    middleware.wrap_tool_call(_request("hubspot_search_records", query="acme"), search)
+    middleware.wrap_tool_call(_request("hubspot_search_records", query="acme"), search)
+
+    assert search.runs == 2
+    assert get_tool_cache_stats().lookups == 0
+
+
+def test_write_invalidates_same_service_and_object_type():
+    middleware = ToolResultCacheMiddleware()
+    contacts, deals, other = Tool("12"), Tool("3"), Tool("7")
+
+    def count(tool, service="hubspot", **args):
+        middleware.wrap_tool_call(_request(f"{service}_count_records", **args), tool)
+
+    for _ in range(2):
+        count(contacts, object_type="contacts")
+        count(deals, object_type="deals")
+        count(other, service="salesforce", object_name="Contact")
+    assert (contacts.runs, deals.runs, other.runs) == (1, 1, 1)
+
+    middleware.wrap_tool_call(_request("hubspot_create_contact", email="a@b.co"), Tool())
+    count(contacts, object_type="contacts")
+    count(deals, object_type="deals")
+    count(other, service="salesforce", object_name="Contact")
+
+    assert (contacts.runs, deals.runs, other.runs) == (2, 1, 1)
+
+
+def test_errors_are_not_cached_and_entries_expire(monkeypatch):
+    middleware = ToolResultCacheMiddleware()
+    failing = Tool("Error: HubSpot is down")
+    users = Tool("Ann, Bob")
+    now = [1000.0]
+    monkeypatch.setattr(tool_cache.time, "monotonic", lambda: now[0])
+
+    middleware.wrap_tool_call(_request("pipedrive_list_users"), failing)
+    middleware.wrap_tool_call(_request("pipedrive_list_users"), users)
+    middleware.wrap_tool_call(_request("pipedrive_list_users"), users)
+    now[0] += tool_cache.CACHEABLE_TOOLS["*_list_users"] + 1
+    middleware.wrap_tool_call(_request("pipedrive_list_users"), users)
+
+    assert (failing.runs, users.runs) == (1, 2)
+
+
+def test_mcp_tools_opt_in_through_read_only_hint():
+    middleware = ToolResultCacheMiddleware()
+
+    def mcp_tool(name, read_only):
+        spec = SimpleNamespace(
+            name=name,
+            description=name,
+            inputSchema={},
+            annotations={"readOnlyHint": True} if read_only else None,
+        )
+        return create_langchain_tool("docs", spec, connection=None)
+
+    search = mcp_tool("search", read_only=True)
+    update = mcp_tool("update", read_only=False)
+    handler, writes = Tool("3 pages"), Tool()
+
+    async def call(tool, handler, **args):
+        request = _request(tool.name, tool=tool, **args)
+        return await middleware.awrap_tool_call(request, _async(handler))
+
+    async def run():
+        await call(search, handler, query="pricing")
+        await call(search, handler, query="pricing")
+        await call(update, writes, page="pricing")
+        await call(update, writes, page="pricing")
+        await call(search, handler, query="pricing")
+
+    asyncio.run(run())
+
+    assert search.metadata == {"read_only": True}
+    assert (handler.runs, writes.runs) == (2, 2)
+
+
+def _async(handler):
+    async def run(request):
+        return handler(request)
+
+    return run
@@ -0,0 +1,68 @@
+"""Tests for offloading large tool results to the virtual filesystem."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from deepagents.backends import CompositeBackend
+from deepagents.backends.filesystem import FilesystemBackend
+from langchain_core.messages import ToolMessage
+
+from sdrbot_cli.tool_results import ToolResultOffloadMiddleware, describe
+
+
+def _request(name="hubspot_search_contacts", call_id="call_1"):
+    return SimpleNamespace(tool_call={"name": name, "id": call_id, "args": {}})
+
+
+def _middleware(tmp_path, **kwargs):
+    # Same routing as the agent: /tmp goes to a virtual filesystem
+    backend = CompositeBackend(
+        default=FilesystemBackend(root_dir=tmp_path / "files"),
+        routes={"/tmp": FilesystemBackend(root_dir=tmp_path, virtual_mode=True)},
+    )
+    return ToolResultOffloadMiddleware(backend=backend, token_budget=100, **kwargs)
+
+
+def _message(content, call_id="call_1"):
+    return ToolMessage(content=content, tool_call_id=call_id, name="hubspot_search_contacts")
+
+
+def test_large_result_is_written_and_replaced(tmp_path):
+    middleware = _middleware(tmp_path)
+    table = "Found 200 contacts:\nid,email\n" + "\n".join(f"{n},u{n}@x.com" for n in range(200))
+
+    result = middleware.wrap_tool_call(_request(), lambda request: _message(table))
+
+    assert (tmp_path / "tool_results" / "call_1").read_text() == table
+    assert "full output saved to /tmp/tool_results/call_1" in result.content
+    assert "Table: 200 rows, columns: id,email" in result.content
+    assert len(result.content) < 1000
+    assert result.tool_call_id == "call_1"
+
+
+def test_small_and_excluded_results_pass_through(tmp_path):
+    middleware = _middleware(tmp_path)
+    small = _message("Created contact 123")
+    big = _message("x" * 5000)
+
+    assert middleware.wrap_tool_call(_request(), lambda request: small) is small
+    assert middleware.wrap_tool_call(_request("read_file"), lambda request: big) is big
+    assert not (tmp_path / "tool_results").exists()
+
+
+def test_async_offload(tmp_path):
+    middleware = _middleware(tmp_path)
+    payload = json.dumps([{"id": n, "name": f"Deal {n}"} for n in range(100)])
+
+    async def handler(request):
+        return _message(payload, call_id="call/2")
+
+    result = asyncio.run(middleware.awrap_tool_call(_request(call_id="call/2"), handler))
+
+    assert (tmp_path / "tool_results" / "call_2").exists()
+    assert "JSON: [{id: int, name: str}] (100 items)" in result.content
+
+
+def test_describe_plain_text():
+    assert describe("line one\nline two") == "Text: 2 lines"